@@ -56,6 +56,11 @@ __version__ = "0.0.5"
 class Settings:
     enableCutEdges: bool
     enableSplits: bool
+    enableProfiling: bool
+    profileMemory: bool
+    profilingLog: str
+    traceSql: bool
+    sqlSlowThreshold: int
     popTotalFields: list[str]
     vapTotalFields: list[str]
     cvapTotalFields: list[str]
@@ -70,6 +75,11 @@ class Settings:
         self._settings.beginGroup("redistricting", QgsSettings.Section.Plugins)
         self.enableCutEdges = self._settings.value("enable_cut_edges", False, bool)
         self.enableSplits = self._settings.value("enable_split_detail", True, bool)
+        self.enableProfiling = self._settings.value("enable_profiling", False, bool)
+        self.profileMemory = self._settings.value("profile_memory", False, bool)
+        self.profilingLog = self._settings.value("profiling_log", "", str)
+        self.traceSql = self._settings.value("trace_sql", False, bool)
+        self.sqlSlowThreshold = self._settings.value("sql_slow_threshold", 100, int)
 
         # TODO: load from settings
         self.popTotalFields = POP_TOTAL_FIELDS
@@ -87,6 +97,11 @@ class Settings:
         self._settings.beginGroup("redistricting", QgsSettings.Section.Plugins)
         self._settings.setValue("enable_cut_edges", self.enableCutEdges)
         self._settings.setValue("enable_split_detail", self.enableSplits)
+        self._settings.setValue("enable_profiling", self.enableProfiling)
+        self._settings.setValue("profile_memory", self.profileMemory)
+        self._settings.setValue("profiling_log", self.profilingLog)
+        self._settings.setValue("trace_sql", self.traceSql)
+        self._settings.setValue("sql_slow_threshold", self.sqlSlowThreshold)
         self._settings.endGroup()
 
 
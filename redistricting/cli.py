@@ -0,0 +1,198 @@
+"""QGIS Redistricting Plugin - command line interface
+
+        begin                : 2026-10-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2026 by Cryptodira
+        email                : stuart@cryptodira.org
+
+Recalculates plans outside of QGIS. Run from the directory containing the
+plugin, with the QGIS python environment:
+
+    python -m redistricting update -j 8 --summary metrics.csv plans/*.gpkg
+    python -m redistricting score plan.gpkg candidates/*.csv --geo-column geoid20 \
+        --dist-column district -o scores.csv
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 3 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ *   This program is distributed in the hope that it will be useful, but   *
+ *   WITHOUT ANY WARRANTY; without even the implied warranty of            *
+ *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          *
+ *   GNU General Public License for more details. You should have          *
+ *   received a copy of the GNU General Public License along with this     *
+ *   program. If not, see <http://www.gnu.org/licenses/>.                  *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+import argparse
+import os
+import pathlib
+import sys
+from functools import partial
+from typing import Optional
+
+from qgis.core import QgsApplication
+
+# this module is imported by each worker process before QGIS is started, so it
+# must not import the plugin's services, which depend on the processing plugin
+
+_app: Optional[QgsApplication] = None
+
+
+def initQgis(prefixPath: Optional[str] = None) -> QgsApplication:
+    """Start QGIS without a GUI, if it is not already running, and make the
+    processing plugin that ships with QGIS importable"""
+    global _app  # pylint: disable=global-statement
+
+    if QgsApplication.instance() is None:
+        if prefixPath:
+            QgsApplication.setPrefixPath(prefixPath, True)
+        _app = QgsApplication([], False)
+        _app.initQgis()
+
+    plugins = os.path.join(QgsApplication.pkgDataPath(), "python", "plugins")
+    if plugins not in sys.path:
+        sys.path.append(plugins)
+
+    return QgsApplication.instance()
+
+
+def _geoPackages(paths: list[str]) -> list[pathlib.Path]:
+    result = []
+    for p in map(pathlib.Path, paths):
+        if p.is_dir():
+            result.extend(sorted(p.glob("*.gpkg")))
+        else:
+            result.append(p)
+    return result
+
+
+def update(args: argparse.Namespace) -> int:
+    # pylint: disable-next=import-outside-toplevel
+    from .services.batch import BatchJob, BatchResult, runBatch, writeSummary  # noqa: PLC0415
+
+    def report(result: BatchResult):
+        if result.success:
+            print(f"OK    {result.geoPackage} ({result.plan}) {result.elapsed:.1f}s", flush=True)
+        else:
+            print(f"ERROR {result.geoPackage}: {result.error}", flush=True)
+
+    jobs = [
+        BatchJob(
+            gpkg, geoSource=args.geo_layer, popSource=args.pop_layer, provider=args.provider, project=args.project
+        )
+        for gpkg in _geoPackages(args.geopackages)
+    ]
+    results = runBatch(jobs, args.jobs, initializer=partial(initQgis, args.prefix), callback=report)
+    if args.summary:
+        writeSummary(results, args.summary)
+
+    return 0 if all(r.success for r in results) else 1
+
+
+def _column(value: str):
+    return int(value) if value.isdigit() else value
+
+
+def score(args: argparse.Namespace) -> int:
+    # pylint: disable-next=import-outside-toplevel
+    from .services.batch import BatchJob, HeadlessPlan  # noqa: PLC0415
+    # pylint: disable-next=import-outside-toplevel
+    from .services.scoring import ScoringParams, ScoringService, exportScores  # noqa: PLC0415
+
+    params = ScoringParams(
+        [str(p) for p in args.candidates],
+        includeGeometry=not args.no_geometry,
+        headerRow=not args.no_header,
+        geoColumn=_column(args.geo_column),
+        distColumn=_column(args.dist_column),
+        delimiter=args.delimiter,
+        joinField=args.join_field,
+        threads=args.jobs,
+    )
+    job = BatchJob(
+        args.geopackage,
+        geoSource=args.geo_layer,
+        popSource=args.pop_layer,
+        provider=args.provider,
+        project=args.project,
+    )
+    with HeadlessPlan(job) as plan:
+        scores = ScoringService().run(None, plan, params).scores
+
+    if args.output:
+        exportScores(scores, args.output)
+    else:
+        print(scores.to_string())
+
+    return 0 if scores["error"].isna().all() else 1
+
+
+def buildParser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m redistricting", description="QGIS Redistricting Plugin")
+    parser.add_argument("--prefix", help="QGIS installation prefix, if QGIS_PREFIX_PATH is not set")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    sources = argparse.ArgumentParser(add_help=False)
+    sources.add_argument("--geo-layer", help="source of the geography layer, if it has moved since the plan was saved")
+    sources.add_argument("--pop-layer", help="source of the population layer, if it has moved since the plan was saved")
+    sources.add_argument("--provider", default="ogr", help="data provider for --geo-layer and --pop-layer")
+    sources.add_argument(
+        "--project",
+        help="QGIS project file to read the plan definition from, for GeoPackages that do not contain it",
+    )
+
+    cmd = commands.add_parser(
+        "update",
+        parents=[sources],
+        help="recalculate district geometry, demographics and metrics",
+        description="Recalculate the districts and metrics of the plans in plan GeoPackages, "
+        "without a project or map canvas. The plan definition is read from the GeoPackage, "
+        "where the plugin saves it along with the project. For GeoPackages saved before the plugin "
+        "did so, the definition is read from the project file given with --project and saved to "
+        "the GeoPackage with the recalculated plan.",
+    )
+    cmd.add_argument("geopackages", nargs="+", help="plan GeoPackages, or directories containing them")
+    cmd.add_argument(
+        "-j", "--jobs", type=int, default=None, help="number of plans to process in parallel (default: CPU count)"
+    )
+    cmd.add_argument("--summary", help="write the plan-wide metrics of each plan to this CSV or JSON file")
+    cmd.set_defaults(func=update)
+
+    cmd = commands.add_parser(
+        "score",
+        parents=[sources],
+        help="score block equivalency files against the units of a plan",
+        description="Score candidate assignments, read from block equivalency files, with the metrics of the "
+        "plan in a plan GeoPackage, without importing them into a plan.",
+    )
+    cmd.add_argument("geopackage", help="plan GeoPackage whose units and metrics are used to score the candidates")
+    cmd.add_argument("candidates", nargs="+", help="block equivalency files")
+    cmd.add_argument("--geo-column", default="0", help="name or index of the geography column (default: 0)")
+    cmd.add_argument("--dist-column", default="1", help="name or index of the district column (default: 1)")
+    cmd.add_argument("--join-field", help="geography field of the plan matching the geography column")
+    cmd.add_argument("--delimiter", default=",", help="delimiter of text files (default: ,)")
+    cmd.add_argument("--no-header", action="store_true", help="the files do not have a header row")
+    cmd.add_argument("--no-geometry", action="store_true", help="skip compactness and other geometric metrics")
+    cmd.add_argument(
+        "-j", "--jobs", type=int, default=None, help="number of candidates to score at once (default: CPU count)"
+    )
+    cmd.add_argument("-o", "--output", help="write the scores to this CSV or JSON file instead of the console")
+    cmd.set_defaults(func=score)
+
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = buildParser().parse_args(argv)
+    initQgis(args.prefix)
+    try:
+        return args.func(args)
+    finally:
+        if _app is not None:
+            _app.exitQgis()
@@ -289,14 +289,12 @@ class DistrictController(DockWidgetController):
     def copyMimeDataToClipboard(self, selection: Optional[list[QModelIndex]] = None):
         """Copy district data to clipboard in html table format"""
         if selection:
-            selection = ((s.row(), s.column()) for s in selection)
+            selection = [(s.row(), s.column()) for s in selection]
 
         clipboard = DistrictClipboardAccess()
-        html = clipboard.getAsHtml(self.planManager.activePlan, selection)
-        text = clipboard.getAsCsv(self.planManager.activePlan, selection)
         mime = QMimeData()
-        mime.setHtml(html)
-        mime.setData("application/csv", text.encode())
+        for fmt, text in clipboard.getAsMimeData(self.planManager.activePlan, selection).items():
+            mime.setData(fmt, text.encode())
         QgsApplication.instance().clipboard().setMimeData(mime)
 
     def copyToClipboard(self):
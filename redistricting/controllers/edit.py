@@ -33,7 +33,7 @@ from qgis.PyQt.QtWidgets import QDialog
 
 from ..gui import DlgCopyPlan, DlgNewDistrict, DockRedistrictingToolbox, PaintDistrictsTool, PaintMode
 from ..models import DistrictSelectModel, GeoFieldsModel, RdsDistrict, RdsPlan, TargetDistrictModel
-from ..services import AssignmentsService, PlanCopier
+from ..services import AssignmentsService, DistrictUpdater, PlanCopier
 from ..utils import tr
 from .base import DockWidgetController
 
@@ -51,10 +51,12 @@ class EditAssignmentsController(DockWidgetController):
         planManager,
         toolbar,
         assignmentsService: AssignmentsService,
+        updateService: Optional[DistrictUpdater] = None,
         parent: Optional[QObject] = None,
     ):
         super().__init__(iface, project, planManager, toolbar, parent)
         self.assignmentsService = assignmentsService
+        self.updateService = updateService
         self.canvas = self.iface.mapCanvas()
         self.dockwidget: DockRedistrictingToolbox = None
         self.actionToggle: QAction = None
@@ -441,7 +443,7 @@ class EditAssignmentsController(DockWidgetController):
             )
 
             self.planManager.appendPlan(plan, False)
-            copier.copyBufferedAssignments(plan)
+            copier.copyBufferedAssignments(plan, self.updateService)
             self.planManager.activePlan.assignLayer.rollBack(True)
             self.planManager.setActivePlan(plan)
             self.project.setDirty()
@@ -34,6 +34,7 @@ from qgis.PyQt.QtWidgets import QDialog, QMenu, QToolBar, QToolButton
 from redistricting.models.metricslist import MetricTriggers
 
 from ..gui import (
+    DlgComparePlans,
     DlgConfirmDelete,
     DlgCopyPlan,
     DlgEditPlan,
@@ -48,6 +49,7 @@ from ..services import (  # ShapefileImporter
     LayerTreeManager,
     MetricsService,
     PlanBuilder,
+    PlanComparisonService,
     PlanCopier,
     PlanEditor,
     PlanExporter,
@@ -96,6 +98,8 @@ class PlanController(BaseController):
 
         self.planModel: PlanListModel
         self.planManagerDlg: Optional[DlgSelectPlan] = None
+        self.compareService = PlanComparisonService(self)
+        self.compareDlg: Optional[DlgComparePlans] = None
 
     def load(self):
         self.planManager.activePlanChanged.connect(self.enableActivePlanActions)
@@ -107,6 +111,8 @@ class PlanController(BaseController):
         self.updateService.updateComplete.connect(self.planDistrictsUpdated)
         self.importService.importComplete.connect(self.importComplete)
         self.importService.importTerminated.connect(self.endProgress)
+        self.compareService.comparisonComplete.connect(self.comparisonComplete)
+        self.compareService.updateTerminated.connect(self.comparisonFailed)
 
         self.planModel = PlanListModel(self.planManager)
 
@@ -133,6 +139,11 @@ class PlanController(BaseController):
             self.planManagerDlg.deleteLater()
             self.planManagerDlg = None
 
+        if self.compareDlg is not None:
+            self.compareDlg.close()
+            self.compareDlg.deleteLater()
+            self.compareDlg = None
+
         self.planManager.activePlanChanged.disconnect(self.enableActivePlanActions)
         self.planManager.planAdded.disconnect(self.planAdded)
         self.planManager.planRemoved.disconnect(self.planRemoved)
@@ -141,6 +152,8 @@ class PlanController(BaseController):
         self.project.layersRemoved.disconnect(self.enableNewPlan)
         self.updateService.updateComplete.disconnect(self.planDistrictsUpdated)
         self.importService.importComplete.disconnect(self.importComplete)
+        self.compareService.comparisonComplete.disconnect(self.comparisonComplete)
+        self.compareService.updateTerminated.disconnect(self.comparisonFailed)
 
         del self.planModel
         self.toolbar.removeAction(self.toolBtnAction)
@@ -225,6 +238,16 @@ class PlanController(BaseController):
         self.actionExportPlan.setEnabled(False)
         self.menu.addAction(self.actionExportPlan)
 
+        self.actionComparePlans = self.actions.createPlanAction(
+            "actionComparePlans",
+            QgsApplication.getThemeIcon("/algorithms/mAlgorithmIntersect.svg"),
+            tr("Compare Plans"),
+            tooltip=tr("Compare the districts of the active plan with the districts of another plan"),
+            callback=self.comparePlans,
+        )
+        self.actionComparePlans.setEnabled(False)
+        self.menu.addAction(self.actionComparePlans)
+
         self.actionSelectPlan = self.actions.createPlanAction(
             "actionSelectPlan",
             QIcon(":/plugins/redistricting/activateplan.svg"),
@@ -279,6 +302,8 @@ class PlanController(BaseController):
             plan is not None and plan.assignLayer is not None and plan.distLayer is not None
         )
         self.actionExportPlan.setTarget(plan)
+        self.actionComparePlans.setEnabled(plan is not None and plan.isValid() and len(self.planManager) > 1)
+        self.actionComparePlans.setTarget(plan)
         self.actionAutoAssign.setEnabled(
             AUTOASSIGN_ENABLED
             and plan is not None
@@ -341,11 +366,22 @@ class PlanController(BaseController):
         plan.districtRemoved.connect(self.project.setDirty)
         self.updateService.watchPlan(plan)
         self.actionSelectPlan.setEnabled(len(self.planManager) > 0)
+        self.actionComparePlans.setEnabled(
+            self.activePlan is not None and self.activePlan.isValid() and len(self.planManager) > 1
+        )
 
     def planRemoved(self, plan: RdsPlan):
         self.removePlanFromMenu(plan)
         self.updateService.unwatchPlan(plan)
         self.actionSelectPlan.setEnabled(len(self.planManager) > 0)
+        self.actionComparePlans.setEnabled(
+            self.activePlan is not None and self.activePlan.isValid() and len(self.planManager) > 1
+        )
+        if self.compareDlg is not None:
+            # the dialog holds references to the plans it can compare
+            self.compareDlg.close()
+            self.compareDlg.deleteLater()
+            self.compareDlg = None
         plan.districtAdded.disconnect(self.project.setDirty)
         plan.districtRemoved.disconnect(self.project.setDirty)
         plan.districtDataChanged.disconnect(self.project.setDirty)
@@ -572,6 +608,32 @@ class PlanController(BaseController):
                 export.exportTerminated.connect(exportError)
                 export.export()
 
+    def comparePlans(self, plan=None):
+        if not isinstance(plan, RdsPlan):
+            if not self.checkActivePlan(tr("compare")):
+                return
+            plan = self.activePlan
+
+        if self.compareDlg is not None:
+            self.compareDlg.close()
+            self.compareDlg.deleteLater()
+
+        self.compareDlg = DlgComparePlans(plan, self.planManager, self.iface.mainWindow())
+        self.compareDlg.compareRequested.connect(
+            lambda other, popField: self.compareService.compare(plan, other, True, popField=popField)
+        )
+        self.compareDlg.show()
+        self.compareDlg.requestComparison()
+
+    def comparisonComplete(self, plan: RdsPlan, comparison):
+        if self.compareDlg is not None and self.compareDlg.plan is plan:
+            self.compareDlg.setComparison(comparison)
+
+    def comparisonFailed(self, plan: RdsPlan, exception: Exception):
+        if self.compareDlg is not None and self.compareDlg.plan is plan:
+            self.compareDlg.setComparison(None)
+        self.iface.messageBar().pushCritical(tr("Error"), str(exception))
+
     def selectPlan(self, plan: Optional[RdsPlan] = None):
         """Make the selected plan the active plan"""
         if plan is None:
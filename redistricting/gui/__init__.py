@@ -26,6 +26,7 @@ from qgis.PyQt.QtCore import QEvent, QObject, Qt
 from qgis.PyQt.QtGui import QKeyEvent
 from qgis.PyQt.QtWidgets import QTableView
 
+from .dlgcompare import DlgComparePlans
 from .dlgcopy import DlgCopyPlan
 from .dlgdelete import DlgConfirmDelete
 
@@ -60,6 +61,7 @@ class TableViewKeyEventFilter(QObject):
 __all__ = [
     "DlgEditPlan",
     "DlgCopyPlan",
+    "DlgComparePlans",
     "DlgSelectPlan",
     "DlgSplitDetail",
     "DlgExportPlan",
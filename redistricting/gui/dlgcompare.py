@@ -0,0 +1,240 @@
+"""QGIS Redistricting Plugin - dialog to compare the districts of two plans
+
+        begin                : 2026-10-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2026 by Cryptodira
+        email                : stuart@cryptodira.org
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 3 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ *   This program is distributed in the hope that it will be useful, but   *
+ *   WITHOUT ANY WARRANTY; without even the implied warranty of            *
+ *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          *
+ *   GNU General Public License for more details. You should have          *
+ *   received a copy of the GNU General Public License along with this     *
+ *   program. If not, see <http://www.gnu.org/licenses/>.                  *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, Optional
+
+import numpy as np
+import pandas as pd
+from qgis.PyQt.QtCore import QAbstractTableModel, QModelIndex, QObject, Qt, QVariant, pyqtSignal
+from qgis.PyQt.QtGui import QColor, QPalette
+from qgis.PyQt.QtWidgets import QApplication, QDialog, QDialogButtonBox, QFileDialog, QWidget
+
+from ..models import DistrictColumns, RdsPlan
+from ..utils import tr
+from .ui.DlgComparePlans import Ui_dlgComparePlans
+
+if TYPE_CHECKING:
+    from ..services.compare import PlanComparison
+
+
+def districtName(plan: RdsPlan, district: int) -> str:
+    dist = plan.districts.get(district, None)
+    return dist.name if dist is not None else str(district)
+
+
+class RdsPlanComparisonModel(QAbstractTableModel):
+    """Table of the districts of a plan with their core retention, best match and overlap with
+    each district of the other plan, shading each overlap cell by its share of the district"""
+
+    SUMMARY_COLUMNS = 4
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._comparison: Optional["PlanComparison"] = None
+        self._table = pd.DataFrame()
+        self._header: list[str] = []
+        self._showPercent = False
+
+    @property
+    def comparison(self) -> Optional["PlanComparison"]:
+        return self._comparison
+
+    def setComparison(self, comparison: Optional["PlanComparison"]):
+        self.beginResetModel()
+        self._comparison = comparison
+        if comparison is None:
+            self._table = pd.DataFrame()
+            self._header = []
+        else:
+            self._table = comparison.table()
+            self._header = [
+                tr("Population"),
+                tr("Core Retention"),
+                tr("Best Match"),
+                tr("Best Match %"),
+                *(districtName(comparison.other, d) for d in comparison.overlap.columns),
+            ]
+        self.endResetModel()
+
+    @property
+    def showPercent(self) -> bool:
+        return self._showPercent
+
+    def setShowPercent(self, value: bool):
+        if self._showPercent == value:
+            return
+
+        self._showPercent = value
+        if self.rowCount() > 0:
+            self.dataChanged.emit(
+                self.index(0, self.SUMMARY_COLUMNS),
+                self.index(self.rowCount() - 1, self.columnCount() - 1),
+                {Qt.ItemDataRole.DisplayRole},
+            )
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: B008
+        return 0 if parent.isValid() else len(self._table)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: B008
+        return 0 if parent.isValid() else len(self._table.columns)
+
+    def _share(self, row: int, col: int) -> float:
+        population = self._comparison.population.iat[row]
+        return self._table.iat[row, col] / population if population else 0.0
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or self._comparison is None:
+            return QVariant()
+
+        row, col = index.row(), index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            value = self._table.iat[row, col]
+            if pd.isna(value):
+                return ""
+            if col in (1, 3):
+                return f"{value:.1%}"
+            if col == 2:
+                return districtName(self._comparison.other, int(value))
+            if col >= self.SUMMARY_COLUMNS and self._showPercent:
+                return f"{self._share(row, col):.1%}"
+            if isinstance(value, (int, np.integer)):
+                return f"{value:,}"
+            return f"{value:,.2f}"
+
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return int(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+
+        if role == Qt.ItemDataRole.BackgroundRole and col >= self.SUMMARY_COLUMNS:
+            share = self._share(row, col)
+            if share > 0:
+                color = QColor(QApplication.palette().color(QPalette.ColorRole.Highlight))
+                color.setAlpha(int(32 + 160 * share))
+                return color
+
+        return QVariant()
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role != Qt.ItemDataRole.DisplayRole or self._comparison is None:
+            return QVariant()
+
+        if orientation == Qt.Orientation.Horizontal:
+            return self._header[section] if section < len(self._header) else ""
+
+        return districtName(self._comparison.plan, int(self._table.index[section]))
+
+
+class DlgComparePlans(Ui_dlgComparePlans, QDialog):
+    compareRequested = pyqtSignal("PyQt_PyObject", str)  # RdsPlan, population field
+
+    def __init__(
+        self,
+        plan: RdsPlan,
+        plans: Iterable[RdsPlan],
+        parent: Optional[QWidget] = None,
+        flags: Qt.WindowType = Qt.WindowType.Dialog,
+    ):
+        super().__init__(parent, flags)
+        self.setupUi(self)
+
+        self._plan = plan
+        self.lblPlan.setText(plan.name)
+        for p in plans:
+            if p is not plan:
+                self.cmbComparePlan.addItem(p.name, p)
+
+        caption = DistrictColumns.POPULATION.comment  # pylint: disable=no-member
+        self.cmbPopField.addItem(caption, DistrictColumns.POPULATION)
+        for f in plan.popFields:
+            self.cmbPopField.addItem(f.caption, f.fieldName)
+
+        self.model = RdsPlanComparisonModel(self)
+        self.tvComparison.setModel(self.model)
+
+        self.btnExport = self.buttonBox.addButton(tr("Export..."), QDialogButtonBox.ButtonRole.ActionRole)
+        self.btnExport.setEnabled(False)
+        self.btnExport.clicked.connect(self.exportComparison)
+
+        self.cmbComparePlan.currentIndexChanged.connect(self.requestComparison)
+        self.cmbPopField.currentIndexChanged.connect(self.requestComparison)
+        self.cbxPercent.toggled.connect(self.model.setShowPercent)
+
+    @property
+    def plan(self) -> RdsPlan:
+        return self._plan
+
+    @property
+    def otherPlan(self) -> Optional[RdsPlan]:
+        return self.cmbComparePlan.currentData()
+
+    @property
+    def popField(self) -> str:
+        return self.cmbPopField.currentData()
+
+    def requestComparison(self):
+        if self.otherPlan is None:
+            return
+
+        self.setComparison(None)
+        self.lblSummary.setText(tr("Comparing plans..."))
+        self.compareRequested.emit(self.otherPlan, self.popField)
+
+    def setComparison(self, comparison: Optional["PlanComparison"]):
+        if comparison is not None and (
+            comparison.plan is not self._plan
+            or comparison.other is not self.otherPlan
+            or comparison.popField != self.popField
+        ):
+            # result of a comparison that has since been superseded
+            return
+
+        self.model.setComparison(comparison)
+        self.btnExport.setEnabled(comparison is not None)
+        if comparison is None:
+            self.lblSummary.setText("")
+            return
+
+        summary = tr("{retention:.1%} of the assigned population remains in the same district of {plan}.").format(
+            retention=comparison.totalRetention, plan=comparison.other.name
+        )
+        if comparison.unmatched:
+            summary += " " + tr("{unmatched:,} people are in units not found in {plan}.").format(
+                unmatched=comparison.unmatched, plan=comparison.other.name
+            )
+        self.lblSummary.setText(summary)
+        self.tvComparison.resizeColumnsToContents()
+
+    def exportComparison(self):
+        comparison = self.model.comparison
+        if comparison is None:
+            return
+
+        fileName, _ = QFileDialog.getSaveFileName(
+            self,
+            tr("Export Comparison"),
+            f"{comparison.plan.name}_{comparison.other.name}.csv",
+            tr("CSV files (*.csv);;JSON files (*.json)"),
+        )
+        if fileName:
+            comparison.export(fileName)
@@ -49,6 +49,13 @@ class DlgCopyPlan(Ui_dlgCopyPlan, QDialog):
 
         self.lblSourcePlan.setText(tr("Copy from <b>{plan}</b>").format(plan=plan.name))
         self.cbxCopyAssignments.setText(tr("Copy {geography} assignments").format(geography=plan.geoIdCaption.lower()))
+        self.cbxCopyAssignments.setToolTip(
+            tr(
+                "Copies the plan's GeoPackage, including the unit geometry. On file systems that support "
+                "copy-on-write (btrfs, XFS, APFS) the copy is quick and initially takes no extra disk space; "
+                "on others, such as NTFS and ext4, the whole GeoPackage is duplicated."
+            )
+        )
         self.inpPlanName.editingFinished.connect(self.planNameChanged)
         self.inpPlanName.textChanged.connect(self.updateButtonBox)
         self.txtDescription.setPlainText(plan.description)
@@ -22,12 +22,26 @@
  ***************************************************************************/
 """
 
+from collections import OrderedDict
 from collections.abc import Iterable
 from enum import IntEnum
 
-from qgis.core import Qgis, QgsFeature, QgsGeometry
+from qgis.core import (
+    Qgis,
+    QgsCoordinateTransform,
+    QgsFeature,
+    QgsFeatureRequest,
+    QgsGeometry,
+    QgsGeometryEngine,
+    QgsPoint,
+    QgsPointXY,
+    QgsProject,
+    QgsRectangle,
+    QgsSpatialIndex,
+    QgsVectorLayer,
+)
 from qgis.gui import QgsMapCanvas, QgsMapMouseEvent, QgsMapToolIdentify, QgsRubberBand
-from qgis.PyQt.QtCore import QRect, Qt, pyqtSignal
+from qgis.PyQt.QtCore import QPoint, QRect, Qt, pyqtSignal
 from qgis.PyQt.QtGui import QColor, QCursor, QKeyEvent, QPixmap
 
 from ..models import RdsPlan
@@ -47,6 +61,7 @@ class PaintDistrictsTool(QgsMapToolIdentify):
     selectFeatures = pyqtSignal("PyQt_PyObject", int, int, "PyQt_PyObject")
 
     MinPixelZoom = 20
+    MaxPreparedGeometries = 1000
 
     def __init__(self, canvas: QgsMapCanvas):
         super().__init__(canvas)
@@ -63,6 +78,13 @@ class PaintDistrictsTool(QgsMapToolIdentify):
         self._plan = None
         self._layer = None
 
+        # in-memory spatial index of the assignment layer geometry, built when the tool is activated
+        self._index: QgsSpatialIndex = None
+        self._indexLayer: QgsVectorLayer = None
+        # prepared geometry of the most recently hit units, least recently used first
+        self._prepared: OrderedDict[int, tuple[QgsGeometryEngine, QgsGeometry]] = OrderedDict()
+        self._painted: set[int] = set()
+
         self.buttonsPressed = Qt.MouseButton.NoButton
 
     @property
@@ -76,6 +98,78 @@ class PaintDistrictsTool(QgsMapToolIdentify):
             self._layer = self._plan.assignLayer if self._plan is not None else None
             self._distTarget = None
             self._distSource = None
+            self._index = None
+            self._indexLayer = None
+            self._prepared.clear()
+            if self.isActive():
+                self.buildIndex()
+
+    def activate(self):
+        super().activate()
+        self.buildIndex()
+
+    def deactivate(self):
+        self._prepared.clear()
+        super().deactivate()
+
+    def buildIndex(self):
+        if self._layer is None or (self._index is not None and self._indexLayer is self._layer):
+            return
+
+        request = QgsFeatureRequest()
+        request.setNoAttributes()
+        self._index = QgsSpatialIndex(
+            self._layer.getFeatures(request), None, QgsSpatialIndex.Flag.FlagStoreFeatureGeometries
+        )
+        self._indexLayer = self._layer
+        self._prepared.clear()
+
+    def _preparedGeometry(self, fid: int) -> QgsGeometryEngine:
+        if fid in self._prepared:
+            self._prepared.move_to_end(fid)
+        else:
+            geom = self._index.geometry(fid)
+            engine = QgsGeometry.createGeometryEngine(geom.constGet())
+            engine.prepareGeometry()
+            # keep a reference to the geometry -- the engine does not own it
+            self._prepared[fid] = (engine, geom)
+            if len(self._prepared) > self.MaxPreparedGeometries:
+                self._prepared.popitem(last=False)
+
+        return self._prepared[fid][0]
+
+    def _featuresAtPoint(self, pos: QPoint) -> list[int]:
+        return self._featuresAtLayerPoint(self.toLayerCoordinates(self._layer, pos))
+
+    def _featuresAtLayerPoint(self, point: QgsPointXY) -> list[int]:
+        self.buildIndex()
+        pt = QgsPoint(point)
+        return [
+            fid
+            for fid in self._index.intersects(QgsRectangle(point, point))
+            if self._preparedGeometry(fid).intersects(pt)
+        ]
+
+    def _featuresInGeometry(self, geom: QgsGeometry) -> list[int]:
+        self.buildIndex()
+        geom = QgsGeometry(geom)
+        xform = QgsCoordinateTransform(
+            self.canvas().mapSettings().destinationCrs(), self._layer.crs(), QgsProject.instance()
+        )
+        geom.transform(xform)
+        engine = QgsGeometry.createGeometryEngine(geom.constGet())
+        engine.prepareGeometry()
+        return [
+            fid
+            for fid in self._index.intersects(geom.boundingBox())
+            if engine.intersects(self._index.geometry(fid).constGet())
+        ]
+
+    def _getFeatures(self, fids: list[int]) -> list[QgsFeature]:
+        # fetch the attributes from the layer to pick up the current (possibly uncommitted) assignments
+        request = QgsFeatureRequest(fids)
+        request.setFlags(QgsFeatureRequest.Flag.NoGeometry)
+        return list(self._layer.getFeatures(request))
 
     def targetDistrict(self, buttons=Qt.MouseButton.LeftButton):
         if buttons & Qt.MouseButton.RightButton != Qt.MouseButton.NoButton:
@@ -124,8 +218,7 @@ class PaintDistrictsTool(QgsMapToolIdentify):
             return
 
         if self._paintMode == PaintMode.PaintByGeography:
-            r = self.searchRadiusMU(self.canvas())
-            self.setCanvasPropertiesOverrides(r / 4)
+            self._painted.clear()
             self.paintingStarted.emit(
                 self.targetDistrict(self.buttonsPressed), self.sourceDistrict(self.buttonsPressed)
             )
@@ -145,11 +238,9 @@ class PaintDistrictsTool(QgsMapToolIdentify):
         if self.targetDistrict(self.buttonsPressed) is None:
             return
 
-        self.restoreCanvasPropertiesOverrides()
-
         if self._paintMode == PaintMode.PaintByGeography:
-            results: list[QgsMapToolIdentify.IdentifyResult] = self.identify(e.pos().x(), e.pos().y(), [self._layer])
-            if not results:
+            fids = self._featuresAtPoint(e.pos())
+            if not fids:
                 if self._dragging:
                     self._dragging = False
                     self.paintingComplete.emit()
@@ -157,11 +248,14 @@ class PaintDistrictsTool(QgsMapToolIdentify):
                     self.paintingCanceled.emit()
                 return
 
-            self._paintFeatures(
-                (r.mFeature for r in results),
-                self.targetDistrict(self.buttonsPressed),
-                self.sourceDistrict(self.buttonsPressed),
-            )
+            fids = [fid for fid in fids if fid not in self._painted]
+            if fids:
+                self._paintFeatures(
+                    self._getFeatures(fids),
+                    self.targetDistrict(self.buttonsPressed),
+                    self.sourceDistrict(self.buttonsPressed),
+                )
+            self._painted.clear()
             self._dragging = False
             self.paintingComplete.emit()
         elif self._paintMode in {PaintMode.PaintRectangle, PaintMode.SelectByGeography}:
@@ -179,18 +273,20 @@ class PaintDistrictsTool(QgsMapToolIdentify):
                 geom = QgsGeometry.fromPointXY(self.toMapCoordinates(e.pos()))
 
             if not tooShort:
-                results: list[QgsMapToolIdentify.IdentifyResult] = self.identify(
-                    geom, QgsMapToolIdentify.DefaultQgsSetting, [self._layer], QgsMapToolIdentify.VectorLayer
-                )
+                if geom.type() == Qgis.GeometryType.Point:
+                    fids = self._featuresAtPoint(e.pos())
+                else:
+                    fids = self._featuresInGeometry(geom)
+                features = self._getFeatures(fids) if fids else []
                 if self._paintMode == PaintMode.SelectByGeography:
                     self._selectFeatures(
-                        (r.mFeature for r in results),
+                        features,
                         self.targetDistrict(self.buttonsPressed),
                         self.sourceDistrict(self.buttonsPressed),
                     )
                 else:
                     self._paintFeatures(
-                        (r.mFeature for r in results),
+                        features,
                         self.targetDistrict(self.buttonsPressed),
                         self.sourceDistrict(self.buttonsPressed),
                     )
@@ -206,14 +302,20 @@ class PaintDistrictsTool(QgsMapToolIdentify):
             return
 
         if self._paintMode == PaintMode.PaintByGeography:
-            results: list[QgsMapToolIdentify.IdentifyResult] = self.identify(e.pos().x(), e.pos().y(), [self._layer])
-
-            if not results:
+            fids = self._featuresAtPoint(e.pos())
+            if not fids:
                 return
 
             self._dragging = True
+
+            # skip units already painted during this drag
+            fids = [fid for fid in fids if fid not in self._painted]
+            if not fids:
+                return
+
+            self._painted.update(fids)
             self._paintFeatures(
-                (r.mFeature for r in results), self.targetDistrict(buttons), self.sourceDistrict(buttons), False
+                self._getFeatures(fids), self.targetDistrict(buttons), self.sourceDistrict(buttons), False
             )
         elif self._paintMode in {PaintMode.PaintRectangle, PaintMode.SelectByGeography}:
             if not self._dragging:
@@ -22,13 +22,24 @@
  ***************************************************************************/
 """
 
-from qgis.gui import QgsCollapsibleGroupBox, QgsOptionsPageWidget, QgsOptionsWidgetFactory
+from qgis.gui import QgsCollapsibleGroupBox, QgsFileWidget, QgsOptionsPageWidget, QgsOptionsWidgetFactory
 from qgis.PyQt.QtCore import QProcess
 from qgis.PyQt.QtGui import QIcon
-from qgis.PyQt.QtWidgets import QCheckBox, QGridLayout, QLabel, QPushButton, QTextEdit, QVBoxLayout
+from qgis.PyQt.QtWidgets import (
+    QCheckBox,
+    QFileDialog,
+    QGridLayout,
+    QHBoxLayout,
+    QLabel,
+    QPushButton,
+    QSpinBox,
+    QTextEdit,
+    QVBoxLayout,
+)
 
 from .. import settings
 from ..utils import addons, tr
+from ..utils.sqltrace import sqlTracer
 
 
 class RdsOptionsFactory(QgsOptionsWidgetFactory):
@@ -129,13 +140,84 @@ class RdsConfigOptionsPage(QgsOptionsPageWidget):
         self.btnUninstallAll.setEnabled(addons.vendor_dir().exists())
         layout.addWidget(self.btnUninstallAll, 6, 0, 1, 2)
 
+        self.gbDiagnostics = QgsCollapsibleGroupBox(tr("Diagnostics"), self)
+        self.gbDiagnostics.setCollapsed(True)
+        main_layout.addWidget(self.gbDiagnostics)
+        layout = QGridLayout(self)
+        layout.setContentsMargins(12, 12, 12, 12)
+        layout.setVerticalSpacing(12)
+        layout.setColumnStretch(1, 1)
+        self.gbDiagnostics.setLayout(layout)
+        self.cbEnableProfiling = QCheckBox(tr("Profile background tasks"), self)
+        self.cbEnableProfiling.setToolTip(
+            tr("Log the time taken by each stage of district and metric updates to the Redistricting Profiling log")
+        )
+        self.cbEnableProfiling.setChecked(settings.enableProfiling)
+        layout.addWidget(self.cbEnableProfiling, 0, 0, 1, 2)
+        self.cbProfileMemory = QCheckBox(tr("Include memory usage (slower)"), self)
+        self.cbProfileMemory.setChecked(settings.profileMemory)
+        self.cbProfileMemory.setEnabled(settings.enableProfiling)
+        self.cbEnableProfiling.toggled.connect(self.cbProfileMemory.setEnabled)
+        layout.addWidget(self.cbProfileMemory, 1, 0, 1, 2)
+        layout.addWidget(QLabel(tr("Profile log file"), self), 2, 0)
+        self.fwProfilingLog = QgsFileWidget(self)
+        self.fwProfilingLog.setStorageMode(QgsFileWidget.StorageMode.SaveFile)
+        self.fwProfilingLog.setConfirmOverwrite(False)
+        self.fwProfilingLog.setFilter(tr("JSON Lines (*.jsonl)"))
+        self.fwProfilingLog.setToolTip(tr("Optionally append the stage timings to this file"))
+        self.fwProfilingLog.setFilePath(settings.profilingLog)
+        self.fwProfilingLog.setEnabled(settings.enableProfiling)
+        self.cbEnableProfiling.toggled.connect(self.fwProfilingLog.setEnabled)
+        layout.addWidget(self.fwProfilingLog, 2, 1)
+
+        self.cbTraceSql = QCheckBox(tr("Trace GeoPackage SQL statements"), self)
+        self.cbTraceSql.setToolTip(
+            tr(
+                "Log the duration and row count of each statement run on plan GeoPackages to the "
+                "Redistricting SQL log, with the query plan of slow statements. Applies to new connections."
+            )
+        )
+        self.cbTraceSql.setChecked(settings.traceSql)
+        layout.addWidget(self.cbTraceSql, 3, 0, 1, 2)
+        layout.addWidget(QLabel(tr("Slow statement threshold"), self), 4, 0)
+        self.sbSlowThreshold = QSpinBox(self)
+        self.sbSlowThreshold.setRange(0, 600000)
+        self.sbSlowThreshold.setSuffix(tr(" ms"))
+        self.sbSlowThreshold.setToolTip(tr("Capture the query plan of statements that take at least this long"))
+        self.sbSlowThreshold.setValue(settings.sqlSlowThreshold)
+        self.sbSlowThreshold.setEnabled(settings.traceSql)
+        self.cbTraceSql.toggled.connect(self.sbSlowThreshold.setEnabled)
+        layout.addWidget(self.sbSlowThreshold, 4, 1)
+        buttons = QHBoxLayout()
+        self.btnExportSqlReport = QPushButton(tr("Export SQL Trace Report..."), self)
+        self.btnExportSqlReport.setToolTip(tr("Save the statistics for each traced statement to a CSV or JSON file"))
+        self.btnExportSqlReport.clicked.connect(self.exportSqlReport)
+        buttons.addWidget(self.btnExportSqlReport)
+        self.btnResetSqlReport = QPushButton(tr("Clear SQL Trace"), self)
+        self.btnResetSqlReport.clicked.connect(sqlTracer.reset)
+        buttons.addWidget(self.btnResetSqlReport)
+        buttons.addStretch()
+        layout.addLayout(buttons, 5, 0, 1, 2)
+
         main_layout.addStretch()
 
     def apply(self):
         settings.enableCutEdges = self.cbEnableCutEdges.isChecked()
         settings.enableSplits = self.cbEnableSplitDetail.isChecked()
+        settings.enableProfiling = self.cbEnableProfiling.isChecked()
+        settings.profileMemory = self.cbProfileMemory.isChecked()
+        settings.profilingLog = self.fwProfilingLog.filePath()
+        settings.traceSql = self.cbTraceSql.isChecked()
+        settings.sqlSlowThreshold = self.sbSlowThreshold.value()
         settings.saveSettings()
 
+    def exportSqlReport(self):
+        fileName, _ = QFileDialog.getSaveFileName(
+            self, tr("Export SQL Trace Report"), "", tr("CSV files (*.csv);;JSON files (*.json)")
+        )
+        if fileName:
+            sqlTracer.exportReport(fileName)
+
     # pylint: disable=import-outside-toplevel, unused-import
     def canInstallPyogrio(self):
         if (addons.vendor_dir() / "pyogrio").exists():
@@ -0,0 +1,87 @@
+# Form implementation generated from reading ui file '/Users/stuart/Source/qgis_redistricting/ui/DlgComparePlans.ui'
+#
+# Created by: qgis.PyQt UI code generator 5.15.7
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from qgis.PyQt import (
+    QtCore,
+    QtGui,
+    QtWidgets
+)
+
+
+class Ui_dlgComparePlans(object):
+    def setupUi(self, dlgComparePlans):
+        dlgComparePlans.setObjectName("dlgComparePlans")
+        dlgComparePlans.resize(640, 420)
+        dlgComparePlans.setSizeGripEnabled(True)
+        self.verticalLayout = QtWidgets.QVBoxLayout(dlgComparePlans)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.gridLayout = QtWidgets.QGridLayout()
+        self.gridLayout.setHorizontalSpacing(15)
+        self.gridLayout.setObjectName("gridLayout")
+        self.lblPlanLabel = QtWidgets.QLabel(dlgComparePlans)
+        self.lblPlanLabel.setMinimumSize(QtCore.QSize(120, 0))
+        self.lblPlanLabel.setObjectName("lblPlanLabel")
+        self.gridLayout.addWidget(self.lblPlanLabel, 0, 0, 1, 1)
+        self.lblPlan = QtWidgets.QLabel(dlgComparePlans)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.MinimumExpanding,
+                                           QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.lblPlan.sizePolicy().hasHeightForWidth())
+        self.lblPlan.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.lblPlan.setFont(font)
+        self.lblPlan.setObjectName("lblPlan")
+        self.gridLayout.addWidget(self.lblPlan, 0, 1, 1, 1)
+        self.lblComparePlan = QtWidgets.QLabel(dlgComparePlans)
+        self.lblComparePlan.setObjectName("lblComparePlan")
+        self.gridLayout.addWidget(self.lblComparePlan, 1, 0, 1, 1)
+        self.cmbComparePlan = QtWidgets.QComboBox(dlgComparePlans)
+        self.cmbComparePlan.setObjectName("cmbComparePlan")
+        self.gridLayout.addWidget(self.cmbComparePlan, 1, 1, 1, 1)
+        self.lblPopField = QtWidgets.QLabel(dlgComparePlans)
+        self.lblPopField.setObjectName("lblPopField")
+        self.gridLayout.addWidget(self.lblPopField, 2, 0, 1, 1)
+        self.cmbPopField = QtWidgets.QComboBox(dlgComparePlans)
+        self.cmbPopField.setObjectName("cmbPopField")
+        self.gridLayout.addWidget(self.cmbPopField, 2, 1, 1, 1)
+        self.verticalLayout.addLayout(self.gridLayout)
+        self.cbxPercent = QtWidgets.QCheckBox(dlgComparePlans)
+        self.cbxPercent.setObjectName("cbxPercent")
+        self.verticalLayout.addWidget(self.cbxPercent)
+        self.tvComparison = QtWidgets.QTableView(dlgComparePlans)
+        self.tvComparison.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.tvComparison.setAlternatingRowColors(True)
+        self.tvComparison.setObjectName("tvComparison")
+        self.verticalLayout.addWidget(self.tvComparison)
+        self.lblSummary = QtWidgets.QLabel(dlgComparePlans)
+        self.lblSummary.setText("")
+        self.lblSummary.setObjectName("lblSummary")
+        self.verticalLayout.addWidget(self.lblSummary)
+        self.buttonBox = QtWidgets.QDialogButtonBox(dlgComparePlans)
+        self.buttonBox.setOrientation(QtCore.Qt.Orientation.Horizontal)
+        self.buttonBox.setStandardButtons(QtWidgets.QDialogButtonBox.StandardButton.Close)
+        self.buttonBox.setObjectName("buttonBox")
+        self.verticalLayout.addWidget(self.buttonBox)
+        self.lblComparePlan.setBuddy(self.cmbComparePlan)
+        self.lblPopField.setBuddy(self.cmbPopField)
+
+        self.retranslateUi(dlgComparePlans)
+        self.buttonBox.rejected.connect(dlgComparePlans.reject)  # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(dlgComparePlans)
+
+    def retranslateUi(self, dlgComparePlans):
+        _translate = QtCore.QCoreApplication.translate
+        dlgComparePlans.setWindowTitle(_translate("dlgComparePlans", "Compare Plans"))
+        self.lblPlanLabel.setText(_translate("dlgComparePlans", "Redistricting Plan"))
+        self.lblPlan.setText(_translate("dlgComparePlans", "No plan selected"))
+        self.lblComparePlan.setText(_translate("dlgComparePlans", "Compare with"))
+        self.lblPopField.setText(_translate("dlgComparePlans", "Population"))
+        self.cbxPercent.setText(_translate("dlgComparePlans", "Show overlap as a percentage of district population"))
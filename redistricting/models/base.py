@@ -31,6 +31,7 @@ import sys
 from collections.abc import Iterable, MutableMapping, MutableSequence
 from copy import copy
 from enum import Enum
+from operator import attrgetter
 from reprlib import recursive_repr
 from types import GenericAlias, UnionType
 from typing import (  # pylint: disable=no-name-in-module
@@ -527,6 +528,11 @@ class Property(Field[_T]):
         self.fvalid = fvalid
         self.notify = notify
 
+        # generic accessors until the owner class is known -- see compile()
+        self._fastget: Callable[[Any], _T] = self._get
+        self._fastvalidate: Optional[Callable[[Any, Any], Any]] = self.validate
+        self._fastset: Callable[[Any, Any], None] = self._set
+
         if doc is None and fget is not None:
             doc = fget.__doc__
         self.__doc__ = doc
@@ -600,6 +606,8 @@ class Property(Field[_T]):
         else:
             self.type = t
 
+        self.compile(owner)
+
     @overload
     def __get__(self, instance: None, owner: type, /) -> "Self[_T]": ...
 
@@ -610,17 +618,27 @@ class Property(Field[_T]):
         if instance is None:
             return self
 
+        return self._fastget(instance)
+
+    def __set__(self, instance: Any, value: Any):
+        self._fastset(instance, value)
+
+    def _get(self, instance: Any):
         if self.fget is None:
-            raise AttributeError(f"property {self.name!r} of {owner.__name__!r} object has no getter")  # type: ignore
+            raise AttributeError(f"property {self.name!r} of {type(instance).__name__!r} object has no getter")
 
         return self.fget(instance)
 
-    def __set__(self, instance: Any, value: Any):
+    def _set(self, instance: Any, value: Any):
         if self.fset is None:
             raise AttributeError(f"property {self.name!r} of {type(instance).__name__!r} object has no setter")
 
         value = self.validate(instance, value)
 
+        journal: Optional[dict[str, Any]] = getattr(instance, "_changeJournal", None)
+        if journal is not None and self.name not in journal and self.fget is not None:
+            journal[self.name] = _journal_value(self.fget(instance))
+
         if self.notify:
             if self.fget is not None:
                 old = self.fget(instance)
@@ -636,6 +654,85 @@ class Property(Field[_T]):
                 boundSignal = self.notify.__get__(instance, type(instance))
                 boundSignal.emit()
 
+    def compile(self, owner: type):
+        """Generate accessors specialized for this property once the owner class is known
+
+        Private attributes without a custom getter are read with an attrgetter rather than through
+        get_private, values whose type exactly matches the property type skip coercion, and the
+        setter only performs the steps (validation, change journal, notification) the property uses.
+        """
+        fget = self.fget
+        if (
+            self.private
+            and getattr(fget, "__self__", None) is self
+            and getattr(fget, "__func__", None) is Property.get_private
+        ):
+            fget = attrgetter(self.private)
+        self._fastget = fget if fget is not None else self._get
+
+        self._fastvalidate = self._make_validator()
+
+        self._fastset = self._set if self.fset is None else self._make_setter(owner, self._fastvalidate)
+
+    def _make_validator(self) -> Optional[Callable[[Any, Any], Any]]:
+        if self.fvalid is None and self.type is Any:
+            return None
+
+        validate = self.validate
+        if self.fvalid is not None:
+            return validate
+
+        if isinstance(self.type, type):
+            exact = frozenset((self.type,))
+        elif isinstance(self.type, tuple):
+            exact = frozenset(t for t in self.type if isinstance(t, type))
+        else:
+            return validate
+
+        def validator(instance, value):
+            if type(value) in exact:
+                return value
+
+            return validate(instance, value)
+
+        return validator
+
+    def _make_setter(
+        self, owner: type, validate: Optional[Callable[[Any, Any], Any]]
+    ) -> Callable[[Any, Any], None]:
+        name = self.name
+        fset = self.fset
+        notify = self.notify
+        getter = self._fastget if self.fget is not None else None
+        journaled = getter is not None and hasattr(owner, "_changeJournal")
+
+        def setter(instance, value):
+            if validate is not None:
+                value = validate(instance, value)
+
+            if journaled:
+                journal = instance._changeJournal
+                if journal is not None and name not in journal:
+                    journal[name] = _journal_value(getter(instance))
+
+            if notify is None:
+                fset(instance, value)
+                return
+
+            if getter is not None:
+                old = getter(instance)
+                if isinstance(value, Iterable):
+                    old = copy(old)
+            else:
+                old = MISSING  # write-only props still emit a change signal when set
+
+            fset(instance, value)
+
+            if old is MISSING or old != value:
+                notify.__get__(instance, type(instance)).emit()
+
+        return setter
+
     def __delete__(self, instance: Any):
         if self.fdel is None:
             raise AttributeError(f"property {self.name!r} of {type(instance).__name__!r} object has no deleter")
@@ -658,7 +755,8 @@ class Property(Field[_T]):
             else:
                 raise ValueError(f"no initial value for property {self.name!r} of {type(instance).__name__!r} object")
 
-        value = self.validate(instance, value)
+        if self._fastvalidate is not None:
+            value = self._fastvalidate(instance, value)
 
         if self.finit is not None:
             self.finit(instance, value)
@@ -1257,6 +1355,17 @@ def _is_classvar(a_type):
     )
 
 
+def _journal_value(value: Any) -> Any:
+    """Copy the contents of mutable containers so the recorded value isn't changed by later in-place updates"""
+    if isinstance(value, MutableSequence):
+        return list(value)
+
+    if isinstance(value, MutableMapping):
+        return dict(value)
+
+    return value
+
+
 class _FACTORY_MARKER_TYPE:
     def __repr__(self):
         return "_FACTORY_MARKER"
@@ -1284,6 +1393,8 @@ def compare_models(self, other):
 class RdsBaseModel(QObject):
     __fields__: dict[str, Field]
 
+    _changeJournal = None
+
     @classmethod
     def has_method(cls, method_name):
         if cls.__dict__.get(method_name, None):
@@ -1454,6 +1565,44 @@ class RdsBaseModel(QObject):
 
         self.__post_init__(**post_init_args)
 
+    def beginChanges(self):
+        """Start recording the original value of each property that is set on the model
+
+        Properties record their value the first time they are set. Plain fields are not descriptors,
+        so their values are captured up front.
+        """
+        self._changeJournal = {
+            f.name: _journal_value(getattr(self, f.name, MISSING)) for f in fields(self) if not isinstance(f, Property)
+        }
+
+    def isRecordingChanges(self) -> bool:
+        return self._changeJournal is not None
+
+    def endChanges(self) -> dict[str, Any]:
+        """Stop recording changes
+
+        Returns:
+            dict[str, Any]: The original values of the properties whose values differ from
+                            their values when beginChanges was called, keyed by property name
+        """
+        journal, self._changeJournal = self._changeJournal, None
+        if not journal:
+            return {}
+
+        return {name: old for name, old in journal.items() if _journal_value(getattr(self, name, MISSING)) != old}
+
+    def rollbackChanges(self):
+        """Stop recording changes and restore the recorded properties to their original values"""
+        journal, self._changeJournal = self._changeJournal, None
+        if not journal:
+            return
+
+        for name, old in journal.items():
+            if old is MISSING:
+                continue
+
+            setattr(self, name, old)
+
     def __deepcopy__(self, memo):
         return deserialize_model(self.__class__, serialize_model(self, memo, False), self.parent())
 
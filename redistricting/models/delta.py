@@ -24,27 +24,28 @@
 
 from typing import Optional, Union, overload
 
+import numpy as np
 import pandas as pd
 from qgis.PyQt.QtCore import QObject, pyqtSignal
 
 
 class Delta:
-    def __init__(self, district: int, data: pd.DataFrame):
+    def __init__(self, deltaList: "DeltaList", row: int, district):
+        self._list = deltaList
+        self._row = row
         self._district = district
-        self._data = data
 
     def __getitem__(self, index):
-        if isinstance(index, int) and 0 <= index < len(self._data.columns):
-            i = self._data.index.get_loc(self._district)
-            return self._data.iloc[i, index]
+        if isinstance(index, int) and 0 <= index < len(self):
+            return self._list.value(self._row, index)
 
-        if isinstance(index, str) and index in self._data.columns:
-            return self._data.loc[self._district, index]
+        if isinstance(index, str) and index in self._list._columns:  # pylint: disable=protected-access
+            return self._list.value(self._row, self._list._columns[index])  # pylint: disable=protected-access
 
         raise IndexError("Bad delta index")
 
     def __len__(self):
-        return len(self._data.columns)
+        return len(self._list._columns)  # pylint: disable=protected-access
 
     @property
     def district(self):
@@ -56,8 +57,19 @@ class Delta:
 
 
 class DeltaList(QObject):
+    """Pending changes by district, held as a dense matrix of values
+
+    The frame passed to setData/update is copied into a 2D numpy array along with
+    maps from district label to row and column name to column, so that cell access
+    from the table model is a plain array lookup. When an update has the same
+    districts and columns as the current data, only the blocks of rows that actually
+    changed are reported via valuesChanged(top, left, bottom, right) rather than
+    resetting the whole list.
+    """
+
     updateStarted = pyqtSignal()
     updateComplete = pyqtSignal()
+    valuesChanged = pyqtSignal(int, int, int, int)
 
     def __init__(self, parent: Optional[QObject] = None) -> None:
         super().__init__(parent)
@@ -68,29 +80,27 @@ class DeltaList(QObject):
         pass
 
     @overload
-    def __getitem__(self, index: str) -> Union[Delta, pd.Series, None]:
+    def __getitem__(self, index: str) -> Union[Delta, list, None]:
         pass
 
     @overload
     def __getitem__(self, index: tuple[int, int]) -> Union[int, str, float]:
         pass
 
-    def __getitem__(self, index: Union[str, int, tuple[int, int]]) -> Union[int, str, float, pd.Series, Delta, None]:
+    def __getitem__(self, index: Union[str, int, tuple[int, int]]) -> Union[int, str, float, list, Delta, None]:
         if self._data is None:
             return None
 
         if isinstance(index, tuple):
-            row, col = index
-            value = self._data.iat[row, col]  # noqa: PD009
-            return value if not pd.isna(value) else None
+            return self.value(*index)
 
         if isinstance(index, str):
             if index.isnumeric():
                 index = int(index)
-                if index in self._data.index:
-                    return self._deltaDict[index]
-            elif index in self._data.columns:
-                return list(self._data[index])
+                if index in self._rows:
+                    return self._delta[self._rows[index]]
+            elif index in self._columns:
+                return self._values[:, self._columns[index]].tolist()
 
         elif isinstance(index, int):
             return self._delta[index]
@@ -98,13 +108,13 @@ class DeltaList(QObject):
         raise IndexError()
 
     def __len__(self) -> int:
-        return len(self._data) if self._data is not None else 0
+        return len(self._delta)
 
     def __iter__(self):
         return iter(self._delta)
 
     def __bool__(self):
-        return self._data is not None and not self._data.empty
+        return self._values.size > 0
 
     def __eq__(self, other: "DeltaList"):
         if other is None:
@@ -118,14 +128,58 @@ class DeltaList(QObject):
 
         return self._data.equals(other._data)
 
+    @property
+    def columns(self) -> list[str]:
+        return list(self._columns)
+
+    def value(self, row: int, col: int) -> Union[int, float, str, None]:
+        value = self._values[row, col]
+        return None if value is None or value != value else value  # pylint: disable=comparison-with-itself
+
+    def rowValues(self, row: int) -> np.ndarray:
+        return self._values[row]
+
+    @staticmethod
+    def _toMatrix(data: pd.DataFrame) -> np.ndarray:
+        try:
+            return data.to_numpy(dtype=float, na_value=np.nan)
+        except (TypeError, ValueError):
+            return data.to_numpy(dtype=object)
+
+    def _changedBlocks(self, values: np.ndarray):
+        """Compare new values against the current matrix and return a list of
+        (top, left, bottom, right) ranges covering the rows that differ"""
+        if values.dtype == object or self._values.dtype == object:
+            same = (values == self._values) | (pd.isna(values) & pd.isna(self._values))
+        else:
+            same = (values == self._values) | (np.isnan(values) & np.isnan(self._values))
+        changed = ~same
+        rows = np.flatnonzero(changed.any(axis=1))
+        if len(rows) == 0:
+            return []
+
+        blocks = []
+        breaks = np.flatnonzero(np.diff(rows) > 1)
+        starts = np.concatenate(([0], breaks + 1))
+        ends = np.concatenate((breaks, [len(rows) - 1]))
+        for s, e in zip(starts, ends):
+            top, bottom = int(rows[s]), int(rows[e])
+            cols = np.flatnonzero(changed[top : bottom + 1].any(axis=0))
+            blocks.append((top, int(cols[0]), bottom, int(cols[-1])))
+        return blocks
+
     def setData(self, data: Optional[pd.DataFrame]):
         self._data = data
         if data is not None:
-            self._delta = [Delta(d, data) for d in data.index]
-            self._deltaDict = {d.district: d for d in self._delta}
+            self._values = self._toMatrix(data)
+            self._rows = {d: i for i, d in enumerate(data.index)}
+            self._columns = {c: i for i, c in enumerate(data.columns)}
+            self._delta = [Delta(self, i, d) for i, d in enumerate(data.index)]
         else:
+            self._values = np.empty((0, 0))
+            self._rows: dict[int, int] = {}
+            self._columns: dict[str, int] = {}
             self._delta: list[Delta] = []
-            self._deltaDict: dict[int, Delta] = {}
 
     def clear(self):
         self.updateStarted.emit()
@@ -133,6 +187,21 @@ class DeltaList(QObject):
         self.updateComplete.emit()
 
     def update(self, data: pd.DataFrame):
+        if (
+            self._data is not None
+            and data is not None
+            and data.index.equals(self._data.index)
+            and data.columns.equals(self._data.columns)
+        ):
+            values = self._toMatrix(data)
+            if values.dtype == self._values.dtype:
+                blocks = self._changedBlocks(values)
+                self._data = data
+                self._values = values
+                for block in blocks:
+                    self.valuesChanged.emit(*block)
+                return
+
         self.updateStarted.emit()
         self.setData(data)
         self.updateComplete.emit()
@@ -22,10 +22,10 @@
  ***************************************************************************/
 """
 
-from collections.abc import Iterable
-from itertools import repeat
-from typing import Annotated, Any, Literal, Optional, Union, cast, overload
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Annotated, Any, Literal, Optional, SupportsIndex, Union, cast, overload
 
+import numpy as np
 from qgis.PyQt.QtCore import QObject, pyqtSignal
 
 from ..utils import tr
@@ -34,9 +34,257 @@ from .consts import DistrictColumns, MetricsColumns
 from .lists import SortedKeyedList
 
 
-class RdsDistrict(QObject):
+class DistrictStore:
+    """Columnar storage for district attributes -- one numpy array per column and one row per district
+
+    Each RdsDistrict is a view over a row in a store. A standalone district owns a single-row store; when
+    the district is added to a DistrictList, its row is moved into the list's shared store so that the
+    attributes of all the districts in a plan can be read or refreshed a column at a time. A district whose
+    row is already held by another list's store stays a view over that store.
+
+    The numeric base and stats columns are typed arrays with a separate mask marking NULLs, and their values
+    are returned as Python scalars (or None). Other columns are object arrays so that values keep their
+    Python types. A typed column that is given a value it cannot hold exactly becomes an object column.
+
+    The store also tracks which rows have been edited since they were last read from or written to the
+    districts layer, so that saving a plan only has to write the districts that changed.
+    """
+
     BASE_COLUMNS = list(DistrictColumns)
     STATS_COLUMNS = list(MetricsColumns)
+    NUMERIC_COLUMNS: dict[str, type] = {
+        DistrictColumns.DISTRICT: np.int64,
+        DistrictColumns.MEMBERS: np.int64,
+        DistrictColumns.POPULATION: np.int64,
+        DistrictColumns.DEVIATION: np.int64,
+        DistrictColumns.PCT_DEVIATION: np.float64,
+        MetricsColumns.POLSBYPOPPER: np.float64,
+        MetricsColumns.REOCK: np.float64,
+        MetricsColumns.CONVEXHULL: np.float64,
+        MetricsColumns.PIECES: np.int64,
+    }
+
+    def __init__(self, shared: bool = False):
+        self._shared = shared
+        self._columns: dict[str, np.ndarray] = {}
+        self._nulls: dict[str, np.ndarray] = {}
+        self._extra: list[str] = []
+        self._fids = np.empty(0, dtype=np.int64)
+        self._dirty = np.empty(0, dtype=bool)
+        self._views: list["RdsDistrict"] = []
+        self.addColumns(DistrictStore.BASE_COLUMNS + DistrictStore.STATS_COLUMNS)
+
+    def __len__(self):
+        return len(self._views)
+
+    def __contains__(self, column: str):
+        return column in self._columns
+
+    @property
+    def shared(self) -> bool:
+        """whether the store holds the rows of a DistrictList rather than those of a standalone district"""
+        return self._shared
+
+    @property
+    def columns(self) -> list[str]:
+        return self._names
+
+    @property
+    def fids(self) -> np.ndarray:
+        return self._fids
+
+    @property
+    def dirty(self) -> np.ndarray:
+        return self._dirty[: len(self._views)]
+
+    def owns(self, view: "RdsDistrict") -> bool:
+        return view._store is self  # pylint: disable=protected-access
+
+    def addColumns(self, columns: Iterable[str]):
+        capacity = len(self._fids)
+        added = False
+        for c in columns:
+            if c in self._columns:
+                continue
+
+            if c in DistrictStore.NUMERIC_COLUMNS:
+                self._columns[c] = np.zeros(capacity, dtype=DistrictStore.NUMERIC_COLUMNS[c])
+                self._nulls[c] = np.ones(capacity, dtype=bool)
+            else:
+                self._columns[c] = np.full(capacity, None, dtype=object)
+            if c not in DistrictStore.BASE_COLUMNS and c not in DistrictStore.STATS_COLUMNS:
+                self._extra.append(c)
+            added = True
+
+        if added:
+            self._names = [
+                *(c for c in DistrictStore.BASE_COLUMNS if c in self._columns),
+                *self._extra,
+                *(c for c in DistrictStore.STATS_COLUMNS if c in self._columns),
+            ]
+
+    def _grow(self):
+        capacity = len(self._fids)
+        size = max(4, capacity * 2)
+        for c, column in self._columns.items():
+            if c in self._nulls:
+                self._columns[c] = np.concatenate((column, np.zeros(size - capacity, dtype=column.dtype)))
+                self._nulls[c] = np.concatenate((self._nulls[c], np.ones(size - capacity, dtype=bool)))
+            else:
+                self._columns[c] = np.concatenate((column, np.full(size - capacity, None, dtype=object)))
+        self._fids = np.concatenate((self._fids, np.full(size - capacity, -1, dtype=np.int64)))
+        self._dirty = np.concatenate((self._dirty, np.zeros(size - capacity, dtype=bool)))
+
+    def _toObject(self, column: str):
+        """convert a typed column to an object column, e.g. when it is assigned a value it cannot hold"""
+        nulls = self._nulls.pop(column)
+        data = np.empty(len(nulls), dtype=object)
+        data[:] = self._columns[column].tolist()
+        data[nulls] = None
+        self._columns[column] = data
+
+    def _typed(self, column: str, values: Sequence[Any]) -> Optional[np.ndarray]:
+        """the non-null values converted to the dtype of a typed column, or None if they don't fit"""
+        dtype = self._columns[column].dtype
+        try:
+            data = np.asarray(values)
+        except (TypeError, ValueError):
+            return None
+
+        if data.dtype.kind in "biu":
+            return data.astype(dtype)
+        if data.dtype.kind == "f" and (dtype.kind == "f" or np.array_equal(data, np.trunc(data))):
+            return data.astype(dtype)
+        return None
+
+    def _write(self, row: int, column: str, value: Any):
+        if column in self._nulls:
+            if value is None:
+                self._nulls[column][row] = True
+                return
+
+            data = self._typed(column, [value])
+            if data is not None:
+                self._columns[column][row] = data[0]
+                self._nulls[column][row] = False
+                return
+
+            self._toObject(column)
+
+        self._columns[column][row] = value
+
+    def append(self, view: "RdsDistrict", data: Mapping[str, Any], fid: int = -1, dirty: Optional[bool] = None):
+        self.addColumns(data.keys())
+
+        row = len(self._views)
+        if row == len(self._fids):
+            self._grow()
+
+        for c, v in data.items():
+            self._write(row, c, v)
+        self._fids[row] = fid
+        # a district that has no feature in the districts layer yet needs to be written
+        self._dirty[row] = fid < 0 if dirty is None else dirty
+        self._views.append(view)
+
+        view._store = self  # pylint: disable=protected-access
+        view._row = row  # pylint: disable=protected-access
+
+    def remove(self, row: int):
+        """remove a row by moving the last row into its place"""
+        last = len(self._views) - 1
+        if row != last:
+            for column in self._columns.values():
+                column[row] = column[last]
+            for nulls in self._nulls.values():
+                nulls[row] = nulls[last]
+            self._fids[row] = self._fids[last]
+            self._dirty[row] = self._dirty[last]
+            view = self._views[last]
+            view._row = row  # pylint: disable=protected-access
+            self._views[row] = view
+
+        for c, column in self._columns.items():
+            if c in self._nulls:
+                self._nulls[c][last] = True
+            else:
+                column[last] = None
+        self._fids[last] = -1
+        self._dirty[last] = False
+        self._views.pop()
+
+    def adopt(self, view: "RdsDistrict"):
+        """move the row of a standalone district into this store
+
+        A district whose row is held by another list's store is left where it is -- it remains a view over
+        that store and any list it belongs to reads and writes it there.
+        """
+        store: DistrictStore = view._store  # pylint: disable=protected-access
+        if store is self or store.shared:
+            return
+
+        row: int = view._row  # pylint: disable=protected-access
+        data = store.row(row)
+        fid = int(store.fids[row])
+        dirty = bool(store.dirty[row])
+        store.remove(row)
+        self.append(view, data, fid, dirty)
+
+    def detach(self, view: "RdsDistrict"):
+        """move the district's row out of this store into a private store of its own"""
+        if not self.owns(view):
+            return
+
+        DistrictStore().adopt(view)
+
+    def get(self, row: int, column: str) -> Any:
+        if column in self._nulls:
+            return None if self._nulls[column][row] else self._columns[column][row].item()
+
+        return self._columns[column][row]
+
+    def set(self, row: int, column: str, value: Any):
+        if column not in self._columns:
+            self.addColumns([column])
+
+        if self.get(row, column) != value:
+            self._write(row, column, value)
+            self._dirty[row] = True
+
+    def setDirty(self, row: int, dirty: bool = True):
+        self._dirty[row] = dirty
+
+    def row(self, row: int) -> dict[str, Any]:
+        return {c: self.get(row, c) for c in self._names}
+
+    def setRow(self, row: int, data: Mapping[str, Any]):
+        self.addColumns(data.keys())
+        for c, v in data.items():
+            self._write(row, c, v)
+
+    def assign(self, rows: np.ndarray, column: str, values: Sequence[Any]):
+        if column not in self._columns:
+            self.addColumns([column])
+
+        data = np.empty(len(rows), dtype=object)
+        data[:] = values
+
+        if column in self._nulls:
+            nulls = np.fromiter((v is None for v in data), dtype=bool, count=len(data))
+            typed = self._typed(column, data[~nulls].tolist())
+            if typed is not None:
+                self._columns[column][rows[~nulls]] = typed
+                self._nulls[column][rows] = nulls
+                return
+
+            self._toObject(column)
+
+        self._columns[column][rows] = data
+
+
+class RdsDistrict(QObject):
+    BASE_COLUMNS = DistrictStore.BASE_COLUMNS
+    STATS_COLUMNS = DistrictStore.STATS_COLUMNS
     WRITABLE_ATTRIBUTES = (
         DistrictColumns.NAME,
         int(DistrictColumns.NAME),
@@ -55,7 +303,6 @@ class RdsDistrict(QObject):
     deviation: int = 0
     pct_deviation: float = 0.0
     description: str = rds_property(private=True, notify=descriptionChanged)
-    fid: int = -1
 
     def __init__(
         self,
@@ -67,17 +314,21 @@ class RdsDistrict(QObject):
         **kwargs,
     ):
         super().__init__()
-        self.fid = fid
-        self._data = {
-            DistrictColumns.DISTRICT: district,
-            DistrictColumns.NAME: name or str(district),
-            DistrictColumns.MEMBERS: members,
-            DistrictColumns.POPULATION: 0,
-            DistrictColumns.DEVIATION: 0,
-            DistrictColumns.PCT_DEVIATION: 0.0,
-        }
+        self._store: DistrictStore = None
+        self._row = -1
+        DistrictStore().append(
+            self,
+            {
+                DistrictColumns.DISTRICT: district,
+                DistrictColumns.NAME: name or str(district),
+                DistrictColumns.MEMBERS: members,
+                DistrictColumns.POPULATION: 0,
+                DistrictColumns.DEVIATION: 0,
+                DistrictColumns.PCT_DEVIATION: 0.0,
+            },
+            fid,
+        )
         self._description = description
-        self._data.update(zip(RdsDistrict.STATS_COLUMNS, repeat(None)))
 
         self.update(kwargs)
 
@@ -91,10 +342,10 @@ class RdsDistrict(QObject):
         return self.district
 
     def clone(self):
-        return self.__class__(fid=self.fid, description=self.description, **self._data)
+        return self.__class__(fid=self.fid, description=self.description, **self[:])
 
     def __contains__(self, index: str):
-        return index in self._data
+        return index in self._store
 
     @overload
     def __getitem__(self, index: Union[str, int]) -> Any: ...
@@ -103,13 +354,13 @@ class RdsDistrict(QObject):
     def __getitem__(self, index: slice) -> dict[str, Any]: ...
 
     def __getitem__(self, key: Union[int, str, slice]):
-        if isinstance(key, str) and key in self._data:
-            value = self._data[key]
-        elif isinstance(key, int) and 0 <= key < len(self._data):
-            value = list(self._data.values())[key]
+        store = self._store
+        if isinstance(key, str) and key in store:
+            value = store.get(self._row, key)
+        elif isinstance(key, int) and 0 <= key < len(store.columns):
+            value = store.get(self._row, store.columns[key])
         elif isinstance(key, slice):
-            keys = list(self._data.keys())[key]
-            value = {k: self._data[k] for k in keys}
+            value = {k: store.get(self._row, k) for k in store.columns[key]}
         else:
             raise IndexError(f"{key} not found in district")
 
@@ -120,12 +371,12 @@ class RdsDistrict(QObject):
             raise IndexError(f"Field '{key}' is readonly")
 
         if isinstance(key, int):
-            if 0 <= key < len(self._data):
-                key = list(self._data.keys())[key]
+            if 0 <= key < len(self._store.columns):
+                key = self._store.columns[key]
             else:
                 raise IndexError(f"no item at index {key}")
 
-        self._data[key] = value
+        self._store.set(self._row, key, value)
 
     def __eq__(self, __value: "RdsDistrict"):
         if __value is None:
@@ -134,76 +385,95 @@ class RdsDistrict(QObject):
         if not isinstance(__value, RdsDistrict):
             return NotImplemented
 
-        return self._data == __value._data
+        return self[:] == __value[:]
 
     def __hash__(self):
         return hash(
             (
                 self.fid,
                 self.description,
-                *tuple(self._data.items()),
+                *tuple(self[:].items()),
             )
         )
 
     def __getattr__(self, name):
-        if name in self._data:
-            return self._data[name]
+        store: DistrictStore = self.__dict__.get("_store")
+        if store is not None and name in store:
+            return store.get(self._row, name)
 
         return super().__getattr__(name)
 
+    @property
+    def fid(self) -> int:
+        return int(self._store.fids[self._row])
+
+    @fid.setter
+    def fid(self, value: int):
+        self._store.fids[self._row] = value
+
     @Property
     def district(self) -> int:
-        return self._data[DistrictColumns.DISTRICT]
+        return self._store.get(self._row, DistrictColumns.DISTRICT)
 
     @cast("Property[str]", name).getter
     def name(self) -> str:
-        return self._data[DistrictColumns.NAME]
+        return self._store.get(self._row, DistrictColumns.NAME)
 
     @name.setter
     def name(self, value: str):
-        self._data[DistrictColumns.NAME] = value
+        self._store.set(self._row, DistrictColumns.NAME, value)
 
     @cast("Property[int]", members).getter
     def members(self) -> int:
-        return self._data[DistrictColumns.MEMBERS]
+        return self._store.get(self._row, DistrictColumns.MEMBERS)
 
     @members.setter
     def members(self, value: int):
-        self._data[DistrictColumns.MEMBERS] = value
+        self._store.set(self._row, DistrictColumns.MEMBERS, value)
 
     @Property
     def population(self) -> int:
-        return self._data[DistrictColumns.POPULATION]
+        return self._store.get(self._row, DistrictColumns.POPULATION)
 
     @population.setter
     def population(self, value: int):
-        self._data[DistrictColumns.POPULATION] = value
+        self._store.set(self._row, DistrictColumns.POPULATION, value)
 
     @Property
     def deviation(self) -> int:
-        return self._data[DistrictColumns.DEVIATION]
+        return self._store.get(self._row, DistrictColumns.DEVIATION)
 
     @deviation.setter
     def deviation(self, value: int):
-        self._data[DistrictColumns.DEVIATION] = value
+        self._store.set(self._row, DistrictColumns.DEVIATION, value)
 
     @Property
     def pct_deviation(self) -> float:
-        return self._data[DistrictColumns.PCT_DEVIATION]
+        return self._store.get(self._row, DistrictColumns.PCT_DEVIATION)
 
     @pct_deviation.setter
     def pct_deviation(self, value: float):
-        self._data[DistrictColumns.PCT_DEVIATION] = value
+        self._store.set(self._row, DistrictColumns.PCT_DEVIATION, value)
+
+    @cast("Property[str]", description).setter
+    def description(self, value: str):
+        if value != self._description:
+            self._description = value
+            self._store.setDirty(self._row)
 
     @property
     def columns(self):
-        return list(self._data.keys())
+        return list(self._store.columns)
+
+    def isDirty(self) -> bool:
+        """Whether the district has been edited since it was last read from or written to the districts layer"""
+        return bool(self._store.dirty[self._row])
+
+    def setClean(self):
+        self._store.setDirty(self._row, False)
 
     def extend(self, columns: Iterable[str]):
-        data = self._data
-        addcols = [c for c in columns if c not in RdsDistrict.BASE_COLUMNS and c not in RdsDistrict.STATS_COLUMNS]
-        self._data = dict.fromkeys(RdsDistrict.BASE_COLUMNS + addcols + RdsDistrict.STATS_COLUMNS)
-        self._data.update(data)
+        self._store.addColumns(columns)
 
     @overload
     def update(self, data: "RdsDistrict"): ...
@@ -214,10 +484,14 @@ class RdsDistrict(QObject):
     def update(self, data: Union["RdsDistrict", dict[str, Any]]):
         if isinstance(data, RdsDistrict):
             self.fid = data.fid
+            self._store.setDirty(self._row, data.isDirty())
             data = data[:]
 
-        newkeys = [k for k in data.keys() if k not in RdsDistrict.BASE_COLUMNS + RdsDistrict.STATS_COLUMNS]
-        self._data = dict.fromkeys(RdsDistrict.BASE_COLUMNS + newkeys + RdsDistrict.STATS_COLUMNS) | self._data | data
+        self._store.setRow(self._row, data)
+        self._resetReadonly()
+
+    def _resetReadonly(self):
+        """restore any attributes that are fixed for this kind of district after a bulk update"""
 
 
 class RdsUnassigned(RdsDistrict):
@@ -241,18 +515,110 @@ class RdsUnassigned(RdsDistrict):
     def __setitem__(self, key: Union[str, int, slice], value: Any):
         raise IndexError(tr("'{key}' field is readonly for Unassigned goegraphies").format(key=key))
 
-    def update(self, data: Union["RdsDistrict", dict[str, Any]]):
-        super().update(data)
+    def _resetReadonly(self):
+        self._store.setRow(
+            self._row,
+            {
+                DistrictColumns.NAME: tr("Unassigned"),
+                DistrictColumns.MEMBERS: None,
+                DistrictColumns.DEVIATION: None,
+                DistrictColumns.PCT_DEVIATION: None,
+                **dict.fromkeys(RdsDistrict.STATS_COLUMNS),
+            },
+        )
 
-        self._data[DistrictColumns.NAME] = tr("Unassigned")
-        self._data[DistrictColumns.MEMBERS] = None
-        self._data[DistrictColumns.DEVIATION] = None
-        self._data[DistrictColumns.PCT_DEVIATION] = None
 
-        self._data.update(zip(RdsDistrict.STATS_COLUMNS, repeat(None)))
+class DistrictList(SortedKeyedList[int, RdsDistrict]):  # pylint: disable=abstract-method
+    def __init__(
+        self,
+        iterable: Optional[Iterable[RdsDistrict]] = None,
+        *,
+        key=None,
+        elem_type: Optional[type[RdsDistrict]] = None,
+    ):
+        self._store = DistrictStore(shared=True)
+        super().__init__(iterable, key=key, elem_type=elem_type)
 
+    @overload
+    def __getitem__(self, index: SupportsIndex) -> RdsDistrict: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "DistrictList": ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            # build the slice through insert so that it is set up like any other list -- its districts
+            # remain views over the rows in this list's store
+            return self.__class__((self._items[k] for k in self._keys[index]), key=self._keyfunc)
+
+        return super().__getitem__(index)
+
+    def insert(self, index, value: RdsDistrict):
+        super().insert(index, value)
+        self._store.adopt(value)
+
+    def set(self, key: int, value: RdsDistrict):
+        old = self._items.get(key)
+        super().set(key, value)
+        if old is not None and old is not value:
+            self._store.detach(old)
+        self._store.adopt(value)
+
+    def __delitem__(self, index):
+        removed = list(self[index]) if isinstance(index, slice) else [self[index]]
+        super().__delitem__(index)
+        for district in removed:
+            self._store.detach(district)
+
+    def updateData(
+        self, districts: Sequence[int], data: Mapping[str, Sequence[Any]], fids: Optional[Sequence[int]] = None
+    ):
+        """refresh the attributes of the given districts a column at a time
+
+        Args:
+            districts: district numbers of the rows in data
+            data: mapping of column name to the column values, in the same order as districts
+            fids: feature ids of the districts in the district layer
+        """
+        store = self._store
+        views = [self._items[d] for d in districts]
+        owned = np.fromiter((store.owns(v) for v in views), dtype=bool, count=len(views))
+        rows = np.fromiter(
+            (v._row for v in views),  # pylint: disable=protected-access
+            dtype=np.intp,
+            count=len(views),
+        )
+        if not owned.all():
+            # districts whose rows are held by another list's store are refreshed one at a time
+            for i in np.flatnonzero(~owned):
+                view = views[i]
+                view.update({column: values[i] for column, values in data.items()})
+                if fids is not None:
+                    view.fid = fids[i]
+                view.setClean()
+
+            index = np.flatnonzero(owned)
+            data = {column: [values[i] for i in index] for column, values in data.items()}
+            if fids is not None:
+                fids = [fids[i] for i in index]
+            rows = rows[index]
+
+        for column, values in data.items():
+            store.assign(rows, column, values)
+
+        if fids is not None:
+            store.fids[rows] = fids
+
+        # the refreshed rows now match the districts layer
+        store.dirty[rows] = False
+
+        if 0 in self._items:
+            self._items[0]._resetReadonly()  # pylint: disable=protected-access
+
+    def dirtyDistricts(self) -> list[RdsDistrict]:
+        """districts that have been edited since they were last read from or written to the districts layer"""
+        return [d for d in self if d.isDirty()]
 
-class DistrictList(SortedKeyedList[int, RdsDistrict]):  # pylint: disable=abstract-method
     def clear(self):
         addUnassigned = 0 in self._keys
 
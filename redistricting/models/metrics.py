@@ -27,19 +27,26 @@ from collections.abc import Mapping, Sequence
 from statistics import StatisticsError, mean
 from typing import TYPE_CHECKING, Optional, Union
 
-import geopandas as gpd
 import pandas as pd
-import pyproj
 from qgis.PyQt.QtCore import Qt
 from qgis.PyQt.QtGui import QColor
 
 from ..utils import spatialite_connect, tr
 from ..utils.misc import quote_identifier
 from .consts import ConstStr, DeviationType, DistrictColumns, MetricsColumns
-from .metricslist import MetricLevel, MetricTriggers, RdsAggregateMetric, RdsMetric, register_metrics
+from .metricslist import (
+    MetricContext,
+    MetricLevel,
+    MetricTriggers,
+    RdsAggregateMetric,
+    RdsMetric,
+    register_metrics,
+)
 from .validators import validators
 
 if TYPE_CHECKING:
+    import geopandas as gpd
+
     from .plan import RdsPlan
 
 # pylint: disable=unused-argument
@@ -55,7 +62,7 @@ class RdsTotalPopulationMetric(
         self,
         populationData: pd.DataFrame,
         districtData: pd.DataFrame,
-        geometry: gpd.GeoSeries,
+        geometry: "gpd.GeoSeries",
         plan: "RdsPlan",
         **depends,
     ):
@@ -84,21 +91,17 @@ class RdsDeviationMetric(
         self,
         populationData: pd.DataFrame,
         districtData: pd.DataFrame,
-        geometry: gpd.GeoSeries,
+        geometry: "gpd.GeoSeries",
         plan: "RdsPlan",
         *,
         totalPopulation: int = 0,
         **depends,
     ):
-        if populationData is not None and plan is not None:
+        if districtData is not None and plan is not None:
             idealPerMember = round(totalPopulation / plan.numSeats)
 
-            self._value = (
-                populationData[[plan.distField, DistrictColumns.POPULATION]]
-                .groupby(plan.distField)
-                .sum()[DistrictColumns.POPULATION]
-                .sub(districtData["members"] * idealPerMember)
-            )
+            # the district totals have already been summed by the district update
+            self._value = districtData[DistrictColumns.POPULATION].sub(districtData["members"] * idealPerMember)
 
     def format(self, idx=None) -> str:
         if self._value is None:
@@ -128,7 +131,7 @@ class RdsPctDeviationMetric(
         self,
         populationData: pd.DataFrame,
         districtData: pd.DataFrame,
-        geometry: gpd.GeoSeries,
+        geometry: "gpd.GeoSeries",
         plan: "RdsPlan",
         *,
         totalPopulation: int = 0,
@@ -195,7 +198,7 @@ class RdsPlanDeviationMetric(
 
 
 class CeaProjMetric(
-    RdsMetric[gpd.GeoSeries],
+    RdsMetric["gpd.GeoSeries"],
     mname="cea_proj",
     level=MetricLevel.DISTRICT,
     triggers=MetricTriggers.ON_UPDATE_GEOMETRY,
@@ -206,10 +209,12 @@ class CeaProjMetric(
         self,
         populationData: pd.DataFrame,
         districtData: pd.DataFrame,
-        geometry: gpd.GeoSeries,
+        geometry: "gpd.GeoSeries",
         plan: "RdsPlan",
         **depends,
     ):
+        import pyproj  # pylint: disable=import-outside-toplevel # noqa: PLC0415
+
         cea_crs = pyproj.CRS("+proj=cea")
         self._value: gpd.GeoSeries = geometry.geometry.to_crs(cea_crs)
 
@@ -350,10 +355,10 @@ class RdsPolsbyPopper(RdsCompactnessMetric, score=MetricsColumns.POLSBYPOPPER):
         self,
         populationData: pd.DataFrame,
         districtData: pd.DataFrame,
-        geometry: gpd.GeoSeries,
+        geometry: "gpd.GeoSeries",
         plan: "RdsPlan",
         *,
-        cea_proj: gpd.GeoSeries = None,
+        cea_proj: "gpd.GeoSeries" = None,
         **depends,
     ):
         if cea_proj is None:
@@ -405,7 +410,7 @@ class RdsAggScores(RdsMetric, mname="__agg_compactness", level=MetricLevel.PLANW
         self,
         populationData: pd.DataFrame,
         districtData: pd.DataFrame,
-        geometry: gpd.GeoSeries,
+        geometry: "gpd.GeoSeries",
         plan: "RdsPlan",
         **depends,
     ):
@@ -436,10 +441,10 @@ class RdsReock(RdsCompactnessMetric, score=MetricsColumns.REOCK):
         self,
         populationData: pd.DataFrame,
         districtData: pd.DataFrame,
-        geometry: gpd.GeoSeries,
+        geometry: "gpd.GeoSeries",
         plan: "RdsPlan",
         *,
-        cea_proj: gpd.GeoSeries = None,
+        cea_proj: "gpd.GeoSeries" = None,
         **depends,
     ):
         if cea_proj is None:
@@ -482,10 +487,10 @@ class RdsConvexHull(RdsCompactnessMetric, score=MetricsColumns.CONVEXHULL):
         self,
         populationData: pd.DataFrame,
         districtData: pd.DataFrame,
-        geometry: gpd.GeoSeries,
+        geometry: "gpd.GeoSeries",
         plan: "RdsPlan",
         *,
-        cea_proj: gpd.GeoSeries = None,
+        cea_proj: "gpd.GeoSeries" = None,
         **depends,
     ):
         if cea_proj is None:
@@ -538,14 +543,41 @@ class RdsCutEdges(
     def caption(self):
         return tr("Cut Edges")
 
-    def calculate(
+    @staticmethod
+    def unitAdjacency(plan: "RdsPlan") -> pd.DataFrame:
+        """pairs of geoids of the units of the plan that are adjacent at more than a point, each pair listed once"""
+        with spatialite_connect(plan.geoPackagePath) as db:
+            sql = f"""SELECT a.{quote_identifier(plan.geoIdField)}, b.{quote_identifier(plan.geoIdField)}
+                FROM assignments a JOIN assignments b
+                ON b.{quote_identifier(plan.geoIdField)} > a.{quote_identifier(plan.geoIdField)}
+                AND b.fid IN (
+                    SELECT id FROM rtree_assignments_geometry r
+                    WHERE r.minx <= st_maxx(a.geometry) and r.maxx >= st_minx(a.geometry)
+                    AND r.miny <= st_maxy(a.geometry) and r.maxy >= st_miny(a.geometry)
+                )
+                AND st_relate(a.geometry, b.geometry, 'F***1****')"""  # noqa: S608
+
+            return pd.DataFrame(db.execute(sql).fetchall(), columns=["a", "b"])
+
+    def calculate(  # noqa: PLR0913
         self,
         populationData: pd.DataFrame,
         districtData: pd.DataFrame,
-        geometry: gpd.GeoSeries,
+        geometry: "gpd.GeoSeries",
         plan: "RdsPlan",
+        *,
+        context: Optional[MetricContext] = None,
         **depends,
     ):
+        if context is not None and context.adjacency is not None:
+            # count the adjacent pairs of units assigned to different districts
+            # without going back to the assignments stored in the GeoPackage
+            districts = populationData[plan.distField]
+            a = districts.reindex(context.adjacency["a"]).to_numpy()
+            b = districts.reindex(context.adjacency["b"]).to_numpy()
+            self._value = int((a != b).sum())
+            return
+
         with spatialite_connect(plan.geoPackagePath) as db:
             # select count of unit pairs where
             #   1) assigned districts are different (also takes care of excluding unassigned units from count),
@@ -595,7 +627,7 @@ class RdsContiguityMetric(RdsBoolMetric, mname="contiguity", triggers=MetricTrig
         self,
         populationData: pd.DataFrame,
         districtData: pd.DataFrame,
-        geometry: gpd.GeoSeries,
+        geometry: "gpd.GeoSeries",
         plan: "RdsPlan",
         **depends,
     ):
@@ -619,17 +651,20 @@ class RdsCompleteMetric(RdsBoolMetric, mname="complete", triggers=MetricTriggers
         self,
         populationData: pd.DataFrame,
         districtData: pd.DataFrame,
-        geometry: gpd.GeoSeries,
+        geometry: "gpd.GeoSeries",
         plan: "RdsPlan",
+        *,
+        context: Optional[MetricContext] = None,
         **depends,
     ):
         if plan is None:
             self._value = False
         else:
-            self._value = (
-                populationData[populationData[plan.distField] == 0].empty
-                and populationData[plan.distField].nunique() == plan.numDistricts
-            )
+            if context is None:
+                context = MetricContext(populationData, plan)
+
+            counts = context.districtUnitCounts
+            self._value = bool(0 not in counts.index and len(counts) == plan.numDistricts)
 
     def tooltip(self, idx=None):
         if self._value:
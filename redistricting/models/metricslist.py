@@ -27,6 +27,7 @@ from collections import defaultdict
 from collections.abc import Iterable, Iterator, Mapping
 from copy import copy
 from enum import Enum, IntFlag, auto
+from functools import cached_property
 from numbers import Integral, Real
 from types import GenericAlias
 from typing import (
@@ -43,7 +44,6 @@ from typing import (
     overload,
 )
 
-import geopandas as gpd
 import pandas as pd
 from qgis.core import QgsField
 from qgis.PyQt.QtCore import QMetaType, QObject, pyqtSignal
@@ -51,10 +51,13 @@ from qgis.PyQt.QtGui import QColor
 
 from ..utils import camel_to_kebab, kebab_to_camel, tr
 from .base import Property, RdsBaseModel, rds_property
+from .consts import DistrictColumns
 from .lists import KeyedList
 from .serialization import deserialize_value, serialize_value
 
 if TYPE_CHECKING:
+    import geopandas as gpd
+
     from .plan import RdsPlan
 
 
@@ -72,6 +75,52 @@ class MetricLevel(Enum):
     DISTRICT = auto()
 
 
+class MetricContext:
+    """Shared, lazily computed aggregations of the unit-level data for a single metrics update
+
+    Metrics that need the same grouping of the population data (e.g. totals by geography and district)
+    read it from the context so that the groupby is computed once per update rather than once per metric.
+    District totals are not aggregated here -- the district update has already summed them in districtData.
+
+    When the same units are scored under many different assignments, the context can also carry
+    the unit adjacency pairs so that metrics can be computed without querying the plan's GeoPackage.
+    """
+
+    def __init__(
+        self,
+        populationData: Optional[pd.DataFrame],
+        plan: Optional["RdsPlan"],
+        adjacency: Optional[pd.DataFrame] = None,
+    ):
+        self.populationData = populationData
+        self.plan = plan
+        self.adjacency = adjacency
+        self._geoDistrictSums: dict[str, pd.DataFrame] = {}
+
+    @cached_property
+    def sumColumns(self) -> list[str]:
+        if self.populationData is None or DistrictColumns.POPULATION not in self.populationData.columns:
+            return []
+
+        return [DistrictColumns.POPULATION, *self.plan.popFields.keys(), *self.plan.dataFields.keys()]
+
+    @cached_property
+    def districtUnitCounts(self) -> pd.Series:
+        """number of units assigned to each district"""
+        return self.populationData[self.plan.distField].value_counts(sort=False)
+
+    def geoDistrictSums(self, field: str) -> pd.DataFrame:
+        """population and data field totals by geography and district, indexed by (geoid, district)"""
+        if field not in self._geoDistrictSums:
+            self._geoDistrictSums[field] = (
+                self.populationData[[field, self.plan.distField, *self.sumColumns]]
+                .groupby([field, self.plan.distField])
+                .sum()
+            )
+
+        return self._geoDistrictSums[field]
+
+
 T = TypeVar("T")
 
 
@@ -136,7 +185,7 @@ class RdsMetric(Generic[T], RdsBaseModel):
         self,
         populationData: pd.DataFrame,
         districtData: pd.DataFrame,
-        geometry: gpd.GeoSeries,
+        geometry: "gpd.GeoSeries",
         plan: "RdsPlan",
         **depends,
     ): ...
@@ -215,7 +264,7 @@ class RdsAggregateMetric(RdsMetric[T], mname="__aggregate"):
         self,
         populationData: pd.DataFrame,
         districtData: pd.DataFrame,
-        geometry: gpd.GeoSeries,
+        geometry: "gpd.GeoSeries",
         plan: "RdsPlan",
         values: Iterable[Any],
     ) -> Any: ...
@@ -224,7 +273,7 @@ class RdsAggregateMetric(RdsMetric[T], mname="__aggregate"):
         self,
         populationData: pd.DataFrame,
         districtData: pd.DataFrame,
-        geometry: gpd.GeoSeries,
+        geometry: "gpd.GeoSeries",
         plan: "RdsPlan",
         **depends,
     ):
@@ -26,7 +26,7 @@ import pathlib
 from contextlib import contextmanager
 from itertools import repeat
 from math import ceil, floor
-from typing import Annotated, Optional, Union, cast, overload
+from typing import Annotated, Callable, Optional, Union, cast, overload
 from uuid import UUID, uuid4
 
 from qgis.core import QgsVectorLayer
@@ -114,6 +114,12 @@ class RdsPlan(RdsBaseModel):
     )
 
     districts: DistrictList = rds_property(private=True, serialize=False, factory=DistrictList)
+
+    @cast("Property[DistrictList]", districts).getter
+    def districts(self) -> DistrictList:
+        self.loadDeferredDistricts()
+        return self._districts
+
     metrics: RdsMetrics = rds_property(private=True, factory=RdsMetrics)
 
     distField: Annotated[str, isidentifier] = rds_property(private=True, default="district")
@@ -243,6 +249,7 @@ class RdsPlan(RdsBaseModel):
     id: UUID = rds_property(private=True, readonly=True, factory=uuid4)
 
     def __pre_init__(self):
+        self._districtLoader = None
         self._geoLayer = None
         self._popLayer = None
         self._distField = None
@@ -252,6 +259,24 @@ class RdsPlan(RdsBaseModel):
         self.districts.append(self.createDistrict(0))
         self.metrics.metricsChanged.connect(self.metricsChanged)
 
+    def setDistrictLoader(self, loader: Optional[Callable[["RdsPlan"], None]]):
+        """Defer reading the plan's districts until they are first accessed
+
+        The loader is called once, with the plan as its only argument, the first
+        time the districts property is read.
+        """
+        self._districtLoader = loader
+
+    @property
+    def districtsLoaded(self) -> bool:
+        return self._districtLoader is None
+
+    def loadDeferredDistricts(self):
+        """Run the deferred district loader, if one is pending"""
+        if self._districtLoader is not None:
+            loader, self._districtLoader = self._districtLoader, None
+            loader(self)
+
     @property
     def totalPopulation(self) -> int:
         return self.metrics.totalPopulation or 0
@@ -27,12 +27,21 @@ from collections.abc import Sequence
 from functools import partial
 from typing import Any, Optional, Union
 
+import numpy as np
 import pandas as pd
 from qgis.PyQt.QtCore import pyqtSignal
 
 from .base import Factory, RdsBaseModel, rds_property
 
 
+def _rowsFor(data: pd.DataFrame, key) -> Union[slice, np.ndarray, int]:
+    loc = data.index.get_loc(key)
+    if isinstance(loc, np.ndarray) and loc.dtype == bool:
+        return np.flatnonzero(loc)
+
+    return loc
+
+
 class RdsSplitBase:
     def __init__(
         self, parent: Union["RdsSplitBase", "RdsSplits"], data: pd.DataFrame, idx: Union[str, tuple[str, int]]
@@ -52,6 +61,16 @@ class RdsSplitBase:
 
 
 class RdsSplitDistrict(RdsSplitBase):
+    def __init__(
+        self,
+        parent: "RdsSplitGeography",
+        data: pd.DataFrame,
+        idx: tuple[str, int],
+        row: Optional[int] = None,
+    ):
+        super().__init__(parent, data, idx)
+        self._row = _rowsFor(data, idx) if row is None else row
+
     def __len__(self) -> int:
         return len(self._data.columns) + 1 - int("__name" in self._data.columns)
 
@@ -60,8 +79,7 @@ class RdsSplitDistrict(RdsSplitBase):
             return self.district
 
         if 0 < index < len(self._data.columns):
-            col = self._data.columns[index - 1]
-            return self._data.loc[self._idx, col]
+            return self._data.iat[self._row, index - 1]  # noqa: PD009
 
         raise IndexError()
 
@@ -82,19 +100,41 @@ class RdsSplitDistrict(RdsSplitBase):
 
 
 class RdsSplitGeography(RdsSplitBase):
-    def __init__(self, parent: "RdsSplits", data: pd.DataFrame, idx: str):
+    """A split geography -- the rows for the geography's districts and their attributes are only
+    materialized when they are requested"""
+
+    def __init__(
+        self,
+        parent: "RdsSplits",
+        data: pd.DataFrame,
+        idx: str,
+        rows: Optional[Union[slice, np.ndarray]] = None,
+    ):
         super().__init__(parent, data, idx)
-        self._districts = list(data.loc[idx].index)
-        self._splits = [RdsSplitDistrict(self, data, (idx, d)) for d in self._districts]
-        self._attributes = [
-            f"{self.name} ({self.geoid})" if "__name" in self._data.columns else self.geoid,
-            ", ".join(data.loc[idx].index.astype(str)),
-        ]
+        if rows is None:
+            rows = _rowsFor(data, idx)
+        if isinstance(rows, slice):
+            self._positions = np.arange(rows.start or 0, rows.stop)
+        else:
+            self._positions = np.atleast_1d(rows)
+        self._splits: dict[int, RdsSplitDistrict] = {}
+        self._districts: Optional[list[int]] = None
+        self._attributes: Optional[list[str]] = None
 
     def __len__(self):
-        return len(self._splits)
+        return len(self._positions)
 
     def __getitem__(self, index) -> RdsSplitDistrict:
+        if index < 0:
+            index += len(self._positions)
+        if not 0 <= index < len(self._positions):
+            raise IndexError()
+
+        if index not in self._splits:
+            self._splits[index] = RdsSplitDistrict(
+                self, self._data, (self._idx, self.districts[index]), int(self._positions[index])
+            )
+
         return self._splits[index]
 
     @property
@@ -103,23 +143,84 @@ class RdsSplitGeography(RdsSplitBase):
 
     @property
     def districts(self):
+        if self._districts is None:
+            self._districts = list(self._data.index.get_level_values(1)[self._positions])
+
         return self._districts
 
     @property
     def name(self):
         if "__name" in self._data.columns:
-            i = self._data.columns.get_loc(
-                "__name",
-            )
-            return self._data.loc[self._idx].iat[0, i]  # noqa: PD009
+            return self._data["__name"].iat[self._positions[0]]  # noqa: PD009
 
         return ""
 
     @property
     def attributes(self):
+        if self._attributes is None:
+            self._attributes = [
+                f"{self.name} ({self.geoid})" if "__name" in self._data.columns else self.geoid,
+                ", ".join(str(d) for d in self.districts),
+            ]
+
         return self._attributes
 
 
+class RdsSplitGeographies(Sequence[RdsSplitGeography]):
+    """Lazy sequence of the split geographies in an RdsSplits
+
+    Group boundaries are computed once when the splits data is set; RdsSplitGeography objects
+    are created (and cached so that Qt model indexes can hold on to them) as they are accessed.
+    """
+
+    def __init__(self, splits: "RdsSplits", data: Optional[pd.DataFrame]):
+        self._splits = splits
+        self._cache: dict[int, RdsSplitGeography] = {}
+
+        if data is None or data.empty:
+            self._data = data
+            self._geoids = pd.Index([])
+            self._bounds = np.zeros(1, dtype=np.intp)
+            return
+
+        codes, geoids = pd.factorize(data.index.get_level_values(0))
+        if (np.diff(codes) < 0).any():
+            # rows for a geography aren't contiguous -- regroup them, keeping the existing order of the groups
+            order = np.argsort(codes, kind="stable")
+            data = data.iloc[order]
+            codes = codes[order]
+
+        self._data = data
+        self._geoids = pd.Index(geoids)
+        self._bounds = np.concatenate(([0], np.flatnonzero(np.diff(codes)) + 1, [len(codes)]))
+
+    @property
+    def data(self) -> Optional[pd.DataFrame]:
+        return self._data
+
+    def __len__(self):
+        return len(self._geoids)
+
+    def __getitem__(self, index: int) -> RdsSplitGeography:
+        if index < 0:
+            index += len(self._geoids)
+        if not 0 <= index < len(self._geoids):
+            raise IndexError()
+
+        if index not in self._cache:
+            self._cache[index] = RdsSplitGeography(
+                self._splits,
+                self._data,
+                self._geoids[index],
+                slice(int(self._bounds[index]), int(self._bounds[index + 1])),
+            )
+
+        return self._cache[index]
+
+    def index(self, geoid: str) -> int:
+        return self._geoids.get_loc(geoid)
+
+
 class RdsSplits(RdsBaseModel):
     splitUpdating = pyqtSignal()
     splitUpdated = pyqtSignal()
@@ -129,10 +230,7 @@ class RdsSplits(RdsBaseModel):
     data: pd.DataFrame = Factory(partial(pd.DataFrame, index=pd.RangeIndex(0)), False)
 
     def __post_init__(self, **kwargs):
-        if self.data is not None:
-            self.makeSplits()
-        else:
-            self.splits = []
+        self.makeSplits()
 
     def __len__(self):
         return len(self.splits)
@@ -158,23 +256,19 @@ class RdsSplits(RdsBaseModel):
         self.caption = self.sender().caption
 
     def index(self, item: RdsSplitGeography):
-        if item.geoid not in self.data.index.get_level_values(0):
-            raise IndexError(f"No split for {self.caption} {item.geoid!r}")
-
-        return self.data.index.get_level_values(0).unique().get_loc(item.geoid)
+        try:
+            return self.splits.index(item.geoid)
+        except KeyError:
+            raise IndexError(f"No split for {self.caption} {item.geoid!r}") from None
 
     @property
     def attrCount(self):
         return len(self.data.columns) + 2 - int("__name" in self.data.columns)
 
     def makeSplits(self):
-        if self.data is None:
-            self.splits = []
-            return
-
-        self.splits = [
-            RdsSplitGeography(self, self.data, geoid) for geoid in self.data.index.get_level_values(0).unique()
-        ]
+        self.splits = RdsSplitGeographies(self, self.data)
+        if self.splits.data is not None:
+            self.data = self.splits.data
 
     def setData(self, data: pd.DataFrame):
         self.splitUpdating.emit()
@@ -23,15 +23,14 @@
 """
 
 from collections.abc import Iterable
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 import pandas as pd
 
 from ..utils import tr
 from .base import Factory
-from .consts import DistrictColumns
 from .lists import KeyedList
-from .metricslist import MetricLevel, MetricTriggers, RdsMetric, register_metrics
+from .metricslist import MetricContext, MetricLevel, MetricTriggers, RdsMetric, register_metrics
 from .splits import RdsSplits
 
 if TYPE_CHECKING:
@@ -55,29 +54,32 @@ class RdsSplitsMetric(
     def getSplitNames(self, field: "RdsGeoField", geoids: Iterable[str]):
         return {g: field.getName(g) for g in geoids}
 
-    def calculate(
-        self, populationData: pd.DataFrame, districtData: pd.DataFrame, geometry: pd.Series, plan: "RdsPlan", **depends
+    def calculate(  # noqa: PLR0913
+        self,
+        populationData: pd.DataFrame,
+        districtData: pd.DataFrame,
+        geometry: pd.Series,
+        plan: "RdsPlan",
+        *,
+        context: Optional[MetricContext] = None,
+        **depends,
     ):
-        def constant(s: pd.Series):
-            array = s.to_numpy()
-            return array.shape[0] == 0 or (array[0] == array).all()
-
         if plan is None:
             self._value: KeyedList[str, RdsSplits] = KeyedList(elem_type=RdsSplits)
             self.data: dict[str, pd.DataFrame] = {}
             return
 
         if populationData is not None:
-            cols = [plan.distField]
-            if DistrictColumns.POPULATION in populationData.columns:
-                cols += [DistrictColumns.POPULATION, *plan.popFields.keys(), *plan.dataFields.keys()]
+            if context is None:
+                context = MetricContext(populationData, plan)
 
             self.data = {}
             for field in plan.geoFields:
-                g = populationData.dropna(subset=[field.fieldName])[[field.fieldName] + cols].groupby([field.fieldName])
-                splits_data = g.filter(lambda x: not constant(x[plan.distField]))
-
-                splitpop = splits_data[[field.fieldName] + cols].groupby([field.fieldName, plan.distField]).sum()
+                # a geography is split if its units fall in more than one district
+                geoDistrictSums = context.geoDistrictSums(field.fieldName)
+                geoids = geoDistrictSums.index.get_level_values(0)
+                districtCounts = geoids.value_counts()
+                splitpop = geoDistrictSums[geoids.isin(districtCounts.index[districtCounts > 1])]
 
                 if field.nameField and field.getRelation() is not None:
                     name_map = self.getSplitNames(field, splitpop.index.get_level_values(0).unique())
@@ -86,6 +86,14 @@ class RdsDistrictDataModel(QAbstractTableModel):
         self._plan = None
         self._districts: KeyedList[int, RdsDistrict] = KeyedList()
         self._validator: BaseDeviationValidator = None
+        self._assignLayer = None
+        self._render: dict[int, dict[int, list]] = {}
+        self._specs: Optional[list[tuple[str, Optional[str], Optional[str], bool]]] = None
+        self._alignments: list[Qt.AlignmentFlag] = []
+        self._boldFont = QFont()
+        self._boldFont.setBold(True)
+        self._validBrush = QBrush(QColor(0x60, 0xBD, 0x63))  # QColor(99, 196, 101)  # 60be63ff
+        self._districtForeground = QColor(55, 55, 55)
         self.plan = plan
 
     @property
@@ -115,6 +123,8 @@ class RdsDistrictDataModel(QAbstractTableModel):
             DistrictColumnData(c, c.comment, FieldCategory.Metrics)  # pylint: disable=no-member
             for c in MetricsColumns.CompactnessScores()
         )
+        self._alignments = [Qt.AlignmentFlag.AlignCenter] + [Qt.AlignmentFlag.AlignRight] * (len(self._columns) - 1)
+        self.invalidate()
 
         self.endResetModel()
 
@@ -130,8 +140,12 @@ class RdsDistrictDataModel(QAbstractTableModel):
             self._plan.deviationTypeChanged.disconnect(self.deviationTypeChanged)
             self._plan.districtAdded.disconnect(self.districtListChanged)
             self._plan.districtRemoved.disconnect(self.districtListChanged)
+        if self._assignLayer is not None:
+            self._assignLayer.rendererChanged.disconnect(self.rendererChanged)
+            self._assignLayer = None
 
         self._plan = value
+        self.invalidate()
         if self._plan:
             self._districts = self._plan.districts
             self.updatePlanFields()
@@ -147,12 +161,135 @@ class RdsDistrictDataModel(QAbstractTableModel):
             self._plan.deviationTypeChanged.connect(self.deviationTypeChanged)
             self._plan.districtAdded.connect(self.districtListChanged)
             self._plan.districtRemoved.connect(self.districtListChanged)
+            self._assignLayer = self._plan.assignLayer
+            if self._assignLayer is not None:
+                self._assignLayer.rendererChanged.connect(self.rendererChanged)
         else:
             self._columns = []
+            self._alignments = []
 
         self.endResetModel()
 
+    def invalidate(self, rows: Optional[Iterable[int]] = None):
+        """Discard cached render data for the given rows, or for all rows if none are given"""
+        if rows is None:
+            self._render = {}
+            self._specs = None
+        else:
+            for row in rows:
+                self._render.pop(row, None)
+
+    def _columnSpecs(self) -> list[tuple[str, Optional[str], Optional[str], bool]]:
+        """Resolve, once per field configuration, how each column's value is computed and formatted
+
+        Returns a list of (key, format, pct base, is pct) tuples, one per column
+        """
+        if self._specs is None:
+            compactness = set(MetricsColumns.CompactnessScores())
+            specs = []
+            for column in self._columns:
+                key = column.key
+                fmt = None
+                pctbase = None
+                isPct = key[:3] == "pct" and key != DistrictColumns.PCT_DEVIATION
+                if key == DistrictColumns.DEVIATION:
+                    fmt = "{:+,}"
+                elif key == DistrictColumns.PCT_DEVIATION:
+                    fmt = "{:+.2%}"
+                elif key in compactness:
+                    fmt = "{:0.3}"
+                elif isPct:
+                    fmt = "{:.2%}"
+                    field = self._plan.dataFields.get(key[4:])
+                    pctbase = field.pctBase if field is not None else None
+                    if pctbase == self._plan.popField:
+                        pctbase = DistrictColumns.POPULATION
+                specs.append((key, fmt, pctbase, isPct))
+            self._specs = specs
+
+        return self._specs
+
+    def _renderRow(self, row: int) -> dict[int, list]:
+        """Compute the values, display strings, brushes and fonts for one row of the table"""
+        district = self._districts[row]
+        specs = self._columnSpecs()
+        isUnassigned = district.district == 0
+
+        raw = []
+        display = []
+        for key, fmt, pctbase, isPct in specs:
+            try:
+                if isPct:
+                    base = district[pctbase]
+                    value = district[key[4:]] / base if base != 0 else None
+                else:
+                    value = district[key]
+                if pd.isna(value):
+                    value = None
+            except Exception:  # noqa  # pylint: disable=broad-exception-caught
+                value = None
+
+            raw.append(value)
+            if value is None:
+                display.append(None)
+            elif fmt is not None:
+                display.append(fmt.format(value))
+            elif isinstance(value, (int, np.integer)):
+                display.append(f"{value:,}")
+            elif isinstance(value, (float, np.floating)):
+                display.append(f"{value:,.2f}")
+            else:
+                display.append(value)
+
+        numCols = len(specs)
+        if isUnassigned:
+            background = [QBrush(getColorForDistrict(self._plan, district.district))] * numCols
+            fonts = [self._boldFont] + [None] * (numCols - 1)
+            foreground = [self._districtForeground] * numCols
+        else:
+            valid = self._validator is not None and self._validator.validateDistrict(district)
+            districtBrush = QBrush(getColorForDistrict(self._plan, district.district))
+            background = [districtBrush]
+            fonts = [self._boldFont]
+            for key, _, _, _ in specs[1:]:
+                background.append(
+                    self._validBrush
+                    if valid
+                    and key in {DistrictColumns.POPULATION, DistrictColumns.DEVIATION, DistrictColumns.PCT_DEVIATION}
+                    else None
+                )
+                fonts.append(
+                    self._boldFont if key in {DistrictColumns.DEVIATION, DistrictColumns.PCT_DEVIATION} else None
+                )
+            foreground = [self._districtForeground] + [None] * (numCols - 1)
+
+        render = {
+            Qt.ItemDataRole.DisplayRole: display,
+            Qt.ItemDataRole.EditRole: display,
+            RdsDistrictDataModel.RawDataRole: raw,
+            Qt.ItemDataRole.BackgroundRole: background,
+            Qt.ItemDataRole.FontRole: fonts,
+            Qt.ItemDataRole.ForegroundRole: foreground,
+            Qt.ItemDataRole.TextAlignmentRole: self._alignments,
+        }
+        self._render[row] = render
+        return render
+
+    def _renderAll(self):
+        for row in range(len(self._districts)):
+            if row not in self._render:
+                self._renderRow(row)
+
+    def rendererChanged(self):
+        self.invalidate()
+        self.dataChanged.emit(
+            self.createIndex(0, 0),
+            self.createIndex(self.rowCount() - 1, self.columnCount() - 1),
+            [Qt.ItemDataRole.BackgroundRole],
+        )
+
     def deviationChanged(self):
+        self.invalidate()
         self.dataChanged.emit(
             self.createIndex(1, 1), self.createIndex(self.rowCount() - 1, 4), [Qt.ItemDataRole.BackgroundRole]
         )
@@ -163,16 +300,19 @@ class RdsDistrictDataModel(QAbstractTableModel):
             if self._plan.deviationType == DeviationType.OverUnder
             else MaxDeviationValidator(self._plan)
         )
+        self.invalidate()
         self.dataChanged.emit(
             self.createIndex(1, 1), self.createIndex(self.rowCount() - 1, 4), [Qt.ItemDataRole.BackgroundRole]
         )
 
     def districtListChanged(self):
         self.beginResetModel()
+        self.invalidate()
         self.endResetModel()
 
     def districtChanged(self, district: RdsDistrict):
         row = self._districts.index(district)
+        self.invalidate([row])
         start = self.createIndex(row, 1)
         end = self.createIndex(row, self.columnCount())
         self.dataChanged.emit(
@@ -188,79 +328,39 @@ class RdsDistrictDataModel(QAbstractTableModel):
 
         return len(self._columns)
 
-    # pylint: disable=too-many-statements
-    def data(self, index, role=Qt.ItemDataRole.DisplayRole):  # noqa: PLR0912, PLR0915
-        value = None
-        try:
-            row = index.row()
-            col = index.column()
-            key = self._columns[col].key
-            district = self._districts[row]  # noqa: PD009
-
-            if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole, RdsDistrictDataModel.RawDataRole):
-                if key[:3] == "pct" and key != "pct_deviation":
-                    pctbase = self._plan.dataFields.get(key[4:]).pctBase
-                    if pctbase == self._plan.popField:
-                        pctbase = DistrictColumns.POPULATION
-                    if district[pctbase] != 0:
-                        value = district[key[4:]] / district[pctbase]
-                    else:
-                        value = None
-                else:
-                    value = district[key]
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        row = index.row()
+        render = self._render.get(row)
+        if render is None:
+            if not 0 <= row < len(self._districts):
+                return None
+            if not self._render:
+                # everything was invalidated -- rebuild the whole table in one pass
+                self._renderAll()
+                render = self._render[row]
+            else:
+                render = self._renderRow(row)
 
-                if pd.isna(value):
-                    return None
-
-                if role != RdsDistrictDataModel.RawDataRole:
-                    if key == "deviation":
-                        value = f"{value:+,}"
-                    elif key == "pct_deviation":
-                        value = f"{value:+.2%}"
-                    elif key in MetricsColumns.CompactnessScores():
-                        value = f"{value:0.3}"
-                    elif key[:3] == "pct":
-                        value = f"{value:.2%}"
-                    elif isinstance(value, (int, np.integer)):
-                        value = f"{value:,}"
-                    elif isinstance(value, (float, np.floating)):
-                        value = f"{value:,.2f}"
-
-            elif role == Qt.ItemDataRole.BackgroundRole:
-                if col == 0 or district.district == 0:
-                    color = getColorForDistrict(self._plan, district.district)
-                    value = QBrush(color)
-                elif col in {
-                    int(DistrictColumns.POPULATION),
-                    int(DistrictColumns.DEVIATION),
-                    int(DistrictColumns.PCT_DEVIATION),
-                }:
-                    if self._validator.validateDistrict(district):
-                        color = QColor(0x60, 0xBD, 0x63)  # QColor(99, 196, 101)  # 60be63ff
-                        value = QBrush(color)
-
-            elif role == Qt.ItemDataRole.FontRole:
-                # bold for district name and deviations (except for the unassigned row)
-                if col == 0 or (
-                    district.district != 0 and key in {DistrictColumns.DEVIATION, DistrictColumns.PCT_DEVIATION}
-                ):
-                    value = QFont()
-                    value.setBold(True)
-
-            elif role == Qt.ItemDataRole.TextAlignmentRole:
-                if col == 0:
-                    value = Qt.AlignmentFlag.AlignCenter
-                else:
-                    value = Qt.AlignmentFlag.AlignRight
+        values = render.get(role)
+        if values is None:
+            return None
 
-            elif role == Qt.ItemDataRole.ForegroundRole:
-                if col == 0 or district.district == 0:
-                    value = QColor(55, 55, 55)
+        col = index.column()
+        return values[col] if 0 <= col < len(values) else None
 
-        except Exception as e:  # noqa  # pylint: disable=broad-exception-caught, unused-variable
-            return None
+    def toDataFrame(self, role: int = Qt.ItemDataRole.DisplayRole) -> pd.DataFrame:
+        """Return the contents of the table for the given role as a DataFrame indexed by the first column"""
+        if not self._columns:
+            return pd.DataFrame()
 
-        return value
+        self._renderAll()
+        data = pd.DataFrame(
+            [self._render[row][role] for row in range(len(self._districts))],
+            columns=[c.heading for c in self._columns],
+        )
+        data = data.set_index(data.columns[0])
+        data.index.name = None
+        return data
 
     def setData(self, index: QModelIndex, value: Any, role: int) -> bool:
         if (
@@ -270,6 +370,7 @@ class RdsDistrictDataModel(QAbstractTableModel):
         ):
             dist = self._districts[index.row()]
             dist.name = value
+            self.invalidate([index.row()])
             self.dataChanged.emit(index, index, {Qt.ItemDataRole.EditRole})
             return True
 
@@ -297,6 +398,7 @@ class RdsDistrictDataModel(QAbstractTableModel):
             return
 
         if districts:
+            self.invalidate(districts)
             for d in districts:
                 self.dataChanged.emit(
                     self.createIndex(d, 3),
@@ -306,6 +408,7 @@ class RdsDistrictDataModel(QAbstractTableModel):
                 self.dataChanged.emit(self.createIndex(d, 4), self.createIndex(d, 5), [Qt.ItemDataRole.FontRole])
         else:
             self.beginResetModel()
+            self.invalidate()
             self.endResetModel()
 
 
@@ -500,6 +603,7 @@ class DeltaListModel(QAbstractTableModel):
         self._plan = None
         self._fields = []
         self._delta: DeltaList = None
+        self._display: dict[int, list[Optional[str]]] = {}
 
     @property
     def plan(self):
@@ -530,15 +634,19 @@ class DeltaListModel(QAbstractTableModel):
             if self._delta is not None:
                 self._delta.updateStarted.disconnect(self.startUpdate)
                 self._delta.updateComplete.disconnect(self.endUpdate)
+                self._delta.valuesChanged.disconnect(self.updateValues)
 
             self._delta = delta
+            self._display = {}
 
             if self._delta is not None:
                 self._delta.updateStarted.connect(self.startUpdate)
                 self._delta.updateComplete.connect(self.endUpdate)
+                self._delta.valuesChanged.connect(self.updateValues)
             self.endResetModel()
 
     def updateFields(self):
+        self._display = {}
         self._fields = [
             {
                 "name": f"new_{DistrictColumns.POPULATION}",
@@ -622,8 +730,10 @@ class DeltaListModel(QAbstractTableModel):
             col = index.column()
 
             if role in {Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole}:
-                value = self._delta[row, col]
-                return self._fields[col]["format"].format(value) if value is not None else None
+                text = self._display.get(row)
+                if text is None:
+                    text = self._formatRow(row)
+                return text[col]
 
             if role == DeltaListModel.FieldTypeRole:
                 return self._fields[col]["field-type"]
@@ -654,12 +764,29 @@ class DeltaListModel(QAbstractTableModel):
 
         return None
 
+    def _formatRow(self, row: int) -> list[Optional[str]]:
+        text = []
+        numCols = len(self._delta.columns)
+        for col, field in enumerate(self._fields):
+            value = self._delta.value(row, col) if col < numCols else None
+            text.append(field["format"].format(value) if value is not None else None)
+        self._display[row] = text
+        return text
+
     def startUpdate(self):
         self.beginResetModel()
 
     def endUpdate(self):
+        self._display = {}
         self.endResetModel()
 
+    def updateValues(self, top: int, left: int, bottom: int, right: int):
+        for row in range(top, bottom + 1):
+            self._display.pop(row, None)
+        self.dataChanged.emit(
+            self.createIndex(top, left), self.createIndex(bottom, right), [Qt.ItemDataRole.DisplayRole]
+        )
+
 
 class DeltaFieldFilterProxy(QSortFilterProxyModel):
     def __init__(self, parent: Optional[QObject] = None):
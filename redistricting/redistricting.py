@@ -32,7 +32,7 @@ from qgis.PyQt.QtCore import QCoreApplication, QSettings, QTranslator
 from qgis.PyQt.QtWidgets import QMenu, QMessageBox, QToolBar
 from qgis.PyQt.QtXml import QDomDocument
 
-from .resources import *  # noqa # pylint: disable=wildcard-import,unused-wildcard-import
+from .resources import qCleanupResources, qInitResources
 
 # pylint: disable=wrong-import-position
 # isort: off
@@ -70,6 +70,8 @@ class Redistricting:
         self.iface = iface
         self.canvas = self.iface.mapCanvas()
 
+        qInitResources()
+
         self.actionRegistry = ActionRegistry()
 
         self.unloading = False
@@ -125,7 +127,7 @@ class Redistricting:
         )
 
         self.editController = EditAssignmentsController(
-            self.iface, self.project, self.planManager, self.toolbar, self.assignmentsService
+            self.iface, self.project, self.planManager, self.toolbar, self.assignmentsService, self.updaterService
         )
 
         self.metricsController = MetricsController(
@@ -230,6 +232,8 @@ class Redistricting:
         self.toolbar.hide()
         self.toolbar.setParent(None)
 
+        qCleanupResources()
+
     # --------------------------------------------------------------------------
 
     def onQuit(self):
@@ -257,15 +261,19 @@ class Redistricting:
                 return
 
             oldVersion = storage.version
-            storage.migrate()
+        else:
+            oldVersion = None
+
+        # plans that need migration are migrated as they are read
+        self.planManager.extend(storage.readRedistrictingPlans())
+
+        if oldVersion is not None:
             self.iface.messageBar().pushMessage(
                 self.tr("Redistricting Plugin"),
                 self.tr(f"Plans migrated from schema version {oldVersion} to {storage.version}."),
                 level=Qgis.MessageLevel.Success,
             )
 
-        self.planManager.extend(storage.readRedistrictingPlans())
-
         # don't let setting active plan dirty the project
         dirtyBlocker = QgsProjectDirtyBlocker(self.project)
         try:
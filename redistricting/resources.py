@@ -1,4062 +1,54 @@
-# Resource object code (Python 3)
-# Created by: object code
-# Created by: The Resource Compiler for Qt version 6.9.0
-# WARNING! All changes made in this file will be lost!
+"""QGIS Redistricting Plugin - Qt resources
+
+        begin                : 2026-10-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2026 by Cryptodira
+        email                : stuart@cryptodira.org
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 3 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ *   This program is distributed in the hope that it will be useful, but   *
+ *   WITHOUT ANY WARRANTY; without even the implied warranty of            *
+ *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          *
+ *   GNU General Public License for more details. You should have          *
+ *   received a copy of the GNU General Public License along with this     *
+ *   program. If not, see <http://www.gnu.org/licenses/>.                  *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+import pathlib
+
+from qgis.PyQt.QtCore import QResource
+
+# The plugin icons are compiled into a binary resource file, which Qt maps
+# into memory when it is registered by the plugin, rather than into a
+# generated Python module of byte strings that is executed on import.
+# Rebuild it after changing resources/resources.qrc:
+#
+#     rcc -binary resources/resources.qrc -o redistricting/resources.rcc
+RESOURCE_FILE = str(pathlib.Path(__file__).parent / "resources.rcc")
+
+_registered = False
 
-from qgis.PyQt import QtCore
 
-qt_resource_data = b"\
-\x00\x00\x12\xb8\
-<\
-?xml version=\x221.\
-0\x22 encoding=\x22utf\
--8\x22?>\x0a<!-- Gener\
-ator: Adobe Illu\
-strator 26.2.1, \
-SVG Export Plug-\
-In . SVG Version\
-: 6.00 Build 0) \
- -->\x0a<svg versio\
-n=\x221.1\x22 xmlns=\x22h\
-ttp://www.w3.org\
-/2000/svg\x22 xmlns\
-:xlink=\x22http://w\
-ww.w3.org/1999/x\
-link\x22 x=\x220px\x22 y=\
-\x220px\x22\x0a\x09 viewBox=\
-\x220 0 64 64\x22 styl\
-e=\x22enable-backgr\
-ound:new 0 0 64 \
-64;\x22 xml:space=\x22\
-preserve\x22>\x0a<styl\
-e type=\x22text/css\
-\x22>\x0a\x09.st0{fill:#7\
-27375;stroke:#00\
-0000;stroke-mite\
-rlimit:10;}\x0a\x09.st\
-1{fill:#E4E3E3;s\
-troke:#000000;st\
-roke-miterlimit:\
-10;}\x0a\x09.st2{fill:\
-none;stroke:#808\
-080;stroke-width\
-:0.25;}\x0a\x09.st3{fi\
-ll:none;stroke:#\
-000000;stroke-mi\
-terlimit:10;}\x0a\x09.\
-st4{fill:#5A8C5A\
-;}\x0a\x09.st5{fill-ru\
-le:evenodd;clip-\
-rule:evenodd;fil\
-l:#FFFFFF;}\x0a\x09.st\
-6{fill:#FFFFFF;}\
-\x0a\x09.st7{fill:#8BA\
-F8C;}\x0a\x09.st8{fill\
-:#FEFFFF;}\x0a</sty\
-le>\x0a<g id=\x22oulin\
-es\x22 xmlns:cc=\x22ht\
-tp://creativecom\
-mons.org/ns#\x22 xm\
-lns:dc=\x22http://p\
-url.org/dc/eleme\
-nts/1.1/\x22 xmlns:\
-inkscape=\x22http:/\
-/www.inkscape.or\
-g/namespaces/ink\
-scape\x22 xmlns:rdf\
-=\x22http://www.w3.\
-org/1999/02/22-r\
-df-syntax-ns#\x22 x\
-mlns:sodipodi=\x22h\
-ttp://sodipodi.s\
-ourceforge.net/D\
-TD/sodipodi-0.dt\
-d\x22 xmlns:svg=\x22ht\
-tp://www.w3.org/\
-2000/svg\x22>\x0a\x09\x0a\x09\x09<\
-sodipodi:namedvi\
-ew  bordercolor=\
-\x22#666666\x22 border\
-opacity=\x221.0\x22 id\
-=\x22base\x22 inkscape\
-:current-layer=\x22\
-layer1\x22 inkscape\
-:cx=\x229.3247571\x22 \
-inkscape:cy=\x2253.\
-238203\x22 inkscape\
-:document-rotati\
-on=\x220\x22 inkscape:\
-document-units=\x22\
-px\x22 inkscape:obj\
-ect-paths=\x22true\x22\
- inkscape:pageop\
-acity=\x220.0\x22 inks\
-cape:pageshadow=\
-\x222\x22 inkscape:sna\
-p-bbox=\x22true\x22 in\
-kscape:snap-glob\
-al=\x22true\x22 inksca\
-pe:snap-grids=\x22f\
-alse\x22 inkscape:s\
-nap-nodes=\x22true\x22\
- inkscape:snap-o\
-thers=\x22false\x22 in\
-kscape:window-he\
-ight=\x22847\x22 inksc\
-ape:window-maxim\
-ized=\x220\x22 inkscap\
-e:window-width=\x22\
-1252\x22 inkscape:w\
-indow-x=\x222225\x22 i\
-nkscape:window-y\
-=\x22208\x22 inkscape:\
-zoom=\x225.0716018\x22\
- pagecolor=\x22#fff\
-fff\x22 showgrid=\x22f\
-alse\x22 showguides\
-=\x22false\x22>\x0a\x09\x09<ink\
-scape:grid  emps\
-pacing=\x224\x22 id=\x22g\
-rid2640\x22 type=\x22x\
-ygrid\x22></inkscap\
-e:grid>\x0a\x09</sodip\
-odi:namedview>\x0a\x09\
-<polygon class=\x22\
-st0\x22 points=\x2232,\
-24.6 32,33.5 38.\
-2,33.5 38.2,43.5\
- 32,43.5 32,39.6\
- 18.4,39.6 18.4,\
-36.1 13.6,36.1 1\
-3.6,26.2 \x0a\x09\x090.5,\
-26.2 0.5,0.5 21.\
-8,0.5 21.8,17.5 \
-38.2,17.5 38.2,2\
-4.6 \x09\x22/>\x0a\x09<polyg\
-on class=\x22st1\x22 p\
-oints=\x2263.5,0.5 \
-63.5,47.9 55.1,4\
-7.9 55.1,21.3 47\
-.9,21.3 47.9,43.\
-5 38.2,43.5 38.2\
-,33.5 32,33.5 32\
-,24.6 \x0a\x09\x0938.2,24\
-.6 38.2,17.5 21.\
-8,17.5 21.8,0.5 \
-\x09\x22/>\x0a\x09<polygon c\
-lass=\x22st0\x22 point\
-s=\x2263.5,47.9 63.\
-5,63.5 17.5,63.5\
- 17.5,55.3 42.8,\
-55.3 42.8,50.2 3\
-2,50.2 32,43.5 4\
-7.9,43.5 47.9,21\
-.3 \x0a\x09\x0955.1,21.3 \
-55.1,47.9 \x09\x22/>\x0a\x09\
-<polygon class=\x22\
-st1\x22 points=\x2242.\
-8,50.2 42.8,55.3\
- 17.5,55.3 17.5,\
-63.5 0.5,63.5 0.\
-5,26.2 13.6,26.2\
- 13.6,36.1 18.4,\
-36.1 18.4,39.6 \x0a\
-\x09\x0932,39.6 32,50.\
-2 \x09\x22/>\x0a</g>\x0a<g i\
-d=\x22grid\x22>\x0a\x09<g id\
-=\x22g2324\x22>\x0a\x09\x09<pat\
-h id=\x22path1979\x22 \
-class=\x22st2\x22 d=\x22M\
-0,4.6h64\x22/>\x0a\x09\x09<p\
-ath id=\x22path1981\
-\x22 class=\x22st2\x22 d=\
-\x22M0,9.6h64\x22/>\x0a\x09\x09\
-<path id=\x22path19\
-83\x22 class=\x22st2\x22 \
-d=\x22M0,14.6h64\x22/>\
-\x0a\x09\x09<path id=\x22pat\
-h1985\x22 class=\x22st\
-2\x22 d=\x22M0,19.6h64\
-\x22/>\x0a\x09\x09<path id=\x22\
-path1987\x22 class=\
-\x22st2\x22 d=\x22M0,24.6\
-h64\x22/>\x0a\x09\x09<path i\
-d=\x22path1989\x22 cla\
-ss=\x22st2\x22 d=\x22M0,2\
-9.6h64\x22/>\x0a\x09\x09<pat\
-h id=\x22path1991\x22 \
-class=\x22st2\x22 d=\x22M\
-0,34.6h64\x22/>\x0a\x09\x09<\
-path id=\x22path199\
-3\x22 class=\x22st2\x22 d\
-=\x22M0,39.6h64\x22/>\x0a\
-\x09\x09<path id=\x22path\
-1995\x22 class=\x22st2\
-\x22 d=\x22M0,44.6h64\x22\
-/>\x0a\x09\x09<path id=\x22p\
-ath1997\x22 class=\x22\
-st2\x22 d=\x22M0,49.6h\
-64\x22/>\x0a\x09\x09<path id\
-=\x22path1999\x22 clas\
-s=\x22st2\x22 d=\x22M0,54\
-.6h64l0,0\x22/>\x0a\x09\x09<\
-path id=\x22path200\
-1\x22 class=\x22st2\x22 d\
-=\x22M0,59.6h64\x22/>\x0a\
-\x09\x09<path id=\x22path\
-1979-7\x22 class=\x22s\
-t2\x22 d=\x22M59.6,0v6\
-4\x22/>\x0a\x09\x09<path id=\
-\x22path1981-6\x22 cla\
-ss=\x22st2\x22 d=\x22M54.\
-6,0v64\x22/>\x0a\x09\x09<pat\
-h id=\x22path1983-2\
-\x22 class=\x22st2\x22 d=\
-\x22M49.6,0v64\x22/>\x0a\x09\
-\x09<path id=\x22path1\
-985-7\x22 class=\x22st\
-2\x22 d=\x22M44.6,0v64\
-\x22/>\x0a\x09\x09<path id=\x22\
-path1987-0\x22 clas\
-s=\x22st2\x22 d=\x22M39.6\
-,0v64\x22/>\x0a\x09\x09<path\
- id=\x22path1989-3\x22\
- class=\x22st2\x22 d=\x22\
-M34.6,0v64\x22/>\x0a\x09\x09\
-<path id=\x22path19\
-91-9\x22 class=\x22st2\
-\x22 d=\x22M29.6,0v64\x22\
-/>\x0a\x09\x09<path id=\x22p\
-ath1993-9\x22 class\
-=\x22st2\x22 d=\x22M24.6,\
-0v64\x22/>\x0a\x09\x09<path \
-id=\x22path1995-9\x22 \
-class=\x22st2\x22 d=\x22M\
-19.6,0v64\x22/>\x0a\x09\x09<\
-path id=\x22path199\
-7-1\x22 class=\x22st2\x22\
- d=\x22M14.6,0v64\x22/\
->\x0a\x09\x09<path id=\x22pa\
-th1999-7\x22 class=\
-\x22st2\x22 d=\x22M9.6,0v\
-64l0,0\x22/>\x0a\x09\x09<pat\
-h id=\x22path2001-2\
-\x22 class=\x22st2\x22 d=\
-\x22M4.6,0v64\x22/>\x0a\x09<\
-/g>\x0a\x09<rect x=\x220.\
-5\x22 y=\x220.5\x22 class\
-=\x22st3\x22 width=\x2263\
-\x22 height=\x2263\x22/>\x0a\
-</g>\x0a<g id=\x22embl\
-em\x22>\x0a\x09<g>\x0a\x09\x09<pat\
-h class=\x22st4\x22 d=\
-\x22M36.2,29.6h17.8\
-c3.3,0,6,2.7,6,6\
-v17.8c0,3.3-2.7,\
-6-6,6H36.2c-3.3,\
-0-6-2.7-6-6V35.6\
-\x0a\x09\x09\x09C30.2,32.3,3\
-2.9,29.6,36.2,29\
-.6\x22/>\x0a\x09\x09<polylin\
-e class=\x22st5\x22 po\
-ints=\x2236.2,44.5 \
-54.1,44.5 36.2,4\
-4.5 \x09\x09\x22/>\x0a\x09\x09<pat\
-h class=\x22st6\x22 d=\
-\x22M36.2,47.5h17.9\
-c1.6,0,3-1.3,3-3\
-s-1.3-3-3-3H36.2\
-c-1.6,0-3,1.3-3,\
-3S34.6,47.5,36.2\
-,47.5\x22/>\x0a\x09\x09<poly\
-line class=\x22st5\x22\
- points=\x2245.2,53\
-.5 45.2,35.6 45.\
-2,53.5 \x09\x09\x22/>\x0a\x09\x09<\
-path class=\x22st6\x22\
- d=\x22M48.1,53.5V3\
-5.6c0-1.6-1.3-3-\
-3-3c-1.6,0-3,1.3\
--3,3v17.9c0,1.6,\
-1.3,3,3,3C46.8,5\
-6.5,48.1,55.1,48\
-.1,53.5\x22/>\x0a\x09\x09<pa\
-th class=\x22st7\x22 d\
-=\x22M45.2,32.6c-10\
-.4,0-11.9,0-11.9\
-,6v6c0-1.6,1.3-3\
-,3-3h6v-6C42.2,3\
-3.9,43.5,32.6,45\
-.2,32.6c1.6,0,3,\
-1.3,3,3v6h6\x0a\x09\x09\x09c\
-1.6,0,3,1.3,3,3l\
-0,0c0,0,0,0,0-6C\
-57.1,32.6,55.6,3\
-2.6,45.2,32.6\x22/>\
-\x0a\x09\x09<path class=\x22\
-st8\x22 d=\x22M42.2,41\
-.6h-6c-1.6,0-3,1\
-.3-3,3h8.9V41.6 \
-M54.1,41.6h-6v3h\
-8.9C57.1,42.9,55\
-.7,41.6,54.1,41.\
-6\x22/>\x0a\x09\x09<path cla\
-ss=\x22st8\x22 d=\x22M45.\
-2,32.6c-1.6,0-3,\
-1.3-3,3v6v3h6v-3\
-v-6C48.1,33.9,46\
-.8,32.6,45.2,32.\
-6\x22/>\x0a\x09</g>\x0a</g>\x0a\
-</svg>\x0a\
-\x00\x00\x10\xda\
-<\
-?xml version=\x221.\
-0\x22 encoding=\x22utf\
--8\x22?>\x0a<!-- Gener\
-ator: Adobe Illu\
-strator 26.2.1, \
-SVG Export Plug-\
-In . SVG Version\
-: 6.00 Build 0) \
- -->\x0a<svg versio\
-n=\x221.1\x22 xmlns=\x22h\
-ttp://www.w3.org\
-/2000/svg\x22 xmlns\
-:xlink=\x22http://w\
-ww.w3.org/1999/x\
-link\x22 x=\x220px\x22 y=\
-\x220px\x22\x0a\x09 viewBox=\
-\x220 0 64 64\x22 styl\
-e=\x22enable-backgr\
-ound:new 0 0 64 \
-64;\x22 xml:space=\x22\
-preserve\x22>\x0a<styl\
-e type=\x22text/css\
-\x22>\x0a\x09.st0{fill:#7\
-27375;stroke:#00\
-0000;stroke-mite\
-rlimit:10;}\x0a\x09.st\
-1{fill:#E4E3E3;s\
-troke:#000000;st\
-roke-miterlimit:\
-10;}\x0a\x09.st2{fill:\
-none;stroke:#808\
-080;stroke-width\
-:0.25;}\x0a\x09.st3{fi\
-ll:none;stroke:#\
-000000;stroke-mi\
-terlimit:10;}\x0a\x09.\
-st4{fill:#3C5A6E\
-;}\x0a\x09.st5{opacity\
-:0.3;fill-rule:e\
-venodd;clip-rule\
-:evenodd;fill:#F\
-CFFFF;enable-bac\
-kground:new    ;\
-}\x0a\x09.st6{fill-rul\
-e:evenodd;clip-r\
-ule:evenodd;fill\
-:#FFFFFF;}\x0a</sty\
-le>\x0a<g id=\x22oulin\
-es\x22 xmlns:cc=\x22ht\
-tp://creativecom\
-mons.org/ns#\x22 xm\
-lns:dc=\x22http://p\
-url.org/dc/eleme\
-nts/1.1/\x22 xmlns:\
-inkscape=\x22http:/\
-/www.inkscape.or\
-g/namespaces/ink\
-scape\x22 xmlns:rdf\
-=\x22http://www.w3.\
-org/1999/02/22-r\
-df-syntax-ns#\x22 x\
-mlns:sodipodi=\x22h\
-ttp://sodipodi.s\
-ourceforge.net/D\
-TD/sodipodi-0.dt\
-d\x22 xmlns:svg=\x22ht\
-tp://www.w3.org/\
-2000/svg\x22>\x0a\x09\x0a\x09\x09<\
-sodipodi:namedvi\
-ew  bordercolor=\
-\x22#666666\x22 border\
-opacity=\x221.0\x22 id\
-=\x22base\x22 inkscape\
-:current-layer=\x22\
-layer1\x22 inkscape\
-:cx=\x229.3247571\x22 \
-inkscape:cy=\x2253.\
-238203\x22 inkscape\
-:document-rotati\
-on=\x220\x22 inkscape:\
-document-units=\x22\
-px\x22 inkscape:obj\
-ect-paths=\x22true\x22\
- inkscape:pageop\
-acity=\x220.0\x22 inks\
-cape:pageshadow=\
-\x222\x22 inkscape:sna\
-p-bbox=\x22true\x22 in\
-kscape:snap-glob\
-al=\x22true\x22 inksca\
-pe:snap-grids=\x22f\
-alse\x22 inkscape:s\
-nap-nodes=\x22true\x22\
- inkscape:snap-o\
-thers=\x22false\x22 in\
-kscape:window-he\
-ight=\x22847\x22 inksc\
-ape:window-maxim\
-ized=\x220\x22 inkscap\
-e:window-width=\x22\
-1252\x22 inkscape:w\
-indow-x=\x222225\x22 i\
-nkscape:window-y\
-=\x22208\x22 inkscape:\
-zoom=\x225.0716018\x22\
- pagecolor=\x22#fff\
-fff\x22 showgrid=\x22f\
-alse\x22 showguides\
-=\x22false\x22>\x0a\x09\x09<ink\
-scape:grid  emps\
-pacing=\x224\x22 id=\x22g\
-rid2640\x22 type=\x22x\
-ygrid\x22></inkscap\
-e:grid>\x0a\x09</sodip\
-odi:namedview>\x0a\x09\
-<polygon class=\x22\
-st0\x22 points=\x2232,\
-24.6 32,33.5 38.\
-2,33.5 38.2,43.5\
- 32,43.5 32,39.6\
- 18.4,39.6 18.4,\
-36.1 13.6,36.1 1\
-3.6,26.2 \x0a\x09\x090.5,\
-26.2 0.5,0.5 21.\
-8,0.5 21.8,17.5 \
-38.2,17.5 38.2,2\
-4.6 \x09\x22/>\x0a\x09<polyg\
-on class=\x22st1\x22 p\
-oints=\x2263.5,0.5 \
-63.5,47.9 55.1,4\
-7.9 55.1,21.3 47\
-.9,21.3 47.9,43.\
-5 38.2,43.5 38.2\
-,33.5 32,33.5 32\
-,24.6 \x0a\x09\x0938.2,24\
-.6 38.2,17.5 21.\
-8,17.5 21.8,0.5 \
-\x09\x22/>\x0a\x09<polygon c\
-lass=\x22st0\x22 point\
-s=\x2263.5,47.9 63.\
-5,63.5 17.5,63.5\
- 17.5,55.3 42.8,\
-55.3 42.8,50.2 3\
-2,50.2 32,43.5 4\
-7.9,43.5 47.9,21\
-.3 \x0a\x09\x0955.1,21.3 \
-55.1,47.9 \x09\x22/>\x0a\x09\
-<polygon class=\x22\
-st1\x22 points=\x2242.\
-8,50.2 42.8,55.3\
- 17.5,55.3 17.5,\
-63.5 0.5,63.5 0.\
-5,26.2 13.6,26.2\
- 13.6,36.1 18.4,\
-36.1 18.4,39.6 \x0a\
-\x09\x0932,39.6 32,50.\
-2 \x09\x22/>\x0a</g>\x0a<g i\
-d=\x22grid\x22>\x0a\x09<g id\
-=\x22g2324\x22>\x0a\x09\x09<pat\
-h id=\x22path1979\x22 \
-class=\x22st2\x22 d=\x22M\
-0,4.6h64\x22/>\x0a\x09\x09<p\
-ath id=\x22path1981\
-\x22 class=\x22st2\x22 d=\
-\x22M0,9.6h64\x22/>\x0a\x09\x09\
-<path id=\x22path19\
-83\x22 class=\x22st2\x22 \
-d=\x22M0,14.6h64\x22/>\
-\x0a\x09\x09<path id=\x22pat\
-h1985\x22 class=\x22st\
-2\x22 d=\x22M0,19.6h64\
-\x22/>\x0a\x09\x09<path id=\x22\
-path1987\x22 class=\
-\x22st2\x22 d=\x22M0,24.6\
-h64\x22/>\x0a\x09\x09<path i\
-d=\x22path1989\x22 cla\
-ss=\x22st2\x22 d=\x22M0,2\
-9.6h64\x22/>\x0a\x09\x09<pat\
-h id=\x22path1991\x22 \
-class=\x22st2\x22 d=\x22M\
-0,34.6h64\x22/>\x0a\x09\x09<\
-path id=\x22path199\
-3\x22 class=\x22st2\x22 d\
-=\x22M0,39.6h64\x22/>\x0a\
-\x09\x09<path id=\x22path\
-1995\x22 class=\x22st2\
-\x22 d=\x22M0,44.6h64\x22\
-/>\x0a\x09\x09<path id=\x22p\
-ath1997\x22 class=\x22\
-st2\x22 d=\x22M0,49.6h\
-64\x22/>\x0a\x09\x09<path id\
-=\x22path1999\x22 clas\
-s=\x22st2\x22 d=\x22M0,54\
-.6h64l0,0\x22/>\x0a\x09\x09<\
-path id=\x22path200\
-1\x22 class=\x22st2\x22 d\
-=\x22M0,59.6h64\x22/>\x0a\
-\x09\x09<path id=\x22path\
-1979-7\x22 class=\x22s\
-t2\x22 d=\x22M59.6,0v6\
-4\x22/>\x0a\x09\x09<path id=\
-\x22path1981-6\x22 cla\
-ss=\x22st2\x22 d=\x22M54.\
-6,0v64\x22/>\x0a\x09\x09<pat\
-h id=\x22path1983-2\
-\x22 class=\x22st2\x22 d=\
-\x22M49.6,0v64\x22/>\x0a\x09\
-\x09<path id=\x22path1\
-985-7\x22 class=\x22st\
-2\x22 d=\x22M44.6,0v64\
-\x22/>\x0a\x09\x09<path id=\x22\
-path1987-0\x22 clas\
-s=\x22st2\x22 d=\x22M39.6\
-,0v64\x22/>\x0a\x09\x09<path\
- id=\x22path1989-3\x22\
- class=\x22st2\x22 d=\x22\
-M34.6,0v64\x22/>\x0a\x09\x09\
-<path id=\x22path19\
-91-9\x22 class=\x22st2\
-\x22 d=\x22M29.6,0v64\x22\
-/>\x0a\x09\x09<path id=\x22p\
-ath1993-9\x22 class\
-=\x22st2\x22 d=\x22M24.6,\
-0v64\x22/>\x0a\x09\x09<path \
-id=\x22path1995-9\x22 \
-class=\x22st2\x22 d=\x22M\
-19.6,0v64\x22/>\x0a\x09\x09<\
-path id=\x22path199\
-7-1\x22 class=\x22st2\x22\
- d=\x22M14.6,0v64\x22/\
->\x0a\x09\x09<path id=\x22pa\
-th1999-7\x22 class=\
-\x22st2\x22 d=\x22M9.6,0v\
-64l0,0\x22/>\x0a\x09\x09<pat\
-h id=\x22path2001-2\
-\x22 class=\x22st2\x22 d=\
-\x22M4.6,0v64\x22/>\x0a\x09<\
-/g>\x0a\x09<rect x=\x220.\
-5\x22 y=\x220.5\x22 class\
-=\x22st3\x22 width=\x2263\
-\x22 height=\x2263\x22/>\x0a\
-</g>\x0a<g id=\x22embl\
-em\x22>\x0a\x09<g transfo\
-rm=\x22translate(-2\
-7.5 6.000001)\x22>\x0a\
-\x09\x09<path class=\x22s\
-t4\x22 d=\x22M87.6,29.\
-1V48c0,3-2.4,5.5\
--5.5,5.5H63.2c-3\
-,0-5.5-2.4-5.5-5\
-.5V29.1c0-3,2.4-\
-5.5,5.5-5.5h18.9\
-\x0a\x09\x09\x09C85.1,23.6,8\
-7.6,26.1,87.6,29\
-.1z\x22/>\x0a\x09\x09<g>\x0a\x09\x09\x09\
-<path class=\x22st5\
-\x22 d=\x22M71.3,26.3v\
-24.4c0,0,0,0,5.4\
-,0c8.1,0,8.1-2.7\
-,8.1-12.2s0-12.2\
--8.1-12.2C71.3,2\
-6.3,71.3,26.3,71\
-.3,26.3z\x22/>\x0a\x09\x09\x09<\
-path class=\x22st6\x22\
- d=\x22M84.8,37.2h-\
-8.1V26.3h-8.1v10\
-.8h-8.1l10.8,13.\
-5L84.8,37.2z\x22/>\x0a\
-\x09\x09</g>\x0a\x09</g>\x0a</g\
->\x0a</svg>\x0a\
-\x00\x00\x0f\x82\
-<\
-?xml version=\x221.\
-0\x22 encoding=\x22UTF\
--8\x22 standalone=\x22\
-no\x22?>\x0a<svg\x0a   ve\
-rsion=\x221.1\x22\x0a   v\
-iewBox=\x220 0 24 2\
-4\x22\x0a   id=\x22svg8\x22\x0a\
-   sodipodi:docn\
-ame=\x22demographic\
-s.svg\x22\x0a   inksca\
-pe:version=\x221.3.\
-2 (091e20e, 2023\
--11-25)\x22\x0a   xml:\
-space=\x22preserve\x22\
-\x0a   xmlns:inksca\
-pe=\x22http://www.i\
-nkscape.org/name\
-spaces/inkscape\x22\
-\x0a   xmlns:sodipo\
-di=\x22http://sodip\
-odi.sourceforge.\
-net/DTD/sodipodi\
--0.dtd\x22\x0a   xmlns\
-=\x22http://www.w3.\
-org/2000/svg\x22\x0a  \
- xmlns:svg=\x22http\
-://www.w3.org/20\
-00/svg\x22><sodipod\
-i:namedview\x0a    \
- id=\x22namedview8\x22\
-\x0a     pagecolor=\
-\x22#ffffff\x22\x0a     b\
-ordercolor=\x22#000\
-000\x22\x0a     border\
-opacity=\x220.25\x22\x0a \
-    inkscape:sho\
-wpageshadow=\x222\x22\x0a\
-     inkscape:pa\
-geopacity=\x220.0\x22\x0a\
-     inkscape:pa\
-gecheckerboard=\x22\
-0\x22\x0a     inkscape\
-:deskcolor=\x22#d1d\
-1d1\x22\x0a     showgr\
-id=\x22false\x22\x0a     \
-inkscape:zoom=\x229\
-.4835243\x22\x0a     i\
-nkscape:cx=\x2214.2\
-87937\x22\x0a     inks\
-cape:cy=\x2229.5248\
-89\x22\x0a     inkscap\
-e:window-width=\x22\
-1368\x22\x0a     inksc\
-ape:window-heigh\
-t=\x221017\x22\x0a     in\
-kscape:window-x=\
-\x223408\x22\x0a     inks\
-cape:window-y=\x224\
-57\x22\x0a     inkscap\
-e:window-maximiz\
-ed=\x220\x22\x0a     inks\
-cape:current-lay\
-er=\x22svg8\x22><inksc\
-ape:grid\x0a       \
-id=\x22grid9\x22\x0a     \
-  units=\x22px\x22\x0a   \
-    originx=\x220\x22\x0a\
-       originy=\x22\
-0\x22\x0a       spacin\
-gx=\x221\x22\x0a       sp\
-acingy=\x221\x22\x0a     \
-  empcolor=\x22#009\
-9e5\x22\x0a       empo\
-pacity=\x220.301960\
-78\x22\x0a       color\
-=\x22#0099e5\x22\x0a     \
-  opacity=\x220.149\
-01961\x22\x0a       em\
-pspacing=\x225\x22\x0a   \
-    dotted=\x22fals\
-e\x22\x0a       gridan\
-glex=\x2230\x22\x0a      \
- gridanglez=\x2230\x22\
-\x0a       visible=\
-\x22false\x22 /></sodi\
-podi:namedview><\
-defs\x0a     id=\x22de\
-fs1\x22><style\x0a    \
-   id=\x22style1\x22>\x0a\
-      .cls-1 {\x0a \
-       fill: non\
-e;\x0a        strok\
-e: #231f20;\x0a    \
-    stroke-miter\
-limit: 10;\x0a     \
- }\x0a    </style><\
-/defs><path\x0a    \
- style=\x22fill:#ff\
-dd00;fill-opacit\
-y:1;stroke:#fdad\
-17;stroke-width:\
-0.963156;stroke-\
-opacity:1\x22\x0a     \
-id=\x22path9\x22\x0a     \
-sodipodi:type=\x22a\
-rc\x22\x0a     sodipod\
-i:cx=\x2211.250088\x22\
-\x0a     sodipodi:c\
-y=\x2212.5\x22\x0a     so\
-dipodi:rx=\x2210.51\
-8422\x22\x0a     sodip\
-odi:ry=\x2210.51842\
-2\x22\x0a     sodipodi\
-:start=\x222.268928\
-\x22\x0a     sodipodi:\
-end=\x224.712389\x22\x0a \
-    sodipodi:arc\
--type=\x22slice\x22\x0a  \
-   d=\x22M 4.488976\
-5,20.557579 A 10\
-.518422,10.51842\
-2 0 0 1 1.366004\
-1,8.9024878 10.5\
-18422,10.518422 \
-0 0 1 11.250088,\
-1.9815779 V 12.5\
- Z\x22 /><path\x0a    \
- style=\x22fill:#ba\
-0c00;fill-opacit\
-y:1;stroke:#600c\
-00;stroke-width:\
-0.985622;stroke-\
-opacity:1\x22\x0a     \
-id=\x22path10\x22\x0a    \
- sodipodi:type=\x22\
-arc\x22\x0a     sodipo\
-di:cx=\x2212.749811\
-\x22\x0a     sodipodi:\
-cy=\x2211.5\x22\x0a     s\
-odipodi:rx=\x2210.5\
-07189\x22\x0a     sodi\
-podi:ry=\x2210.5071\
-89\x22\x0a     sodipod\
-i:start=\x224.71238\
-9\x22\x0a     sodipodi\
-:end=\x220.34906585\
-\x22\x0a     sodipodi:\
-arc-type=\x22slice\x22\
-\x0a     d=\x22m 12.74\
-9811,0.9928112 a\
- 10.507189,10.50\
-7189 0 0 1 8.606\
-985,4.480513 10.\
-507189,10.507189\
- 0 0 1 1.266543,\
-9.6203458 L 12.7\
-49811,11.5 Z\x22 />\
-<path\x0a     style\
-=\x22fill:#00ba58;f\
-ill-opacity:1;st\
-roke:#005a3a;str\
-oke-width:0.9986\
-38;stroke-opacit\
-y:1\x22\x0a     id=\x22pa\
-th11\x22\x0a     sodip\
-odi:type=\x22arc\x22\x0a \
-    sodipodi:cx=\
-\x2211.249662\x22\x0a    \
- sodipodi:cy=\x2212\
-.5\x22\x0a     sodipod\
-i:rx=\x2210.500681\x22\
-\x0a     sodipodi:r\
-y=\x2210.500681\x22\x0a  \
-   sodipodi:star\
-t=\x220.34906585\x22\x0a \
-    sodipodi:end\
-=\x222.268928\x22\x0a    \
- sodipodi:arc-ty\
-pe=\x22slice\x22\x0a     \
-d=\x22M 21.117075,1\
-6.091444 A 10.50\
-0681,10.500681 0\
- 0 1 13.967439,2\
-2.642879 10.5006\
-81,10.500681 0 0\
- 1 4.499955,20.5\
-43988 L 11.24966\
-2,12.5 Z\x22 /><!--\
- Generator: Adob\
-e Illustrator 28\
-.7.1, SVG Export\
- Plug-In . SVG V\
-ersion: 1.2.0 Bu\
-ild 142)  --><g\x0a\
-     id=\x22g5\x22\x0a   \
-  transform=\x22tra\
-nslate(-0.873867\
-44,0.19169467)\x22>\
-<circle\x0a       c\
-lass=\x22cls-1\x22\x0a   \
-    cx=\x226.5\x22\x0a   \
-    cy=\x228.5\x22\x0a   \
-    r=\x222\x22\x0a      \
- id=\x22circle5\x22 />\
-<path\x0a       cla\
-ss=\x22cls-1\x22\x0a     \
-  d=\x22m 3,13.3 c \
-0,-0.9 1.5,-1.7 \
-3.4,-1.7 1.9,0 3\
-.4,0.8 3.4,1.7\x22\x0a\
-       id=\x22path5\
-\x22 /></g><g\x0a     \
-id=\x22g6\x22\x0a     tra\
-nsform=\x22translat\
-e(0.76772115,-0.\
-40476876)\x22><circ\
-le\x0a       class=\
-\x22cls-1\x22\x0a       c\
-x=\x2216.9\x22\x0a       \
-cy=\x226.6999998\x22\x0a \
-      r=\x222\x22\x0a    \
-   id=\x22circle6\x22 \
-/><path\x0a       c\
-lass=\x22cls-1\x22\x0a   \
-    d=\x22m 13.4,11\
-.5 c 0,-0.9 1.5,\
--1.7 3.4,-1.7 1.\
-9,0 3.4,0.8 3.4,\
-1.7\x22\x0a       id=\x22\
-path6\x22 /></g><g\x0a\
-     id=\x22g7\x22\x0a   \
-  transform=\x22tra\
-nslate(-1.882953\
-2,0.53648282)\x22><\
-circle\x0a       cl\
-ass=\x22cls-1\x22\x0a    \
-   cx=\x2214\x22\x0a     \
-  cy=\x2215.8\x22\x0a    \
-   r=\x222\x22\x0a       \
-id=\x22circle7\x22 /><\
-path\x0a       clas\
-s=\x22cls-1\x22\x0a      \
- d=\x22m 10.6,20.7 \
-c 0,-0.9 1.5,-1.\
-7 3.4,-1.7 1.9,0\
- 3.4,0.8 3.4,1.7\
-\x22\x0a       id=\x22pat\
-h7\x22 /></g></svg>\
-\x0a\
-\x00\x00\x05~\
-<\
-?xml version=\x221.\
-0\x22 encoding=\x22utf\
--8\x22?>\x0a<!-- Gener\
-ator: Adobe Illu\
-strator 28.3.0, \
-SVG Export Plug-\
-In . SVG Version\
-: 6.00 Build 0) \
- -->\x0a<svg versio\
-n=\x221.1\x22 id=\x22Laye\
-r_1\x22 xmlns=\x22http\
-://www.w3.org/20\
-00/svg\x22 xmlns:xl\
-ink=\x22http://www.\
-w3.org/1999/xlin\
-k\x22 x=\x220px\x22 y=\x220p\
-x\x22\x0a\x09 viewBox=\x220 \
-0 24 24\x22 style=\x22\
-enable-backgroun\
-d:new 0 0 24 24;\
-\x22 xml:space=\x22pre\
-serve\x22>\x0a<style t\
-ype=\x22text/css\x22>\x0a\
-\x09\x0a\x09\x09.st0{fill-ru\
-le:evenodd;clip-\
-rule:evenodd;fil\
-l:#72B072;stroke\
-:#41433F;stroke-\
-width:0.878;stro\
-ke-linecap:round\
-;stroke-linejoin\
-:round;}\x0a\x09\x0a\x09\x09.st\
-1{opacity:0.8;fi\
-ll:#E6E6E6;strok\
-e:#505050;stroke\
--width:0.752;str\
-oke-linecap:roun\
-d;stroke-linejoi\
-n:round;enable-b\
-ackground:new   \
- ;}\x0a\x09.st2{fill-r\
-ule:evenodd;clip\
--rule:evenodd;fi\
-ll:#FFCC30;strok\
-e:#505050;stroke\
--width:1.043;str\
-oke-linejoin:rou\
-nd;}\x0a\x09.st3{fill-\
-rule:evenodd;cli\
-p-rule:evenodd;s\
-troke:#505050;st\
-roke-width:1.043\
-;stroke-linejoin\
-:round;}\x0a</style\
->\x0a<path class=\x22s\
-t0\x22 d=\x22M7.2,2.7c\
--2.5,0-4.6,1.1-5\
-.5,3.7c-0.9,2.6,\
-1,7.2,5.2,5.1c6.\
-9-3.4,6.9,0.8,8.\
-7,0.8c2.1,0,4.3-\
-1.5,4.3-3.4\x0a\x09c0-\
-1.7,0.1-3.3-0.9-\
-4.3c-1.7-1.7-2.6\
-,0.9-7.3-1C10.3,\
-3,8.7,2.7,7.2,2.\
-7z\x22/>\x0a<g>\x0a\x09<path\
- class=\x22st1\x22 d=\x22\
-M23.5,8.9c0,4.6-\
-3.7,8.3-8.3,8.3l\
-0,0c-4.6,0-8.3-3\
-.7-8.3-8.3l0,0c0\
--4.6,3.7-8.3,8.3\
--8.3l0,0\x0a\x09\x09C19.7\
-,0.5,23.5,4.3,23\
-.5,8.9C23.5,8.9,\
-23.5,8.9,23.5,8.\
-9z\x22/>\x0a\x09<path cla\
-ss=\x22st2\x22 d=\x22M7.8\
-,14.1c0,2.1,2.1,\
-2.1,2.1,2.1l-7.3\
-,7.3l-2.1-2.1L7.\
-8,14.1z\x22/>\x0a\x09<pat\
-h class=\x22st3\x22 d=\
-\x22M6.3,15.7l2.1-2\
-.1l2.1,2.1l-2.1,\
-2.1L6.3,15.7z\x22/>\
-\x0a</g>\x0a</svg>\x0a\
-\x00\x00\x089\
-(\
-\xb5/\xfd`\xaf\x1e}A\x00*i|\x11)\xe0\x92\
-6\x1dH\x11\x9bh\x1b\xb0h\xc9\xd7\x9fe\xc6\x81R\
-\xa9\x1d\xa2\x5c\xa9\x96\xc2gd\x93\xdd\x0c\xee\xaf\x8a\xdb\
-\x82\x19f(!L\x089\x01\x04\x01\x06\x01\x1e\x9a?\
-\xc1\xff\xfb\xe9\xae]\x8a\x8bo\xf9Z\xb8\xa8\x97\xcck\
-}S\xd3\x11\xff;\x99!\x95H\xe3<\xa2\x1a\xfa-\
-\xf5.\x90a=o3\xf7\xb3\xfa\xaf\xc5\xf5\x9b\xbex\
-\xcb=\xf3\xcf/\x83\xeb\xea\x8a)R\x19@\xe0\x89.\
-\x16@\x00\xe5\xb4\x83TL\x13\x93\x8c{\x87\x02QR\
-%Tb%\xf0\x83\x81C\xc8\xe4\x89\x9cib\xc1\xdc\
-\x00\x88\xc3\x012\xc0\xae\x9e>\x00\xf2<\x13\x0a\x0f7\
-I\x06@\x92\x9a\xc7\xa4\xe1L\x95\x8dIA\xa8\x00\x07\
-\x16\x07#r$'\xaa4\x91\x8a\x041\xa02\x1c\x0a\
-d\x82r\x01E\x12\x0eMD\x03\xe3<\x1a\x22\x14g\
-\x89p\x9e\x8dIR\xcb\xb6:\x05)\xc8p&\x18\x1b\
-j\xd1\xa8\xdc\x12\xf1Xk!\x07\xca\xe4\xd1\x80<\xee\
-.\x1f\x92\x082\xcd\xb0\x8c\x8c\x8c\xc7\x03R\x99\xa6\x8a\
-%B\xa2\xa8\x05%\x18\x12\xc3(U\xe0\xd4\xc43\xb9\
-P\xa0\xee\xac\x15\x04\x83)\xca\x03Fr\xf1LPS\
-\x04U4$\x94\x03\x0c\x15\x94\x03-\xadSM\xd2\xc5\
-\xf3<P\x8e\x06h\x22\x81\x82D\xd0\x14\x89\x1c\x8a\xe3\
-@1\x8c\x00\x88\x00\x07\x10,\xcfPL\x17K\x84\x84\
-2\x99\x80\x1a\x8a\xa3\x963\x5c\x22(\xd0D\x8a\x1c\x0c\
-\xf5Xh \x80\x08\xc9\xe86\x83q\x0ef9\xde\xe5\
-9\xee\xe1\xb5\xbe\xac\xba\x14W\xaetd\xd4\x85\xbf]\
-\xd1\xb6\x8e\x8b\xa0\x96\x5c\x96/\xdc\xd4\x94d\xd8\xfe\xfe\
-\xc7\x5c\xcd\xdf\x95\xfc\xbf\x87\xd9\xb7~\xf7\xb9\xd9\xba\xf0\
-1%\x0f\x88KUi\xf7\x96\xcc\x8e\xeaV)\x1a\xb3\
-Z\xe6\xab\x8d\x0f\xb5\x00\x00\xe0\xf8\x86\xa9\xd8\x0e\x80J\
-\xeblSTh\xbd\xf6\xb8t\xedU\xb1\xa9\xaa\xb6M\
-G\xeaTQ\xcbM\xd2\x12!I\x91\xa7Q\x14H\xb2\
-\xf1@\x15F#2Q6$\x86\xc9|\xe4QLD\
-\x0f4|H\x13\xc5\xb1p\x1e\xe7\xd1L<\xd1Ee\
-b\x80D\x91(\x90\x85\x05\xd48\x18\x93)\xe2DM\
-\xd3L\x10D\x013D\xceF\x04\xc2\x1211Q\x92\
-\x07\x84\xaa&\x9e'\xf7k\xba\xfa=f\xea\xb6\xf6\xb2\
-c\xea\xdanDg\x5cD\xca\x04\xdap\xab\xc1\x80\xf7\
-\xe4\xbfV\xdf\x5c\xd9\xf9\x89\x8f\xd9\xde\x8f\xae\xe9\x89\xfe\
-\x8a\xea\xed\x97\xbd\x1c\xf9\xb93\xbbq\x93o\xb5\xb7\xbe\
-r\xaa\x1bP;\xc8\xc64\x81\x02\xcc\xa85\xe3\xc6\xcc\
-2e\x8ei\xce\xb1\x86\xcf\xb2c\xd6\xeeq[\x0c\x1a\
-\xe2\xc3\x96O\x9bo2\x03M\xe0\xdd\xa9\x0c\x14\xe4\xc2\
-7\xe5\xf4^\xe9\x9c\xe6\x8c\x98iw\xf9\xe9\xde\xae\xf9\
-\xc8\xe9\xad\xbb\xc7\xca\xa7\x8b\xf7\xd6\xfe\x9d+\xb7#w\
-\x80\xe0p\xdb\xc4u\xa4\xb5\x03m\xf1\x82Lf\x91i\
-\xbb\x86\x0d\x95Q\xd3\x5c\xcc\xdaj\xd8\xa1\xc6O\xbe\xa5\
-FH\x5c\xe0\x87~\xaa\x0b81[\x11?\x81\xc4\xe6\
-\xa6\xadc\xa0\x12\x11\xf4@\x0ds\x8eDA\x01\xa9\x0a\
-4I\x05\x16\xfd\xad7\x95_.\xbb\x95\xcc)\x02\x1a\
-\x93h\x8aX,\x11\x16\x11D!Q\x22\x91\x05\xbc\xd5\
-\xf6\x8dyl\x98\xc8\xcd\xa6\x8e\x7f\xff\xd6\x8f\xcc\x12\x81\
-\x1ajq\xa4\x0b\x14\x09\x15\x22G\xba\x98&\x94\x0b\x12\
-\xb5d\xc0\xfb\xfc>?Tn\xc5;\xc7\xe3\xdf\xd6\xd7\
-\xf5e?\x9c(\xced\x22\x129\x88\x22\x10\x15\xd2E\
-\xa4a\xaa\x90L\x9c\x8a^\x22\xd8\xd8\xa6\xc6\x89\x16\x19\
-_\xc8\xab+\x17\x83k\x95YK\x8f\xf1u\x86\xd7\x06\
-\x07$\x18\xd2\x03\xe2\xd0\xfcmq\xe2\xf2&\xb3\xa3\xad\
-q\x01\x1e\xc3\xb8]\xb3\x8e\xdck\xd2\x1c\x11Q\x17M\
-\x17\xd5n\xda\x22.osw\xef\xb5[\xba.-_\
-\x7f\xd9\xfe\xad\xc7]\x98\xba\xaf\x8f\xc9\xbf\xcb\x9dy\xa9\
-\xbf\xba\xae\xfb\xa2\xbd\xc3\x99'm\xa9c\x19\x1e\xf2\xeb\
-\x9ak\x9b\xea\xd2_C;\xb6\xfb\xa7\x89&M\x07\x08\
-\xcb\x0e4\xc5\x05\xeaL3\x88\x8d\x1a3l\x8d\x0et\
-\xa41:\xce\xe1\xf6\xcd\xb3f\xde=K\xa0\x04\xae\x82\
-\xd6\xa5\xd6\x99jo\xd9\xf4S1z\xee9\x9b\xe7\xdf\
-\xb2W\xe4C4\xbc\xfcsE\xe7\xd5\xeb\x1e\xb9\xb3\xb1\
-\xd3\xcf\xbd\x0f\x7f9\x9e> \x0e\xa8\xb11\xb7u:\
-Re\xf2<\x8e\x01,\xe0\xff\xb6\x9c\x8c\xfa\x5cg\xf7\
-\xad\xf2\x5c\xed\x9c\xd9\xd5om#\xb5\xf8\xae\xb7\xd7\xdf\
-\xd8\xc5\xb4te\x9a\xbd\xc5\xff\x9d\xbc\xcf\xbe\xd9\x89\xd9\
-\xb7\x9a]\x11\x9b\xbb[\xfd\x89@x\x02\x81\xcc\xa8!\
-1S\x08\x91\x8c\x88\x88$M\xd2\x1cA\x91QJ1\
-\xa7\x8e\x1eRY\x98d\x19\x92\xa1\x19B\x04D`\x10\
-3D$\x81\x04\x22\x22\x22#2\xa9\x19\x0e5\x07\x84\
-\x14\xc3\x98 6\xff[y\xe2#\xf55`\x95\xa3\xe3\
-\x86\xec\xcf}\x1e\x01\x9f# \xc2\xd7\xbe3\xac\x1e\xab\
-\x1c\x17\xb6`\x14\x0e\x86*`f\xbd\xb4\x97\xc0E\x85\
-/\xd4\xdax/ \x01\xd0jX\xc2\x8b\xcd\xf8\xc4[\
-\xcfP\xd1zn\x96\x8c\xc6\x87.\x0d\x1a=\xc1o{\
-<\x98d.\xac\xb5\xaf\xd6!5\xfet\x8dIP\xf1\
-\xfa\x0e`\x98K\x0b\xf2\xb3\x92\xab\x8e\x80\xab\xa9$\xd4\
-\x80kkZ\xdd\xc9\x8fL\xc7G~\xe6\x1e\x07$\x1c\
-\xf9\x8a\x00\xde\x1c\xd0\xdb\x90\x1c3\xfd\xf7g\x0ec\x5c\
-3cF1\xc0>\x09&\x95\x84\xec\x84\x1f4f%\
-;*Y\x19\x82LV\x02*\x1f\x83\xff\x038\xe3\x85\
-*s\xb39W\xf4\x1fT\xd7\xf7\x1e\xca\x85\xfbl$\
-\xb5\xc4\xad0.T\xc1V\xa5\xcb\xac\xd1\x22y\x86\xd3\
-\x03\xac*>\x02\x99\x22\xf6R\x0aH\x82\xf2\x8e\xf7F\
-\x86\xa6\xe5\x19\xff[6\xc1\x06I})ey\xccg\
-\xb5\xad/,c\x09r\x12\x89e\x0f3\xa5E1\x88\
-p\x15Z\x00i\xd6\x11h\x93\xa8\x89X\xe9\x98_\x14\
-\x0e\xfbJ\xd3\xb0\xcb t3\xcf\x8d\xbe\x89\x16\xdb\xcb\
-\xb0\xb5?q\x14o\xc3\xbd\xf5\xfc\xaa\xd6\x84\x99\x0fi\
-\x9c\xa5\xc1\xb7f\xf4Cc\x0d\x15\xb4\xce\xa61#\xb1\
-\xac\x18\xc6M\xdemH\xd4\xde\xd4\x91?\xb9B\x22R\
-\xcb7@%\xf4\xf828\xc3/] \xdb\x05\xec\xef\
-\x12\x86`K\x03$B$\x0e\xcc0{\x5cdc\xb3\
-\x9e\x1c4*`$n;ZN\xb6~a*\x14\xb8\
-\xab\x82\xc6\xf5\xa3~\xf2\xd6\xaf8\xf3\xaf\xc9)j\xf2\
-\x1d\x0f\x80\x11\xe2`\xfeO\xd3Wz\xd1%:\x88\xa3\
-\xedeAu$3\xbf\x0c\xd8\xb2\xe7#\x85@*!\
-:\x8fh\x9d\xe2t;\x1e\xad\xe7\xc8\xa8f\xa7Z\xdf\
-\xcc)$Xpt\xed\x88\x12\xb23d\xb0\xab\x91\x15\
-M\x8e\xbdm\xd5ym\x94\xe6\xaf:A\xbdY(e\
-\xeb7\x84\x09\x07c\xc4\x0f\x9f\x0be-\xbf9\x1a\x14\
-\x908\x16\xa5\xfc$\x8f\x85\xc2\xc1\xb8\x92\xafV^!\
-\xfc\x19Q\xce\x16\xed\x04\xe1\x9f\x10\xe6lQ\x9d\x1d\x16\
-\xed\x99a\xd1'\x89\xbe\x93\x04=\xc8Q\x97\x09\xb0-\
-+r\xa6X\xe0\x9b\xc1\x05@:\x15J\xd6n\x19$\
-1[\xbe\x0cG\x1e,\xb8\xff\x94\xd6\xee\xf33\xc8V\
-\x89\xc5\xf5\xb8>Ef\x05\xd6\xfc\xb7p\x86\xda\xcb\x10\
-\x91\x86G\x8e\xc0+[\x8b\xb1\x13\xc1\x02\xdf{6Q\
-\xac'\x22\x11\xccQ\x129\xde\xe6\xf1A\xba\x82\xa1\xa1\
-9\xca\xde\xf4\xadi$I\x9a7\x10\x89\xd3\xb0\x84\xd8\
-\xb9&\x80\x12\xd8^p\x98|\x9c\x19A1&\xaaG\
-\x84KfK\xf5'\xdf\x0bd\x8b_\xaat\xa1;\x84\
-W\xcb\xe0\xc7\xdee\xa4\xcf\xbb\x84c\xa0\x22\xe10@\
-)\xbf\x06T\xcd\xec\xfc\xbdzK\x15\xda\xe0\x9d\xfcR\
-\xd6\xf7\x5c\xe5\xbfx\x11$\xc2\xab/\xda\x92\xedP\x9a\
-.hr\x80\x90OU\x0d\xf4\x8f\xfc\xafE\xf8\x9a\x89\
-\x01\x02\xe1\xaf\xd7\x9eL\xa5\xb5@s\xde\xfd\x99\xd1\xcf\
-.\x1c\x0d\xc6\x0d\x5c\xfb\xec\x22\x0d?[\xa3\x98C\x1a\
--\xd4\xf8JA|Et\x18b\xca<\x94$}*\
-\x81\x161q\xedF\xda\xd4\x10\xec\x09\x80-gO\x07\
-\x8b\xea\xd4?\x9d\x910\xd27\xaa/\x1d\x5c\xdcB\x81\
-\xb6\xd0N\x9f\xdf\xbe\xb7q\xbc\xe9\xf0\x87T\xe8\xde\x05\
-\xdcQ(\xb7.\x8f\x8e\x0e+$\xa5\x8d\x06\xbftV\
-\xf8D`\x81\xd5\xb3e,\xc6\x1a4\x93\xdaG\xc9\xc3\
-q\xf8\x90W\xf2\x81\xf4\xf3\x9d\xea\x8d\xf2\x92\x0e\xbc\x18\
-\x91C3w\xa9\xf8\x15T\x8ax\xd6\x93\x0dr6\x0c\
-\xa613\xd8\x98\xc2\xd3\xf8\x9a\x7f\x86 \xdab\xc3'\
-~\x0b+\xd5\xc1Ju\x15\
-\x00\x00\x0bN\
-(\
-\xb5/\xfd`\x1d)%Z\x00*t\xa4\x13*\xf0\x8e\
-H\x07\x10\xf9:\x945h\xe0\x05\xbc\x12!\xca\xb8\xf6\
-\x8bO\x1a\xea\xe1\x12\xa9\x7fEDDD$\xda\xa1\xea\
-^\xd63\xf0Z\xccG\x03U\x01C\x01\x1f\x01\xe8m\
-w\x1b\xef\x1d\xb1\xad\xfe\xf5\xed\xfa\xadG\x14\xc9\x82\xa3\
-\xf2\x80<\xb9\xc9\xb2\x93S?\x9b;{\xf6\xaa6\xdf\
-\xb3&\xb7O\xc6\xfd\xc3~TE\xcc\xc6\xd0\x00\x02(\
-\xb2\x03\x81\x0a\xca\xde\x18\xd7\xdf\x957OQ=\xf1\x1d\
-\xf9\xaeq\xa2\xfb\xe9_\x85\xe7\xceI\xf5\xa84\x0c\x80\
-&\x8b\xc3bT\x14\x09\xc3*';\xc7\xa4\x8aP.\
-\xee\x9fH\x8aR\x13h\x82M\x80\x19\x1c\x0e\x1d\x14h\
-z*J\xc5\xba\x06\xc7sAr`WOop@\
-\x10\x85\x02\xc3U\x14\x03@Q\x90Fuy\xaa\x0aF\
-\xc54\x8f\xc5\xf4P\xcfT\x81<*\x94\xc3\x81\xb9x\
-\x22G$\xb2H\x93\xe4\x02\xe41\xb1\x1eh\xe2\x11=\
-\x0d\xc4\x03aT\x14\xd3l3\xc7H\x08.\x1e\x8a\x05\
-\x03 \x00\x06\xd3\x5c*\xd7@4Zkx!\xa2@\
-\x17G\xe3\xee\xb2!\x99$\xa6\x17\xec\xe2\xe2\xa2\xd1p\
-T\xaaj\xd2@PQ\x85\xe9\xc1x4h \x22\x14\
-\xa6A\x89\x05\xb5\x16\xc3\x108&\x02Q,\x08\x98;\
-\xd6\x8c\x83\x02c\x22\x06Kb\x81 0\xd5$U.\
-\x09\x98\x05\x14\x220\x0e\xb2d\x9dLEY \x88\x01\
-\xf3LH\x91\x03\x8cc\x92\xaa\xc7\xf4D\xcf\x02f-\
-\x01\x0f\x01\x0a\x18h~QT\x96\x06B\x12Q\x22\x12\
-$z\x98\xe6\x186\x10\x91D\xa1\xa6\xc7\x82\x81*.\
-\x06\x1e\x02\xc7$\xebl\xa6\xc8 \xebe\x8fM\x97\xbd\
-2\xccT\x99f\x9bNju\x15E= \x08\x13I\
-\x12\x0cH\xaa4\x1e\x1a\x0f\x05\x1a\x8cKs\xdb\xb9\x95\
-\x8a\x87a\x0a<\x11\x8a\xe5B\x9aPLC\x81\xd7\xe8\
-\xc7*$)\xe3\x0f\x83339#O\xc6\xe5Q\xe1\
-\xfb\x0dD5\x91P\x9e\xc9\x8a(\x17\xd33\xa9\xa4'\
-\x22E\x14\xf4\xa0\x88P&\xe81!A\x92\x8b41\
-\xb1*\x8f\x88\xca\x06\xe2B\x8a<&\xd4=\x92G\xe5\
-\xb1L\xd5\xaa \x8f\x85\x09\xe9BU\x94\xc8r\xd5\xa3\
-\x92\xa6\x0a\x0bD\x8a\xe81eg\xdfT\xd6\x10Z\xd3\
-d\x818\xa8\xc7D\xd3\x0d\x0d\xc4$A\x12dz\x22\
-\x934\xc10\x11\xc7C\x01\x89E\xa4\x8a\xb0[\x12\x12\
-$\x1a\xd5\x13\xb1\x87\xe2\x81L\x16\x89b\x15j]\x1e\
-U\x84A\xad\x95\xd9\xc8\xa3\x88L\x0d\xea\xa9x<T\
-\x03\x196\xa8*z*\x1e\xe8i@\x22\xd0d\xa9D\
-\x1a\xa8\x88\x8a\xa4\x8a\x0a\x09\xf2XP\xaa\xc73A \
-\x10\x07e\x91$\x8d\x07\xed\xf6\x8d\xf0&\xd1\x0d\xad\xfd\
-\xe6\xeb\x9e\xeb\xa2\xf2\xee\xde\xb7\xa6\xdb\xcd\xc9\xefM\xdf\
-\xb9SsQ\xfb:=9\x1b\xf7\xf7\x13\xfb\xd1\xf7\xf5\
-?\xb9\xa5\xf3\xae\xde\xf5\xffr\xf2\xb26{\xc3\xbe\xc6\
-\xfc\xefED\xe6\xbc\x0e\xb5\x9a\xbf\xba\x0e\x98\x8c\x06\x8a\
-\x8d\x1d\xd1\xab\xbb\xb6\xed\xdaeL\xc7\xd1I/\x85n\
-t\x9c_\x84\x1e\x99\x1d\x5c\xe88\xf8\x16}\x0e\xaf\xc9\
-Y`{\xe2;\xb8\xa0uZy\xd7.h5;\x09\
-\xc1\x85P2t\x1an\xb6\x838.\xfds\x16\xd7\x04\
-\x95]sgDpt\x1d\xc4Y.\xaa\xd9\xe3j\x8c\
-\x1de\xbf\x94\xa9s\x90e\xcfNc\xd8\x0e\x1c\xb0\xd1\
-\xac\xea\xa1(($\x86\xa9H\x155!z\x10az\
-(\xcb\x04\x02\xda0\xd9\xebbz\xfbY\xfbE\xe61\
-\xd71\xd9\x9cY\x0e\xb8P\xa6\xeaQ1I\x14T\xf4\
-\x98$H>\x93y\x0319#\x06\xba?\xbb\xe6U\
-a\xef\xba\xcf\x1b\xdf5\xf7\x5c\xf9Z\xb6k-\xb75\
-\xfd\xd6l\xefVE\xcf\x02\xe8A\x89<\xa6\xbd\xdcf\
-VA\x9eiqyC^m\xd9\x16\xb6\xd5\xd5\x9a\xde\
-\xf2]n\x9bK\xb7\x97\xc59\xab9\xde\xe59\x07q\
-[_Vm\x8a-[:2j\xc3o4\xdb\x93f\
-\xeb\x9c\x83\xa6y\xc3MMI\xe3!\xdb\xb2\xbfd\xf7\
-,\x99\x1d\x99[F\x9113\x8d\xf9jc\xa3\x01\xe0\
-\xf8\x0c\x93a\x16\x01\x0aH,\xa8F\x86k\x04\xe7Y\
-k}\xb8\x8b\xdb;\xdf\xbb\x11\xd7\x8dYw\xb3\xe68\
-{\xe7\x88\xd5\x96\xb5e\xac\xfd\xa7\xce\x92\x19\xfb\x99\x1b\
-\xb6M\xf4\xec\xe5m\xa9\x9f\x97\xfc\xeb\xefw~\x9f\xcb\
-\xdd\x92\xbbI4S\xddD\x96\x98\xeb\xbb\xadw3\x93\
-eg7\xb3\xfccT\xfeo\x97{\x8e\xaa\xd8\x97y\
-\xa7\xdc\xda\xf7\xf5\xaf\xe3\xb5\xd3\x98o\x04\x07\xe2P\xce\
-\xf4\x913\x1cfm]#\x96\x93\xac\x11;u\x97\x9b\
-\x02g\x87\x7f\xee\x8c{\xff\xd9\xb6f\xae\xca\xa7\xeb\xfa\
-\xda\x8f\xc8\xdf\xac\xcd;\x11\x9b\xfd\xf3\xfb\x22\x0eH8\
-\xbe\xb3M]\x0c6MOO\xe5^\xa6-\xb5W\x19\
-\xa2\x222k\xe5\xe7\xcf\xc6\xe8\xff\xda\x87}\xcey{\
-\x98{\xaf\xf8\xea\xed\xbf?w\x9d\xd5\xb6\x8e\xd3\x9eL\
-?\xfb%R\x01\x81fN\x86\xe7\xeb\xcb\xd6;\xb6[\
-\xccL\xfed-\x0f\x97\xb3e\xbc0\xbc\x8b\x9d\xed\x9b\
-\xaag\xf3\xf7t\xdd\xcd\xd6\x8b\xe8\xaf\xed\xfd\xda\xf5\xf4\
-p\x12Y\xef:\x90\x83?\xa8\x22\x03W2efD\
-D$i\x92\xe6\xb2I\x8a\x85Y\x9eH]v2y\
-\xae#1\x94q\x86\x10\x01!\x86(\x22\x22\x22\x222\
-\x81D\x22\xd2\xb4\x90\x0e\x8dX\xa3J\x89\xe9\x88 \xf6\
-\x94\x06\x06\x1c\xf8I\xbbC\xe2H\xf9<\xbd'\xc0<\
-a\xa9\x11P\x13\xe0\x0d\xe8y\xb1\x9f\xc5\x96\x22\x07\xcd\
-\xb7\x0d\x96\xd6\xe9\xbe\xb3\x09Y\xa0\x0c\xe7\xf3\xde]6\
-\xd0\xaf\xa7D\x05\xba\x95_?D\x97\xd5\xc1)\xbbI\
-\x7f\x1c\x14\x0b\xc4\xb4\x87|\x9d\x038\xc4\xbc\x04\xfe#\
-\x9f\x16_\xfc\xd6\xda>\xe2.\x1fS\xcc\x08a\xaaJ\
-\xba\xf9\x0a\xf7\x94u@\xe2\xec\xea^9\x10$l\xae\
-\x96j\x06\xeeS\xf1zKT\xa0<\xb42\x9b\x11@\
-\x92\xb8\xf0\x19\xbe\x8cz\xbe2\x85\xe9G'}\xa6\x22\
-\x00\x99\xe4\x0a\x9e\x93\xfa\xb4\xdf\xd2\x13\xf9\xc3\x90\xfbH\
-N\xc1\xba\x22\x1e\xe7\x0d\x7f\x94LIf\xe6\x139\xdf\
-\xb5\x03\xf8\x1b<4\x1c\xa0\xee\x88\xe6~\xdc\xfa\xfd\xe8\
-\xfdU<U\x8a:X\x81i\xe5\x9a\x90\xed\xee9\xf6\
-\xaf \x81\xdc,\x852E\xb2\x1e$\x95Gq\xc0\xa0\
-\xa37\xbe\xf1OV\xd5,\xbc\xee\xd1\xe1\x12\xd2^\xe1\
-z\x99B\x04\x98k2\x95\x1f\x1e\xb8\xb1\x04\x91m\xcf\
-\xcf\xa3\x005\xa76\xa1\x08\xfdel\x09\xb3\x9d\xb0\x18\
-\xb5,\xadAt;\xfbY\xf9b\x19UV4\xb0|\
-\x90O\xdf\xbd\xd1\xca\xae\xe8a~\xcfy\xb4\x92\xe5\xe7\
-\xe6\x08\x9b\x08\x1d\xd8\x83\xed\x93\xa1\xf7%&%\xca\xf0\
-\x0a\x00\xe3aj \xee\xe1T/`\x9c\xa2\xa2\xf9\xa6\
-;@\xf4z\x1e\xd1Q \x06`L\xa8\xe3!\xf2\x11\
-\x03\xe0P\x9c\x04\x82\x11\xe7X\x8e\xe9\xc2\xa4\xedW\x09\
-\x80X\xe9\x8aU>@\x8cCWe#\x9b\x17C\xf6\
-y\x17\xa3\xf1\x9c\x7f\xef\x1a\xf8\x94\xd6\x80\xe86\xb7P\
-+\x9c\xb4\xb6\x9c^fhp;q\xeai\xfb\x0a\x96\
-\xed\xb1\xdf\x17!\x1cm^\xa8/\xe13\xd0=\xdf,\
-\xa4\xc2u\x19\xe8h\xf6\xb7\x0c\xfd\xacy\x91\xe5\xed\xc9\
-5d\x0ao\xd0Qg\x1e\xfd\x1d\x11\x84\xfa7,\xb8\
-\xba\x07\xbck\x99\xbb\xed\xcb\xb9C\x8c\xd2)\xd9\xcc|\
-\x22\xcf[\xf7\xfa\x0b\xedz\xad/\xb6\xf8\x7f\x12\x8f\xde\
-j\xe9H\x9d\xc3\xd3\x09\xa0%\xfc\x22\x83\x14[1\xd0\
-\x96k\x11\x82\x00HV\x1es\x1c\x94\x0b\xa8H\x19<\
-\xfb\xdf_Z\x08\xee\xa6)\xbfj=\x85\x1b\x99\xb6Z\
-\xa4f\x8c\x9ec]\x99\xaa\x8f\xa8!\x19\xab\x0f\x9c9\
-\x91\xaf#8\xa8]\xc4\x98`\x7f9_\x1c>\xe8\x8c\
-\xb8\x81\xf9\xa9v\x09\xf3x\x0c\x0dVs\xd7\xd8\x16\x16\
-\x94\xa81\xa9U\xae\xdf\x12H\xc6\x88q\xb6\x8f\x08 \
-\xca\xf2K\xe5\xfc\xaa\xdc\x99\xe7&\xb6k\xc5\x82\xb1=\
-\xb1\x8b\xa9\x98/\xd7em\xe4w3dp\x81\xa0Z\
-\x5c\x11\x05\x8ei8\x1a\xfae-#\xbf\xc6\xcb\x22\xd0\
-SU\xfb\xef\xd6\xb7\xaf{\xf9]\x84\xed\x14u4\xd3\
-\xff\xad\xd8\xa1\x07\xe4\x07\x0d<\xf6\xd6c\xcel#\x9c\
-\x97\xc2#\x80\x9eK\xa1x\xe9\xa3\x5c;\x00j\xd6=\
-\xb6\x1b\xe9\xe5\x18xpp\xe1>\xfe\x05\x10Xx\x8d\
-\xc2\x83g7\xb4\x1dt'[\x07\xb2w\x22Gw\xdc\
-\xe2G\xc3.\xf3\xd0k\xc1\xee\x8d\xd5\x5c\xb2\x89S\xdb\
-\xc8\xd1\x8e\x95\xab\xa1,\x8co,\xb9!}\x1a\x80\x14\
-f\xdf\xf8!\xe6\xaf\xec4\xbd\xb7\x91\x8f\x072\x84\x97\
-:\xba\x88\xb3\x17v\x99\x9f\xf6`\x8f\xf9 \x85\x10\xa7\
-#5\x09\xddv\xe8$h<\x00\xb0\x84\xceXJ9\
-ty\x0f\xfaPX\x86\xa0A\xb0\xe6\xe2\xe5pzD\
-&\x85\xa9\xbaW\xff\xb4\x01\x1d\x1b\xde]\x93R\x93\xb1\
-\x81&\x13z\xd1\x92\x17\x0d\xd3\x8c\x9c\xec\x93CP\xc7\
-#\x9c\xeb\x15p\xd1\xb0H\xe6b\xa8fb\xe4&a\
-\xfe\x0d{\xfa\xc4\xf2\x12\x15\xf5(\x9e\x92\xf4\xe1\xef:\
-\xfd\xa8L\x5c\x97\xa4\xcb.\xfafJ\xca\x0b<\x88\x91\
-\x95\x0dF\xe4\xc4\xff|\xb5\x0c\x18;\x0c\xfa\xe7\xc8B\
-\x0cL\x81\xe3[\x06H\xe1#P\xa1e\x86\x8aF\x06\
-\xef\x9f\xd1.\x0d\x88?\xb7\xfa*\x03\x04!s\x0c\x17\
-\xf1\xff\xc6\x0a\x14F\x82\xc7\xf8l\x80m6&\xbaq\
-\xbb*KI\x0dCa2\xb6;v\xf5`\xe3>\xd8\
-\xad\xa8\xccU\x92\xc9\xce\xb2O\xeb\x8b-zO\xecQ\
-\xeeyX\xa7\xb829\xc9\xa4L\xa2\xe4\x810\xc3\xf5\
-\x8d\x84P\x10\xae\xdfj\xfa\xb9\xed\xb8a\xe4d`\x1f\
-\x99\x06D\xd5\xff\xffn=Q\xbd%\x85\x9fR&\xb9\
-\xfenk+IZ\x92@T\x8f\xc1\xd2\xf7\x06\x94q\
-[Z\xe3\x9cb\x11\x88\xdc\xd8\xa0`T\xf5\x93\xe9%\
-[/\xc7MK\x9d\xa3\xc9\x9a\xc4\x0b\xf4\x15\x9c\xdbI\
-\xe4\xbf\xbd\xb8Q@\xacLPL\xb7Y\x1b\xeb)Y\
-\xb2\xb7\x92\x0c\xdf\xedY0\x13\x97~\xe6\xbaz\xd3\xc6\
-\xab\xc7u\x1f\xfd\x93l\xda\xf7(\xd5\xaf,L\xa9q\
-\xe7-\x9e\x02)\x14)\xf6v\x88NQ>0\x95\x0a\
-N\xe0\x14\x1b\x0d\xa7;Q\xc2\x19\xd7\x89\x908\xa3\x09\
-\xe9w\xbc\x94\x04N\xea@\xb0\x04\x96}(\xfe\x88k\
-W//zV\xf1b3\x97\xbcS\x82\x98\xca2\x8b\
-\xc1;\x04*>\xc3\xca\x95\x03`\xe3\xd0\xa7`\x9b\xa1\
-\xbb\xa4\xcf\xf7\xcaA`\xe0c\xf5\x16\x0b\xb2\x18m=\
-\xa1\xd58\x8a\x9b;\xdcy\x9bG+8\x1e\x8f)\x11\
-J\xa0-\xef)A^QkZ.+\xce-\x06\x22\
-\xde\x8d\xac\x5c\x049\xed\x94SRH\xfe\xea\xe8\x05\xc5\
-\x04\x92\xcbA\x04\xe6\xc9\x91K\x02\xe1\x10\x94\x89\x0c\x14\
-\x9eQi\xd7[o\x07B\x0c\x04c2\x13\x0a\x01\xc4\
-\xcf-\xc79@b\xf5e\x8aa\x14#@\xeaV\xc0\
-\xb9\xb4p\xab\xe32v\xc8\xcc3\xb7\x8e\xa1\xd5\x83#\
-a\xb9\xdb\xb5ys\x17\xae\x92\x85\x09\x0c\x9a6\xd8\xbc\
-U\xf0k\x03\xdf\xff\xc8_\xee\xe1\xc0;\xa4\xf0X`\
-'-\x8c\xa3{NcM\xccj\xa3w\x1a\xda+\xe5\
-\x98\xa2\xe7\xb9\x22\x82\x01#M\xdb\x1c\xd3\xe8j\x92G\
-7\xd9\x07kS\xd5+\xee\x84\x5c\x22\x1bB8j\x0a\
-\x99<:Ti\x95\x11?\x9a}{\xe5_\x0eWJ\
-\xdf\xec`\x04\xab\xbc\xaa>\x00J\x0fF\xc9\xd7\xe4\xd8\
-\x9f\x5c.\x0c\xf0!\x0a\x02\xd71\xcb\xc2@\x8a\xdc\x9c\
-+8\xd87k\xd1\xf0k9\xe2>\x0f\xe6\xef\x0d\x0f\
-\xa8\x5c\xcb\x07\x5cQ\xc8\xbb\x02\x83h$\x0e\x10\xaez\
-(\x90V`@\x92\x9e\x18\xf8b\xd4Z\xde5\x19\xe7\
-\xe2\xe8*\x80Y\x98\x84!\xb1\x06\xfc\xd3\x09\x03\x17\x8f\
-\xa8\xe7\x22\xc4\xa7\x0d\x0ck\xed`\x5cH+\
-\x00\x00\x05\xfd\
-(\
-\xb5/\xfd`5\x13\x9d/\x00\xc6\xff\xbc)\xe0N\x8a\
-\x1eh\xe3\xb8\xaa\xdf\xb1\xd5\xb1\xbf\xf8\xc7\xc1\x1c1\xa4\
-\x1e\x9f\x03V\x12\x86\xfb\xc0\xbb\xb6A\xfb\x81TN\x19\
-\xcc0f@\xf8\x05\xb3\x00\xb6\x00\xaf\x00\x8e\xc1\xe7\xaf\
-\x13\xef\xef\x9dt\x01\xfd\x1aT|5#\xfcP[\x9d\
-\xb4\xfa\xfc\xf4%\xc8\xac\x91\x95\x14\xd5\x82$\xea%\xf7\
-\xf1\xdf*\x9a\x15VP\x08\x81\x9e|UH5b\xef\
-\xf4\x10\xcd\x06{\xda\x98\xf5i%\xe3\xd8\xb4\xb7=0\
-yJR\xa1T\xbe \xcar\xdd\x88I\x82\x17\x08\x04\
-\x83\xb1\xee\x01\xde\x12\xa5\x22\x07\xda\xbd5\xad\xa0\xd0\xba\
-2`S\x84>\xe8|mEqh\x05\x14\x22t\xc2\
-\xb5\xd7\x9a\xd7\x19G(e\xd0\xdf\xb0\x92\x81V\x5c\x9b\
-\xe7\xfd\xfa\x0a\x9a1\x00\x0b\x04\xa3\xc0\xb2uA_-\
-\x9dR\x9d\x19\xf7zX\x02\x09\x13\x164UJ\xb2Q\
-\xfd^\xde\xdc\x82\xaa\xa5\xf0}IS\x08\xa5\xc0\x22\xf3\
-\x81\xfd\xa7Y}\xe4\xe6G\x9e\x15\xcb\xd1[hXJ\
-\xb5 \x9c\xa9\x1a\xf1<\xb3\xbd\x90\xc8\x93\xcd\xf3dc\
-*\x0cld\xe3\x0d\xbe\xfb\x95IY\xae\x7fo$z\
-<\x1b\x95L\xd9\xd5\x04X\xd0\xb5\xd4F\xf7\xa5k\x1b\
-\xd2\xa2\xa1\x01\x91\xad\x850-\x0b\xc8\xbc\xe6\x8aG\x96\
-\xa8\x89?_m}\xd0\x01:D\x07\x97\x81\x80;\x05\
-E\xefg\x0a\xc2<\x80\xe2\x1f\xec\xcd\x98\x00\xe3@\xe7\
-9\x01\x14\x94R\x0e\x0c\x9eqk@0\x96\xc38Z\
-2\xe5s%/\xbd\x22v\xbc\xb4`,\xee\xfe\xe0D\
-\xcaRs\x86@\x02\x82%\x7fm\xef\xf8\xe8F,n\
-\x0b^\xa6k[\x9bL&\xcb\xa2\xa8r~,H\x81\
-\xeb\x00\xe61\x17\x8f\x84;xK:\xd2\xc5\x07\xdf\xf4\
-*4\x98\x96E\xecv\xd8\xfd\x9a?\xed1\x8c\xe3\xda\
-_\xc7\x86\xae1L\xcb\xe6D\xd88\xd7\x8e{\x9a{\
-\xcd4\xef\xa6A\xd7\xae5\xb1=N\xc2\xd8\x1e\xd8L\
-\x83\xb0\x9b\x16_\xe2\xc1J\xd9\x0a\xe3I\xa3j\xa7\x0a\
-\xb5\xd5\xb2X\xfai\x83\xc2\x94\x84R\xa1Tj\xa2\xae\
-\xadP\x96\xc7\xe6\xc5\x0a\xf2\x8c\xe5\xa4\x87;m\xe3\xfe\
-C\xf4\x8f\x97\xa8\xc8\xc4>\xb0\xe3q\xde8\xc7\x1b\xb3\
- \x88\xb5\x17\xa0\x84\xd2_t)\xfd\x05\xca\x844\xcd\
-s\x0b\xca\x8f\x89\xfa\x07\xab\xd4\xe4\xfe#[\xfc\x92\xad\
-\x98N\x87D]:\x1b\x96N\x14\xdbh\xb0jV\xbc\
-\xa0\x89\x95\x02\x08\xc6$\xc1\xd3\x12#\x84\x17\xfaIO\
-\xc4\x06#\xd3\x9c=\xe6\x09\xef\xa8\xe1\xeb\x05\xed\xbc\x04\
-\xe3\xda\xc1\xab\x94\xb5\xb0\xa0jF_)\xca\x16K\xc4\
-\xe6\xc5\xd7b?\xe8\x9e{\x9a\xc7yZ\xe3\x1a\xf2\xb0\
-\x84\x0b\xf8<\xe9$I\xb6\xbe$rY\xe4p\x95\xe8\
-d\x932:\xe7\xed]\xe7\xcd]lb\xf3\x18k@\
-t\xed9\x8fi\xce1O@\x7fd{\x02(\xd4\xcd\
-\x13\xb2 \xc8\xb5\x0e\x5c\xe7\xcdS\x03\x1b\xd3r\xf47\
-:\xe6H\xc7D(\x9fdNF\xc8\xa4\x84\xce\x9c\x18\
-\x19\x19\x1f\x83\xb1a\x12O0\xe98\xf7\xe7\x09\xa7\x8c\
-\x8cNd \x94\xd0\xc9'\x9f\xe3\x18\x07\xa5{\x9a\x81\
-s\xa8Q\xb5cjDFR\x90\x14%\xad\x01\xd1\x10\
-R\xce9\xabl\x1b\xf2\xa0H\x85\xc1\x18\xcd\x18\x83\x90\
-\x80\x18\x81\x8c\x88LM\x10\x85\x8d\xa9\xed\xe7\x87W\xf0\
-m\x94\xd1\x12P\xc5#\x92\x19\x99\xa1>\x8ePl\xc0\
-\xdf\x00\x9aAs\xfd\xd9$\xd8[^\x99)W\xe8\x00\
-1\xcc\x0cZ\xb8\xa2\xf3\xf0\xfe\xc4\xbc\x04P\xc5f\x14\
-\xba\xb2\xd5\xf0\xbf\x0b\xfeq\xee\xe1h\xe0\xd7H\x95\xd8\
-\x82/\x9e\x08n\xff6\x22EN\xc9<\xa4h\xb0\x0b\
-Q{\x92\x04\xddG\xa30F\x1cJ\xcf=\xd5\x06\x1c\
-\xa0\xc7\xc0\x93\xe81\x1c}\xc2gz\xfc\x7f}\x0d\x8c\
-\x0b\xb9\x88\x0c\x18\xa5*\xc0\xff\xd3\x0a-\xf9\x82]\xf1\
-\x7f4d0Mj2\x85\xd7\x98\x09#&b\xad$\
-\x1c4\x05\x06\xb2\xc4K\x1e\x9c\xfd\x055\xca\xe3W\x0c\
-W\x04\x92\xff\x0f\xf6\x98d|\x22\xfet\x9e\x13\xe7t\
-\xa4\xd2P]\x98v\xd1\xc1\xc5\xdb\xfeN\x1a-\x8cf\
-\x08p\xfdq\x80Q\x0e/\xf0z\xe4\xfc\x02!\x04\xee\
-:P\x81`\x7f\x22q\xde\xaa\xe5.Uw\xa9\xd6\xb6\
-\xeaY\xd3\x18\xeb\x1ck\xd7j\xbd\xb7R\xcbg\x87\xaa\
-\xb5x\xe4k\xb0\x8a\xa9\x7f@\xf8\xc0R\xf7\xd7\xdd\xb5\
-\x8b\x0fi\xd8\xf2\x0a(\x07D\xb8\x94*W\x18\x8f\xe5\
-\xd9>3\xd0\x84\xe4|#g\x8b\x8c#\xf2g\xc8\xd0\
-AVN~\xa1\xab\x8a\x17\xf4\xc0\xa3\xcb\xcbA\xcdO\
-H\x9c\x1aL\xec\x10b\x8bs\xef\xf2\xb0\x88>\xb0}\
-\xb9\x09\x14X\xab\x9a\x96\xa5Ylw\x94)\xaf\xa4\x8d\
-\xfb0Uf\x9d\xcdE\xbb\x02\xa1\xbd\x88a'%\xfe\
-\x99D\x033\xacn\x15B]}e\xcf\x18\xab\x9a\xeb\
-#\x81\xda\x8b\xd9\x10\x8b\xa4\x97<\xf0-dw\xeb\xd4\
-\x83\xd5\x91\xa6w\xf5\x1f\x06\xaa9\xce\x0d,\x047{\
-q\x88A\x9a\xac\x06)x3\xa8\x0a\x0b\xc2\x01z\xfb\
-m\xdb`\xd1\xba^J\x06\x92y\xc0k\xc9+\xce\x00\
-\x8a\xe4\x05\xb9,z\xf5l\xe2f\xca\xae\xdaD\x11d\
-sN\x9f\x95\xd3\xc8\xbc\xe5\x0f\xf8\xbdl\xcfd\x93\x05\
-S\xa2\xa7}\x88U\xdd\x88\x07\x10\x1b\xfd\x91$\xb3\xad\
-\xc0\xebX\xa1l\xe5c\xaf.\xe0\xd6\x04\x81\xc9\xe3\xa0\
-l\x9fh\x10\xc4p\x22p\xa6S\x17t\x81\x80 \x00\
-D\x964\x8e\x98\x1a\xc0d\x19\xe4x\xf6\x0c\xe0\x9d\xce\
-\xee+]\x0f\xe5\xfb1\xfd\x0b\xf8\xec\x9b\xb0\x19\xb4\x08\
-\x0a\x97\x8ce\x17\xcf\x14\xc9D\xc4\x82s\x8d\x9a\xb0\xe3\
-83\xb9'\x0f\xf8\x19S\xb3\xc9*\x8a\xc3\xb0?\x87\
-l&\xda\x9bU\xb4\xd3W\x13q\x90\x06>k\x87\x0c\
-m\x87\x8e\xa8\x0f\xf2+~)\xa4g(N\x85\x0a\x9f\
-\xa4\x00\x18\x1ce\xe6\x8d\xc6]t\xd1\x5c\xc6\x84\x87\xec\
-\x0fc\xa2Ln\xc4\x22\x07\x0bK\x8c\xd7nb\x80\xe8\
-Uh;\x00?\x06\x03\xf9\xf5\x80\x86~`yMN\
-\x97\xd8\x02\x10\x22\xb8\xa1\x9d~B\x0a\x5cT]\x80\x04\
-\xef\x9f\xde/o\xd8\x8a\xc2\x06\xd9\x91\xcd\xf0\x13\x809\
-\xe6\xc1\x01iCR\x19\xd9\x06}5\xa7bzi\x03\
-\x13\x87\xdco^\x09\xdd\x7f2\xcf\x5c\x05\
-\x00\x00\x114\
-<\
-?xml version=\x221.\
-0\x22 encoding=\x22UTF\
--8\x22 standalone=\x22\
-no\x22?>\x0a<!-- Creat\
-ed with Inkscape\
- (http://www.ink\
-scape.org/) -->\x0a\
-\x0a<svg\x0a   width=\x22\
-24\x22\x0a   height=\x222\
-4\x22\x0a   viewBox=\x220\
- 0 6.3500002 6.3\
-500002\x22\x0a   versi\
-on=\x221.1\x22\x0a   id=\x22\
-svg1\x22\x0a   inkscap\
-e:version=\x221.3.2\
- (091e20e, 2023-\
-11-25)\x22\x0a   sodip\
-odi:docname=\x22pop\
-ulation.svg\x22\x0a   \
-xmlns:inkscape=\x22\
-http://www.inksc\
-ape.org/namespac\
-es/inkscape\x22\x0a   \
-xmlns:sodipodi=\x22\
-http://sodipodi.\
-sourceforge.net/\
-DTD/sodipodi-0.d\
-td\x22\x0a   xmlns=\x22ht\
-tp://www.w3.org/\
-2000/svg\x22\x0a   xml\
-ns:svg=\x22http://w\
-ww.w3.org/2000/s\
-vg\x22>\x0a  <sodipodi\
-:namedview\x0a     \
-id=\x22namedview1\x22\x0a\
-     pagecolor=\x22\
-#ffffff\x22\x0a     bo\
-rdercolor=\x22#0000\
-00\x22\x0a     bordero\
-pacity=\x220.25\x22\x0a  \
-   inkscape:show\
-pageshadow=\x222\x22\x0a \
-    inkscape:pag\
-eopacity=\x220.0\x22\x0a \
-    inkscape:pag\
-echeckerboard=\x220\
-\x22\x0a     inkscape:\
-deskcolor=\x22#d1d1\
-d1\x22\x0a     inkscap\
-e:document-units\
-=\x22mm\x22\x0a     inksc\
-ape:zoom=\x228.3467\
-133\x22\x0a     inksca\
-pe:cx=\x2227.555757\
-\x22\x0a     inkscape:\
-cy=\x2220.307395\x22\x0a \
-    inkscape:win\
-dow-width=\x221312\x22\
-\x0a     inkscape:w\
-indow-height=\x2267\
-4\x22\x0a     inkscape\
-:window-x=\x222670\x22\
-\x0a     inkscape:w\
-indow-y=\x22596\x22\x0a  \
-   inkscape:wind\
-ow-maximized=\x220\x22\
-\x0a     inkscape:c\
-urrent-layer=\x22la\
-yer1\x22 />\x0a  <defs\
-\x0a     id=\x22defs1\x22\
- />\x0a  <g\x0a     in\
-kscape:label=\x22La\
-yer 1\x22\x0a     inks\
-cape:groupmode=\x22\
-layer\x22\x0a     id=\x22\
-layer1\x22>\x0a    <g\x0a\
-       id=\x22g1\x22\x0a \
-      transform=\
-\x22translate(2.612\
-35e-4,-1.6242161\
-e-5)\x22>\x0a      <pa\
-th\x0a         d=\x22M\
- 1.4377493,2.264\
-8659 A 0.2645833\
-3,0.26458333 0 0\
- 1 1.3028118,2.2\
-278242 1.0424583\
-,1.0424583 0 0 1\
- 0.79216593,1.32\
-29493 1.0583333,\
-1.0583333 0 0 1 \
-1.8504993,0.2646\
-1596 1.0424583,1\
-.0424583 0 0 1 2\
-.7553743,0.77526\
-183 0.267978,0.2\
-67978 0 0 1 2.30\
-02909,1.0583659 \
-0.52916666,0.529\
-16666 0 0 0 1.85\
-04993,0.79378263\
- 0.52916666,0.52\
-916666 0 0 0 1.3\
-213326,1.3229493\
- 0.52916666,0.52\
-916666 0 0 0 1.5\
-859159,1.7727409\
- 0.26458333,0.26\
-458333 0 0 1 1.4\
-509784,2.2648659\
- Z\x22\x0a         id=\
-\x22path1\x22\x0a        \
- style=\x22fill:#fd\
-ad17;fill-opacit\
-y:1;stroke-width\
-:0.264583\x22 />\x0a  \
-    <path\x0a      \
-   d=\x22m 0.940332\
-63,4.5879076 v 0\
- a 0.24870833,0.\
-24870833 0 0 1 -\
-0.097896,-0.0185\
-21 0.93662499,0.\
-93662499 0 0 1 0\
-,-1.730375 A 2.6\
-643541,2.6643541\
- 0 0 1 1.3001657\
-,2.7014283 0.269\
-82314,0.26982314\
- 0 0 1 1.4059991\
-,3.230595 1.9473\
-333,1.9473333 0 \
-0 0 1.0382282,3.\
-34172 a 0.407458\
-33,0.40745833 0 \
-0 0 0,0.7434791 \
-0.26458333,0.264\
-58333 0 0 1 -0.0\
-89958,0.5132917 \
-z\x22\x0a         id=\x22\
-path2\x22\x0a         \
-style=\x22fill:#fda\
-d17;fill-opacity\
-:1;stroke-width:\
-0.264583\x22 />\x0a   \
-   <path\x0a       \
-  d=\x22M 4.9090826\
-,2.2648659 A 0.2\
-6458333,0.264583\
-33 0 0 1 4.77414\
-51,1.7727409 0.5\
-2916666,0.529166\
-66 0 0 0 5.02549\
-92,1.3229493 0.5\
-2916666,0.529166\
-66 0 0 0 4.49633\
-26,0.79378263 0.\
-52916666,0.52916\
-666 0 0 0 4.0465\
-409,1.0583659 0.\
-26458333,0.26458\
-333 0 1 1 3.5914\
-576,0.79378263 1\
-.0424583,1.04245\
-83 0 0 1 4.49633\
-26,0.26461596 1.\
-0583333,1.058333\
-3 0 0 1 5.554665\
-9,1.3229493 1.04\
-24583,1.0424583 \
-0 0 1 5.0440201,\
-2.2278242 0.2645\
-8333,0.26458333 \
-0 0 1 4.9090826,\
-2.2648659 Z\x22\x0a   \
-      id=\x22path3\x22\
-\x0a         style=\
-\x22fill:#600c00;fi\
-ll-opacity:1;str\
-oke-width:0.2645\
-83\x22 />\x0a      <pa\
-th\x0a         d=\x22M\
- 5.4091451,4.587\
-9076 A 0.2645833\
-3,0.26458333 0 0\
- 1 5.1445617,4.3\
-233242 0.2645833\
-3,0.26458333 0 0\
- 1 5.3271242,4.0\
-719701 0.396875,\
-0.396875 0 0 0 5\
-.5546659,3.70419\
-92 0.3889375,0.3\
-889375 0 0 0 5.3\
-112492,3.3311367\
- 1.9473333,1.947\
-3333 0 0 0 4.943\
-4784,3.2200117 0\
-.26982311,0.2698\
-2311 0 1 1 5.049\
-3117,2.6908451 a\
- 2.6643541,2.664\
-3541 0 0 1 0.457\
-7292,0.1375833 0\
-.93662499,0.9366\
-2499 0 0 1 0,1.7\
-30375 0.24870833\
-,0.24870833 0 0 \
-1 -0.097896,0.02\
-9104 z m 0,-0.26\
-45834 z\x22\x0a       \
-  id=\x22path4\x22\x0a   \
-      style=\x22fil\
-l:#600c00;fill-o\
-pacity:1;stroke-\
-width:0.264583\x22 \
-/>\x0a      <path\x0a \
-        d=\x22M 3.1\
-734159,3.7041992\
- A 1.0583333,1.0\
-583333 0 1 1 4.2\
-317492,2.6458659\
- 1.0583333,1.058\
-3333 0 0 1 3.173\
-4159,3.7041992 Z\
- m 0,-1.5874999 \
-A 0.52916666,0.5\
-2916666 0 1 0 3.\
-7025826,2.645865\
-9 0.52916666,0.5\
-2916666 0 0 0 3.\
-1734159,2.116699\
-3 Z\x22\x0a         id\
-=\x22path5\x22\x0a       \
-  style=\x22fill:#0\
-05a3a;fill-opaci\
-ty:1;stroke-widt\
-h:0.264583\x22 />\x0a \
-     <path\x0a     \
-    d=\x22m 3.17341\
-59,6.0854492 a 2\
-.7569583,2.75695\
-83 0 0 1 -1.0107\
-083,-0.1931458 0\
-.93662499,0.9366\
-2499 0 0 1 0,-1.\
-730375 2.7490208\
-,2.7490208 0 0 1\
- 2.0214166,0 0.9\
-3662499,0.936624\
-99 0 0 1 0,1.730\
-375 2.746375,2.7\
-46375 0 0 1 -1.0\
-107083,0.1931458\
- z m 0,-1.5875 a\
- 2.1986875,2.198\
-6875 0 0 0 -0.81\
-49166,0.1561042 \
-0.40745833,0.407\
-45833 0 0 0 0,0.\
-746125 2.2225,2.\
-2225 0 0 0 1.629\
-8333,0 0.4074583\
-3,0.40745833 0 0\
- 0 0,-0.746125 2\
-.1986875,2.19868\
-75 0 0 0 -0.8149\
-167,-0.1561042 z\
-\x22\x0a         id=\x22p\
-ath6\x22\x0a         s\
-tyle=\x22fill:#005a\
-3a;fill-opacity:\
-1;stroke-width:0\
-.264583\x22 />\x0a    \
-</g>\x0a  </g>\x0a</sv\
-g>\x0a\
-\x00\x00\x03\xb4\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 viewBox=\x22\
-0 0 22 22\x22><g tr\
-ansform=\x22matrix(\
-.04332.00944-.00\
-944.04332 4.374.\
-718)\x22 fill=\x22#4d4\
-d4d\x22><path d=\x22m2\
-11.03 178.32c-45\
-.06-21.617-100.5\
-3.334-123.89 49.\
-03-34.3 71.5 42.\
-761 99.83-20.17 \
-163.53-35.12 35.\
-553 145.27-5.856\
- 183.35-85.25 23\
-.36-48.694 5.768\
--105.69-39.29-12\
-7.31\x22/><path d=\x22\
-m337.69 44.849l-\
-92.11-44.19c-3.5\
-21-1.688-7.376-.\
-029-8.568 3.688 \
-0 0-20.06 60.925\
--27.05 84.29-1.7\
-68 5.902-3.498 9\
-.161 1.848 11.72\
-4 16 7.675 51.77\
-1 24.84 69.73 33\
-.455 4.662 2.236\
- 6.799-1.559 9.9\
-33-6.291 12.63-1\
-9.07 48.701-73.6\
-8 48.701-73.68 2\
-.153-3.258 1.034\
--7.304-2.486-8.9\
-92\x22/><path d=\x22m2\
-71.52 148.2c-15.\
-836-7.594-48.771\
--23.401-64.61-30\
-.995-6.381-3.06-\
-7.568 3.75-8.57 \
-6.469-2.311 6.26\
-7-8.163 25.437-8\
-.163 25.437-1.19\
-2 3.717.991 7.22\
- 4.854 7.785 0 0\
- 14.877 2.175 25\
-.26 7.155 12.852\
- 6.165 26.676 20\
-.937 26.676 20.9\
-37 2.666 2.85 6.\
-61 2.518 8.765-.\
-739 0 0 13.02-18\
-.761 16.772-25.3\
-77 1.375-2.431 4\
-.726-7.933-.989-\
-10.672\x22/></g></s\
-vg>\
-\x00\x00\x05_\
-(\
-\xb5/\xfd`\xa0\x11\xad*\x00\xd6\xf8\xa7(\xf0N\x88\
-\x1e\x08bKD\x80-\xa5\x03\xff\x83\x17\xe50l\xb4\
-\x0e$x^\xe0\x8a\x89\xa1\xca\xa6\xedYX?\xf7f\
-\xe0\xf9`\xf2\xa9\xa2\x00\xa3\x00\x9a\x00o\xf1\xc5a%\
-(\x9d \x0c\xcb1L\x9d~\x1a\xc9\x18C\xff(\xd6\
-jxH\xa0\x5cm\xb5d\x01\xb1\x05\x1e?9\x5c-\
-EY\xe7\x1dSn\xfe:\x8e\xe2\xda)8\xd7\xa7\x9e\
-\xbe\xe2<\xf46*\xe7Q\xf0;M\x85\x9fj\xeaW\
-\x8d\x83-\xd4\xc9\x01W\x06ir\x8d`\xc6\xdc\x15o\
-\xca\x9c\xd3A\xcf}\xf2\xd3\x8d\x19\x80`@\xc9_\xfb\
-\xa1wn\xc3\xe2\xae\x12\x89\xd2Zs%\xba\xb6\xdf\xa3\
-\x1f\x8f\x87\xa2$\xaa\x9c\xa5d\x81\xeb\x8a\x1cX\xd1\xf0\
-0 a\x18\x02\x08\x11\x92ET\xa7\xc7:\xf5W\xd2\
-\xda%\x8bj'|\xdf\xb1(\x05\x19\xa0\x08\xd3Q\x96\
-\xeb\xdf\xdbp\x12\xd2!Y\x5cK\xads\xff\xb9\x96\xb1\
-\x92\xc7\x0d\xe3Idk\x1d8\x0a\xf7#\xcd\x82d\xf1\
-L+bl\xad\x00\x0e\xddz\xe8\xd4(\xb0Z{;\
-|_B\xaf\xaa\x80E\x0d\xda`\xe5k+\xc8\x81\x95\
-@\xc2\x83\x85p\xbd4\xe3+\xe3\x06\xa5\x0a\xd63\xec\
-C`%\xae\xcd\xcd\xfd\xfa\x09\x16c\x00\x14\x8a\xec\x95\
-\x88\xe4\xc9~\x227\xd4\xe2\xe9yl}\xc7\xd3\xc6e\
-\x90\x031\xef\xdf\xc3w\x08\x82\x96\xaf\xb6JH\xe5\xbd\
-\x12R~\xa6G\xa4\xb9Ql\xa0\x03\x9b[\x89\x89\xde\
-\xcf\x13\xc5\x04\xbc\x05{3~\x8eh\xc8  .\x01\
-\xb3\x17\xf8\xa4+\xc9\xe2\x98v\xb1\xa5\xcb~n\xb9\x96\
-\xb0\x197\x1fl\xe6\xad\xd8\xef-\xd9\xd0\x97\xbf\x5c'\
-\x8b\x1b\xea\xacj\xa3\x08\xb5\x95\xa2$\x11H$\xaf\x04\
-V\xd4C\xe9\xffL\x8d\x87\x95\xf0J \xd7\xa4[Z\
-S\xd6^`Z$\xba\xbbG\x7f\xfe\xc2DM\x90\x86\
-Z \x93,\xb2\x14M/\xb1:=\xeeK\xd9\xe2\xc7\
-\xb4\x81\x9e\xe9\xd2\x86ai\x04\xb1\x0c\x06\xab\x9a\x8a=\
-Y<\xec\xd3H\xb8}\xd4T\xdf\xb8Y\xcaM\xc5\xb2\
-\xf3\x15\x18\x16R%\x0b\x9c\xa7\xda\xc8\xf6R\x0d\xc7>\
-\xaf9\xf3\xbc_\x5c\xe2\x02\xfdu\x0f\x91\x03+\x0a6\
-\x1b\xd2\xd8-\x22\xa0d\x5c3\xc7b;\x87p\xfe&\
-D0oi\xd9\x8f9\xde\x92:&[:\xe2\xb1\xd7\
-N\xc6eB\x93\x1c\x0d\x81\xbd\xdd-\xed\xcc5\xc3\x9a\
-\xc3\x1c\xb0\xa1K\xb3#D\xccv\x06v\xbc\x8cw{\
-PF:Y@\xb2\xf3\xb7I\xd0\xb1e\xba\x08\xdf\xf4\
-\xc9\xdc\x84\x8f\xcd\xf9\x1a[ \x8c\x13:{P2G\
-C\xb0\xb9D\xd7\x9a\xc7\x09\x17\x18\xdf\x9b\xcfM\x9f\xbe\
-\xb8\xe8\xdet\x0c\x94\x92l\x88h\x0c\x92\xb9L\x07\xfd\
-y\xe4\x91\xa2\xf0\xe6\x0e>\xd71\xae\x81[\xa8Q=\
-SJDf$\x05I\xa1\xd0\x18\xe1\x10\x81\xceII\
-\xb7\x01\x92Q\x9c\xa1\x80\x90\xb2\xc6\x08\x88\xc0(b\x0c\
-\x9aP\x02\x11Q\xd0\xae\x06\xb2\xf1\xe6\xc2'\xc2\xb0\xe6\
-k\x22\x8bo\xb9\xb6\xd6\x12\xdb\xb4s\xee\xb7\xd90\x91\
-ZZ\xd0\x1b\x91\x7f\x04\xba\xc7\xfa\x9e\xbbs\xf7#+\
--CI\xcfx\x13\xddrUkO\xd8\xea+\x92\xb6\
-e6\x1c\xa0s\x03\x1e\xeb\xbd\x8c\x0b\x7f\x11B\x00\x87\
-m\xb8\xfa\x09\x8a-\x8f\xce\xff\x19\x9b\x9bZ\xaa/\x0b\
- \xd5xN\xe9\xa7\x10b?\x08\xa6XP\xbc\x18\x92\
-cPq\xaf~\x07\xf6\xd7\xde\xdc\xdf\xc9s?\x8eO\
-\x9c\xfd\xf8C\xef\xbbs\xbfL\x88,=\xe7x\xbc \
-p\x92\xd3\xd2\x7f\xa1\x08W\x16p\x94\x01\xeb\xc4C*\
-\xc5S\x81\xec\xbb\xcfw\xd3\xe3\x0e\x9b\xf8\xeb\xab~\xbd\
-j}~=\xf7w\xbc\xf4\xf8\xab\xad\xfe\x15\x8c\xf7\xfb\
-\xb9\xdf)\xdb^D\xfb\xf7GEJ\xf0\x80lL\x16\
-^\xf6)o\xcdO\x22s\xc4u\xef\x15\xd6\x22\xddc\
-\xf0t\xe8~\x02\xa2{~3X{\x0fao\xe4\xe5\
-\xce\x98\xb0\xcbR{\xb7\xee\xfe\xf7iT5:\x98w\
-\x94,\xde\x86Kp\xb1\x01\xe0\x06\xc5\x16\x05[\xed7\
-F\xb3r\xce\xcfC\xc7k\xf9bs\xac\xd6)=\xa9\
-,\x93\xf2\xa2\x96\xf7\xa9[\x8c\xb4\xcc5\x1eeu\xa4\
-\xf3(\x17\x13\xe3g\xc1\xde,%\x0eS\xe1'\xf7\x12\
-\xe0\xf7`\xfb\xcbgT\x92E\xb5\x8bk!,?\x8d\
-\xcd=\xf6\xb0MX\x95[\x9a\xb6\xad\x8f\xd4\x8a~~\
-/\xeb\x7f\x05\xe5\xeb\xe5zzHB\x1aK\x87\xedK\
-\x99*m\xebME\xd3Z\x14\x08N\x07x4(\xfe\
-0k'\x97\xf7\xa6\x8b\xf4\x10\x1e\x92\xd5&\xd8\x02>\
-\xeb\x80/\x879\x88\x01NP0\xa4\xd6q/K\x87\
-\xa5\x1a\x92\x5c\x7f0\xb3y\x00\xfd\x02\x90\xf8,&X\
-7\x7f4Kz\xee\xf6\x0e\xccBl\xa5'\x16`y\
-Cy\x0b\x89F0\xbd\xa8\xc9\x992\x84\x1ab\xcf*\
-\xe8\xedN\x11w\x14\xbcF\x91\xb3\xd6\x00i\xc3l&\
-\xa4zb\x04\xca\x19\xc3h\x1c\xa1\x0a\xb2\xf3\x12L\xc0\
-\x18\x8a\x93O<\x98\x0c\x87*\x16tMdIU\x88\
-\xa8\x14\x0fwS\xc1\xd4$\xbf\x0b\xa9d\xda\x88\xaf<\
-\x02+\xf4\xf0\xfaa\xea\x94!\x8ejNr\xe9\xee\xa7\
-+\x0e\xcd\xbf\x17\x0c\xd5\xcf;z:h\xea\xfbz\xfd\
-\xa6\xeb\x91\xc9\x0fL\x01\x8d\xd6`&\xe5\xb2\xf2\x22|\
-\x08\xd9\x9e0\xf6\x22-\x88Z6\x03\x99\x190p+\
-_\x0a\x1eH\x02\x8f\x5c\x82WK\xf9u\xde$\xe2\xc1\
-SJR\xe7\x02Sb\xb1\x19\xb5xT\x00\x92h\xeb\
-\xbe\xa4hw\xc4\x8f\xd9\x10\xa8\x83\x03\x12\xee\x0b\xc1\xa8\
-\x14\x0b\xd4\xd6\x833\xd6r\x19\x7f6SX\x05\
-\x00\x00\x0d\xe0\
-<\
-?xml version=\x221.\
-0\x22 encoding=\x22utf\
--8\x22?>\x0a<!-- Gener\
-ator: Adobe Illu\
-strator 26.3.1, \
-SVG Export Plug-\
-In . SVG Version\
-: 6.00 Build 0) \
- -->\x0a<svg versio\
-n=\x221.1\x22 id=\x22Laye\
-r_1\x22 xmlns=\x22http\
-://www.w3.org/20\
-00/svg\x22 xmlns:xl\
-ink=\x22http://www.\
-w3.org/1999/xlin\
-k\x22 x=\x220px\x22 y=\x220p\
-x\x22\x0a\x09 viewBox=\x220 \
-0 64 64\x22 style=\x22\
-enable-backgroun\
-d:new 0 0 64 64;\
-\x22 xml:space=\x22pre\
-serve\x22>\x0a<style t\
-ype=\x22text/css\x22>\x0a\
-\x09.st0{fill:url(#\
-bristles_0000003\
-1165038622608008\
-4400000025899504\
-70905137302_);}\x0a\
-\x09.st1{fill:#8284\
-87;}\x0a\x09.st2{fill:\
-#825D21;}\x0a</styl\
-e>\x0a<g id=\x22brush_\
-parts\x22>\x0a\x09\x0a\x09\x09<lin\
-earGradient id=\x22\
-bristles_0000017\
-0976143425425398\
-0000000171179213\
-95775194252_\x22 gr\
-adientUnits=\x22use\
-rSpaceOnUse\x22 x1=\
-\x2210.2681\x22 y1=\x2253\
-.4824\x22 x2=\x2244.57\
-5\x22 y2=\x2242.5721\x22 \
-gradientTransfor\
-m=\x22matrix(-0.381\
-6 0.9243 -0.9243\
- -0.3816 72.2028\
- 14.6089)\x22>\x0a\x09\x09<s\
-top  offset=\x220\x22 \
-style=\x22stop-colo\
-r:#FFF200\x22/>\x0a\x09\x09<\
-stop  offset=\x220.\
-1935\x22 style=\x22sto\
-p-color:#C1005A\x22\
-/>\x0a\x09\x09<stop  offs\
-et=\x220.3871\x22 styl\
-e=\x22stop-color:#2\
-3772D\x22/>\x0a\x09\x09<stop\
-  offset=\x220.5753\
-\x22 style=\x22stop-co\
-lor:#F47521\x22/>\x0a\x09\
-\x09<stop  offset=\x22\
-0.8011\x22 style=\x22s\
-top-color:#3A56A\
-6\x22/>\x0a\x09\x09<stop  of\
-fset=\x221\x22 style=\x22\
-stop-color:#EF80\
-B3\x22/>\x0a\x09</linearG\
-radient>\x0a\x09<path \
-id=\x22bristles\x22 st\
-yle=\x22fill:url(#b\
-ristles_00000170\
-9761434254253980\
-0000001711792139\
-5775194252_);\x22 d\
-=\x22M19.5,33.8\x0a\x09\x09c\
-0,0-6.6-6.2-6.8-\
-6C12.5,28,19,34.\
-3,19,34.3L18.4,3\
-5c0,0-0.6-0.4-1-\
-0.7c-0.4-0.4-2.3\
--2.1-2.3-2.1s-1.\
-6-1.8-1.8-1.6\x0a\x09\x09\
-c-0.2,0.2,4.4,4.\
-6,4.7,4.9c-0.1,0\
-.2-0.5,0.6-0.5,0\
-.6l-1.9-1.7c0,0-\
-5.7-5-5.8-4.9c-0\
-.2,0.2,7.2,7.2,7\
-.2,7.2l-0.6,0.8\x0a\
-\x09\x09c0,0-9.7-9.5-1\
-0-9.1s9.6,9.6,9.\
-6,9.6l-0.5,0.6L1\
-2.5,36c0,0-1.2-1\
-.2-1.4-1c-0.2,0.\
-1,1.2,1.3,1.2,1.\
-3l2.9,2.6l-0.3,0\
-.4\x0a\x09\x09c0,0-1.4-1-\
-2-1.5C12.4,37.3,\
-0.6,25.1,0.6,25.\
-1s5.7,5.1,5.8,5c\
-0.2-0.2-5.2-6.4-\
-5.2-6.4s5.2,4.2,\
-5.4,3.9c0.3-0.3-\
-4-4.7-4-4.7\x0a\x09\x09s8\
-,6.7,8.2,6.4c0.3\
--0.3-7.1-8-7.1-8\
-s8,7.1,8.2,6.9c0\
-.2-0.3-7.1-7.7-7\
-.1-7.7s4.7,3.9,5\
-,3.6c0.3-0.3-4.6\
--5.4-4.6-5.4s9,7\
-,9.3,6.7\x0a\x09\x09c0.3-\
-0.3-7.9-8-7.9-8s\
-10.8,9.3,11,9.1c\
-0.3-0.3-9.5-10-9\
-.5-10s9.1,8.2,9.\
-4,7.9c0.3-0.3-9-\
-9.4-9-9.4s5.4,4.\
-3,5.6,4.1\x0a\x09\x09c0.2\
--0.2-5.2-6-5.2-6\
-s6,5,6.3,4.7s-4.\
-4-5.1-4.4-5.1l6,\
-4.5c0,0,5.3,4.9,\
-5.5,4.7c0.2-0.2-\
-10.2-10.7-10.2-1\
-0.7s10.4,9,10.8,\
-8.6\x0a\x09\x09C23.2,19.5\
-,13,9.4,13,9.4s6\
-.2,5.4,6.5,5c0.3\
--0.4-5.8-6.8-5.8\
--6.8s5.7,5,5.9,4\
-.7S15,7.1,15,7.1\
-s7.9,7.1,8.1,6.8\
-\x0a\x09\x09c0.3-0.3-6.9-\
-7.7-6.9-7.7s10.2\
-,8.5,10.4,8.2c0.\
-3-0.3-9.7-10.5-9\
-.7-10.5l17.3,12.\
-2l-0.6,0.7c0,0-4\
-.1-3.6-4.4-3.4\x0a\x09\
-\x09c-0.3,0.3,4.2,3\
-.6,4.2,3.6l-0.6,\
-0.8c0,0-11.2-10.\
-3-11.4-10s10.9,1\
-0.7,10.9,10.7l-0\
-.9,1.1c0,0-8.4-7\
-.5-8.6-7.3\x0a\x09\x09c-0\
-.2,0.2,8.2,7.8,8\
-.2,7.8L30.2,21c0\
-,0-3.6-3.4-3.8-3\
-.1c-0.2,0.3,3.5,\
-3.5,3.5,3.5L29.3\
-,22c0,0-7.9-7.3-\
-8.2-7.1\x0a\x09\x09c-0.3,\
-0.2,7.8,7.5,7.8,\
-7.5l-0.7,0.8c0,0\
--6.4-5.9-6.6-5.7\
-c-0.3,0.2,6.1,6.\
-3,6.1,6.3l-0.6,0\
-.8c0,0-6.3-5.5-6\
-.5-5.3\x0a\x09\x09c-0.2,0\
-.2,6.1,5.9,6.1,5\
-.9l-0.9,1.1c0,0-\
-8.1-7.3-8.3-7c-0\
-.2,0.2,7.8,7.6,7\
-.8,7.6l-0.7,0.8c\
-0,0-8.9-8.6-9.2-\
-8.2\x0a\x09\x09c-0.3,0.3,\
-8.9,8.6,8.9,8.6l\
--0.8,0.9c0,0-5.2\
--5.3-5.5-5c-0.2,\
-0.2,5.1,5.4,5.1,\
-5.4l-0.4,0.5c0,0\
--1.8-1.5-2-1.2\x0a\x09\
-\x09c-0.2,0.2,1.5,1\
-.8,1.5,1.8l-0.6,\
-0.7c0,0-5.7-5.1-\
-6-4.9c-0.3,0.3,5\
-.5,5.4,5.5,5.4l-\
-0.7,0.9c0,0-0.4-\
-0.5-0.8-0.9\x0a\x09\x09C1\
-9.4,31.1,18,30,1\
-8,30s-6.6-6-6.8-\
-5.7C11,24.5,20.1\
-,33,20.1,33 M13.\
-3,37.9L13.3,37.9\
-L13.3,37.9z\x22/>\x0a\x09\
-<path id=\x22clamp\x22\
- d=\x22M38.6,20.3L1\
-9.6,43.1c-1.7-1.\
-3-3.4-2.7-4.7-3.\
-9l19.3-23C35.4,1\
-7.4,37,18.8,38.6\
-,20.3L38.6,20.3z\
-\x22/>\x0a\x09<path id=\x22b\
-order\x22 class=\x22st\
-1\x22 d=\x22M42.6,24.5\
-L24.1,46.4c-1.4-\
-0.9-3-2-4.5-3.2l\
-19.1-22.8C40.1,2\
-1.7,41.5,23.1,42\
-.6,24.5L42.6,24.\
-5z\x22\x0a\x09\x09/>\x0a\x09<path \
-id=\x22handle\x22 clas\
-s=\x22st2\x22 d=\x22M28.7\
-,48.3c-1.1,0-2.8\
--0.8-4.6-1.9l18.\
-5-21.9c1.5,1.8,2\
-.5,3.5,2.4,4.5c-\
-0.5,3.8-5.8,6.6-\
-3,10.1\x0a\x09\x09c1.6,2,\
-5.9,4.7,9.8,7.4c\
-4.3,3,8.6,6.1,10\
-.2,9c2.6,4.6,0.9\
-,6.2-3.4,4.5c-4.\
-3-1.7-8.5-6.1-11\
-.8-9.2c-2.7-2.6-\
-5.8-6.4-8.4-7.1\x0a\
-\x09\x09C34.5,41.7,32,\
-48.2,28.7,48.3z\x22\
-/>\x0a</g>\x0a</svg>\x0a\
-\x00\x00\x0f\x07\
-<\
-?xml version=\x221.\
-0\x22 encoding=\x22utf\
--8\x22?>\x0a<!-- Gener\
-ator: Adobe Illu\
-strator 26.2.1, \
-SVG Export Plug-\
-In . SVG Version\
-: 6.00 Build 0) \
- -->\x0a<svg versio\
-n=\x221.1\x22 id=\x22Laye\
-r_1\x22 xmlns=\x22http\
-://www.w3.org/20\
-00/svg\x22 xmlns:xl\
-ink=\x22http://www.\
-w3.org/1999/xlin\
-k\x22 x=\x220px\x22 y=\x220p\
-x\x22\x0a\x09 viewBox=\x220 \
-0 64 64\x22 style=\x22\
-enable-backgroun\
-d:new 0 0 64 64;\
-\x22 xml:space=\x22pre\
-serve\x22>\x0a<style t\
-ype=\x22text/css\x22>\x0a\
-\x09.st0{fill:#3D88\
-E1;stroke:#00000\
-0;stroke-miterli\
-mit:10;}\x0a\x09.st1{f\
-ill:#D55358;stro\
-ke:#000000;strok\
-e-miterlimit:10;\
-}\x0a\x09.st2{display:\
-none;}\x0a\x09.st3{dis\
-play:inline;}\x0a\x09.\
-st4{fill:none;st\
-roke:#808080;str\
-oke-width:0.25;}\
-\x0a\x09.st5{display:i\
-nline;fill:none;\
-stroke:#000000;s\
-troke-miterlimit\
-:10;}\x0a</style>\x0a<\
-g id=\x22SVGRoot\x22 x\
-mlns:cc=\x22http://\
-creativecommons.\
-org/ns#\x22 xmlns:d\
-c=\x22http://purl.o\
-rg/dc/elements/1\
-.1/\x22 xmlns:inksc\
-ape=\x22http://www.\
-inkscape.org/nam\
-espaces/inkscape\
-\x22 xmlns:rdf=\x22htt\
-p://www.w3.org/1\
-999/02/22-rdf-sy\
-ntax-ns#\x22 xmlns:\
-sodipodi=\x22http:/\
-/sodipodi.source\
-forge.net/DTD/so\
-dipodi-0.dtd\x22 xm\
-lns:svg=\x22http://\
-www.w3.org/2000/\
-svg\x22>\x0a\x09\x0a\x09\x09<sodip\
-odi:namedview  b\
-ordercolor=\x22#666\
-666\x22 borderopaci\
-ty=\x221.0\x22 id=\x22bas\
-e\x22 inkscape:curr\
-ent-layer=\x22layer\
-1\x22 inkscape:cx=\x22\
-9.3247571\x22 inksc\
-ape:cy=\x2253.23820\
-3\x22 inkscape:docu\
-ment-rotation=\x220\
-\x22 inkscape:docum\
-ent-units=\x22px\x22 i\
-nkscape:object-p\
-aths=\x22true\x22 inks\
-cape:pageopacity\
-=\x220.0\x22 inkscape:\
-pageshadow=\x222\x22 i\
-nkscape:snap-bbo\
-x=\x22true\x22 inkscap\
-e:snap-global=\x22t\
-rue\x22 inkscape:sn\
-ap-grids=\x22false\x22\
- inkscape:snap-n\
-odes=\x22true\x22 inks\
-cape:snap-others\
-=\x22false\x22 inkscap\
-e:window-height=\
-\x22847\x22 inkscape:w\
-indow-maximized=\
-\x220\x22 inkscape:win\
-dow-width=\x221252\x22\
- inkscape:window\
--x=\x222225\x22 inksca\
-pe:window-y=\x22208\
-\x22 inkscape:zoom=\
-\x225.0716018\x22 page\
-color=\x22#ffffff\x22 \
-showgrid=\x22false\x22\
- showguides=\x22fal\
-se\x22>\x0a\x09\x09<inkscape\
-:grid  empspacin\
-g=\x224\x22 id=\x22grid26\
-40\x22 type=\x22xygrid\
-\x22></inkscape:gri\
-d>\x0a\x09</sodipodi:n\
-amedview>\x0a\x09<poly\
-gon class=\x22st0\x22 \
-points=\x2232,24.6 \
-32,33.5 38.2,33.\
-5 38.2,43.5 32,4\
-3.5 32,39.6 18.4\
-,39.6 18.4,36.1 \
-13.6,36.1 13.6,2\
-6.2 \x0a\x09\x090.5,26.2 \
-0.5,0.5 21.8,0.5\
- 21.8,17.5 38.2,\
-17.5 38.2,24.6 \x09\
-\x22/>\x0a\x09<polygon cl\
-ass=\x22st1\x22 points\
-=\x2263.5,0.5 63.5,\
-47.9 55.1,47.9 5\
-5.1,21.3 47.9,21\
-.3 47.9,43.5 38.\
-2,43.5 38.2,33.5\
- 32,33.5 32,24.6\
- \x0a\x09\x0938.2,24.6 38\
-.2,17.5 21.8,17.\
-5 21.8,0.5 \x09\x22/>\x0a\
-\x09<polygon class=\
-\x22st0\x22 points=\x2263\
-.5,47.9 63.5,63.\
-5 17.5,63.5 17.5\
-,55.3 42.8,55.3 \
-42.8,50.2 32,50.\
-2 32,43.5 47.9,4\
-3.5 47.9,21.3 \x0a\x09\
-\x0955.1,21.3 55.1,\
-47.9 \x09\x22/>\x0a\x09<poly\
-gon class=\x22st1\x22 \
-points=\x2242.8,50.\
-2 42.8,55.3 17.5\
-,55.3 17.5,63.5 \
-0.5,63.5 0.5,26.\
-2 13.6,26.2 13.6\
-,36.1 18.4,36.1 \
-18.4,39.6 \x0a\x09\x0932,\
-39.6 32,50.2 \x09\x22/\
->\x0a</g>\x0a<g id=\x22La\
-yer_2_0000002615\
-1946551848755310\
-0000113208952264\
-61100172_\x22 class\
-=\x22st2\x22>\x0a\x09<g id=\x22\
-g2324\x22 class=\x22st\
-3\x22>\x0a\x09\x09<path id=\x22\
-path1979\x22 class=\
-\x22st4\x22 d=\x22M0,4.6h\
-64\x22/>\x0a\x09\x09<path id\
-=\x22path1981\x22 clas\
-s=\x22st4\x22 d=\x22M0,9.\
-6h64\x22/>\x0a\x09\x09<path \
-id=\x22path1983\x22 cl\
-ass=\x22st4\x22 d=\x22M0,\
-14.6h64\x22/>\x0a\x09\x09<pa\
-th id=\x22path1985\x22\
- class=\x22st4\x22 d=\x22\
-M0,19.6h64\x22/>\x0a\x09\x09\
-<path id=\x22path19\
-87\x22 class=\x22st4\x22 \
-d=\x22M0,24.6h64\x22/>\
-\x0a\x09\x09<path id=\x22pat\
-h1989\x22 class=\x22st\
-4\x22 d=\x22M0,29.6h64\
-\x22/>\x0a\x09\x09<path id=\x22\
-path1991\x22 class=\
-\x22st4\x22 d=\x22M0,34.6\
-h64\x22/>\x0a\x09\x09<path i\
-d=\x22path1993\x22 cla\
-ss=\x22st4\x22 d=\x22M0,3\
-9.6h64\x22/>\x0a\x09\x09<pat\
-h id=\x22path1995\x22 \
-class=\x22st4\x22 d=\x22M\
-0,44.6h64\x22/>\x0a\x09\x09<\
-path id=\x22path199\
-7\x22 class=\x22st4\x22 d\
-=\x22M0,49.6h64\x22/>\x0a\
-\x09\x09<path id=\x22path\
-1999\x22 class=\x22st4\
-\x22 d=\x22M0,54.6h64l\
-0,0\x22/>\x0a\x09\x09<path i\
-d=\x22path2001\x22 cla\
-ss=\x22st4\x22 d=\x22M0,5\
-9.6h64\x22/>\x0a\x09\x09<pat\
-h id=\x22path1979-7\
-\x22 class=\x22st4\x22 d=\
-\x22M59.6,0v64\x22/>\x0a\x09\
-\x09<path id=\x22path1\
-981-6\x22 class=\x22st\
-4\x22 d=\x22M54.6,0v64\
-\x22/>\x0a\x09\x09<path id=\x22\
-path1983-2\x22 clas\
-s=\x22st4\x22 d=\x22M49.6\
-,0v64\x22/>\x0a\x09\x09<path\
- id=\x22path1985-7\x22\
- class=\x22st4\x22 d=\x22\
-M44.6,0v64\x22/>\x0a\x09\x09\
-<path id=\x22path19\
-87-0\x22 class=\x22st4\
-\x22 d=\x22M39.6,0v64\x22\
-/>\x0a\x09\x09<path id=\x22p\
-ath1989-3\x22 class\
-=\x22st4\x22 d=\x22M34.6,\
-0v64\x22/>\x0a\x09\x09<path \
-id=\x22path1991-9\x22 \
-class=\x22st4\x22 d=\x22M\
-29.6,0v64\x22/>\x0a\x09\x09<\
-path id=\x22path199\
-3-9\x22 class=\x22st4\x22\
- d=\x22M24.6,0v64\x22/\
->\x0a\x09\x09<path id=\x22pa\
-th1995-9\x22 class=\
-\x22st4\x22 d=\x22M19.6,0\
-v64\x22/>\x0a\x09\x09<path i\
-d=\x22path1997-1\x22 c\
-lass=\x22st4\x22 d=\x22M1\
-4.6,0v64\x22/>\x0a\x09\x09<p\
-ath id=\x22path1999\
--7\x22 class=\x22st4\x22 \
-d=\x22M9.6,0v64l0,0\
-\x22/>\x0a\x09\x09<path id=\x22\
-path2001-2\x22 clas\
-s=\x22st4\x22 d=\x22M4.6,\
-0v64\x22/>\x0a\x09</g>\x0a\x09<\
-rect x=\x220.5\x22 y=\x22\
-0.5\x22 class=\x22st5\x22\
- width=\x2263\x22 heig\
-ht=\x2263\x22/>\x0a</g>\x0a<\
-/svg>\x0a\
-\x00\x00\x01=\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x01\x04IDATx\xdacd \x0d\xb8\x01\
-q&\x10'\x02\xf1\x07\x90\x00#\x09\x9a\xb9\x80\xf82\
-\x10+\x01\xf1= \x0e\x05\xe2s\xa4\x18\xd0\x05\xc4\xa5\
-H\xfc\x1f@\x5c@\xac\x01\x86@|\x0a\x88Y\xd0\xc4\
-\xa7\x11c\x003\x10\x9f\x00b\x134\xf1M@\x1cH\
-\x8c\x01\x85@\xdc\x87&v\x12\x88\x9d\x80\xf8\x1b!\x03\
-\xe4\x81\xf8\x0a\x10\xf3 \x89\xdd\x01b+ ~\x0d\xe2\
-\xe03@\x0c\x88\x7f\x01q+\x03$\xea\x18\xa1\x9a\xac\
-\x81\xf86L\x116\x03\xa4\x81x\x12\x10\xfb3@\xa2\
--\x0c\x88\x0d\xa0b\x81\xd0\xf0`\xc0e\x80 \x10\x9f\
-\x03b\x05$\xb1O@\x9c\x02\x0d\xb4\x9f\xe8\xb6\xa1\x1b\
-\x00rn\x15\x16W\xfd\x07b&l\xfeD7\xe0\x01\
-4\xe0\xd0\xc17 \xe6&d\x80\x0e\xd4\xcf\xd8\xc0%\
- \xd6'd\x00.\xe7\x83@\x05\x10w\xe23\x00\x94\
-A\xce\x031\x1f\x16\xbf\xcf\x07\xe2t \xfe\x83\xcb\x00\
-\x17 \x9e\x03\xc4\x22\x0c\x90\x10\x7f\xc9\x00\xc9mg\x80\
-x\x03\x10_g\xc0\x03\x00eJ/\x0f\xbb\xb6\x8b&\
-\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x10\xc7\
-<\
-?xml version=\x221.\
-0\x22 encoding=\x22utf\
--8\x22?>\x0a<!-- Gener\
-ator: Adobe Illu\
-strator 26.2.1, \
-SVG Export Plug-\
-In . SVG Version\
-: 6.00 Build 0) \
- -->\x0a<svg versio\
-n=\x221.1\x22 xmlns=\x22h\
-ttp://www.w3.org\
-/2000/svg\x22 xmlns\
-:xlink=\x22http://w\
-ww.w3.org/1999/x\
-link\x22 x=\x220px\x22 y=\
-\x220px\x22\x0a\x09 viewBox=\
-\x220 0 64 64\x22 styl\
-e=\x22enable-backgr\
-ound:new 0 0 64 \
-64;\x22 xml:space=\x22\
-preserve\x22>\x0a<styl\
-e type=\x22text/css\
-\x22>\x0a\x09.st0{fill:#7\
-27375;stroke:#00\
-0000;stroke-mite\
-rlimit:10;}\x0a\x09.st\
-1{fill:#E4E3E3;s\
-troke:#000000;st\
-roke-miterlimit:\
-10;}\x0a\x09.st2{fill:\
-none;stroke:#808\
-080;stroke-width\
-:0.25;}\x0a\x09.st3{fi\
-ll:none;stroke:#\
-000000;stroke-mi\
-terlimit:10;}\x0a\x09.\
-st4{fill:#BB6455\
-;}\x0a\x09.st5{opacity\
-:0.3;fill-rule:e\
-venodd;clip-rule\
-:evenodd;fill:#F\
-CFFFF;enable-bac\
-kground:new    ;\
-}\x0a\x09.st6{fill-rul\
-e:evenodd;clip-r\
-ule:evenodd;fill\
-:#FFFFFF;}\x0a</sty\
-le>\x0a<g id=\x22oulin\
-es\x22 xmlns:cc=\x22ht\
-tp://creativecom\
-mons.org/ns#\x22 xm\
-lns:dc=\x22http://p\
-url.org/dc/eleme\
-nts/1.1/\x22 xmlns:\
-inkscape=\x22http:/\
-/www.inkscape.or\
-g/namespaces/ink\
-scape\x22 xmlns:rdf\
-=\x22http://www.w3.\
-org/1999/02/22-r\
-df-syntax-ns#\x22 x\
-mlns:sodipodi=\x22h\
-ttp://sodipodi.s\
-ourceforge.net/D\
-TD/sodipodi-0.dt\
-d\x22 xmlns:svg=\x22ht\
-tp://www.w3.org/\
-2000/svg\x22>\x0a\x09\x0a\x09\x09<\
-sodipodi:namedvi\
-ew  bordercolor=\
-\x22#666666\x22 border\
-opacity=\x221.0\x22 id\
-=\x22base\x22 inkscape\
-:current-layer=\x22\
-layer1\x22 inkscape\
-:cx=\x229.3247571\x22 \
-inkscape:cy=\x2253.\
-238203\x22 inkscape\
-:document-rotati\
-on=\x220\x22 inkscape:\
-document-units=\x22\
-px\x22 inkscape:obj\
-ect-paths=\x22true\x22\
- inkscape:pageop\
-acity=\x220.0\x22 inks\
-cape:pageshadow=\
-\x222\x22 inkscape:sna\
-p-bbox=\x22true\x22 in\
-kscape:snap-glob\
-al=\x22true\x22 inksca\
-pe:snap-grids=\x22f\
-alse\x22 inkscape:s\
-nap-nodes=\x22true\x22\
- inkscape:snap-o\
-thers=\x22false\x22 in\
-kscape:window-he\
-ight=\x22847\x22 inksc\
-ape:window-maxim\
-ized=\x220\x22 inkscap\
-e:window-width=\x22\
-1252\x22 inkscape:w\
-indow-x=\x222225\x22 i\
-nkscape:window-y\
-=\x22208\x22 inkscape:\
-zoom=\x225.0716018\x22\
- pagecolor=\x22#fff\
-fff\x22 showgrid=\x22f\
-alse\x22 showguides\
-=\x22false\x22>\x0a\x09\x09<ink\
-scape:grid  emps\
-pacing=\x224\x22 id=\x22g\
-rid2640\x22 type=\x22x\
-ygrid\x22></inkscap\
-e:grid>\x0a\x09</sodip\
-odi:namedview>\x0a\x09\
-<polygon class=\x22\
-st0\x22 points=\x2232,\
-24.6 32,33.5 38.\
-2,33.5 38.2,43.5\
- 32,43.5 32,39.6\
- 18.4,39.6 18.4,\
-36.1 13.6,36.1 1\
-3.6,26.2 \x0a\x09\x090.5,\
-26.2 0.5,0.5 21.\
-8,0.5 21.8,17.5 \
-38.2,17.5 38.2,2\
-4.6 \x09\x22/>\x0a\x09<polyg\
-on class=\x22st1\x22 p\
-oints=\x2263.5,0.5 \
-63.5,47.9 55.1,4\
-7.9 55.1,21.3 47\
-.9,21.3 47.9,43.\
-5 38.2,43.5 38.2\
-,33.5 32,33.5 32\
-,24.6 \x0a\x09\x0938.2,24\
-.6 38.2,17.5 21.\
-8,17.5 21.8,0.5 \
-\x09\x22/>\x0a\x09<polygon c\
-lass=\x22st0\x22 point\
-s=\x2263.5,47.9 63.\
-5,63.5 17.5,63.5\
- 17.5,55.3 42.8,\
-55.3 42.8,50.2 3\
-2,50.2 32,43.5 4\
-7.9,43.5 47.9,21\
-.3 \x0a\x09\x0955.1,21.3 \
-55.1,47.9 \x09\x22/>\x0a\x09\
-<polygon class=\x22\
-st1\x22 points=\x2242.\
-8,50.2 42.8,55.3\
- 17.5,55.3 17.5,\
-63.5 0.5,63.5 0.\
-5,26.2 13.6,26.2\
- 13.6,36.1 18.4,\
-36.1 18.4,39.6 \x0a\
-\x09\x0932,39.6 32,50.\
-2 \x09\x22/>\x0a</g>\x0a<g i\
-d=\x22grid\x22>\x0a\x09<g id\
-=\x22g2324\x22>\x0a\x09\x09<pat\
-h id=\x22path1979\x22 \
-class=\x22st2\x22 d=\x22M\
-0,4.6h64\x22/>\x0a\x09\x09<p\
-ath id=\x22path1981\
-\x22 class=\x22st2\x22 d=\
-\x22M0,9.6h64\x22/>\x0a\x09\x09\
-<path id=\x22path19\
-83\x22 class=\x22st2\x22 \
-d=\x22M0,14.6h64\x22/>\
-\x0a\x09\x09<path id=\x22pat\
-h1985\x22 class=\x22st\
-2\x22 d=\x22M0,19.6h64\
-\x22/>\x0a\x09\x09<path id=\x22\
-path1987\x22 class=\
-\x22st2\x22 d=\x22M0,24.6\
-h64\x22/>\x0a\x09\x09<path i\
-d=\x22path1989\x22 cla\
-ss=\x22st2\x22 d=\x22M0,2\
-9.6h64\x22/>\x0a\x09\x09<pat\
-h id=\x22path1991\x22 \
-class=\x22st2\x22 d=\x22M\
-0,34.6h64\x22/>\x0a\x09\x09<\
-path id=\x22path199\
-3\x22 class=\x22st2\x22 d\
-=\x22M0,39.6h64\x22/>\x0a\
-\x09\x09<path id=\x22path\
-1995\x22 class=\x22st2\
-\x22 d=\x22M0,44.6h64\x22\
-/>\x0a\x09\x09<path id=\x22p\
-ath1997\x22 class=\x22\
-st2\x22 d=\x22M0,49.6h\
-64\x22/>\x0a\x09\x09<path id\
-=\x22path1999\x22 clas\
-s=\x22st2\x22 d=\x22M0,54\
-.6h64l0,0\x22/>\x0a\x09\x09<\
-path id=\x22path200\
-1\x22 class=\x22st2\x22 d\
-=\x22M0,59.6h64\x22/>\x0a\
-\x09\x09<path id=\x22path\
-1979-7\x22 class=\x22s\
-t2\x22 d=\x22M59.6,0v6\
-4\x22/>\x0a\x09\x09<path id=\
-\x22path1981-6\x22 cla\
-ss=\x22st2\x22 d=\x22M54.\
-6,0v64\x22/>\x0a\x09\x09<pat\
-h id=\x22path1983-2\
-\x22 class=\x22st2\x22 d=\
-\x22M49.6,0v64\x22/>\x0a\x09\
-\x09<path id=\x22path1\
-985-7\x22 class=\x22st\
-2\x22 d=\x22M44.6,0v64\
-\x22/>\x0a\x09\x09<path id=\x22\
-path1987-0\x22 clas\
-s=\x22st2\x22 d=\x22M39.6\
-,0v64\x22/>\x0a\x09\x09<path\
- id=\x22path1989-3\x22\
- class=\x22st2\x22 d=\x22\
-M34.6,0v64\x22/>\x0a\x09\x09\
-<path id=\x22path19\
-91-9\x22 class=\x22st2\
-\x22 d=\x22M29.6,0v64\x22\
-/>\x0a\x09\x09<path id=\x22p\
-ath1993-9\x22 class\
-=\x22st2\x22 d=\x22M24.6,\
-0v64\x22/>\x0a\x09\x09<path \
-id=\x22path1995-9\x22 \
-class=\x22st2\x22 d=\x22M\
-19.6,0v64\x22/>\x0a\x09\x09<\
-path id=\x22path199\
-7-1\x22 class=\x22st2\x22\
- d=\x22M14.6,0v64\x22/\
->\x0a\x09\x09<path id=\x22pa\
-th1999-7\x22 class=\
-\x22st2\x22 d=\x22M9.6,0v\
-64l0,0\x22/>\x0a\x09\x09<pat\
-h id=\x22path2001-2\
-\x22 class=\x22st2\x22 d=\
-\x22M4.6,0v64\x22/>\x0a\x09<\
-/g>\x0a\x09<rect x=\x220.\
-5\x22 y=\x220.5\x22 class\
-=\x22st3\x22 width=\x2263\
-\x22 height=\x2263\x22/>\x0a\
-</g>\x0a<g id=\x22embl\
-em\x22>\x0a\x09<g transfo\
-rm=\x22translate(-2\
-7.5 6.000001)\x22>\x0a\
-\x09\x09<path class=\x22s\
-t4\x22 d=\x22M57.7,48V\
-29.1c0-3,2.4-5.5\
-,5.5-5.5h18.9c3,\
-0,5.5,2.4,5.5,5.\
-5V48c0,3-2.4,5.5\
--5.5,5.5H63.2\x0a\x09\x09\
-\x09C60.2,53.4,57.7\
-,51,57.7,48z\x22/>\x0a\
-\x09\x09<g>\x0a\x09\x09\x09<path c\
-lass=\x22st5\x22 d=\x22M7\
-4,50.7V26.3c0,0,\
-0,0-5.4,0c-8.1,0\
--8.1,2.7-8.1,12.\
-2s0,12.2,8.1,12.\
-2C74,50.7,74,50.\
-7,74,50.7z\x22/>\x0a\x09\x09\
-\x09<path class=\x22st\
-6\x22 d=\x22M60.5,39.9\
-h8.1v10.8h8.1V39\
-.9h8.1L74,26.3L6\
-0.5,39.9z\x22/>\x0a\x09\x09<\
-/g>\x0a\x09</g>\x0a</g>\x0a<\
-/svg>\x0a\
-\x00\x00\x04\xf5\
-(\
-\xb5/\xfd`\xe8\x10]'\x00v\xb5\x9e%\x00\x8d\xca\
-\x03\x1b\xa9n\xb5\xfd-\xcd\x22\xad\xf1\xef\xb8=8h\
-\xf0 \xccDd\xdb\xd6Q]\xc5\x98\xd8 @U\x02\
-\x15!\x94\x00\x94\x00\x95\x00\xbeT\x8f]\xed$Bg\
-\xa9\xaam\xf4\xd3\x09\xd1\x9f\xcd\x87L\xaa)\xae\xad\xbb\
->\xe8\x0e\x1e\x0e\x9a\xfd\xf7\xbd\xf54G\xb0~\x10M\
-5\x10Bw\x94\xb9oE;\xe7\xde8l\xa4\x94\xd1\
-\x99\xbc\xc9db\xd5\xbc\xd0W_\x9ce\x98\xbe\xc4\xee\
-\xf9\x99\xd2\xa5\x89/6z\xdf\xcf\x1e\xfb\x86\xd6\xe6\xca\
-\xf8a9\x02i\x1a\x0a\xb2\xf7c\xa9h\xa5\xf4m\xad\
-\x01\x5c\x12\xcd\x00h\x14,\xf8.\xd5_\x8c\xcdz\xe7\
-\xd6m\x99\x1c\xc2\x03\xc4R]\xd7VL\xef\xb7\x05\xbe\
-\xb8T\x17[\x9d_\xd2\xb0\x8cR\xc0\x08\x14\xe1\xa0\x81\
-\x9a{\xd6\xb9?kZ\xfe\xca\xc4\xdc\xbe\x9fs\x84\xd6\
-\xaf\xb0\x99\xa5\xcc\x0c:2\xba\xbb\xe4\xf0E\xf1q\x1c\
-h\xa9(Tz2\xc3\xb8\xe256\xad|M\xf0C\
-O\xd1\x81\xf1\x99\xa0\xe8\xae\x9dLp\x9d\x0f\xfd\xd5F\
-\xaa\xcd\x17|zg~\x0c\xefM\x7f\xc2\x81+\xdb\xe2\
-(\x7f\xcd\xd8a-\x96*c\x0c\xd3\xbf&d\xf2V\
-R\x19\x8dE`\x82\xee\x81\x0e:\xf4\xc6X\xd2\x8a\xf4\
-a\x04=\xa0A\xcf\xe5\x83\xd4\xb3\xdaF<\xe6\x98\x0f\
-\xf7!\x0c\x9b\x1adKEq\xa5\xf6\xe3\xb2\xffx\x02\
-\x10\xc1\xf4 \x15\xb9\xabaD\xcf\xf3\xb8G\x87\x1e}\
-\x8a\xd2\x9b\xe2\xe4\x97\x80?\xe9\x18\x18\xf0{bK\xa5\
-\xef\xcc\xfb\x9a\xa4\xf6\x88\xd1\xa9\xbf\xf8F\xb2%\xc8\xf7\
-0P[\xa0/\xebt<M\xe2T\x92\x1f-\xa8\xa7\
-\xc0yk\x82\xe8\x17\x94\x85U\xb6\xfe\x1c\xd9S\xe22\
-\xde\xf4\xef\xc5^\xe1\xa0\x17\xbdE4\x19\xdb\xa3\xc9\xe7\
-I\x0c\xf4\xbc=\xf6\x848\x8f\xbc\xae\xc7\xd1\xd6\xd7\xa6\
-i<\xb6\xad\x02\x86\xd9\xed\xd0\xd8\xec\xf3C*\xbba\
-\x0c\xfc53\xdb\xd83\xcb\xd8\xa2h\x8d`\xc7l\x00\
-\x14\x19KP4\x00\x8dK\xa2\x1b\x06\xe4\xfedtS\
-\xb4\xa8%9\xc8@&r\x9e79A\x8eO\x0f2\
-R\x94\x0f:\xd0s\x5cs\xc7x\xf4\x5c\xa2\xcd\x9fG\
-\x06z\xcf\xe3\xe4s\xe8PjY\x8b\x8a\xd6\x18\x8f\x98\
-k\x13\x03\x1bm\xd3\x93\x22\x14\xf0i\x82\xdc\xfd\x13M\
-S\x8c\xf1E\xc7<\x90\x89\x22|1\x80b\xf3\x9e\xd9\
-R+\xbe/y\xea\xb1HvQ\xacp\x8e\x99\x22l\
-\x12d\x22)\xb6\xd9\xdc\xe5{\x22\xf3@)>i\x91\
-\xa8\xfd\xda\xb2\xf0C\xcfz-\x9e\xa87\x823\xf5\xd7\
-b\x91\x03_\x84\x01\x81\x1b\xa8Q1S\x0c\x91\xc8H\
-\x92\xd4\xea\x81\x08B\x12:K\xe9\x06R\x89\x9c\x01\x81\
-\x0eC\xc4 \x83\x10\x91\x99\x80\x02\x11\x91HD\x14\xb4\
-\xa409qBp\x85\xee\x06\x9bF\x08\xc28\xcf=\
-\x94jK\x8bIX\x16\xf8\x84l\x5c\xd6o\xac^H\
-\xeaH4\x00|\xe7\x0a\x98u\x8f\x06,\x89\x0e\x83R\
-\x1b\x18\xa1\x8bJ\xa6fy*\x09\x1f\xd1\x0d\xfd\x02\xf4\
- *7\xa73\xb9\xeezg\x84\xb7\xe1\xf1\xeb\xc9\xac\
-g\x9a\xb6\xb6\x9eJ\xe5\xcf>^\xb0\xd4&\x12/\xe8\
-\xa9\xa3\xe1v\x8a\xff?\xab\x89\x04\x9d\xc0\xfa\xf9B4\
-\xed\x1b:\x8d\xbe[\xae\xcb\xd2~\xe5\x99\xa7\xcb\xb6\xd3\
-q8t\xae8k\xf4d\xa5\x94\x84\x0d8\xe4\x87\x99\
-\x08\xb2Zn\xc04\xb6\xcd.a\x87\xe5\xb5-\x17\x5c\
-n\x95\xd2\xfeX\x8f\x82\xc2G`\x9fnM\x90']\
-\x04U\xf0U\xae\x93\xea\xed\xe0\x176\xcfjq\x937\
-H\xed1\xb7\xa1\x07x'\x1a\x5c\xc2\x82\xa6p\x96\xb4\
-\x9e\xfe$\xdaJ\x12$ZHD\xec\x8c\xe7\xd0\xc1=\
-X}\xf0C\xbcdH\x0cO\xfd\x1b\xaf\x9f\xea)-\
-\xfd\xbe\xcd\x0a\xa0\xf5\xdb\xf0\xb4\xed\xf9c9ff\xe4\
-;Nl\xdbf\x89i\x18\xdb&\xc2\xe6\x08~\xce3\
-\x9e\x83\xfab\x83,\xf0\xe3\xce\x09\x87\x12\x1a\xf31\x17\
-\x85n\x859\xc4\xfe\x05&eC\xce\x95A{\x08\xa0\
-c\xe0)\x1flk\xa4\x99\xa1\xeaU\xb8;\xa6\xe1\xde\
-`\xf3\xfdu2\xbc\x1aC\xb1\xa2M\x99\xbc`(\xd4\
-\x15G01\x86\xc0\x0e\xb1\xd2\xd2\xd0\xf2\xcal\xc9\xd1\
-&\xeb~\x17s\xda\x8a/T\x0e\xdc\xd6\xa7\xd7\x99\xd2\
-\xcc\xf7j\xeb\x93\xe9a\x82ljct\x05\xbb\x96e\
-\xbc\xd2\x96\xdd\xc8Tdz\xaaF\x99\xf5x\x87\xa4\xa0\
-[^\xa5i1\xf8\x18\x87`\xc8\xac\x05\x7f\xa4\xf2\x00\
-\x22\x01\xc50AX\xa5\xc2\x11VJ\xdb\x0a\xe3/^\
-\xa4\xf2\xf2G\x02\xc5\x90\x84\x7f\x8be\x0f\x0b\xcfZ\xc5\
-\xe5U\xcb2\x96\x05\x04_\xe6\x99@\x83T\xf7\x09\xb3\
-\xd8\xb5\x08\x0fz$w\xf1Y\xeeZ!,C\xb5`\
-\xb78\x1cS\xc0J\xea\x0cW(6F\x19\x9a\x95\xe9\
-k\xbe#\x9e\xb3%\xfc1\x1e\xbb\x13\xe1\x87\x0bF\x97\
-D\x13e\x0b\xb8\x90\xd8\xc7\x8d\x5c\xfc,\xb7\x0d{\xb6\
-j\x15\xd0b\x00B\xbe\x8d+x\x08F\xd2\xc6!\x87\
-2\xefpg$r\xb2\xb8){\xc8\xa5\x9d\x08\x05?\
-\xe4\x0b\x8cP\x17D!\x0d!L\xefqHCz\xea\
-\x03\x18\xbb\x0a\
-\x00\x00\x1cq\
-<\
-?xml version=\x221.\
-0\x22 encoding=\x22UTF\
--8\x22 standalone=\x22\
-no\x22?>\x0a<svg\x0a   he\
-ight=\x2224\x22\x0a   wid\
-th=\x2224\x22\x0a   versi\
-on=\x221.1\x22\x0a   id=\x22\
-svg8\x22\x0a   sodipod\
-i:docname=\x22planm\
-etrics.svg\x22\x0a   i\
-nkscape:version=\
-\x221.3.2 (091e20e,\
- 2023-11-25)\x22\x0a  \
- xmlns:inkscape=\
-\x22http://www.inks\
-cape.org/namespa\
-ces/inkscape\x22\x0a  \
- xmlns:sodipodi=\
-\x22http://sodipodi\
-.sourceforge.net\
-/DTD/sodipodi-0.\
-dtd\x22\x0a   xmlns=\x22h\
-ttp://www.w3.org\
-/2000/svg\x22\x0a   xm\
-lns:svg=\x22http://\
-www.w3.org/2000/\
-svg\x22>\x0a  <defs\x0a  \
-   id=\x22defs8\x22>\x0a \
-   <linearGradie\
-nt\x0a       id=\x22a-\
-2\x22\x0a       gradie\
-ntTransform=\x22mat\
-rix(-0.08352,0.6\
-8021,0.6768,0.08\
-31,-7.0983369,-2\
-17.5825)\x22\x0a      \
- gradientUnits=\x22\
-userSpaceOnUse\x22\x0a\
-       x1=\x22304.7\
-6001\x22\x0a       x2=\
-\x22335.29999\x22\x0a    \
-   y1=\x2264.294998\
-\x22\x0a       y2=\x2281.\
-926003\x22>\x0a      <\
-stop\x0a         of\
-fset=\x220\x22\x0a       \
-  stop-color=\x22#d\
-3d7cf\x22\x0a         \
-id=\x22stop5\x22 />\x0a  \
-    <stop\x0a      \
-   offset=\x22.183\x22\
-\x0a         stop-c\
-olor=\x22#babdb6\x22\x0a \
-        id=\x22stop\
-6\x22 />\x0a      <sto\
-p\x0a         offse\
-t=\x22.319\x22\x0a       \
-  stop-color=\x22#f\
-ff\x22\x0a         id=\
-\x22stop7\x22 />\x0a     \
- <stop\x0a         \
-offset=\x22.876\x22\x0a  \
-       stop-colo\
-r=\x22#babdb6\x22\x0a    \
-     id=\x22stop8\x22 \
-/>\x0a      <stop\x0a \
-        offset=\x22\
-1\x22\x0a         stop\
--color=\x22#eeeeec\x22\
-\x0a         id=\x22st\
-op9\x22 />\x0a    </li\
-nearGradient>\x0a  \
-  <linearGradien\
-t\x0a       id=\x22b\x22\x0a\
-       gradientT\
-ransform=\x22matrix\
-(-0.26413,0.2066\
-6,0.26875,0.3456\
-,0.0236631,-9.30\
-75)\x22\x0a       grad\
-ientUnits=\x22userS\
-paceOnUse\x22\x0a     \
-  x1=\x22-6.3080001\
-\x22\x0a       x2=\x22-9.\
-7749996\x22\x0a       \
-y1=\x2244.229\x22\x0a    \
-   y2=\x2244.139999\
-\x22>\x0a      <stop\x0a \
-        offset=\x22\
-0\x22\x0a         id=\x22\
-stop3\x22 />\x0a      \
-<stop\x0a         o\
-ffset=\x221\x22\x0a      \
-   stop-opacity=\
-\x220\x22\x0a         id=\
-\x22stop4\x22 />\x0a    <\
-/linearGradient>\
-\x0a    <linearGrad\
-ient\x0a       id=\x22\
-c\x22\x0a       gradie\
-ntTransform=\x22mat\
-rix(-0.52251313,\
-0.40834259,0.227\
-89198,0.29296415\
-,54.481711,-45.3\
-28735)\x22\x0a       g\
-radientUnits=\x22us\
-erSpaceOnUse\x22\x0a  \
-     x1=\x2297.4420\
-01\x22\x0a       x2=\x229\
-0.221001\x22\x0a      \
- y1=\x2235.152\x22\x0a   \
-    y2=\x2235.07899\
-9\x22>\x0a      <stop\x0a\
-         offset=\
-\x220\x22\x0a         sto\
-p-color=\x22#f8e27e\
-\x22\x0a         id=\x22s\
-top1-2\x22 />\x0a     \
- <stop\x0a         \
-offset=\x221\x22\x0a     \
-    stop-color=\x22\
-#e3d189\x22\x0a       \
-  id=\x22stop2-6\x22 /\
->\x0a    </linearGr\
-adient>\x0a  </defs\
->\x0a  <sodipodi:na\
-medview\x0a     id=\
-\x22namedview8\x22\x0a   \
-  pagecolor=\x22#ff\
-ffff\x22\x0a     borde\
-rcolor=\x22#000000\x22\
-\x0a     borderopac\
-ity=\x220.25\x22\x0a     \
-inkscape:showpag\
-eshadow=\x222\x22\x0a    \
- inkscape:pageop\
-acity=\x220.0\x22\x0a    \
- inkscape:pagech\
-eckerboard=\x220\x22\x0a \
-    inkscape:des\
-kcolor=\x22#d1d1d1\x22\
-\x0a     inkscape:z\
-oom=\x228.729956\x22\x0a \
-    inkscape:cx=\
-\x220.97365897\x22\x0a   \
-  inkscape:cy=\x221\
-2.371196\x22\x0a     i\
-nkscape:window-w\
-idth=\x221312\x22\x0a    \
- inkscape:window\
--height=\x22449\x22\x0a  \
-   inkscape:wind\
-ow-x=\x222883\x22\x0a    \
- inkscape:window\
--y=\x22471\x22\x0a     in\
-kscape:window-ma\
-ximized=\x220\x22\x0a    \
- inkscape:curren\
-t-layer=\x22svg8\x22 /\
->\x0a  <linearGradi\
-ent\x0a     id=\x22a\x22\x0a\
-     gradientUni\
-ts=\x22userSpaceOnU\
-se\x22\x0a     x1=\x223.1\
-23\x22\x0a     x2=\x228.2\
-75\x22\x0a     y1=\x2212.\
-47\x22\x0a     y2=\x2214.\
-921\x22>\x0a    <stop\x0a\
-       offset=\x220\
-\x22\x0a       stop-co\
-lor=\x22#bfbfbf\x22\x0a  \
-     id=\x22stop1\x22 \
-/>\x0a    <stop\x0a   \
-    offset=\x221\x22\x0a \
-      stop-color\
-=\x22#e1e1e1\x22\x0a     \
-  id=\x22stop2\x22 />\x0a\
-  </linearGradie\
-nt>\x0a  <path\x0a    \
- d=\x22m21.221 4.80\
-5-.983.438-3.164\
--.43-2.547.128-4\
-.647-.551-3.426 \
-2.206-1.444-.013\
--1.161 4.66-2.87\
-4 4.437 3.144.06\
-4 9.54 2.573 7.8\
-5-.564z\x22\x0a     fi\
-ll=\x22url(#a)\x22\x0a   \
-  id=\x22path2\x22 />\x0a\
-  <g\x0a     fill=\x22\
-none\x22\x0a     strok\
-e=\x22#aaa\x22\x0a     st\
-roke-width=\x22.5\x22\x0a\
-     id=\x22g4\x22>\x0a  \
-  <path\x0a       d\
-=\x22m13.053 4.715-\
-3.673 3.635-2.66\
- 3.262-.99 1.817\
--1.55 2.315m13.0\
-77-10.703-4.394 \
-5.173-1.863 2.72\
-2-.952 4.106m10.\
-19-11.799-.482 3\
-.423-2.192 3.091\
--2.156 1.624-.75\
-8 2.046-.736 2.8\
-9\x22\x0a       id=\x22pa\
-th3\x22 />\x0a    <pat\
-h\x0a       d=\x22m4.0\
-6 11.594 2.661.0\
-18 4.279 1.324c2\
-.195-.35 4.378-.\
-78 6.565-1.179l3\
-.63 3.249m-14.97\
-8-8.12 4.044.6 2\
-.682 2.523 6.813\
--1.343 1.794 1.9\
-44\x22\x0a       id=\x22p\
-ath4\x22 />\x0a  </g>\x0a\
-  <path\x0a     d=\x22\
-m21.221 4.805-1.\
-415.33-2.732-.32\
-2-2.547.128-4.64\
-7-.551-3.426 2.2\
-06-1.444-.013-1.\
-161 4.66-2.874 4\
-.437 3.144.064 9\
-.54 2.573 7.85-.\
-564z\x22\x0a     fill=\
-\x22none\x22\x0a     stro\
-ke=\x22#9a9a9a\x22\x0a   \
-  stroke-linecap\
-=\x22round\x22\x0a     st\
-roke-linejoin=\x22r\
-ound\x22\x0a     id=\x22p\
-ath5\x22 />\x0a  <g\x0a  \
-   id=\x22g5\x22\x0a     \
-transform=\x22matri\
-x(0.77384356,0,0\
-,0.77384356,6.43\
-50977,14.699222)\
-\x22>\x0a    <path\x0a   \
-    d=\x22m 3.40166\
-31,-3.6945 c -0.\
-043,-0.663 0.49,\
--0.194 0.678,0 0\
-.794,0.575 1.572\
-,1.174 2.375,1.7\
-34 0.561,0.199 1\
-.101,-0.241 1.47\
-5,-0.613 0.535,-\
-0.598 1.057,-1.3\
-7 0.96,-2.21 -0.\
-078,-0.427 -0.52\
-6,-0.586 -0.821,\
--0.842 -0.735,-0\
-.542 -1.475,-1.0\
-8 -2.206,-1.626 \
-0.038,-0.415 0.7\
-13,-0.333 1.046,\
--0.351 1.394,0.0\
-25 2.913,0.48 3.\
-7539999,1.663 0.\
-692,0.963 0.849,\
-2.253 0.5,3.376 \
-0.192,1.05 0.58,\
-2.078 1.242,2.92\
-3 l -2.4499999,1\
-.801 c -0.576,-0\
-.751 -1.29,-1.40\
-4 -2.124,-1.857 \
--1.237,0.18 -2.5\
-01,-0.402 -3.248\
-,-1.387 -0.59,-0\
-.755 -1.027,-1.6\
-6 -1.181,-2.607 \
-z\x22\x0a       fill=\x22\
-url(#a)\x22\x0a       \
-fill-rule=\x22eveno\
-dd\x22\x0a       strok\
-e=\x22#3b3b3b\x22\x0a    \
-   stroke-width=\
-\x220.795\x22\x0a       s\
-troke-linecap=\x22r\
-ound\x22\x0a       str\
-oke-linejoin=\x22ro\
-und\x22\x0a       stro\
-ke-dashoffset=\x220\
-.361\x22\x0a       id=\
-\x22path14\x22\x0a       \
-style=\x22fill:url(\
-#a-2)\x22 />\x0a    <p\
-ath\x0a       d=\x22m \
-10.231663,0.4505\
- a 0.665,0.665 0\
- 0 0 -0.124,0.93\
-2 l 4.085,5.983 \
-c 0.224,0.288 0.\
-992,0.06 1.285,-\
-0.17 0.292,-0.23\
- 0.701,-0.92 0.4\
-77,-1.208 l -4.7\
-86,-5.432 a 0.66\
-,0.66 0 0 0 -0.9\
-31,-0.105 z\x22\x0a   \
-    opacity=\x220.2\
-31\x22\x0a       fill=\
-\x22url(#b)\x22\x0a      \
- id=\x22path15\x22\x0a   \
-    style=\x22fill:\
-url(#b)\x22 />\x0a    \
-<path\x0a       d=\x22\
-m 3.6486631,-3.6\
-605 c 0.003,0.01\
-3 0.02,0.008 0.0\
-2,0 l 2.541,1.86\
-6 c 0.343,0.251 \
-0.795,0.156 1.18\
-7,-0.05 0.396,-0\
-.206 0.798,-0.55\
-2 1.135,-1.025 0\
-.338,-0.474 0.53\
-6,-0.991 0.606,-\
-1.436 0.07,-0.44\
-4 -0.006,-0.878 \
--0.335,-1.12 l -\
-2.562,-1.869 c 0\
-,-0.01 0.004,-0.\
-023 0.003,-0.022\
- -0.017,0.013 0.\
-01,0.008 0.021,0\
- 1.245,-0.133 2.\
-626,0.185 3.485,\
-0.816 1.1759999,\
-0.865 1.5969999,\
-2.42 1.1589999,3\
-.854 -0.44,1.428\
- -1.8569999,2.52\
- -3.0999999,2.68\
-4 -0.803,0.1 -1.\
-63,-0.086 -2.31,\
--0.586 -0.857,-0\
-.63 -1.585,-1.87\
-4 -1.85,-3.119 z\
-\x22\x0a       fill=\x22#\
-f0f3f2\x22\x0a       f\
-ill-rule=\x22evenod\
-d\x22\x0a       id=\x22pa\
-th16\x22 />\x0a    <pa\
-th\x0a       d=\x22m 1\
-1.316034,-2.1320\
-87 7.418568,8.59\
-55043 c 0.441351\
-,0.5683362 -0.02\
-478,1.6554534 -1\
-.038336,2.446788\
- -1.012784,0.792\
-1089 -2.17888,0.\
-9810381 -2.62100\
-5,0.4134762 L 8.\
-5711406,0.012724\
- 11.317583,-2.13\
-2087 Z m 4.91293\
-4,9.1530003 c -0\
-.503295,0.394118\
-7 -0.6086,1.1087\
-976 -0.356953,1.\
-4316807 0.250873\
-,0.3228831 0.992\
-653,0.3755355 1.\
-496722,-0.017809\
- 0.503295,-0.394\
-1187 0.583822,-1\
-.0894401 0.33294\
-9,-1.4123232 -0.\
-251647,-0.322883\
-1 -0.968649,-0.3\
-94893 -1.472718,\
-0 z\x22\x0a       fill\
-=\x22url(#c)\x22\x0a     \
-  stroke=\x22#3b3b3\
-b\x22\x0a       stroke\
--width=\x220.671318\
-\x22\x0a       stroke-\
-linecap=\x22round\x22\x0a\
-       stroke-li\
-nejoin=\x22round\x22\x0a \
-      stroke-das\
-hoffset=\x220.7\x22\x0a  \
-     id=\x22path17\x22\
-\x0a       style=\x22f\
-ill:url(#c)\x22 />\x0a\
-    <path\x0a      \
- d=\x22m 10.103663,\
-2.0635 2.28,-1.5\
-65 0.296,0.336 -\
-2.28,1.564 z\x22\x0a  \
-     fill=\x22#ffff\
-ff\x22\x0a       fill-\
-opacity=\x220.578\x22\x0a\
-       stroke=\x22#\
-3b3b3b\x22\x0a       s\
-troke-width=\x220.9\
-94\x22\x0a       id=\x22p\
-ath18\x22 />\x0a  </g>\
-\x0a  <g\x0a     id=\x22g\
-8\x22\x0a     transfor\
-m=\x22matrix(1.0024\
-058,0,0,1.002405\
-8,21.043304,-0.0\
-0481155)\x22>\x0a    <\
-path\x0a       d=\x22M\
- -17.5,2.5001245\
- V 21.490124 h 4\
-.016 V 7.5511245\
- l 4.96,0.036 v \
--5.05 l -4.96,-0\
-.036 z\x22\x0a       f\
-ill=\x22#ffe680\x22\x0a  \
-     stroke=\x22#d4\
-aa00\x22\x0a       str\
-oke-linecap=\x22squ\
-are\x22\x0a       id=\x22\
-path6\x22 />\x0a    <p\
-ath\x0a       d=\x22m \
--16.971,2.564124\
-5 3.973,3.44 -0.\
-85,0.766 -3.972,\
--3.44 z\x22\x0a       \
-fill=\x22#d4aa00\x22\x0a \
-      fill-opaci\
-ty=\x220.647\x22\x0a     \
-  id=\x22path7\x22 />\x0a\
-    <path\x0a      \
- d=\x22m -17.998,7.\
-0041245 h 3 v 1 \
-h -3 z m 0,2 h 3\
- v 1.0000005 h -\
-3 z m 0,2.000000\
-5 h 3 v 1 h -3 z\
- m 0,2 h 3 v 1 h\
- -3 z m 0,2 h 3 \
-v 0.999999 h -3 \
-z\x22\x0a       fill=\x22\
-#b29000\x22\x0a       \
-id=\x22path8\x22 />\x0a  \
-  <path\x0a       d\
-=\x22m -17.974,16.9\
-96124 h 3 v 1 h \
--3 z\x22\x0a       fil\
-l=\x22#b29000\x22\x0a    \
-   id=\x22path10\x22 /\
->\x0a  </g>\x0a</svg>\x0a\
-\
-\x00\x00\x10\xfb\
-<\
-?xml version=\x221.\
-0\x22 encoding=\x22utf\
--8\x22?>\x0a<!-- Gener\
-ator: Adobe Illu\
-strator 27.7.0, \
-SVG Export Plug-\
-In . SVG Version\
-: 6.00 Build 0) \
- -->\x0a<svg versio\
-n=\x221.1\x22 id=\x22Laye\
-r_1\x22 xmlns=\x22http\
-://www.w3.org/20\
-00/svg\x22 xmlns:xl\
-ink=\x22http://www.\
-w3.org/1999/xlin\
-k\x22 x=\x220px\x22 y=\x220p\
-x\x22\x0a\x09 viewBox=\x220 \
-0 64 64\x22 style=\x22\
-enable-backgroun\
-d:new 0 0 64 64;\
-\x22 xml:space=\x22pre\
-serve\x22>\x0a<style t\
-ype=\x22text/css\x22>\x0a\
-\x09.st0{fill:#7273\
-75;stroke:#00000\
-0;stroke-miterli\
-mit:10;}\x0a\x09.st1{f\
-ill:#E4E3E3;stro\
-ke:#000000;strok\
-e-miterlimit:10;\
-}\x0a\x09.st2{fill:non\
-e;stroke:#808080\
-;stroke-width:0.\
-25;}\x0a\x09.st3{fill:\
-none;stroke:#000\
-000;stroke-miter\
-limit:10;}\x0a\x09.st4\
-{fill:#3C5A6E;}\x0a\
-\x09.st5{opacity:0.\
-3;fill-rule:even\
-odd;clip-rule:ev\
-enodd;fill:#FCFF\
-FF;enable-backgr\
-ound:new    ;}\x0a\x09\
-.st6{fill-rule:e\
-venodd;clip-rule\
-:evenodd;fill:#F\
-FFFFF;}\x0a</style>\
-\x0a<g id=\x22SVGRoot\x22\
- xmlns:cc=\x22http:\
-//creativecommon\
-s.org/ns#\x22 xmlns\
-:svg=\x22http://www\
-.w3.org/2000/svg\
-\x22 xmlns:sodipodi\
-=\x22http://sodipod\
-i.sourceforge.ne\
-t/DTD/sodipodi-0\
-.dtd\x22 xmlns:rdf=\
-\x22http://www.w3.o\
-rg/1999/02/22-rd\
-f-syntax-ns#\x22 xm\
-lns:inkscape=\x22ht\
-tp://www.inkscap\
-e.org/namespaces\
-/inkscape\x22 xmlns\
-:dc=\x22http://purl\
-.org/dc/elements\
-/1.1/\x22>\x0a\x09\x0a\x09\x09<sod\
-ipodi:namedview \
- bordercolor=\x22#6\
-66666\x22 borderopa\
-city=\x221.0\x22 id=\x22b\
-ase\x22 inkscape:cu\
-rrent-layer=\x22lay\
-er1\x22 inkscape:cx\
-=\x229.3247571\x22 ink\
-scape:cy=\x2253.238\
-203\x22 inkscape:do\
-cument-rotation=\
-\x220\x22 inkscape:doc\
-ument-units=\x22px\x22\
- inkscape:object\
--paths=\x22true\x22 in\
-kscape:pageopaci\
-ty=\x220.0\x22 inkscap\
-e:pageshadow=\x222\x22\
- inkscape:snap-b\
-box=\x22true\x22 inksc\
-ape:snap-global=\
-\x22true\x22 inkscape:\
-snap-grids=\x22fals\
-e\x22 inkscape:snap\
--nodes=\x22true\x22 in\
-kscape:snap-othe\
-rs=\x22false\x22 inksc\
-ape:window-heigh\
-t=\x22847\x22 inkscape\
-:window-maximize\
-d=\x220\x22 inkscape:w\
-indow-width=\x22125\
-2\x22 inkscape:wind\
-ow-x=\x222225\x22 inks\
-cape:window-y=\x222\
-08\x22 inkscape:zoo\
-m=\x225.0716018\x22 pa\
-gecolor=\x22#ffffff\
-\x22 showgrid=\x22fals\
-e\x22 showguides=\x22f\
-alse\x22>\x0a\x09\x09<inksca\
-pe:grid  empspac\
-ing=\x224\x22 id=\x22grid\
-2640\x22 type=\x22xygr\
-id\x22></inkscape:g\
-rid>\x0a\x09</sodipodi\
-:namedview>\x0a\x09<po\
-lygon class=\x22st0\
-\x22 points=\x2232,24.\
-6 32,33.5 38.2,3\
-3.5 38.2,43.5 32\
-,43.5 32,39.6 18\
-.4,39.6 18.4,36.\
-1 13.6,36.1 13.6\
-,26.2 \x0a\x09\x090.5,26.\
-2 0.5,0.5 21.8,0\
-.5 21.8,17.5 38.\
-2,17.5 38.2,24.6\
- \x09\x22/>\x0a\x09<polygon \
-class=\x22st1\x22 poin\
-ts=\x2263.5,0.5 63.\
-5,47.9 55.1,47.9\
- 55.1,21.3 47.9,\
-21.3 47.9,43.5 3\
-8.2,43.5 38.2,33\
-.5 32,33.5 32,24\
-.6 \x0a\x09\x0938.2,24.6 \
-38.2,17.5 21.8,1\
-7.5 21.8,0.5 \x09\x22/\
->\x0a\x09<polygon clas\
-s=\x22st0\x22 points=\x22\
-63.5,47.9 63.5,6\
-3.5 17.5,63.5 17\
-.5,55.3 42.8,55.\
-3 42.8,50.2 32,5\
-0.2 32,43.5 47.9\
-,43.5 47.9,21.3 \
-\x0a\x09\x0955.1,21.3 55.\
-1,47.9 \x09\x22/>\x0a\x09<po\
-lygon class=\x22st1\
-\x22 points=\x2242.8,5\
-0.2 42.8,55.3 17\
-.5,55.3 17.5,63.\
-5 0.5,63.5 0.5,2\
-6.2 13.6,26.2 13\
-.6,36.1 18.4,36.\
-1 18.4,39.6 \x0a\x09\x093\
-2,39.6 32,50.2 \x09\
-\x22/>\x0a</g>\x0a<g id=\x22\
-Layer_2_00000180\
-3473180100324711\
-2000001421153053\
-3098782871_\x22>\x0a\x09<\
-g id=\x22g2324\x22>\x0a\x09\x09\
-<path id=\x22path19\
-79\x22 class=\x22st2\x22 \
-d=\x22M0,4.6h64\x22/>\x0a\
-\x09\x09<path id=\x22path\
-1981\x22 class=\x22st2\
-\x22 d=\x22M0,9.6h64\x22/\
->\x0a\x09\x09<path id=\x22pa\
-th1983\x22 class=\x22s\
-t2\x22 d=\x22M0,14.6h6\
-4\x22/>\x0a\x09\x09<path id=\
-\x22path1985\x22 class\
-=\x22st2\x22 d=\x22M0,19.\
-6h64\x22/>\x0a\x09\x09<path \
-id=\x22path1987\x22 cl\
-ass=\x22st2\x22 d=\x22M0,\
-24.6h64\x22/>\x0a\x09\x09<pa\
-th id=\x22path1989\x22\
- class=\x22st2\x22 d=\x22\
-M0,29.6h64\x22/>\x0a\x09\x09\
-<path id=\x22path19\
-91\x22 class=\x22st2\x22 \
-d=\x22M0,34.6h64\x22/>\
-\x0a\x09\x09<path id=\x22pat\
-h1993\x22 class=\x22st\
-2\x22 d=\x22M0,39.6h64\
-\x22/>\x0a\x09\x09<path id=\x22\
-path1995\x22 class=\
-\x22st2\x22 d=\x22M0,44.6\
-h64\x22/>\x0a\x09\x09<path i\
-d=\x22path1997\x22 cla\
-ss=\x22st2\x22 d=\x22M0,4\
-9.6h64\x22/>\x0a\x09\x09<pat\
-h id=\x22path1999\x22 \
-class=\x22st2\x22 d=\x22M\
-0,54.6h64l0,0\x22/>\
-\x0a\x09\x09<path id=\x22pat\
-h2001\x22 class=\x22st\
-2\x22 d=\x22M0,59.6h64\
-\x22/>\x0a\x09\x09<path id=\x22\
-path1979-7\x22 clas\
-s=\x22st2\x22 d=\x22M59.6\
-,0v64\x22/>\x0a\x09\x09<path\
- id=\x22path1981-6\x22\
- class=\x22st2\x22 d=\x22\
-M54.6,0v64\x22/>\x0a\x09\x09\
-<path id=\x22path19\
-83-2\x22 class=\x22st2\
-\x22 d=\x22M49.6,0v64\x22\
-/>\x0a\x09\x09<path id=\x22p\
-ath1985-7\x22 class\
-=\x22st2\x22 d=\x22M44.6,\
-0v64\x22/>\x0a\x09\x09<path \
-id=\x22path1987-0\x22 \
-class=\x22st2\x22 d=\x22M\
-39.6,0v64\x22/>\x0a\x09\x09<\
-path id=\x22path198\
-9-3\x22 class=\x22st2\x22\
- d=\x22M34.6,0v64\x22/\
->\x0a\x09\x09<path id=\x22pa\
-th1991-9\x22 class=\
-\x22st2\x22 d=\x22M29.6,0\
-v64\x22/>\x0a\x09\x09<path i\
-d=\x22path1993-9\x22 c\
-lass=\x22st2\x22 d=\x22M2\
-4.6,0v64\x22/>\x0a\x09\x09<p\
-ath id=\x22path1995\
--9\x22 class=\x22st2\x22 \
-d=\x22M19.6,0v64\x22/>\
-\x0a\x09\x09<path id=\x22pat\
-h1997-1\x22 class=\x22\
-st2\x22 d=\x22M14.6,0v\
-64\x22/>\x0a\x09\x09<path id\
-=\x22path1999-7\x22 cl\
-ass=\x22st2\x22 d=\x22M9.\
-6,0v64l0,0\x22/>\x0a\x09\x09\
-<path id=\x22path20\
-01-2\x22 class=\x22st2\
-\x22 d=\x22M4.6,0v64\x22/\
->\x0a\x09</g>\x0a\x09<rect x\
-=\x220.5\x22 y=\x220.5\x22 c\
-lass=\x22st3\x22 width\
-=\x2263\x22 height=\x2263\
-\x22/>\x0a</g>\x0a<g tran\
-sform=\x22translate\
-(-27.5 6.000001)\
-\x22>\x0a\x09<path class=\
-\x22st4\x22 d=\x22M63.2,2\
-3.6h19c3,0,5.5,2\
-.4,5.5,5.5v19c0,\
-3-2.4,5.5-5.5,5.\
-5h-19c-3,0-5.5-2\
-.4-5.5-5.5v-19\x0a\x09\
-\x09C57.7,26,60.1,2\
-3.6,63.2,23.6z\x22/\
->\x0a\x09<g>\x0a\x09\x09<path c\
-lass=\x22st5\x22 d=\x22M6\
-0.4,39.9l24.5,0c\
-0,0,0,0,0-5.4c0-\
-8.1-2.7-8.1-12.2\
--8.1s-12.2,0-12.\
-2,8.2C60.4,39.9,\
-60.4,39.9,60.4,3\
-9.9z\x22/>\x0a\x09\x09<path \
-class=\x22st6\x22 d=\x22M\
-71.3,26.3v8.2H60\
-.4v8.2h10.9v8.2l\
-13.6-10.9L71.3,2\
-6.3z\x22/>\x0a\x09</g>\x0a</\
-g>\x0a</svg>\x0a\
-\x00\x00\x04/\
-<\
-?xml version=\x221.\
-0\x22 encoding=\x22utf\
--8\x22?>\x0a<!-- Gener\
-ator: Adobe Illu\
-strator 28.3.0, \
-SVG Export Plug-\
-In . SVG Version\
-: 6.00 Build 0) \
- -->\x0a<svg versio\
-n=\x221.1\x22 id=\x22Laye\
-r_1\x22 xmlns=\x22http\
-://www.w3.org/20\
-00/svg\x22 xmlns:xl\
-ink=\x22http://www.\
-w3.org/1999/xlin\
-k\x22 x=\x220px\x22 y=\x220p\
-x\x22\x0a\x09 viewBox=\x220 \
-0 24 24\x22 style=\x22\
-enable-backgroun\
-d:new 0 0 24 24;\
-\x22 xml:space=\x22pre\
-serve\x22>\x0a<style t\
-ype=\x22text/css\x22>\x0a\
-\x09\x0a\x09\x09.st0{fill-ru\
-le:evenodd;clip-\
-rule:evenodd;fil\
-l:#A6CCA6;stroke\
-:#696B67;stroke-\
-width:0.8785;str\
-oke-linecap:roun\
-d;stroke-linejoi\
-n:round;}\x0a\x09\x0a\x09\x09.s\
-t1{fill-rule:eve\
-nodd;clip-rule:e\
-venodd;fill:#72B\
-072;stroke:#4143\
-3F;stroke-width:\
-0.878;stroke-lin\
-ecap:round;strok\
-e-linejoin:round\
-;}\x0a</style>\x0a<g>\x0a\
-\x09<path class=\x22st\
-0\x22 d=\x22M10.2,4.8c\
--2.5,0-4.6,1.1-5\
-.5,3.7c-0.9,2.6,\
-1,7.2,5.2,5.1c6.\
-9-3.4,6.9,0.8,8.\
-7,0.8c2.1,0,4.3-\
-1.5,4.3-3.4\x0a\x09\x09c0\
--1.7,0.1-3.3-0.9\
--4.3c-1.7-1.7-2.\
-6,0.9-7.3-1C13.3\
-,5.1,11.7,4.8,10\
-.2,4.8z\x22/>\x0a\x09<pat\
-h class=\x22st1\x22 d=\
-\x22M6.8,9.5c-2.5,0\
--4.6,1.1-5.5,3.7\
-c-0.9,2.6,1,7.2,\
-5.2,5.1c6.9-3.4,\
-6.9,0.8,8.7,0.8c\
-2.1,0,4.3-1.5,4.\
-3-3.4\x0a\x09\x09c0-1.7,0\
-.1-3.3-0.9-4.3c-\
-1.7-1.7-2.6,0.9-\
-7.3-1C9.9,9.9,8.\
-3,9.5,6.8,9.5z\x22/\
->\x0a</g>\x0a</svg>\x0a\
-\x00\x00\x02\xcd\
-<\
-?xml version=\x221.\
-0\x22 encoding=\x22utf\
--8\x22?>\x0a<!-- Gener\
-ator: Adobe Illu\
-strator 28.3.0, \
-SVG Export Plug-\
-In . SVG Version\
-: 6.00 Build 0) \
- -->\x0a<svg versio\
-n=\x221.1\x22 id=\x22Laye\
-r_1\x22 xmlns=\x22http\
-://www.w3.org/20\
-00/svg\x22 xmlns:xl\
-ink=\x22http://www.\
-w3.org/1999/xlin\
-k\x22 x=\x220px\x22 y=\x220p\
-x\x22\x0a\x09 viewBox=\x220 \
-0 24 24\x22 style=\x22\
-enable-backgroun\
-d:new 0 0 24 24;\
-\x22 xml:space=\x22pre\
-serve\x22>\x0a<style t\
-ype=\x22text/css\x22>\x0a\
-\x09\x0a\x09\x09.st0{fill-ru\
-le:evenodd;clip-\
-rule:evenodd;fil\
-l:#72B072;stroke\
-:#FF6633;stroke-\
-width:2;stroke-l\
-inejoin:round;st\
-roke-dasharray:0\
-.1,0.5;}\x0a</style\
->\x0a<path class=\x22s\
-t0\x22 d=\x22M8.5,7.5C\
-6,7.6,3.9,8.6,3,\
-11.2c-0.9,2.6,1,\
-7.2,5.2,5.1c6.9-\
-3.4,6.9,0.8,8.7,\
-0.8c2.1,0,4.3-1.\
-5,4.3-3.4\x0a\x09c0-1.\
-7,0.1-3.3-0.9-4.\
-3c-1.7-1.7-2.6,0\
-.9-7.3-1C11.6,7.\
-9,10,7.5,8.5,7.5\
-z\x22/>\x0a</svg>\x0a\
-\x00\x00\x03\xee\
-<\
-?xml version=\x221.\
-0\x22 encoding=\x22utf\
--8\x22?>\x0a<!-- Gener\
-ator: Adobe Illu\
-strator 26.3.1, \
-SVG Export Plug-\
-In . SVG Version\
-: 6.00 Build 0) \
- -->\x0a<svg versio\
-n=\x221.1\x22 id=\x22Laye\
-r_1\x22 xmlns=\x22http\
-://www.w3.org/20\
-00/svg\x22 xmlns:xl\
-ink=\x22http://www.\
-w3.org/1999/xlin\
-k\x22 x=\x220px\x22 y=\x220p\
-x\x22\x0a\x09 viewBox=\x220 \
-0 24 24\x22 style=\x22\
-enable-backgroun\
-d:new 0 0 24 24;\
-\x22 xml:space=\x22pre\
-serve\x22>\x0a<style t\
-ype=\x22text/css\x22>\x0a\
-\x09.st0{fill:none;\
-stroke:#727272;s\
-troke-dasharray:\
-1,2;}\x0a\x09.st1{fill\
-:#E5E5E5;stroke:\
-#727272;}\x0a\x09.st2{\
-fill:#835193;}\x0a\x09\
-.st3{fill:#6B440\
-5;}\x0a\x09.st4{fill:#\
-CCCCCC;}\x0a</style\
->\x0a<path class=\x22s\
-t0\x22 d=\x22M2.5,2.5h\
-17v17h-17V2.5z\x22/\
->\x0a<path class=\x22s\
-t1\x22 d=\x22M2.5,2.5h\
-3v3h-3V2.5z M16.\
-5,2.5h3v3h-3V2.5\
-z M16.5,16.5h3v3\
-h-3V16.5z M2.5,1\
-6.5h3v3h-3V16.5z\
-\x22/>\x0a<path class=\
-\x22st2\x22 d=\x22M6.6,10\
-.2C5.5,9.2,4.5,4\
-,4.5,4s1.9,2.1,4\
-.9,3c1.5,0.4,1.4\
-,2.5,0.6,3.4C9.3\
-,11.3,7.7,11.2,6\
-.6,10.2\x22/>\x0a<path\
- class=\x22st3\x22 d=\x22\
-M22.6,20.3c0.1,0\
-.5-0.9,1.6-1.4,1\
-.6c-2.3,0.2-10.6\
--9.6-10.6-9.6l1.\
-4-1.6C12,10.8,22\
-.4,18,22.6,20.3\x22\
-/>\x0a<path class=\x22\
-st4\x22 d=\x22M10.5,9.\
-4L9.1,11l1.6,1.4\
-l1.4-1.6L10.5,9.\
-4z\x22/>\x0a</svg>\x0a\
-\x00\x00\x147\
-<\
-?xml version=\x221.\
-0\x22 encoding=\x22utf\
--8\x22?>\x0a<!-- Gener\
-ator: Adobe Illu\
-strator 26.2.1, \
-SVG Export Plug-\
-In . SVG Version\
-: 6.00 Build 0) \
- -->\x0a<svg versio\
-n=\x221.1\x22 xmlns=\x22h\
-ttp://www.w3.org\
-/2000/svg\x22 xmlns\
-:xlink=\x22http://w\
-ww.w3.org/1999/x\
-link\x22 x=\x220px\x22 y=\
-\x220px\x22\x0a\x09 viewBox=\
-\x220 0 64 64\x22 styl\
-e=\x22enable-backgr\
-ound:new 0 0 64 \
-64;\x22 xml:space=\x22\
-preserve\x22>\x0a<styl\
-e type=\x22text/css\
-\x22>\x0a\x09.st0{fill:#7\
-27375;stroke:#00\
-0000;stroke-mite\
-rlimit:10;}\x0a\x09.st\
-1{fill:#E4E3E3;s\
-troke:#000000;st\
-roke-miterlimit:\
-10;}\x0a\x09.st2{fill:\
-none;stroke:#808\
-080;stroke-width\
-:0.25;}\x0a\x09.st3{fi\
-ll:none;stroke:#\
-000000;stroke-mi\
-terlimit:10;}\x0a\x09.\
-st4{fill:#C4A000\
-;}\x0a\x09.st5{opacity\
-:0.3;fill-rule:e\
-venodd;clip-rule\
-:evenodd;fill:#F\
-CFFFF;enable-bac\
-kground:new    ;\
-}\x0a\x09.st6{fill:#FF\
-FFFF;stroke:#FFF\
-FFF;stroke-width\
-:6.387687e-02;st\
-roke-miterlimit:\
-10;}\x0a</style>\x0a<g\
- id=\x22oulines\x22 xm\
-lns:cc=\x22http://c\
-reativecommons.o\
-rg/ns#\x22 xmlns:dc\
-=\x22http://purl.or\
-g/dc/elements/1.\
-1/\x22 xmlns:inksca\
-pe=\x22http://www.i\
-nkscape.org/name\
-spaces/inkscape\x22\
- xmlns:rdf=\x22http\
-://www.w3.org/19\
-99/02/22-rdf-syn\
-tax-ns#\x22 xmlns:s\
-odipodi=\x22http://\
-sodipodi.sourcef\
-orge.net/DTD/sod\
-ipodi-0.dtd\x22 xml\
-ns:svg=\x22http://w\
-ww.w3.org/2000/s\
-vg\x22>\x0a\x09\x0a\x09\x09<sodipo\
-di:namedview  bo\
-rdercolor=\x22#6666\
-66\x22 borderopacit\
-y=\x221.0\x22 id=\x22base\
-\x22 inkscape:curre\
-nt-layer=\x22layer1\
-\x22 inkscape:cx=\x229\
-.3247571\x22 inksca\
-pe:cy=\x2253.238203\
-\x22 inkscape:docum\
-ent-rotation=\x220\x22\
- inkscape:docume\
-nt-units=\x22px\x22 in\
-kscape:object-pa\
-ths=\x22true\x22 inksc\
-ape:pageopacity=\
-\x220.0\x22 inkscape:p\
-ageshadow=\x222\x22 in\
-kscape:snap-bbox\
-=\x22true\x22 inkscape\
-:snap-global=\x22tr\
-ue\x22 inkscape:sna\
-p-grids=\x22false\x22 \
-inkscape:snap-no\
-des=\x22true\x22 inksc\
-ape:snap-others=\
-\x22false\x22 inkscape\
-:window-height=\x22\
-847\x22 inkscape:wi\
-ndow-maximized=\x22\
-0\x22 inkscape:wind\
-ow-width=\x221252\x22 \
-inkscape:window-\
-x=\x222225\x22 inkscap\
-e:window-y=\x22208\x22\
- inkscape:zoom=\x22\
-5.0716018\x22 pagec\
-olor=\x22#ffffff\x22 s\
-howgrid=\x22false\x22 \
-showguides=\x22fals\
-e\x22>\x0a\x09\x09<inkscape:\
-grid  empspacing\
-=\x224\x22 id=\x22grid264\
-0\x22 type=\x22xygrid\x22\
-></inkscape:grid\
->\x0a\x09</sodipodi:na\
-medview>\x0a\x09<polyg\
-on class=\x22st0\x22 p\
-oints=\x2232,24.6 3\
-2,33.5 38.2,33.5\
- 38.2,43.5 32,43\
-.5 32,39.6 18.4,\
-39.6 18.4,36.1 1\
-3.6,36.1 13.6,26\
-.2 \x0a\x09\x090.5,26.2 0\
-.5,0.5 21.8,0.5 \
-21.8,17.5 38.2,1\
-7.5 38.2,24.6 \x09\x22\
-/>\x0a\x09<polygon cla\
-ss=\x22st1\x22 points=\
-\x2263.5,0.5 63.5,4\
-7.9 55.1,47.9 55\
-.1,21.3 47.9,21.\
-3 47.9,43.5 38.2\
-,43.5 38.2,33.5 \
-32,33.5 32,24.6 \
-\x0a\x09\x0938.2,24.6 38.\
-2,17.5 21.8,17.5\
- 21.8,0.5 \x09\x22/>\x0a\x09\
-<polygon class=\x22\
-st0\x22 points=\x2263.\
-5,47.9 63.5,63.5\
- 17.5,63.5 17.5,\
-55.3 42.8,55.3 4\
-2.8,50.2 32,50.2\
- 32,43.5 47.9,43\
-.5 47.9,21.3 \x0a\x09\x09\
-55.1,21.3 55.1,4\
-7.9 \x09\x22/>\x0a\x09<polyg\
-on class=\x22st1\x22 p\
-oints=\x2242.8,50.2\
- 42.8,55.3 17.5,\
-55.3 17.5,63.5 0\
-.5,63.5 0.5,26.2\
- 13.6,26.2 13.6,\
-36.1 18.4,36.1 1\
-8.4,39.6 \x0a\x09\x0932,3\
-9.6 32,50.2 \x09\x22/>\
-\x0a</g>\x0a<g id=\x22gri\
-d\x22>\x0a\x09<g id=\x22g232\
-4\x22>\x0a\x09\x09<path id=\x22\
-path1979\x22 class=\
-\x22st2\x22 d=\x22M0,4.6h\
-64\x22/>\x0a\x09\x09<path id\
-=\x22path1981\x22 clas\
-s=\x22st2\x22 d=\x22M0,9.\
-6h64\x22/>\x0a\x09\x09<path \
-id=\x22path1983\x22 cl\
-ass=\x22st2\x22 d=\x22M0,\
-14.6h64\x22/>\x0a\x09\x09<pa\
-th id=\x22path1985\x22\
- class=\x22st2\x22 d=\x22\
-M0,19.6h64\x22/>\x0a\x09\x09\
-<path id=\x22path19\
-87\x22 class=\x22st2\x22 \
-d=\x22M0,24.6h64\x22/>\
-\x0a\x09\x09<path id=\x22pat\
-h1989\x22 class=\x22st\
-2\x22 d=\x22M0,29.6h64\
-\x22/>\x0a\x09\x09<path id=\x22\
-path1991\x22 class=\
-\x22st2\x22 d=\x22M0,34.6\
-h64\x22/>\x0a\x09\x09<path i\
-d=\x22path1993\x22 cla\
-ss=\x22st2\x22 d=\x22M0,3\
-9.6h64\x22/>\x0a\x09\x09<pat\
-h id=\x22path1995\x22 \
-class=\x22st2\x22 d=\x22M\
-0,44.6h64\x22/>\x0a\x09\x09<\
-path id=\x22path199\
-7\x22 class=\x22st2\x22 d\
-=\x22M0,49.6h64\x22/>\x0a\
-\x09\x09<path id=\x22path\
-1999\x22 class=\x22st2\
-\x22 d=\x22M0,54.6h64l\
-0,0\x22/>\x0a\x09\x09<path i\
-d=\x22path2001\x22 cla\
-ss=\x22st2\x22 d=\x22M0,5\
-9.6h64\x22/>\x0a\x09\x09<pat\
-h id=\x22path1979-7\
-\x22 class=\x22st2\x22 d=\
-\x22M59.6,0v64\x22/>\x0a\x09\
-\x09<path id=\x22path1\
-981-6\x22 class=\x22st\
-2\x22 d=\x22M54.6,0v64\
-\x22/>\x0a\x09\x09<path id=\x22\
-path1983-2\x22 clas\
-s=\x22st2\x22 d=\x22M49.6\
-,0v64\x22/>\x0a\x09\x09<path\
- id=\x22path1985-7\x22\
- class=\x22st2\x22 d=\x22\
-M44.6,0v64\x22/>\x0a\x09\x09\
-<path id=\x22path19\
-87-0\x22 class=\x22st2\
-\x22 d=\x22M39.6,0v64\x22\
-/>\x0a\x09\x09<path id=\x22p\
-ath1989-3\x22 class\
-=\x22st2\x22 d=\x22M34.6,\
-0v64\x22/>\x0a\x09\x09<path \
-id=\x22path1991-9\x22 \
-class=\x22st2\x22 d=\x22M\
-29.6,0v64\x22/>\x0a\x09\x09<\
-path id=\x22path199\
-3-9\x22 class=\x22st2\x22\
- d=\x22M24.6,0v64\x22/\
->\x0a\x09\x09<path id=\x22pa\
-th1995-9\x22 class=\
-\x22st2\x22 d=\x22M19.6,0\
-v64\x22/>\x0a\x09\x09<path i\
-d=\x22path1997-1\x22 c\
-lass=\x22st2\x22 d=\x22M1\
-4.6,0v64\x22/>\x0a\x09\x09<p\
-ath id=\x22path1999\
--7\x22 class=\x22st2\x22 \
-d=\x22M9.6,0v64l0,0\
-\x22/>\x0a\x09\x09<path id=\x22\
-path2001-2\x22 clas\
-s=\x22st2\x22 d=\x22M4.6,\
-0v64\x22/>\x0a\x09</g>\x0a\x09<\
-rect x=\x220.5\x22 y=\x22\
-0.5\x22 class=\x22st3\x22\
- width=\x2263\x22 heig\
-ht=\x2263\x22/>\x0a</g>\x0a<\
-g id=\x22emblem\x22>\x0a\x09\
-<g transform=\x22ma\
-trix(.46153811 0\
- 0 .46153811 .23\
-0778 16.230778)\x22\
->\x0a\x09\x09<path class=\
-\x22st4\x22 d=\x22M78,29h\
-38.6c7.2,0,13,5.\
-8,13,13v38.6c0,7\
-.2-5.8,13-13,13H\
-78c-7.2,0-13-5.8\
--13-13V42C65,34.\
-8,70.9,29,78,29z\
-\x22\x0a\x09\x09\x09/>\x0a\x09\x09<path \
-class=\x22st5\x22 d=\x22M\
-71.5,61.3h51.7c0\
-,0,0,0,0-12.9S12\
-0,35.5,97.4,35.5\
-s-25.8,0-25.8,12\
-.9L71.5,61.3L71.\
-5,61.3z\x22/>\x0a\x09\x09<pa\
-th class=\x22st6\x22 d\
-=\x22M95.8,64v2.3c0\
-,3.1-0.5,5.3-1.9\
-,8c-2.2,4.7-2.4,\
-5.3-2.4,7.1c0,3.\
-5,2.6,6.4,5.7,6.\
-4c3.2,0,5.7-2.9,\
-5.7-6.5\x0a\x09\x09\x09c0-1.\
-2-0.4-2.8-1.2-4.\
-3c-2.8-5.9-3-6.8\
--3-10.7V64l1.9,1\
-.2c2.5,1.4,4.4,3\
-.1,6.1,5.5c4,5.4\
-,5.3,6.5,8.5,6.5\
-c3,0,5.4-2.3,5.4\
--5.3\x0a\x09\x09\x09c0-3.7-3\
-.1-6.5-7.8-6.8c-\
-5.9-0.4-6.9-0.6-\
-10.7-2.6l-1.9-1.\
-1l1.9-1.1c2.8-1.\
-6,4.8-2.3,7.9-2.\
-4c4.8-0.5,5.2-0.\
-5,6.6-1.1\x0a\x09\x09\x09c2.\
-4-1.2,4-3.4,4-5.\
-9c0-3.1-2.5-5.5-\
-5.6-5.5c-2.6,0-4\
-.8,1.3-6.7,4.2c-\
-3.4,5-4.1,5.8-7.\
-7,7.9l-1.9,1.2v-\
-2.3c0-3,0.5-5.3,\
-1.9-8\x0a\x09\x09\x09c2.3-4.\
-8,2.4-5.3,2.4-7c\
-0-3.6-2.6-6.5-5.\
-9-6.5c-3.1,0-5.7\
-,2.9-5.7,6.4c0,1\
-.3,0.4,2.9,1.2,4\
-.4c2.9,6,3.1,6.8\
-,3.1,10.7v2.3l-1\
-.9-1.2\x0a\x09\x09\x09c-2.8-\
-1.6-4.3-3.1-6.1-\
-5.6c-2.4-3.6-2.4\
--3.6-3.4-4.6c-1.\
-3-1.2-3.2-1.9-4.\
-8-1.9c-3.2,0-5.7\
-,2.5-5.7,5.5c0,3\
-.7,3,6.4,7.7,6.7\
-\x0a\x09\x09\x09c6.1,0.4,7.1\
-,0.6,10.8,2.6l1.\
-9,1.1l-1.9,1.2c-\
-2.5,1.4-4.9,2.2-\
-7.9,2.4c-4.7,0.2\
--5,0.4-6.6,1c-2.\
-4,1.1-4,3.4-4,5.\
-9\x0a\x09\x09\x09c0,3,2.5,5.\
-5,5.6,5.5c2.6,0,\
-4.9-1.4,6.7-4.2c\
-3.2-4.8,4.2-5.9,\
-7.7-7.9L95.8,64z\
-\x22/>\x0a\x09</g>\x0a</g>\x0a<\
-/svg>\x0a\
-\x00\x00\x02\xdb\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x12\x00\x00\x0b\x12\
-\x01\xd2\xdd~\xfc\x00\x00\x02\x8dIDATx\x9c\xed\
-\x9b\xb1k\x13Q\x1c\xc7\xbf\x97\x9e\xb4PbjC\x82\
-\x101$\xb8\xd4\x0b\x0a-\xc5\x08\xea \x05\xd7\x82C\
-E\x97\xe0\xe0P'7ApqqR\x17+v\x10\
-\x07\x85:\xf4?\x08\x19\xa2C\xa5(\x18\x13\xeb\xa0\xd1\
-\x8a\x22$4i\xaa\x08\x09\x9a8\xe8\xa2\xb9\x9c\x97\xcb\
-\xef\xfa\xf5z\xef3\xbe{\xf7\xbbo>\xc9{\xf7\xf2\
-.\xd1\x00t \xccp`\x08\xcd\xf6\x0f\xe9\xb2\xae\xa0\
-\x03\xc0\xf1\xeb\xeb\xa2E_^;\x8c\xbbS\x93\x98\x8e\
-DE\xebJc,/!\xc0\x0e\xc1F\x09`\x07`\
-\xa3\x04\xb0\x03\xb0Q\x02\xd8\x01\xd8(\x01\xec\x00l\x94\
-\x00v\x006J\x00;\x00\x1b%\x80\x1d\x80\x8d\xeeF\
-\xd1V\xa7\x83L>7P\x8d\xe9H\x14\xf7O\x9c\x14\
-J\xd4\x1bW\x04L]-\x0ct\xfe\xa7'\xf7\x80\xa7\
-w\x84\xd2X\xa3\x86\x00;\xc0 <\xdf\xa8\xa2T\xab\
-\xf5<n\x8c\x8fc2\x1c\xb1\xac\xe1i\x017\xde~\
-Di\xb3\x86\xe1`\xa4\xfd\xf7\xb1\xe6\x97j\xc0\xa8\x7f\
-\xc3\x83\x9d,\xa0=\xb4\x0b{\x8f\x9cC|\xe6R\xd7\
-P^\xcf\xdeD\xfbM\xf6\x9f5\xd4\x1c\xc0\xbcxa\
-q\x0e\x8d\xf2\x8a\xe9\xb1\xf06m\xa9\xeb\xc0\xef\xdbN\
-\x9f\xc4\x8e\x9d\x17\x090?\x91\xc2\xc5\x83)\x91ZN\
-\xd0\x01 \xdc\xe7=w\xb5Z\x11\x13\xc0F\x07\xd0\xf7\
-\x8a\xcbX^r%\x0c\x03\xdfO\x82J\x00;\x00\x1b\
-%\x80\x1d\x80\x0d})\xbc\xb0V\xc4\xc2Z\xb1\xab\xdd\
-\xd3\xfb\x01v9t\xe1\x91i\xfbv\xee\x078\x16P\
-X\x9c\xebj\xeb\xf5\x82\xfeg\x1c\x09\x98\x9fH\x01\xf8\
-\xfaG\x9b\xd9\xc7\xd8\x0b8\x12`\xb6v\xf7\xaa\x00u\
-\x17\x90,\xf6\xf8r\xbc\xefsB\xc94u\xee\x10\x13\
-P:}\xa6\xefsn\xbf*\xe2aS*\x813|\
-?\x04|/\x80\xbe\x12l\x94WL\xe7\x8e2\xec\xed\
-;\xec?03\xd0\xf5\xe9\x02\xd8\x93\xa0\xef\x87\x80\xef\
-\x05\xd0\x87\x80\x9b\xbc\xdb\xaa\xe3\xec\xb3\xde+T}d\
-\xf7\xce\x150\x96<\x0a\x00\xa8[\xf4\xf9\xfe\xfe\x16_\
-@\xab\xf1\xd9\xf6s\x89\xb0q\x0a#{b\xb6\xfa\x86\
-\x92i\x84\x92i\xcb>\x1f\xb2d\x01\xb1\xd1Q\xa4\x02\
-\x15[\xdf\xfd_o\xfez/\xa5\x9fGP\x05\xcc\xc6\
-\x13\x98\x8d'l\xf5\xcd\xe4s\xd8p!\x83\xef\xef\x02\
-\xbe\x17 2\x04V\xab\x15\x892\x96l\xb5Z\xae\xd4\
-\x15\x11\x90\xc9\xe7\xb0/8\xd6\xf5+\x0dQ4M\x0b\
-\x06\xa3\x9atY\xb1I0q\xe5\x85'\x87\x93'C\
-K\xa2\x04\xb0\x03\xb0Q\x02\xd8\x01\xd8\xf8^\x80\x06\x17\
-\xfe>\xef%~\x02(h\x8cO7r\xe0\xa9\x00\x00\
-\x00\x00IEND\xaeB`\x82\
-"
-
-qt_resource_name = b"\
-\x00\x07\
-\x07;\xe0\xb3\
-\x00p\
-\x00l\x00u\x00g\x00i\x00n\x00s\
-\x00\x0d\
-\x09\x8c\xbc\xc7\
-\x00r\
-\x00e\x00d\x00i\x00s\x00t\x00r\x00i\x00c\x00t\x00i\x00n\x00g\
-\x00\x0b\
-\x02\xce\x0c'\
-\x00a\
-\x00d\x00d\x00p\x00l\x00a\x00n\x00.\x00s\x00v\x00g\
-\x00\x0e\
-\x0c\xacw\x07\
-\x00e\
-\x00x\x00p\x00o\x00r\x00t\x00p\x00l\x00a\x00n\x00.\x00s\x00v\x00g\
-\x00\x10\
-\x04q\xe6\x07\
-\x00d\
-\x00e\x00m\x00o\x00g\x00r\x00a\x00p\x00h\x00i\x00c\x00s\x00.\x00s\x00v\x00g\
-\x00\x10\
-\x08\xe6TG\
-\x00z\
-\x00o\x00o\x00m\x00d\x00i\x00s\x00t\x00r\x00i\x00c\x00t\x00.\x00s\x00v\x00g\
-\x00\x12\
-\x01\x03=\xa7\
-\x00p\
-\x00a\x00i\x00n\x00t\x00d\x00i\x00s\x00t\x00r\x00i\x00c\x00t\x00s\x00.\x00s\x00v\
-\x00g\
-\x00\x0f\
-\x0db\x0e\x87\
-\x00p\
-\x00l\x00a\x00n\x00m\x00a\x00n\x00a\x00g\x00e\x00r\x00.\x00s\x00v\x00g\
-\x00\x0e\
-\x0aX\x18\x87\
-\x00d\
-\x00e\x00l\x00e\x00t\x00e\x00p\x00l\x00a\x00n\x00.\x00s\x00v\x00g\
-\x00\x0e\
-\x04\xd9\x16G\
-\x00p\
-\x00o\x00p\x00u\x00l\x00a\x00t\x00i\x00o\x00n\x00.\x00s\x00v\x00g\
-\x00\x0f\
-\x0a\xd1\xd9\xe7\
-\x00p\
-\x00a\x00i\x00n\x00t\x00c\x00u\x00r\x00s\x00o\x00r\x00.\x00s\x00v\x00g\
-\x00\x0c\
-\x0f7L'\
-\x00e\
-\x00d\x00i\x00t\x00p\x00l\x00a\x00n\x00.\x00s\x00v\x00g\
-\x00\x10\
-\x00\xd9\xffG\
-\x00p\
-\x00a\x00i\x00n\x00t\x00p\x00a\x00l\x00e\x00t\x00t\x00e\x00.\x00s\x00v\x00g\
-\x00\x08\
-\x0aaW'\
-\x00i\
-\x00c\x00o\x00n\x00.\x00s\x00v\x00g\
-\x00\x0f\
-\x0a\xd1\xd4g\
-\x00p\
-\x00a\x00i\x00n\x00t\x00c\x00u\x00r\x00s\x00o\x00r\x00.\x00p\x00n\x00g\
-\x00\x0e\
-\x0a\xacp'\
-\x00i\
-\x00m\x00p\x00o\x00r\x00t\x00p\x00l\x00a\x00n\x00.\x00s\x00v\x00g\
-\x00\x0b\
-\x0f)CG\
-\x00p\
-\x00r\x00e\x00v\x00i\x00e\x00w\x00.\x00s\x00v\x00g\
-\x00\x0f\
-\x0f\x04\x11g\
-\x00p\
-\x00l\x00a\x00n\x00m\x00e\x00t\x00r\x00i\x00c\x00s\x00.\x00s\x00v\x00g\
-\x00\x0c\
-\x0fLZ'\
-\x00c\
-\x00o\x00p\x00y\x00p\x00l\x00a\x00n\x00.\x00s\x00v\x00g\
-\x00\x10\
-\x00\xdc\x94'\
-\x00c\
-\x00o\x00p\x00y\x00d\x00i\x00s\x00t\x00r\x00i\x00c\x00t\x00.\x00s\x00v\x00g\
-\x00\x11\
-\x03r\xaf\xa7\
-\x00f\
-\x00l\x00a\x00s\x00h\x00d\x00i\x00s\x00t\x00r\x00i\x00c\x00t\x00.\x00s\x00v\x00g\
-\
-\x00\x13\
-\x0dW\xa6\x07\
-\x00p\
-\x00a\x00i\x00n\x00t\x00r\x00u\x00b\x00b\x00e\x00r\x00b\x00a\x00n\x00d\x00.\x00s\
-\x00v\x00g\
-\x00\x10\
-\x04\x09\xe8\xe7\
-\x00a\
-\x00c\x00t\x00i\x00v\x00a\x00t\x00e\x00p\x00l\x00a\x00n\x00.\x00s\x00v\x00g\
-\x00\x08\
-\x0aaZ\xa7\
-\x00i\
-\x00c\x00o\x00n\x00.\x00p\x00n\x00g\
-"
+def qInitResources():
+    global _registered  # pylint: disable=global-statement
 
-qt_resource_struct = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x14\x00\x02\x00\x00\x00\x16\x00\x00\x00\x03\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x01\x92\x00\x00\x00\x00\x00\x01\x00\x00l\x85\
-\x00\x00\x01\x82s&<q\
-\x00\x00\x02r\x00\x00\x00\x00\x00\x01\x00\x00\xcd\xed\
-\x00\x00\x01\x94[^\xefh\
-\x00\x00\x00\xbe\x00\x04\x00\x00\x00\x01\x00\x008\xa2\
-\x00\x00\x01\x82s&<q\
-\x00\x00\x004\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x82s&<f\
-\x00\x00\x02\x98\x00\x00\x00\x00\x00\x01\x00\x00\xd2 \
-\x00\x00\x01\x94[^\xefl\
-\x00\x00\x02\xec\x00\x00\x00\x00\x00\x01\x00\x00\xd8\xe3\
-\x00\x00\x01\x94[]\xfc\xf8\
-\x00\x00\x00r\x00\x00\x00\x00\x00\x01\x00\x00#\x9a\
-\x00\x00\x01\x94[^\xefl\
-\x00\x00\x01.\x00\x00\x00\x00\x00\x01\x00\x00R2\
-\x00\x00\x01\x94[^\xefm\
-\x00\x00\x00\x98\x00\x00\x00\x00\x00\x01\x00\x003 \
-\x00\x00\x01\x94[^\xefo\
-\x00\x00\x01\x0c\x00\x04\x00\x00\x00\x01\x00\x00L1\
-\x00\x00\x01\x969\xe3\xa9\x8b\
-\x00\x00\x01\xb8\x00\x00\x00\x00\x00\x01\x00\x00zi\
-\x00\x00\x01\x82s&<p\
-\x00\x00\x03\x12\x00\x00\x00\x00\x00\x01\x00\x00\xed\x1e\
-\x00\x00\x01\x82s&<p\
-\x00\x00\x01\xf2\x00\x00\x00\x00\x00\x01\x00\x00\x8a\xb5\
-\x00\x00\x01\x82s&<p\
-\x00\x00\x01\xce\x00\x00\x00\x00\x00\x01\x00\x00\x89t\
-\x00\x00\x01\x82s&<q\
-\x00\x00\x01P\x00\x00\x00\x00\x00\x01\x00\x00cj\
-\x00\x00\x01\x94[^\xefh\
-\x00\x00\x00P\x00\x00\x00\x00\x00\x01\x00\x00\x12\xbc\
-\x00\x00\x01\x82s&<p\
-\x00\x00\x02\xc0\x00\x00\x00\x00\x00\x01\x00\x00\xd4\xf1\
-\x00\x00\x01\x82s&<q\
-\x00\x00\x00\xe8\x00\x04\x00\x00\x00\x01\x00\x00@\xdf\
-\x00\x00\x01\x82s&<t\
-\x00\x00\x020\x00\x00\x00\x00\x00\x01\x00\x00\xa0y\
-\x00\x00\x01\x94[^\xefm\
-\x00\x00\x02\x14\x00\x04\x00\x00\x00\x01\x00\x00\x9b\x80\
-\x00\x00\x01\x82s&<r\
-\x00\x00\x01t\x00\x04\x00\x00\x00\x01\x00\x00g\x22\
-\x00\x00\x01\x94[^\xefl\
-\x00\x00\x02T\x00\x00\x00\x00\x00\x01\x00\x00\xbc\xee\
-\x00\x00\x01\x94[]\xfc\xf8\
-"
+    if not _registered:
+        _registered = QResource.registerResource(RESOURCE_FILE)
 
-
-def qInitResources():
-    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+    return _registered
 
 
 def qCleanupResources():
-    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
-
+    global _registered  # pylint: disable=global-statement
 
-qInitResources()
+    if _registered:
+        QResource.unregisterResource(RESOURCE_FILE)
+        _registered = False
@@ -25,11 +25,13 @@
 from .actions import ActionRegistry
 from .assignments import AssignmentsService, PlanAssignmentEditor
 from .clipboard import DistrictClipboardAccess
+from .compare import PlanComparisonService
 from .copy import PlanCopier
 from .delta import DeltaUpdateService
 from .district import DistrictUpdater
 from .districtutil import DistrictUtils
 from .errormixin import ErrorListMixin
+from .geolookup import GeoFieldLookup
 from .layertree import LayerTreeManager
 from .metrics import MetricsService
 from .planbuilder import PlanBuilder
@@ -38,6 +40,7 @@ from .planexport import PlanExporter
 from .planimport import AssignmentImporter, PlanImporter, PlanImportService, ShapefileImporter
 from .planlistmodel import PlanListModel
 from .planmgr import PlanManager
+from .scoring import ScoringService
 from .storage import ProjectStorage
 from .style import PlanStylerService
 
@@ -55,6 +58,7 @@ __all__ = (
     "PlanAssignmentEditor",
     "AssignmentsService",
     "DistrictUtils",
+    "GeoFieldLookup",
     "PlanExporter",
     "PlanImporter",
     "AssignmentImporter",
@@ -64,4 +68,6 @@ __all__ = (
     "ErrorListMixin",
     "PlanListModel",
     "MetricsService",
+    "ScoringService",
+    "PlanComparisonService",
 )
@@ -25,7 +25,8 @@
 from __future__ import annotations
 
 import itertools
-from collections.abc import Iterable, Iterator, Sequence
+from collections.abc import Iterable, Sequence
+from numbers import Integral
 from typing import TYPE_CHECKING, Any, Optional, Union, overload
 
 from qgis.core import (
@@ -37,10 +38,11 @@ from qgis.core import (
     QgsVectorLayerEditPassthrough,
     QgsVectorLayerFeatureIterator,
 )
-from qgis.PyQt.QtCore import QObject, QSignalMapper, pyqtSignal
+from qgis.PyQt.QtCore import NULL, QObject, QSignalMapper, pyqtSignal
 from qgis.PyQt.QtWidgets import QUndoCommand
 
 from ..utils import tr
+from .geolookup import GeoFieldLookup
 
 if TYPE_CHECKING:
     from ..models import RdsPlan
@@ -68,6 +70,9 @@ class PlanAssignmentEditor(QObject):
         self._undoStack = self._assignLayer.undoStack()
         self._undoStack.indexChanged.connect(self.undoChanged)
 
+        self._geoLookup = GeoFieldLookup(plan)
+        plan.geoFieldsChanged.connect(self._geoLookup.clear)
+
     def beginEditCommand(self, msg: str = None):
         if not self._assignLayer.isEditable():
             self._assignLayer.startEditing()
@@ -91,8 +96,8 @@ class PlanAssignmentEditor(QObject):
         request.setFilterExpression(f"{self._distField} = {district}")
         request.setFlags(QgsFeatureRequest.NoGeometry)
         request.setSubsetOfAttributes([])
-        for f in self._assignLayer.getFeatures(request):
-            self._assignLayer.changeAttributeValue(f.id(), self._fieldIndex, newDistrict, district)
+        fids = [f.id() for f in self._assignLayer.getFeatures(request)]
+        self._assignFids(fids, itertools.repeat(district, len(fids)), newDistrict)
 
     def getDistFeatures(self, field: str, value: Union[Iterable[Any], Any], targetDistrict=None, sourceDistrict=None):
         if not self._assignLayer:
@@ -101,7 +106,30 @@ class PlanAssignmentEditor(QObject):
         if not isinstance(value, Iterable) or isinstance(value, (str, bytes)):
             value = [value]
 
-        flt = " and ".join(f"{field} = {v!r}" for v in value)
+        fids = self._geoLookup.lookup(field, value)
+        if fids is None:
+            return self._getDistFeaturesByExpression(field, value, targetDistrict, sourceDistrict)
+
+        def accept(f: QgsFeature):
+            dist = f[self._fieldIndex]
+            unassigned = dist is None or dist == NULL or dist == 0
+            if sourceDistrict is not None:
+                return unassigned if sourceDistrict == 0 else dist == sourceDistrict
+            return not unassigned if targetDistrict == 0 else dist != targetDistrict
+
+        request = QgsFeatureRequest()
+        request.setFilterFids(fids.tolist())
+        request.setFlags(QgsFeatureRequest.NoGeometry)
+
+        features = self._assignLayer.getFeatures(request)
+        if sourceDistrict is None and targetDistrict is None:
+            return features
+
+        # filter on the current assignments, including any uncommitted changes in the edit buffer
+        return (f for f in features if accept(f))
+
+    def _getDistFeaturesByExpression(self, field: str, value: Iterable[Any], targetDistrict=None, sourceDistrict=None):
+        flt = f"{QgsExpression.quotedColumnRef(field)} IN ({', '.join(QgsExpression.quotedValue(v) for v in value)})"
 
         if sourceDistrict is not None:
             if sourceDistrict == 0:
@@ -135,33 +163,71 @@ class PlanAssignmentEditor(QObject):
     def assignFeaturesToDistrict(self, featureIds: Iterable[int], district: int): ...
 
     def assignFeaturesToDistrict(self, features: Union[Iterable[QgsFeature], Iterable[int]], district):
-        # determine type of iterable elements
-        if isinstance(features, Sequence):
-            if len(features) > 0:
-                if isinstance(features[0], int):
-                    features = self._assignLayer.getFeatures(features)
-        elif not isinstance(features, QgsVectorLayerFeatureIterator):
-            if not isinstance(features, Iterator):
-                features = iter(features)
-
+        fids, oldValues = self._readOldValues(features)
+        self._assignFids(fids, oldValues, district)
+
+    def _readOldValues(self, features: Union[Iterable[QgsFeature], Iterable[int]]) -> tuple[list[int], list[Any]]:
+        """collect the ids and current district assignments of the features to be assigned"""
+        if isinstance(features, QgsVectorLayerFeatureIterator):
+            f = None
+        elif isinstance(features, Sequence):
+            if len(features) == 0:
+                return [], []
+            f = features[0]
+        else:
+            features = iter(features)
             f = next(features, None)
             if f is None:
-                return
+                return [], []
 
-            if isinstance(f, int):
-                # int-iterator convert to feature iterator (so we can get the old value for undo purposes)
-                features = self._assignLayer.getFeatures([f, *features])
-            else:
-                # push the peeked value back on the iterator
-                features = itertools.chain([f], features)
+            # push the peeked value back on the iterator
+            features = itertools.chain([f], features)
+
+        if isinstance(f, Integral):
+            # fetch only the district field (so we can get the old value for undo purposes)
+            request = QgsFeatureRequest([int(fid) for fid in features])
+            request.setFlags(QgsFeatureRequest.NoGeometry)
+            request.setSubsetOfAttributes([self._fieldIndex])
+            features = self._assignLayer.getFeatures(request)
+
+        fids = []
+        oldValues = []
+        for feature in features:
+            fids.append(feature.id())
+            oldValues.append(feature[self._fieldIndex])
+
+        return fids, oldValues
+
+    def _assignFids(self, fids: Sequence[int], oldValues: Iterable[Any], district: int):
+        # skip features that are already assigned to the target district
+        changes = [(fid, old) for fid, old in zip(fids, oldValues) if old != district]
+        if not changes:
+            return
+
+        fids, oldValues = map(list, zip(*changes))
 
         try:
             inTransaction = self._assignLayer.isEditable()
             if not inTransaction:
                 self._assignLayer.startEditing()
 
-            for f in features:
-                self._assignLayer.changeAttributeValue(f.id(), self._fieldIndex, district, f[self._fieldIndex])
+            # group the batch into a single undo macro -- the undo stack only reports the index change
+            # (and thus assignmentsChanged) once the macro is closed; if an edit command is already
+            # active, the batch becomes part of that command's macro
+            inCommand = self._assignLayer.isEditCommandActive()
+            if not inCommand:
+                self._assignLayer.beginEditCommand(tr("Edit assignments"))
+
+            try:
+                for fid, oldValue in zip(fids, oldValues, strict=True):
+                    self._assignLayer.changeAttributeValue(fid, self._fieldIndex, district, oldValue)
+            except:
+                if not inCommand:
+                    self._assignLayer.destroyEditCommand()
+                raise
+
+            if not inCommand:
+                self._assignLayer.endEditCommand()
 
             if not inTransaction:
                 self._assignLayer.commitChanges(True)
@@ -0,0 +1,357 @@
+"""QGIS Redistricting Plugin - headless recalculation of plans
+
+        begin                : 2026-10-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2026 by Cryptodira
+        email                : stuart@cryptodira.org
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 3 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ *   This program is distributed in the hope that it will be useful, but   *
+ *   WITHOUT ANY WARRANTY; without even the implied warranty of            *
+ *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          *
+ *   GNU General Public License for more details. You should have          *
+ *   received a copy of the GNU General Public License along with this     *
+ *   program. If not, see <http://www.gnu.org/licenses/>.                  *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+import csv
+import json
+import multiprocessing
+import pathlib
+import time
+import zipfile
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import closing
+from dataclasses import asdict, dataclass, field
+from typing import Any, Optional, Union
+from xml.etree import ElementTree
+
+from packaging import version
+from qgis.core import QgsProject, QgsVectorLayer
+
+from ..models import MetricTriggers, RdsPlan, deserialize, serialize
+from ..models.metricslist import MetricLevel
+from ..utils import spatialite_connect, tr
+from .district import DistrictUpdateParams, DistrictUpdater
+from .districtio import DistrictReader
+from .metrics import MetricsService, MetricsUpdate
+from .schema import checkMigrateSchema, readGeoPackagePlan, schemaVersion, writeGeoPackagePlan
+from .storage import sourceWithoutCredentials
+
+
+@dataclass
+class BatchJob:
+    """A plan GeoPackage to recalculate. The plan definition and the sources of its
+    geography and population layers are read from the GeoPackage, but the layer
+    sources can be overridden, e.g. when the census data has moved. GeoPackages saved
+    before the plugin stored the plan definition in them are read with the definition
+    from the project file the plan was saved in."""
+
+    geoPackage: Union[str, pathlib.Path]
+    geoSource: Optional[str] = None
+    popSource: Optional[str] = None
+    provider: str = "ogr"
+    project: Optional[Union[str, pathlib.Path]] = None
+
+
+@dataclass
+class BatchResult:
+    geoPackage: str
+    plan: Optional[str] = None
+    success: bool = False
+    error: Optional[str] = None
+    elapsed: float = 0.0
+    metrics: dict[str, Any] = field(default_factory=dict)
+
+
+def _replaceLayerIds(value: Any, ids: dict[str, str]) -> Any:
+    if isinstance(value, dict):
+        return {k: _replaceLayerIds(v, ids) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_replaceLayerIds(v, ids) for v in value]
+    if isinstance(value, str):
+        return ids.get(value, value)
+    return value
+
+
+def _readProjectDocument(path: pathlib.Path) -> ElementTree.Element:
+    if path.suffix.lower() != ".qgz":
+        return ElementTree.parse(path).getroot()
+
+    with zipfile.ZipFile(path) as z:
+        name = next((n for n in z.namelist() if n.lower().endswith(".qgs")), None)
+        if name is None:
+            raise ValueError(tr("{path} is not a QGIS project file").format(path=str(path)))
+        return ElementTree.fromstring(z.read(name))
+
+
+def readProjectPlan(
+    project: Union[str, pathlib.Path], geoPackage: Union[str, pathlib.Path]
+) -> tuple[Optional[dict], dict[str, tuple[str, str]]]:
+    """Read the definition of the plan in a plan GeoPackage, and the sources of its geography
+    and population layers, from the QGIS project file (.qgs or .qgz) the plan was saved in.
+    The project file is parsed directly, so none of its layers are loaded."""
+    project = pathlib.Path(project)
+    if not project.exists():
+        raise ValueError(tr("File {path} does not exist").format(path=str(project)))
+
+    try:
+        root = _readProjectDocument(project)
+    except (ElementTree.ParseError, zipfile.BadZipFile) as e:
+        raise ValueError(tr("Could not read project {path}: {error}").format(path=str(project), error=e)) from e
+
+    def resolve(source: str) -> str:
+        # layer sources are saved relative to the project file by default
+        path, sep, options = source.partition("|")
+        if path.startswith(("./", "../")):
+            path = str((project.parent / path).resolve())
+        return f"{path}{sep}{options}"
+
+    sources = {
+        layer.findtext("id"): (layer.findtext("provider") or "ogr", resolve(layer.findtext("datasource") or ""))
+        for layer in root.iterfind("projectlayers/maplayer")
+    }
+
+    gpkgPath = pathlib.Path(geoPackage).resolve()
+    planVersion = root.findtext("properties/redistricting/schema-version") or "1.0.0"
+    for value in root.iterfind("properties/redistricting/redistricting-plans/value"):
+        data = json.loads(value.text or "{}")
+        _, assignSource = sources.get(data.get("assign-layer"), (None, ""))
+        if pathlib.Path(assignSource.split("|")[0]).resolve() != gpkgPath:
+            continue
+
+        # the project stores the schema version of its plans separately
+        data.setdefault("schema-version", planVersion)
+        if "geo-layer" not in data and "pop-layer" in data:
+            data["geo-layer"] = data.pop("pop-layer")
+
+        layerIds = {data.get("geo-layer"), data.get("pop-layer")}
+        return data, {
+            layerId: (provider, sourceWithoutCredentials(source))
+            for layerId, (provider, source) in sources.items()
+            if layerId in layerIds
+        }
+
+    return None, {}
+
+
+class HeadlessPlan:
+    """Opens the plan saved in a plan GeoPackage without a project file or map canvas.
+
+    The plan's layers are registered with the project instance only so that the plan
+    definition can be deserialized, and are removed again when the plan is closed.
+    """
+
+    def __init__(self, job: BatchJob):
+        self.path = pathlib.Path(job.geoPackage)
+        if not self.path.exists():
+            raise ValueError(tr("File {gpkgPath} does not exist").format(gpkgPath=str(self.path)))
+
+        with closing(spatialite_connect(self.path)) as db:
+            self.data, self.sources = readGeoPackagePlan(db)
+
+        if self.data is None and job.project is not None:
+            # the definition is saved to the GeoPackage with the recalculated plan
+            self.data, self.sources = readProjectPlan(job.project, self.path)
+            if self.data is None:
+                raise ValueError(
+                    tr("Project {project} does not contain the plan in {gpkgPath}").format(
+                        project=str(job.project), gpkgPath=str(self.path)
+                    )
+                )
+
+        if self.data is None:
+            raise ValueError(
+                tr(
+                    "{gpkgPath} does not contain a plan definition. Save the project containing the plan, "
+                    "or give the project file as the source of the plan definition."
+                ).format(gpkgPath=str(self.path))
+            )
+
+        self.layers: dict[str, QgsVectorLayer] = {}
+        geoId = self.data.get("geo-layer")
+        popId = self.data.get("pop-layer")
+        overrides = {popId: job.popSource, geoId: job.geoSource}
+        for layerId in dict.fromkeys(i for i in (geoId, popId) if i is not None):
+            if overrides.get(layerId):
+                provider, source = job.provider, overrides[layerId]
+            elif layerId in self.sources:
+                provider, source = self.sources[layerId]
+            else:
+                raise ValueError(tr("No source found for layer {layerId}").format(layerId=layerId))
+            self.layers[layerId] = self._openLayer(source, provider)
+
+        self.layers[self.data["assign-layer"]] = self._openLayer(f"{self.path}|layername=assignments")
+        self.layers[self.data["dist-layer"]] = self._openLayer(f"{self.path}|layername=districts")
+        self.plan: Optional[RdsPlan] = None
+
+    def _openLayer(self, source: str, provider: str = "ogr") -> QgsVectorLayer:
+        layer = QgsVectorLayer(source, pathlib.Path(source.split("|")[0]).stem, provider)
+        if not layer.isValid():
+            raise ValueError(tr("Could not open layer {source}").format(source=source))
+        return layer
+
+    def open(self) -> RdsPlan:
+        QgsProject.instance().addMapLayers(list(self.layers.values()), False)
+        try:
+            data = _replaceLayerIds(self.data, {k: v.id() for k, v in self.layers.items()})
+
+            planVersion = version.parse(data.get("schema-version", "1.0.0"))
+            if planVersion < schemaVersion:
+                data = checkMigrateSchema(data, planVersion)
+
+            self.plan = deserialize(RdsPlan, data)
+            if self.plan is None:
+                raise ValueError(
+                    tr("Could not read the plan definition in {gpkgPath}").format(gpkgPath=str(self.path))
+                )
+
+            DistrictReader(self.plan.distLayer, self.plan.distField, self.plan.popField).loadDistricts(self.plan)
+        except Exception:
+            self.close()
+            raise
+
+        return self.plan
+
+    def save(self):
+        """Save the plan definition, with its recalculated metrics, back to the GeoPackage"""
+        data = _replaceLayerIds(serialize(self.plan), {v.id(): k for k, v in self.layers.items()})
+        data["schema-version"] = str(schemaVersion)
+        with closing(spatialite_connect(self.path)) as db:
+            writeGeoPackagePlan(db, data, self.sources)
+            db.commit()
+
+    def close(self):
+        self.plan = None
+        QgsProject.instance().removeMapLayers([layer.id() for layer in self.layers.values()])
+        self.layers = {}
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+def planMetrics(plan: RdsPlan) -> dict[str, Any]:
+    """The plan-wide metrics of a plan, in serializable form"""
+    return {
+        m.name(): serialize(m.value)
+        for m in plan.metrics  # pylint: disable=not-an-iterable
+        if m.level() == MetricLevel.PLANWIDE and m.serialize() and m.value is not None
+    }
+
+
+def recalculatePlan(job: BatchJob) -> BatchResult:
+    """Recalculate the district geometry, demographics and metrics of the plan in a plan
+    GeoPackage, using the same aggregation, dissolve and metric code as the plugin, and
+    write the districts and the plan's metrics back to the GeoPackage"""
+    result = BatchResult(str(job.geoPackage))
+    start = time.perf_counter()
+    try:
+        headless = HeadlessPlan(job)
+        with headless as plan:
+            result.plan = plan.name
+
+            metricsService = MetricsService()
+            params = DistrictUpdater(metricsService).run(None, plan, DistrictUpdateParams(True, True))
+            plan.distLayer.reload()
+            DistrictReader(plan.distLayer, plan.distField, plan.popField, plan.districtColumns).loadDistricts(plan)
+
+            update = MetricsUpdate(
+                MetricTriggers.ON_UPDATE_DEMOGRAPHICS | MetricTriggers.ON_UPDATE_GEOMETRY,
+                params.populationData,
+                params.districtData,
+                params.geometry,
+            )
+            metricsService.completeUpdate(plan, metricsService.run(None, plan, update))
+            headless.save()
+
+            result.metrics = planMetrics(plan)
+            result.success = True
+    except Exception as e:  # pylint: disable=broad-except
+        result.error = f"{e!r}"
+
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+def runBatch(
+    jobs: Iterable[BatchJob],
+    processes: Optional[int] = None,
+    initializer: Optional[Callable[[], Any]] = None,
+    callback: Optional[Callable[[BatchResult], None]] = None,
+) -> list[BatchResult]:
+    """Recalculate a set of plans, one plan per worker process, returning the results
+    in the order of the jobs.
+
+    Worker processes are spawned rather than forked, since Qt does not survive a fork,
+    so each one must run an initializer that starts QGIS before it can work on a plan.
+    With a single process the plans are recalculated in the calling process.
+    """
+    jobs = list(jobs)
+    results: list[Optional[BatchResult]] = [None] * len(jobs)
+
+    if processes == 1 or len(jobs) <= 1:
+        for i, job in enumerate(jobs):
+            results[i] = recalculatePlan(job)
+            if callback:
+                callback(results[i])
+        return results
+
+    with ProcessPoolExecutor(
+        max_workers=processes, mp_context=multiprocessing.get_context("spawn"), initializer=initializer
+    ) as pool:
+        futures = {pool.submit(recalculatePlan, job): i for i, job in enumerate(jobs)}
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                results[i] = future.result()
+            except BrokenProcessPool as e:
+                # a worker died, e.g. from a crash in a native library
+                results[i] = BatchResult(str(jobs[i].geoPackage), error=f"{e!r}")
+            if callback:
+                callback(results[i])
+
+    return results
+
+
+def writeSummary(results: Iterable[BatchResult], path: Union[str, pathlib.Path]):
+    """Write the plan-wide metrics of each plan to a CSV file, or to JSON if the file
+    does not have a .csv extension. Metrics that are not scalar values are only
+    included in the JSON summary."""
+    path = pathlib.Path(path)
+    results = list(results)
+    if path.suffix.lower() != ".csv":
+        with path.open("w", encoding="utf-8") as f:
+            json.dump([asdict(r) for r in results], f, indent=2)
+        return
+
+    metrics = dict.fromkeys(
+        name for r in results for name, value in r.metrics.items() if isinstance(value, (int, float, str, bool))
+    )
+    with path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, ["geopackage", "plan", "success", "error", "elapsed", *metrics])
+        writer.writeheader()
+        for r in results:
+            writer.writerow(
+                {
+                    "geopackage": r.geoPackage,
+                    "plan": r.plan,
+                    "success": r.success,
+                    "error": r.error,
+                    "elapsed": round(r.elapsed, 3),
+                    **{name: r.metrics.get(name) for name in metrics},
+                }
+            )
@@ -24,9 +24,11 @@
 """
 
 from collections.abc import Iterable
+from typing import Optional
 
+import numpy as np
 import pandas as pd
-from qgis.PyQt.QtCore import QAbstractTableModel, Qt
+from qgis.PyQt.QtCore import Qt
 from qgis.PyQt.QtGui import QBrush
 
 from ..models import RdsDistrictDataModel, RdsPlan
@@ -34,40 +36,62 @@ from ..utils import tr
 
 
 class DistrictClipboardAccess:
-    def getSelectionData(self, model: QAbstractTableModel, selection: Iterable[tuple[int, int]]) -> pd.DataFrame:
-        data = {}
-        index = [model.data(model.createIndex(d, 0), Qt.ItemDataRole.DisplayRole) for d in range(model.rowCount())]
-        for c in range(1, model.columnCount()):
-            data[model.headerData(c, Qt.Orientation.Horizontal, Qt.ItemDataRole.DisplayRole)] = [
-                model.data(model.createIndex(d, c), Qt.ItemDataRole.DisplayRole) for d in range(model.rowCount())
-            ]
-        selectionData = pd.DataFrame(data=data, index=index).fillna("")
-
-        if selection is not None:
-            # create a dataframe of bools with the same dimensions as data
-            s = (selectionData != selectionData).fillna(False)  # noqa: PLR0124
-            # set elements to True if in selection
-            for row, col in selection:
-                s.iloc[row, col] = True
-            # select the elements of data that are contained in selection
-            selectionData = selectionData[s]
-
-            # drop the unselected rows and columns
-            selectionData = selectionData.dropna(axis=0, how="all").dropna(axis=1, how="all")
-
-        selectionData.columns.name = tr("District")
-        return selectionData
-
-    def getAsHtml(self, plan: RdsPlan, selection: Iterable[tuple[int, int]]) -> str:
-        def colorRowHeader(row):
-            r = 0 if row == tr("Unassigned") else selectionData.index.get_loc(row)
-            clr: QBrush = model.data(model.index(r, 0), Qt.ItemDataRole.BackgroundRole)
-            return f"background-color: #{clr.color().rgb() & 0xFFFFFF:x};"
+    def _selectData(
+        self, model: RdsDistrictDataModel, selection: Optional[Iterable[tuple[int, int]]]
+    ) -> tuple[pd.DataFrame, np.ndarray]:
+        """Return the selected cells of the district table along with the model rows they came from
 
+        The first column of the model (the district name) becomes the row index, so
+        model column c corresponds to column c - 1 of the data frame. Cells in the
+        selected rows and columns that are not themselves selected are left empty.
+        """
+        data = model.toDataFrame().fillna("")
+        if selection is None:
+            rows = np.arange(len(data))
+        else:
+            cells = np.array(list(selection), dtype=int).reshape(-1, 2)
+            rows, rowPos = np.unique(cells[:, 0], return_inverse=True)
+            cols = cells[:, 1] - 1
+            isData = cols >= 0
+            cols, colPos = np.unique(cols[isData], return_inverse=True)
+            mask = np.zeros((len(rows), len(cols)), dtype=bool)
+            mask[rowPos[isData], colPos] = True
+            data = data.iloc[rows, cols].where(mask)
+
+        data.columns.name = tr("District")
+        return data, rows
+
+    def getSelectionData(
+        self, model: RdsDistrictDataModel, selection: Optional[Iterable[tuple[int, int]]]
+    ) -> pd.DataFrame:
+        return self._selectData(model, selection)[0]
+
+    def _toHtml(self, model: RdsDistrictDataModel, selectionData: pd.DataFrame, rows: np.ndarray) -> str:
+        colors = []
+        for r in rows:
+            clr: QBrush = model.data(model.index(int(r), 0), Qt.ItemDataRole.BackgroundRole)
+            colors.append(f"background-color: #{clr.color().rgb() & 0xFFFFFF:x};" if clr is not None else "")
+
+        return selectionData.style.apply_index(lambda _: colors).to_html(doctype_html=True)
+
+    def getAsHtml(self, plan: RdsPlan, selection: Optional[Iterable[tuple[int, int]]]) -> str:
         model = RdsDistrictDataModel(plan)
-        selectionData = self.getSelectionData(model, selection)
-        return selectionData.style.map_index(colorRowHeader).to_html(doctype_html=True)
+        return self._toHtml(model, *self._selectData(model, selection))
 
-    def getAsCsv(self, plan: RdsPlan, selection: Iterable[tuple[int, int]]) -> str:
+    def getAsCsv(self, plan: RdsPlan, selection: Optional[Iterable[tuple[int, int]]]) -> str:
         model = RdsDistrictDataModel(plan)
         return self.getSelectionData(model, selection).to_csv()
+
+    def getAsTsv(self, plan: RdsPlan, selection: Optional[Iterable[tuple[int, int]]]) -> str:
+        model = RdsDistrictDataModel(plan)
+        return self.getSelectionData(model, selection).to_csv(sep="\t")
+
+    def getAsMimeData(self, plan: RdsPlan, selection: Optional[Iterable[tuple[int, int]]]) -> dict[str, str]:
+        """Extract the selection once and render it in each of the clipboard formats, keyed by mime type"""
+        model = RdsDistrictDataModel(plan)
+        selectionData, rows = self._selectData(model, selection)
+        return {
+            "text/html": self._toHtml(model, selectionData, rows),
+            "application/csv": selectionData.to_csv(),
+            "text/plain": selectionData.to_csv(sep="\t"),
+        }
@@ -0,0 +1,215 @@
+"""QGIS Redistricting Plugin - compare the district populations of two plans
+
+        begin                : 2026-10-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2026 by Cryptodira
+        email                : stuart@cryptodira.org
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 3 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ *   This program is distributed in the hope that it will be useful, but   *
+ *   WITHOUT ANY WARRANTY; without even the implied warranty of            *
+ *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          *
+ *   GNU General Public License for more details. You should have          *
+ *   received a copy of the GNU General Public License along with this     *
+ *   program. If not, see <http://www.gnu.org/licenses/>.                  *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+import pathlib
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional, Union
+
+import numpy as np
+import pandas as pd
+from qgis.core import QgsFeedback, QgsTask
+from qgis.PyQt.QtCore import QObject, pyqtSignal
+
+from ..models import DistrictColumns
+from ..utils import tr
+from .updateservice import IncrementalFeedback, UpdateParams, UpdateService
+
+if TYPE_CHECKING:
+    from ..models import RdsPlan
+
+
+@dataclass
+class PlanComparison:
+    """Population-weighted overlap of the districts of two plans.
+
+    The overlap matrix has a row for each district of the plan, including the unassigned
+    district 0, and a column for each district of the other plan. Core retention is the share
+    of each district's population that stays in the district with the same number in the other
+    plan; the best match is the district of the other plan that receives the largest share.
+    """
+
+    plan: "RdsPlan"
+    other: "RdsPlan"
+    popField: str
+    overlap: pd.DataFrame
+    unmatched: int = 0
+    population: pd.Series = field(init=False)
+    retained: pd.Series = field(init=False)
+    coreRetention: pd.Series = field(init=False)
+    bestMatch: pd.Series = field(init=False)
+    bestMatchShare: pd.Series = field(init=False)
+
+    def __post_init__(self):
+        values = self.overlap.to_numpy()
+        self.population = pd.Series(values.sum(axis=1), index=self.overlap.index)
+        denom = np.where(self.population.to_numpy() == 0, np.nan, self.population.to_numpy())
+
+        same = self.overlap.reindex(columns=self.overlap.index, fill_value=0).to_numpy()
+        self.retained = pd.Series(np.diagonal(same), index=self.overlap.index)
+        self.coreRetention = pd.Series(self.retained.to_numpy() / denom, index=self.overlap.index)
+
+        # a district is not matched to the unassigned units of the other plan
+        targets = self.overlap.columns[self.overlap.columns != 0]
+        assigned = self.overlap[targets].to_numpy()
+        if len(targets) == 0:
+            best = np.zeros(len(self.overlap), dtype=values.dtype)
+            match = np.full(len(self.overlap), np.nan)
+        else:
+            best = assigned.max(axis=1)
+            match = np.where(best > 0, targets.to_numpy()[assigned.argmax(axis=1)], np.nan)
+        self.bestMatch = pd.Series(match, index=self.overlap.index).astype("Int64")
+        self.bestMatchShare = pd.Series(best / denom, index=self.overlap.index)
+
+    @property
+    def totalRetention(self) -> float:
+        """share of the population assigned to a district of the plan that stays in the same district"""
+        assigned = self.population[self.population.index != 0].sum()
+        if assigned == 0:
+            return 0.0
+
+        return float(self.retained[self.retained.index != 0].sum() / assigned)
+
+    def table(self) -> pd.DataFrame:
+        """summary of each district of the plan followed by its overlap with each district of the other plan"""
+        summary = pd.DataFrame(
+            {
+                DistrictColumns.POPULATION: self.population,
+                "core_retention": self.coreRetention,
+                "best_match": self.bestMatch,
+                "best_match_share": self.bestMatchShare,
+            }
+        )
+        summary.index.name = DistrictColumns.DISTRICT
+        return summary.join(self.overlap.rename(columns=lambda d: f"{self.other.name}:{d}"))
+
+    def export(self, path: Union[str, pathlib.Path]):
+        """write the comparison to a CSV file, or to JSON if the file does not have a .csv extension"""
+        path = pathlib.Path(path)
+        if path.suffix.lower() == ".csv":
+            self.table().to_csv(path)
+        else:
+            self.table().to_json(path, orient="index", indent=2)
+
+
+@dataclass
+class ComparisonParams(UpdateParams):
+    other: "RdsPlan"
+    popField: str = DistrictColumns.POPULATION
+    comparison: Optional[PlanComparison] = None
+
+
+class PlanComparisonService(UpdateService):
+    """Builds the population overlap of the districts of two plans with the same units by joining
+    their assignments on the geoid"""
+
+    paramsCls = ComparisonParams
+
+    comparisonComplete = pyqtSignal("PyQt_PyObject", "PyQt_PyObject")  # RdsPlan, PlanComparison
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(tr("Comparing plans"), parent)
+
+    def run(self, task: Optional[QgsTask], plan: "RdsPlan", params: ComparisonParams) -> ComparisonParams:
+        feedback = IncrementalFeedback(task or QgsFeedback())
+        other = params.other
+
+        feedback.setProgressIncrement(0, 60, "load")
+        populationData = self._loadAssignments(plan, False, True, False, feedback)
+        feedback.setRows(len(populationData))
+        if params.popField not in populationData.columns:
+            raise ValueError(
+                tr("Field {field} is not a population field of {plan}").format(field=params.popField, plan=plan.name)
+            )
+
+        feedback.setProgressIncrement(60, 90, "load comparison")
+        otherDistricts = self.readLayer(
+            other.assignLayer, columns=[other.geoIdField, other.distField], readGeometry=False, feedback=feedback
+        ).set_index(other.geoIdField)[other.distField].fillna(0)
+        feedback.checkCanceled()
+
+        feedback.setProgressIncrement(90, 100, "crosstab")
+        joined = pd.DataFrame(
+            {
+                "source": populationData[plan.distField].fillna(0).astype(int),
+                "target": otherDistricts.reindex(populationData.index),
+                "population": populationData[params.popField],
+            }
+        )
+        matched = joined["target"].notna()
+        unmatched = int(joined.loc[~matched, "population"].sum())
+        overlap = (
+            joined[matched]
+            .astype({"target": int})
+            .groupby(["source", "target"])["population"]
+            .sum()
+            .unstack(fill_value=0)
+        )
+        # keep units assigned to district numbers beyond the current number of districts, e.g.,
+        # after the number of districts is reduced, so all of the population is accounted for
+        overlap = overlap.reindex(
+            index=sorted(set(range(plan.numDistricts + 1)) | set(overlap.index)),
+            columns=sorted(set(range(other.numDistricts + 1)) | set(overlap.columns)),
+            fill_value=0,
+        )
+        overlap.index.name = plan.name
+        overlap.columns.name = other.name
+
+        params.comparison = PlanComparison(plan, other, params.popField, overlap, unmatched)
+        feedback.setRows(len(joined))
+        return params
+
+    def finished(
+        self,
+        status: UpdateService.UpdateStatus,
+        task: Optional[QgsTask],
+        plan: Optional["RdsPlan"],
+        params: Optional[ComparisonParams],
+        exception: Optional[Exception],
+    ):
+        super().finished(status, task, plan, params, exception)
+        if status == UpdateService.UpdateStatus.SUCCESS:
+            self.comparisonComplete.emit(plan, params.comparison)
+
+    def compare(
+        self,
+        plan: "RdsPlan",
+        other: "RdsPlan",
+        force: bool = False,
+        foreground: bool = False,
+        *,
+        popField: str = DistrictColumns.POPULATION,
+    ):
+        """compare the districts of plan with the districts of other, weighted by popField,
+        emitting comparisonComplete with the result
+
+        :param plan: Plan whose districts form the rows of the comparison
+        :type plan: RdsPlan
+
+        :param other: Plan with the same units whose districts form the columns of the comparison
+        :type other: RdsPlan
+
+        :param popField: Population or population field of plan used to weight the overlap
+        :type popField: str
+        """
+        return self.update(plan, force, foreground, other=other, popField=popField)
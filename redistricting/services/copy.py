@@ -25,8 +25,8 @@
 from __future__ import annotations
 
 import pathlib
-import shutil
 import sqlite3
+from collections import defaultdict
 from contextlib import closing
 from typing import TYPE_CHECKING, Any, Optional, Union
 
@@ -34,14 +34,16 @@ from qgis.core import Qgis
 from qgis.PyQt.QtCore import QObject, pyqtSignal
 from qgis.utils import spatialite_connect
 
-from ..utils import tr
+from ..utils import cloneGeoPackage, tr
 from ..utils.misc import quote_identifier
 from .districtio import DistrictReader
 from .errormixin import ErrorListMixin
 from .planbuilder import PlanBuilder
+from .schema import clearGeoPackagePlan
 
 if TYPE_CHECKING:
     from ..models import RdsPlan
+    from .district import DistrictUpdater
 
 
 class PlanCopier(ErrorListMixin, QObject):
@@ -90,7 +92,15 @@ class PlanCopier(ErrorListMixin, QObject):
             return None
 
         if copyAssignments:
-            shutil.copyfile(self._plan.geoPackagePath, destGpkgPath)
+            # the new plan gets its own copy of the source GeoPackage -- a block clone made in constant
+            # time on copy-on-write file systems (btrfs, XFS, APFS), a full copy elsewhere (e.g. NTFS, ext4)
+            cloneGeoPackage(self._plan.geoPackagePath, destGpkgPath)
+
+            # the copy holds a different plan -- its definition is saved with the project
+            with closing(spatialite_connect(destGpkgPath)) as db:
+                clearGeoPackagePlan(db)
+                db.commit()
+
             plan.addLayersFromGeoPackage(destGpkgPath)
 
             reader = DistrictReader(
@@ -102,16 +112,59 @@ class PlanCopier(ErrorListMixin, QObject):
 
         return plan
 
-    def copyBufferedAssignments(self, target: RdsPlan):
+    def copyBufferedAssignments(self, target: RdsPlan, updater: Optional[DistrictUpdater] = None) -> set[int]:
+        """write the uncommitted assignment changes of the source plan to target
+
+        The changes are written directly to the target GeoPackage, bypassing the target layer's
+        edit session and the commit signals that trigger a district update, so the districts
+        whose assignments changed are returned and, if an updater is supplied, recalculated.
+        """
         if not self._plan.assignLayer.isEditable():
-            return
+            return set()
 
         buffer = self._plan.assignLayer.editBuffer()
         values: dict[int, dict[int, Any]] = buffer.changedAttributeValues()
-        target.assignLayer.startEditing()
-        for fid, feat in values.items():
-            target.assignLayer.changeAttributeValues(fid, feat)
-        target.assignLayer.commitChanges(True)
+        if not values:
+            return set()
+
+        # pivot the buffer into one (value, fid) parameter list per changed column
+        fields = self._plan.assignLayer.fields()
+        distIndex = fields.lookupField(self._plan.distField)
+        columns: dict[str, list[tuple[Any, int]]] = defaultdict(list)
+        newDistricts: dict[int, Any] = {}
+        for fid, attrs in values.items():
+            for idx, value in attrs.items():
+                columns[fields[idx].name()].append((value, fid))
+                if idx == distIndex:
+                    newDistricts[fid] = value
+
+        with closing(spatialite_connect(target.geoPackagePath)) as db:
+            db: sqlite3.Connection
+            districts = set(newDistricts.values())
+            if newDistricts:
+                # look up the current assignments through a temporary table rather than an IN (...) list,
+                # which would exceed SQLite's limit on host parameters for large edits
+                db.execute("CREATE TEMP TABLE changed_assignments (fid INTEGER PRIMARY KEY)")
+                db.executemany("INSERT INTO changed_assignments (fid) VALUES (?)", ((fid,) for fid in newDistricts))
+                sql = (
+                    f"SELECT DISTINCT {quote_identifier(target.distField)} "  # noqa: S608
+                    "FROM assignments JOIN changed_assignments USING (fid)"
+                )
+                c = db.execute(sql)
+                districts |= {r[0] for r in c}
+                db.execute("DROP TABLE changed_assignments")
+            for field, params in columns.items():
+                sql = f"UPDATE assignments SET {quote_identifier(field)} = ? WHERE fid = ?"  # noqa: S608
+                db.executemany(sql, params)
+            db.commit()
+
+        target.assignLayer.reload()
+
+        districts = {0 if d is None else int(d) for d in districts}
+        if districts and updater is not None:
+            updater.update(target, True, districts=districts, includeDemographics=True, includeGeometry=True)
+
+        return districts
 
     def copyAssignments(self, target: RdsPlan, autocommit=True):
         def progress():
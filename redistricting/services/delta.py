@@ -159,14 +159,15 @@ class DeltaUpdateService(ErrorListMixin, UpdateService):
     def run(self, task: Optional[QgsTask], plan: RdsPlan, params: DeltaUpdate) -> UpdateParams:  # noqa: PLR0915
         feedback = IncrementalFeedback(task or QgsFeedback())
 
-        feedback.setProgressIncrement(0, 10)
+        feedback.setProgressIncrement(0, 10, "load pending changes")
         df_new = self.loadPendingChanges(plan)
+        feedback.setRows(len(df_new))
         feedback.checkCanceled()
         if df_new.empty:
             return params
 
         if params.assignments is None:
-            feedback.setProgressIncrement(10, 30)
+            feedback.setProgressIncrement(10, 30, "load assignments")
             with spatialite_connect(plan.geoPackagePath) as db:
                 params.assignments = pd.read_sql(
                     f"SELECT fid, {quote_identifier(plan.geoIdField)}, "  # noqa: S608
@@ -175,14 +176,16 @@ class DeltaUpdateService(ErrorListMixin, UpdateService):
                     db,
                     index_col="fid",
                 )
+            feedback.setRows(len(params.assignments))
             feedback.checkCanceled()
 
         if params.popData is None:
-            feedback.setProgressIncrement(30, 70)
+            feedback.setProgressIncrement(30, 70, "load population")
             params.popData = self._loadPopData(plan, feedback=feedback)
+            feedback.setRows(len(params.popData))
             feedback.checkCanceled()
 
-        feedback.setProgressIncrement(70, 100)
+        feedback.setProgressIncrement(70, 100, "aggregate")
         pending = params.assignments.join(df_new, how="inner")
         pending = pending[pending[f"new_{plan.distField}"] != pending[f"old_{plan.distField}"]]
         if len(pending) == 0:
@@ -27,12 +27,9 @@ from dataclasses import dataclass
 from itertools import repeat
 from typing import TYPE_CHECKING, Any, Optional, Union
 
-import geopandas as gpd
 import pandas as pd
-import shapely.ops
 from qgis.core import QgsFeatureRequest, QgsFeedback, QgsTask
 from qgis.PyQt.QtCore import QObject, QRunnable, QSignalMapper, QThreadPool
-from shapely import MultiPolygon, Polygon
 
 from ..models import DistrictColumns, MetricTriggers
 from ..utils import spatialite_connect, tr
@@ -42,11 +39,14 @@ from .metrics import MetricsService
 from .updateservice import IncrementalFeedback, UpdateParams, UpdateService
 
 if TYPE_CHECKING:
+    import geopandas as gpd
+    import shapely
+
     from ..models import RdsPlan
 
 
 class DissolveWorker(QRunnable):
-    def __init__(self, dist: int, geoms: Sequence[MultiPolygon], cb=None):
+    def __init__(self, dist: int, geoms: Sequence["shapely.MultiPolygon"], cb=None):
         super().__init__()
         self.dist = dist
         self.geoms = geoms
@@ -54,9 +54,11 @@ class DissolveWorker(QRunnable):
         self.callback = cb
 
     def run(self):
+        import shapely.ops  # pylint: disable=import-outside-toplevel # noqa: PLC0415
+
         self.merged = shapely.ops.unary_union(self.geoms)
-        if isinstance(self.merged, Polygon):
-            self.merged = MultiPolygon([self.merged])
+        if isinstance(self.merged, shapely.Polygon):
+            self.merged = shapely.MultiPolygon([self.merged])
 
         if self.callback:
             self.callback()
@@ -69,8 +71,8 @@ class DistrictUpdateParams(UpdateParams):
     updateDistricts: Optional[set[int]] = None
     totalPopulation: Optional[int] = None
     populationData: Optional[pd.DataFrame] = None
-    districtData: Optional[Union[pd.DataFrame, gpd.GeoDataFrame]] = None
-    geometry: Optional[gpd.GeoSeries] = None
+    districtData: Optional[Union[pd.DataFrame, "gpd.GeoDataFrame"]] = None
+    geometry: Optional["gpd.GeoSeries"] = None
 
 
 class DistrictUpdater(UpdateService):
@@ -86,7 +88,7 @@ class DistrictUpdater(UpdateService):
         self._afterCommitSignals.mappedObject.connect(self.startUpdateDistricts)
 
     def _disolveGeometry(
-        self, plan: "RdsPlan", update: gpd.GeoDataFrame, feedback: Optional[IncrementalFeedback] = None
+        self, plan: "RdsPlan", update: "gpd.GeoDataFrame", feedback: Optional[IncrementalFeedback] = None
     ):
         def dissolve_progress():
             nonlocal count, total
@@ -171,12 +173,15 @@ class DistrictUpdater(UpdateService):
             feedback.updateProgress(1, 1)
 
     def run(self, task: Optional[QgsTask], plan: "RdsPlan", params: DistrictUpdateParams):
+        import geopandas as gpd  # pylint: disable=import-outside-toplevel # noqa: PLC0415
+
         feedback = IncrementalFeedback(task or QgsFeedback())
 
-        feedback.setProgressIncrement(0, 40)
+        feedback.setProgressIncrement(0, 40, "load")
         params.populationData = self._loadAssignments(
             plan, True, params.includeDemographics, params.includeGeometry, feedback
         )
+        feedback.setRows(len(params.populationData))
 
         if params.includeDemographics:
             params.totalPopulation = int(params.populationData[DistrictColumns.POPULATION].sum())
@@ -187,7 +192,7 @@ class DistrictUpdater(UpdateService):
         params.districtData = params.populationData[pop_cols].groupby(by=plan.distField).sum()
 
         if params.includeGeometry:
-            feedback.setProgressIncrement(40, 90)
+            feedback.setProgressIncrement(40, 90, "dissolve")
             if params.updateDistricts is not None:
                 assignments = params.populationData.loc[
                     params.populationData[plan.distField].isin(params.updateDistricts), [plan.distField, "geometry"]
@@ -201,8 +206,9 @@ class DistrictUpdater(UpdateService):
                 params.districtData, geometry=params.geometry, crs=params.populationData.crs
             )
 
-        feedback.setProgressIncrement(90, 100)
+        feedback.setProgressIncrement(90, 100, "save")
         self._saveDistricts(plan, params, feedback)
+        feedback.setRows(len(params.districtData))
 
         return params
 
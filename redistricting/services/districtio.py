@@ -1,9 +1,13 @@
 from collections.abc import Iterable
+from typing import Any
 
+import numpy as np
 from qgis.core import QgsFeature, QgsVectorLayer
 from qgis.PyQt.QtCore import QVariant
 
 from ..models import DistrictColumns, RdsDistrict, RdsPlan, RdsUnassigned
+from ..utils import spatialite_connect
+from ..utils.misc import quote_identifier
 
 
 class DistrictReader:
@@ -27,8 +31,8 @@ class DistrictReader:
         else:
             self._columns = columns
 
-    def readFromLayer(self) -> list[RdsDistrict]:
-        result: list[RdsDistrict] = []
+    def _readRecords(self) -> list[tuple[int, int, dict[str, Any]]]:
+        result: list[tuple[int, int, dict[str, Any]]] = []
 
         f: QgsFeature
         for f in self._distLayer.getFeatures():
@@ -46,21 +50,35 @@ class DistrictReader:
             if data.get("description", "") is None:
                 data["description"] = ""
 
-            if f[str(self._distField)] == 0:
-                result.append(RdsUnassigned(fid=f.id(), **data))
-            else:
-                result.append(RdsDistrict(fid=f.id(), **data))
+            result.append((f[str(self._distField)], f.id(), data))
 
-        return sorted(result, key=lambda s: s.district)
+        return sorted(result, key=lambda r: r[0])
+
+    def readFromLayer(self) -> list[RdsDistrict]:
+        return [
+            RdsUnassigned(fid=fid, **data) if district == 0 else RdsDistrict(fid=fid, **data)
+            for district, fid, data in self._readRecords()
+        ]
 
     def loadDistricts(self, plan: RdsPlan):
+        records = self._readRecords()
+        if len(records) == len(plan.districts) and all(plan.districts.has(d) for d, _, _ in records):
+            # same set of districts -- refresh the existing district objects in place, a column at a time
+            columns = dict.fromkeys(k for _, _, data in records for k in data if k != "description")
+            plan.districts.updateData(
+                [d for d, _, _ in records],
+                {c: [data.get(c) for _, _, data in records] for c in columns},
+                [fid for _, fid, _ in records],
+            )
+            return
+
         plan.blockSignals(True)
         plan.districts.clear()
-        for district in self.readFromLayer():
-            if district.district == 0:
-                plan.districts[0].update(district)
+        for district, fid, data in records:
+            if district == 0:
+                plan.districts[0].update(RdsUnassigned(fid=fid, **data))
             else:
-                plan.addDistrict(district)
+                plan.addDistrict(RdsDistrict(fid=fid, **data))
         plan.blockSignals(False)
 
 
@@ -92,30 +110,56 @@ class DistrictWriter:
             }
         self._dist_idx = self._fields.indexFromName(self._distField)
 
+    def _tableSource(self) -> tuple[str, str]:
+        parts = self._layer.dataProvider().dataSourceUri().split("|")
+        table = "districts"
+        for part in parts[1:]:
+            if part.startswith("layername="):
+                table = part[len("layername=") :]
+        return parts[0], table
+
     def writeToLayer(self, districts: Iterable[RdsDistrict]):
-        def changeAttributes(dist: RdsDistrict, feature: QgsFeature):
-            dirty = False
-            for idx, field in self._field_map.items():
-                if field not in dist:
-                    continue
-
-                value = dist[field]
-                if value != feature[idx]:
-                    feature.setAttribute(idx, value)
-                    dirty = True
-
-            if dirty:
-                if dist.fid == -1:
-                    self._layer.addFeature(feat)
-                else:
-                    self._layer.updateFeature(feat)
-
-        self._layer.startEditing()
-        for d in districts:
-            if d.fid == -1:
-                feat = QgsFeature(self._fields)
-                feat.setAttribute(self._dist_idx, d.district)
-            else:
-                feat = self._layer.getFeature(d.fid)
-            changeAttributes(d, feat)
-        self._layer.commitChanges(True)
+        """Write the districts that have been edited since they were loaded directly to the geopackage
+
+        Unchanged districts are skipped entirely; the changed ones are written with
+        a single batched UPDATE (and an INSERT for districts not yet in the layer)
+        rather than through a layer edit session.
+        """
+        dirty = [d for d in districts if d.isDirty()]
+        if not dirty:
+            return
+
+        columns = [f for f in self._field_map.values() if f == "description" or f in dirty[0]]
+        rows = []
+        for d in dirty:
+            values = [d.description if f == "description" else d[f] for f in columns]
+            rows.append([v.item() if isinstance(v, np.generic) else v for v in values])
+
+        path, table = self._tableSource()
+        distField = quote_identifier(self._distField)
+        with spatialite_connect(path) as db:
+            if columns:
+                parameters = ",".join(f"{quote_identifier(f)} = ?" for f in columns)
+                sql = f"UPDATE {quote_identifier(table)} SET {parameters} WHERE {distField} = ?"  # noqa: S608
+                db.executemany(sql, (values + [d.district] for d, values in zip(dirty, rows)))
+
+            new = [[d.district, *values] for d, values in zip(dirty, rows) if d.fid == -1]
+            if new:
+                fields = ",".join([distField, *(quote_identifier(f) for f in columns)])
+                parameters = ",".join("?" * (len(columns) + 1))
+                sql = f"INSERT OR IGNORE INTO {quote_identifier(table)} ({fields}) VALUES ({parameters})"  # noqa: S608
+                db.executemany(sql, new)
+
+                # pick up the feature ids assigned to the new districts -- the table has one row per district,
+                # so read them all rather than binding a parameter per district
+                c = db.execute(f"SELECT {distField}, fid FROM {quote_identifier(table)}")  # noqa: S608
+                fids = dict(c.fetchall())
+                for d in dirty:
+                    if d.fid == -1 and d.district in fids:
+                        d.fid = fids[d.district]
+            db.commit()
+
+        for d in dirty:
+            d.setClean()
+
+        self._layer.reload()
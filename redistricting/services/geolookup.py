@@ -0,0 +1,91 @@
+"""QGIS Redistricting Plugin - geography field lookup
+
+        begin                : 2026-10-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2026 by Cryptodira
+        email                : stuart@cryptodira.org
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 3 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ *   This program is distributed in the hope that it will be useful, but   *
+ *   WITHOUT ANY WARRANTY; without even the implied warranty of            *
+ *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          *
+ *   GNU General Public License for more details. You should have          *
+ *   received a copy of the GNU General Public License along with this     *
+ *   program. If not, see <http://www.gnu.org/licenses/>.                  *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from contextlib import closing
+from typing import TYPE_CHECKING, Any, Optional
+
+import numpy as np
+import pandas as pd
+
+from ..utils import spatialite_connect
+from ..utils.misc import quote_identifier
+
+if TYPE_CHECKING:
+    from ..models import RdsPlan
+
+
+class GeoFieldLookup:
+    """Resolves geography field values to assignment feature ids.
+
+    The geography fields in a plan's assignments table never change once the plan is created, so the lookup
+    for each field is read once from the indexed column of the assignments table and cached as a mapping from
+    value to an array of feature ids. Values are keyed by their string representation so that values of
+    integer columns can be looked up with the text values read from QGIS features and vice versa.
+    """
+
+    def __init__(self, plan: RdsPlan):
+        self._plan = plan
+        self._index: dict[str, dict[str, np.ndarray]] = {}
+
+    def isIndexable(self, field: str) -> bool:
+        """district assignments change during editing and are not indexed"""
+        if field == self._plan.distField or not self._plan.assignLayer:
+            return False
+
+        return self._plan.assignLayer.fields().lookupField(field) != -1
+
+    def clear(self):
+        self._index.clear()
+
+    def _buildIndex(self, field: str) -> dict[str, np.ndarray]:
+        # CreatePlanLayersTask creates an index on each geography field -- ordering by the field
+        # lets sqlite satisfy the query with a scan of the (covering) index instead of the table
+        col = quote_identifier(field)
+        with closing(spatialite_connect(self._plan.geoPackagePath)) as db:
+            df = pd.read_sql(
+                f"SELECT fid, {col} AS value FROM assignments WHERE {col} IS NOT NULL ORDER BY {col}",  # noqa: S608
+                db,
+            )
+
+        fids = df["fid"].to_numpy()
+        return {str(value): fids[positions] for value, positions in df.groupby("value", sort=False).indices.items()}
+
+    def lookup(self, field: str, values: Iterable[Any]) -> Optional[np.ndarray]:
+        """return the ids of the features whose geography field matches any of the values, or None if the field
+        cannot be indexed"""
+        if not self.isIndexable(field):
+            return None
+
+        if field not in self._index:
+            self._index[field] = self._buildIndex(field)
+
+        index = self._index[field]
+        matches = [index[key] for key in {str(v) for v in values} if key in index]
+        if not matches:
+            return np.empty(0, dtype=np.int64)
+
+        return np.concatenate(matches)
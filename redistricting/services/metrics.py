@@ -26,17 +26,20 @@ from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Optional, Union
 
-import geopandas as gpd
 import pandas as pd
-from qgis.core import QgsTask
+from qgis.core import QgsFeedback, QgsTask
 from qgis.PyQt.QtCore import QObject
 
-from ..models.metricslist import MetricLevel, MetricTriggers, get_batches
+from ..models.metricslist import MetricContext, MetricLevel, MetricTriggers, get_batches
 from ..utils import camel_to_snake, tr
+from ..utils.snapshot import snapshot
 from .districtio import DistrictReader
+from .profiling import profiler
 from .updateservice import UpdateParams, UpdateService
 
 if TYPE_CHECKING:
+    import geopandas as gpd
+
     from ..models import RdsMetrics, RdsPlan
 
 
@@ -45,7 +48,8 @@ class MetricsUpdate(UpdateParams):
     trigger: "MetricTriggers"
     populationData: Optional[pd.DataFrame]
     districtData: Optional[pd.DataFrame]
-    geometry: Optional[gpd.GeoSeries]
+    geometry: Optional["gpd.GeoSeries"]
+    adjacency: Optional[pd.DataFrame] = None
 
 
 class MetricsService(UpdateService):
@@ -64,23 +68,40 @@ class MetricsService(UpdateService):
 
         return get_batches(triggered_metrics, ready)
 
-    def run(self, task: QgsTask, plan: "RdsPlan", params: MetricsUpdate):
+    def _createParams(self, plan: "RdsPlan", *args, **kwargs) -> MetricsUpdate:
+        params: MetricsUpdate = super()._createParams(plan, *args, **kwargs)
+        # the geometry may still be referenced on the main thread once the task starts
+        params.geometry = snapshot(params.geometry)
+        return params
+
+    def run(self, task: Optional[QgsTask], plan: "RdsPlan", params: MetricsUpdate):
+        task = task or QgsFeedback()
         if params.populationData is None:
             params.populationData = self._loadAssignments(plan, True, True, False, task)
 
         batches = self._get_batches_for_trigger(plan.metrics, params.trigger)
         total = sum(len(b) for b in batches)
         count = 0
+        context = MetricContext(params.populationData, plan, params.adjacency)
         task.setProgress(0)
         for b in batches:
             for metric in b:
                 if params.trigger & metric.triggers():
+                    profiler.beginStage(f"metric {metric.name()}")
+                    profiler.setRows(len(params.populationData))
                     depends = {
                         m.name(): plan.metrics[m.name()].value
                         for m in metric.depends()
                         if plan.metrics.metrics.has(m.name())
                     }
-                    metric.calculate(params.populationData, params.districtData, params.geometry, plan, **depends)
+                    metric.calculate(
+                        params.populationData,
+                        params.districtData,
+                        params.geometry,
+                        plan,
+                        context=context,
+                        **depends,
+                    )
 
                 count += 1
                 task.setProgress(count / total)
@@ -129,6 +150,24 @@ class MetricsService(UpdateService):
         except Exception as e:  # pylint: disable=broad-except
             raise RuntimeError(f"Failed to update district metrics: {e}") from e
 
+    def completeUpdate(self, plan: "RdsPlan", params: MetricsUpdate):
+        """finish the metrics calculations on the plan and save the district-level metrics to the
+        district layer once the update has run"""
+        plan.metrics.beginUpdate()
+
+        batches = self._get_batches_for_trigger(plan.metrics, params.trigger)
+        update_districts = False
+
+        for b in batches:
+            for metric in b:
+                if metric.level() == MetricLevel.DISTRICT:
+                    update_districts = True
+                metric.finished(plan)
+        if update_districts:
+            self._saveDistrictMetrics(plan, params)
+
+        plan.metrics.endUpdate()
+
     def finished(
         self,
         status: UpdateService.UpdateStatus,
@@ -139,21 +178,7 @@ class MetricsService(UpdateService):
     ):
         if status == UpdateService.UpdateStatus.SUCCESS:
             try:
-                plan.metrics.beginUpdate()
-
-                # Finish metrics calculations
-                batches = self._get_batches_for_trigger(plan.metrics, params.trigger)
-                update_districts = False
-
-                for b in batches:
-                    for metric in b:
-                        if metric.level() == MetricLevel.DISTRICT:
-                            update_districts = True
-                        metric.finished(plan)
-                if update_districts:
-                    self._saveDistrictMetrics(plan, params)
-
-                plan.metrics.endUpdate()
+                self.completeUpdate(plan, params)
             except Exception as e:
                 exception = e
                 status = UpdateService.UpdateStatus.ERROR
@@ -169,7 +194,7 @@ class MetricsService(UpdateService):
         trigger: "MetricTriggers",
         populationData: Optional[pd.DataFrame],
         districtData: Optional[pd.DataFrame],
-        geometry: Optional[gpd.GeoSeries],
+        geometry: Optional["gpd.GeoSeries"],
     ):
         return super().update(
             plan,
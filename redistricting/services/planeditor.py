@@ -23,13 +23,13 @@
 """
 
 from collections.abc import Iterable
-from typing import Optional, overload
+from typing import overload
 
-from qgis.core import Qgis, QgsApplication, QgsField, QgsProject, QgsVectorLayer
+from qgis.core import Qgis, QgsApplication, QgsField, QgsVectorLayer
 from qgis.PyQt.QtCore import QMetaType, QObject, pyqtSignal
 
-from ..models import RdsDataField, RdsField, RdsGeoField, deserialize, serialize
-from ..utils import tr
+from ..models import RdsDataField, RdsField, RdsGeoField
+from ..utils import camel_to_kebab, tr
 from .basebuilder import BasePlanBuilder
 from .district import DistrictUpdater
 from .tasks.addgeofield import AddGeoFieldToAssignmentLayerTask
@@ -46,7 +46,6 @@ class PlanEditor(BasePlanBuilder):
         self._updater = planUpdater
         self._updateAssignLayerTask = None
         self._updating = 0
-        self._oldvalues: Optional[dict] = None
         self._modifiedFields = set()
 
     @property
@@ -256,13 +255,10 @@ class PlanEditor(BasePlanBuilder):
         return self._plan
 
     def startPlanUpdate(self):
-        self._oldvalues = serialize(self._plan)
+        self._plan.beginChanges()
 
     def endPlanUpdate(self):
-        newvalues = serialize(self._plan)
-        modifiedFields = {k for k in newvalues if k not in self._oldvalues or newvalues[k] != self._oldvalues[k]}
-        modifiedFields |= {k for k in self._oldvalues if k not in newvalues}
-        self._oldvalues = None
+        modifiedFields = {camel_to_kebab(name) for name in self._plan.endChanges()}
         self._modifiedFields = modifiedFields
 
         if self._updater:
@@ -283,39 +279,7 @@ class PlanEditor(BasePlanBuilder):
                 )
 
     def cancelPlanUpdate(self):
-        if self._oldvalues is None:
+        if not self._plan.isRecordingChanges():
             return
 
-        self._plan.name = self._oldvalues.get("name")
-        self._plan.description = self._oldvalues.get("description", "")
-        self._plan.numDistricts = self._oldvalues.get("num-districts")
-        self._plan.numSeats = self._oldvalues.get("num-seats")
-        self._plan.deviation = self._oldvalues.get("deviation", 0.0)
-
-        self._plan._geoIdCaption = self._oldvalues.get("geo-id-caption", "")
-
-        if "pop-layer" in self._oldvalues:
-            popLayer = QgsProject.instance().mapLayer(self._oldvalues.get("pop-layer"))
-            self._plan._popLayer = popLayer
-        self._plan._popJoinField = self._oldvalues.get("pop-join-field", "")
-        self._plan._popField = self._oldvalues.get("pop-field")
-
-        self._plan.popFields.clear()
-        for field in self._oldvalues.get("pop-fields", []):
-            f = deserialize(RdsField, field)
-            if f:
-                self._plan.popFields.append(f)
-
-        self._plan.dataFields.clear()
-        for field in self._oldvalues.get("data-fields", []):
-            f = deserialize(RdsDataField, field)
-            if f:
-                self._plan.dataFields.append(f)
-
-        self._plan._geoFields.clear()
-        for field in self._oldvalues.get("geo-fields", []):
-            f = deserialize(RdsGeoField, field)
-            if f:
-                self._plan.geoFields.append(f)
-
-        self._oldvalues = None
+        self._plan.rollbackChanges()
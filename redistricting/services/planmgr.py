@@ -107,6 +107,8 @@ class PlanManager(QObject):
             return
 
         if self._activePlan != plan:
+            if plan is not None:
+                plan.loadDeferredDistricts()
             self.aboutToChangeActivePlan.emit(self._activePlan, plan)
             self._activePlan = plan
             self.activePlanChanged.emit(plan)
@@ -0,0 +1,212 @@
+"""QGIS Redistricting Plugin - per-stage profiling of background tasks
+
+        begin                : 2026-10-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2026 by Cryptodira
+        email                : stuart@cryptodira.org
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 3 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ *   This program is distributed in the hope that it will be useful, but   *
+ *   WITHOUT ANY WARRANTY; without even the implied warranty of            *
+ *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          *
+ *   GNU General Public License for more details. You should have          *
+ *   received a copy of the GNU General Public License along with this     *
+ *   program. If not, see <http://www.gnu.org/licenses/>.                  *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+import json
+import sys
+import threading
+import time
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+from qgis.core import Qgis, QgsMessageLog
+from qgis.PyQt.QtCore import QObject, pyqtSignal
+
+from .. import settings
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+
+def _maxRss() -> Optional[int]:
+    if resource is None:
+        return None
+
+    # ru_maxrss is in kilobytes on Linux, bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+@dataclass
+class StageProfile:
+    task: str
+    stage: str
+    wallTime: float
+    cpuTime: float
+    peakMemory: Optional[int] = None
+    maxRss: Optional[int] = None
+    rows: Optional[int] = None
+    # tracemalloc's peak is process-wide -- when other stages ran at the same time, peakMemory
+    # includes their allocations and is not a reliable measure of this stage alone
+    peakMemoryShared: Optional[bool] = None
+
+    def __str__(self):
+        s = f"{self.task} - {self.stage}: wall {self.wallTime:.3f}s, cpu {self.cpuTime:.3f}s"
+        if self.peakMemory is not None:
+            s += f", peak memory {self.peakMemory / 1048576:.1f} MB"
+            if self.peakMemoryShared:
+                s += " (shared with concurrent stages)"
+        if self.rows is not None:
+            s += f", {self.rows} rows"
+        return s
+
+
+class _ActiveStage:
+    def __init__(self, task: str, stage: str, concurrent: bool = False):
+        self.task = task
+        self.stage = stage
+        self.rows: Optional[int] = None
+        self.concurrent = concurrent
+        if tracemalloc.is_tracing():
+            # resetting the peak would discard the peak of any other stage that is running
+            if not concurrent:
+                tracemalloc.reset_peak()
+            self.baseMemory = tracemalloc.get_traced_memory()[0]
+        else:
+            self.baseMemory = None
+        self.wallStart = time.perf_counter()
+        self.cpuStart = time.thread_time()
+
+    def stop(self) -> StageProfile:
+        wallTime = time.perf_counter() - self.wallStart
+        cpuTime = time.thread_time() - self.cpuStart
+        if self.baseMemory is not None and tracemalloc.is_tracing():
+            peakMemory = max(0, tracemalloc.get_traced_memory()[1] - self.baseMemory)
+            shared = self.concurrent
+        else:
+            peakMemory = None
+            shared = None
+
+        return StageProfile(self.task, self.stage, wallTime, cpuTime, peakMemory, _maxRss(), self.rows, shared)
+
+
+class TaskProfiler(QObject):
+    """Records wall time, CPU time, memory and row counts for the stages of
+    background tasks when profiling is enabled in the plugin settings.
+
+    Stages are tracked per thread, so tasks running concurrently on different
+    threads are profiled independently, though peak memory from tracemalloc
+    covers allocations from all threads. The peak is only reset when a stage
+    starts with no other stage running, and the profile of any stage that
+    overlapped another is marked with peakMemoryShared.
+    """
+
+    stageProfiled = pyqtSignal(object)
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._local = threading.local()
+        self._logLock = threading.Lock()
+        self._tracingLock = threading.Lock()
+        self._tracedTasks = 0
+        self._startedTracing = False
+        self._stagesLock = threading.Lock()
+        self._activeStages: set[_ActiveStage] = set()
+
+    @property
+    def enabled(self) -> bool:
+        return settings.enableProfiling
+
+    @contextmanager
+    def profileTask(self, task: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+
+        traceMemory = settings.profileMemory
+        if traceMemory:
+            self._startTracing()
+
+        # a task run in the foreground from within another task's stage is profiled separately
+        outer = (getattr(self._local, "task", None), getattr(self._local, "stage", None))
+        self._local.task = task
+        self._local.stage = None
+        try:
+            yield
+        finally:
+            self.endStage()
+            self._local.task, self._local.stage = outer
+            if traceMemory:
+                self._stopTracing()
+
+    def _startTracing(self):
+        with self._tracingLock:
+            if self._tracedTasks == 0 and not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._startedTracing = True
+            self._tracedTasks += 1
+
+    def _stopTracing(self):
+        # tracemalloc slows every allocation in the process, so tracing started here is
+        # stopped as soon as the last task being traced, on any thread, is done
+        with self._tracingLock:
+            self._tracedTasks -= 1
+            if self._tracedTasks == 0 and self._startedTracing:
+                tracemalloc.stop()
+                self._startedTracing = False
+
+    def beginStage(self, stage: str):
+        task = getattr(self._local, "task", None)
+        if task is None:
+            return
+
+        self.endStage()
+        with self._stagesLock:
+            # stages of tasks on other threads, or of an outer task on this thread, share the peak
+            active = _ActiveStage(task, stage, concurrent=bool(self._activeStages))
+            for other in self._activeStages:
+                other.concurrent = True
+            self._activeStages.add(active)
+        self._local.stage = active
+
+    def endStage(self):
+        active: Optional[_ActiveStage] = getattr(self._local, "stage", None)
+        if active is None:
+            return
+
+        self._local.stage = None
+        with self._stagesLock:
+            self._activeStages.discard(active)
+            profile = active.stop()
+        self._record(profile)
+
+    def setRows(self, rows: int):
+        active: Optional[_ActiveStage] = getattr(self._local, "stage", None)
+        if active is not None:
+            active.rows = rows
+
+    def _record(self, profile: StageProfile):
+        self.stageProfiled.emit(profile)
+        QgsMessageLog.logMessage(str(profile), "Redistricting Profiling", Qgis.MessageLevel.Info, notifyUser=False)
+
+        if settings.profilingLog:
+            with self._logLock, open(settings.profilingLog, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"time": time.time(), **asdict(profile)}) + "\n")
+
+
+profiler = TaskProfiler()
@@ -23,6 +23,7 @@
 """
 
 import json
+import sqlite3
 from numbers import Number
 from typing import Any, Callable, Optional, TypedDict, Union
 
@@ -38,6 +39,9 @@ from ..utils.misc import quote_identifier
 
 schemaVersion = version.parse("1.0.5")
 
+# table in each plan GeoPackage recording the schema version its layers have been migrated to
+SCHEMA_VERSION_TABLE = "redistricting_schema"
+
 
 class fieldSchema1_0_0(TypedDict):
     layer: str
@@ -248,13 +252,122 @@ planSchema = TypedDict(
 )
 
 
+def readGeoPackageVersion(db: sqlite3.Connection) -> Optional[version.Version]:
+    cur = db.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = ?", (SCHEMA_VERSION_TABLE,))
+    if cur.fetchone() is None:
+        return None
+
+    row = db.execute(f"SELECT value FROM {SCHEMA_VERSION_TABLE} WHERE key = 'schema-version'").fetchone()  # noqa: S608
+    return version.parse(row[0]) if row else None
+
+
+def writeGeoPackageVersion(db: sqlite3.Connection, v: version.Version):
+    db.execute(f"CREATE TABLE IF NOT EXISTS {SCHEMA_VERSION_TABLE} (key TEXT PRIMARY KEY, value TEXT)")
+    db.execute(
+        f"INSERT OR REPLACE INTO {SCHEMA_VERSION_TABLE} (key, value) VALUES ('schema-version', ?)",  # noqa: S608
+        (str(v),),
+    )
+
+
+def readGeoPackagePlan(db: sqlite3.Connection) -> tuple[Optional[dict], dict[str, tuple[str, str]]]:
+    """Read the plan definition saved in a plan GeoPackage, along with the provider
+    and source of each of the plan's layers outside the GeoPackage, keyed by layer id"""
+    cur = db.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = ?", (SCHEMA_VERSION_TABLE,))
+    if cur.fetchone() is None:
+        return None, {}
+
+    sql = (
+        f"SELECT key, value FROM {SCHEMA_VERSION_TABLE} "  # noqa: S608
+        "WHERE key IN ('plan-definition', 'layer-sources')"
+    )
+    values = dict(db.execute(sql))
+    data = json.loads(values["plan-definition"]) if "plan-definition" in values else None
+    sources = {k: tuple(v) for k, v in json.loads(values.get("layer-sources", "{}")).items()}
+    return data, sources
+
+
+def writeGeoPackagePlan(db: sqlite3.Connection, data: dict, sources: dict[str, tuple[str, str]]):
+    db.execute(f"CREATE TABLE IF NOT EXISTS {SCHEMA_VERSION_TABLE} (key TEXT PRIMARY KEY, value TEXT)")
+    db.executemany(
+        f"INSERT OR REPLACE INTO {SCHEMA_VERSION_TABLE} (key, value) VALUES (?, ?)",  # noqa: S608
+        [("plan-definition", json.dumps(data)), ("layer-sources", json.dumps(sources))],
+    )
+
+
+def clearGeoPackagePlan(db: sqlite3.Connection):
+    """Remove the plan definition and layer sources saved in a plan GeoPackage, e.g. from a copy of
+    the GeoPackage that will hold a different plan"""
+    cur = db.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = ?", (SCHEMA_VERSION_TABLE,))
+    if cur.fetchone() is None:
+        return
+
+    db.execute(
+        f"DELETE FROM {SCHEMA_VERSION_TABLE} WHERE key IN ('plan-definition', 'layer-sources')"  # noqa: S608
+    )
+
+
+class GeoPackageMigration:
+    """Connection to the GeoPackage containing a plan's district layer, shared by
+    all the migration steps for the plan. Each step that changes the layer records
+    the version it migrated the GeoPackage to, so changes that have already been
+    applied are skipped when a migration is repeated or resumed."""
+
+    def __init__(self, data: dict):
+        self.distLayer: Optional[QgsVectorLayer] = QgsProject.instance().mapLayer(data.get("dist-layer"))
+        self.db: Optional[sqlite3.Connection] = None
+        self.version: Optional[version.Version] = None
+        self.modified = False
+
+    def __enter__(self):
+        if self.distLayer is not None:
+            geoPackagePath, _ = self.distLayer.source().split("|", 1)
+            self.db = spatialite_connect(geoPackagePath)
+            self.version = readGeoPackageVersion(self.db)
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.db is not None:
+            if exc_type is None:
+                self.db.commit()
+            else:
+                self.db.rollback()
+            self.db.close()
+            self.db = None
+
+        if self.modified:
+            self.distLayer.reload()
+
+        return False
+
+    def needsUpdate(self, v: version.Version) -> bool:
+        """Check whether the layer changes for the migration to version v have yet to be applied"""
+        return self.db is not None and (self.version is None or self.version < v)
+
+    def districtColumns(self) -> list[str]:
+        return [row[1] for row in self.db.execute("PRAGMA table_info(districts)")]
+
+    def renameColumn(self, old_name: str, new_name: str):
+        if old_name in self.districtColumns():
+            self.db.execute(
+                f"ALTER TABLE districts RENAME COLUMN {quote_identifier(old_name)} TO {quote_identifier(new_name)}"
+            )
+            self.modified = True
+
+    def setVersion(self, v: version.Version):
+        if self.needsUpdate(v):
+            writeGeoPackageVersion(self.db, v)
+            self.db.commit()
+            self.version = v
+
+
 def _renameField(data: dict, old_name: str, new_name: str):
     if old_name in data:
         data[new_name] = data[old_name]
         del data[old_name]
 
 
-def migrateSchema1_0_0_to_1_0_1(data: planSchema1_0_0):
+def migrateSchema1_0_0_to_1_0_1(data: planSchema1_0_0, gpkg: GeoPackageMigration):  # pylint: disable=unused-argument
     migrated = planSchema1_0_1(data)
     _renameField(migrated, "join-field", "pop-join-field")
     _renameField(migrated, "geo-id-display", "geo-id-caption")
@@ -297,39 +410,33 @@ def migrateSchema1_0_0_to_1_0_1(data: planSchema1_0_0):
     return migrated, version.parse("1.0.1")
 
 
-def _updateDistLayer1_0_1_to_1_0_2(data: planSchema1_0_1):
-    distLayer: QgsVectorLayer = QgsProject.instance().mapLayer(data.get("dist-layer"))
-    if distLayer is None:
+def _updateDistLayer1_0_1_to_1_0_2(data: planSchema1_0_1, gpkg: GeoPackageMigration):
+    if not gpkg.needsUpdate(version.parse("1.0.2")):
         return
 
-    geoPackagePath, _ = distLayer.source().split("|", 1)
-
     fields = {
         "deviation": "deviation REAL DEFAULT 0",
         "pct_deviation": "pct_deviation REAL DEFAULT 0",
         "description": "description TEXT",
         "pieces": "pieces INT",
     }
-    update_fields = []
-    for f in fields:
-        if distLayer.fields().lookupField(f) == -1:
-            update_fields.append(f)
+    columns = gpkg.districtColumns()
+    update_fields = [f for f in fields if f not in columns]
     if update_fields:
-        with spatialite_connect(geoPackagePath) as db:
-            sql = ";".join(f"ALTER TABLE districts ADD COLUMN {fields[f]}" for f in update_fields)
-            db.executescript(sql)
+        for f in update_fields:
+            gpkg.db.execute(f"ALTER TABLE districts ADD COLUMN {fields[f]}")
 
-            if "description" in update_fields:
-                sql = "UPDATE districts SET name = ?, description = ? WHERE district = ?"
-                db.executemany(sql, [(f["name"], f["description"], f["district"]) for f in data["districts"]])
-            else:
-                sql = "UPDATE districts SET name = ? WHERE district = ?"
-                db.executemany(sql, [(f["name"], f["district"]) for f in data["districts"]])
-        distLayer.reload()
+        if "description" in update_fields:
+            sql = "UPDATE districts SET name = ?, description = ? WHERE district = ?"
+            gpkg.db.executemany(sql, [(f["name"], f["description"], f["district"]) for f in data["districts"]])
+        else:
+            sql = "UPDATE districts SET name = ? WHERE district = ?"
+            gpkg.db.executemany(sql, [(f["name"], f["district"]) for f in data["districts"]])
+        gpkg.modified = True
 
 
-def migrateSchema1_0_1_to_1_0_2(data: planSchema1_0_1):
-    _updateDistLayer1_0_1_to_1_0_2(data)
+def migrateSchema1_0_1_to_1_0_2(data: planSchema1_0_1, gpkg: GeoPackageMigration):
+    _updateDistLayer1_0_1_to_1_0_2(data, gpkg)
 
     plan_splits = {}
     splits = data["plan-stats"].get("splits")
@@ -376,23 +483,14 @@ def migrateSchema1_0_1_to_1_0_2(data: planSchema1_0_1):
     return data, version.parse("1.0.2")
 
 
-def migrateSchema1_0_2_to_1_0_3(data: planSchema1_0_2):
-    distLayer: QgsVectorLayer = QgsProject.instance().mapLayer(data.get("dist-layer"))
-    if distLayer is None:
-        return data, version.parse("1.0.3")
-
-    geoPackagePath, _ = distLayer.source().split("|", 1)
-
-    if data["pop-field"] != DistrictColumns.POPULATION and distLayer.fields().lookupField(data["pop-field"]) != -1:
-        with spatialite_connect(geoPackagePath) as db:
-            sql = f"ALTER TABLE districts RENAME COLUMN {data['pop-field']} TO {DistrictColumns.POPULATION}"
-            db.execute(sql)
-        distLayer.reload()
+def migrateSchema1_0_2_to_1_0_3(data: planSchema1_0_2, gpkg: GeoPackageMigration):
+    if gpkg.needsUpdate(version.parse("1.0.3")) and data["pop-field"] != DistrictColumns.POPULATION:
+        gpkg.renameColumn(data["pop-field"], DistrictColumns.POPULATION)
 
     return data, version.parse("1.0.3")
 
 
-def migrateSchema1_0_3_to_1_0_4(data: planSchema1_0_2):
+def migrateSchema1_0_3_to_1_0_4(data: planSchema1_0_2, gpkg: GeoPackageMigration):
     def addKeyField(fld: dict[str, Any]):
         l: QgsVectorLayer = QgsProject.instance().mapLayer(fld.get("layer"))
         if l is None:
@@ -445,23 +543,13 @@ def migrateSchema1_0_3_to_1_0_4(data: planSchema1_0_2):
     data["plan-stats"]["splits"] = splits
     _renameField(data, "plan-stats", "metrics")
 
-    if data["pop-field"] != DistrictColumns.POPULATION:
-        distLayer: QgsVectorLayer = QgsProject.instance().mapLayer(data.get("dist-layer"))
-        if distLayer is not None:
-            geoPackagePath, _ = distLayer.source().split("|", 1)
-            with spatialite_connect(geoPackagePath) as db:
-                cur = db.execute("SELECT * FROM districts LIMIT 1")
-                for col in cur.description:
-                    if col[0] == data["pop-field"]:
-                        db.execute(
-                            f"ALTER TABLE districts RENAME COLUMN {data['pop-field']} TO {DistrictColumns.POPULATION}"
-                        )
-                        break
+    if gpkg.needsUpdate(version.parse("1.0.4")) and data["pop-field"] != DistrictColumns.POPULATION:
+        gpkg.renameColumn(data["pop-field"], DistrictColumns.POPULATION)
 
     return data, version.parse("1.0.4")
 
 
-def migrateSchema1_0_4_to_1_0_5(data: planSchema1_0_4):
+def migrateSchema1_0_4_to_1_0_5(data: planSchema1_0_4, gpkg: GeoPackageMigration):
     metrics: dict[str, Any] = {
         camel_to_kebab(n): None
         for n, m in metrics_classes.items()
@@ -469,51 +557,49 @@ def migrateSchema1_0_4_to_1_0_5(data: planSchema1_0_4):
     }
     metrics["total-population"] = data["total-population"]
 
-    distLayer: QgsVectorLayer = QgsProject.instance().mapLayer(data.get("dist-layer"))
-    if distLayer is not None:
-        geoPackagePath, _ = distLayer.source().split("|", 1)
-        with spatialite_connect(geoPackagePath) as db:
-            ideal = data["total-population"] / data.get("num-seats", data["num-districts"])
-
-            cur = db.execute(
-                f"SELECT min(({DistrictColumns.POPULATION}-members*{ideal})/(members*{ideal})) AS min_deviation, "  # noqa: S608
-                f"max(({DistrictColumns.POPULATION}-members*{ideal})/(members*{ideal})) AS max_deviation, "
-                f"min({MetricsColumns.POLSBYPOPPER}) AS minpolsbypopper, "
-                f"max({MetricsColumns.POLSBYPOPPER}) AS maxpolsbypopper, "
-                f"avg({MetricsColumns.POLSBYPOPPER}) AS meanpolsbypopper, "
-                f"min({MetricsColumns.REOCK}) AS minreock, "
-                f"max({MetricsColumns.REOCK}) AS maxreock, "
-                f"avg({MetricsColumns.REOCK}) AS meanreock, "
-                f"min({MetricsColumns.CONVEXHULL}) AS minconvexhull, "
-                f"max({MetricsColumns.CONVEXHULL}) AS maxconvexhull, "
-                f"avg({MetricsColumns.CONVEXHULL}) AS meanconvexhull "
-                "FROM districts"
-            )
-            (
-                mindev,
-                maxdev,
-                metrics["min-polsbypopper"],
-                metrics["max-polsbypopper"],
-                metrics["mean-polsbypopper"],
-                metrics["min-reock"],
-                metrics["max-reock"],
-                metrics["mean-reock"],
-                metrics["min-convexhull"],
-                metrics["max-convexhull"],
-                metrics["mean-convexhull"],
-            ) = cur.fetchone()
-            metrics["plan-deviation"] = [mindev, maxdev]
-
-            cur = db.execute("SELECT count(*) FROM districts HAVING NumGeometries(geometry) > 1")
-            metrics["contiguity"] = not bool(cur.fetchall())
-
-            if not isinstance(data["dist-field"], str) or not data["dist-field"].isidentifier():
-                raise ValueError("distField must be a valid identifier")
-            distField = quote_identifier(data["dist-field"])
-            cur = db.execute(
-                f"SELECT count(*) FROM assignments WHERE {distField} = 0 OR {distField} IS NULL"  # noqa: S608
-            )
-            metrics["complete"] = cur.fetchone()[0] == 0
+    if gpkg.db is not None:
+        db = gpkg.db
+        ideal = data["total-population"] / data.get("num-seats", data["num-districts"])
+
+        cur = db.execute(
+            f"SELECT min(({DistrictColumns.POPULATION}-members*{ideal})/(members*{ideal})) AS min_deviation, "  # noqa: S608
+            f"max(({DistrictColumns.POPULATION}-members*{ideal})/(members*{ideal})) AS max_deviation, "
+            f"min({MetricsColumns.POLSBYPOPPER}) AS minpolsbypopper, "
+            f"max({MetricsColumns.POLSBYPOPPER}) AS maxpolsbypopper, "
+            f"avg({MetricsColumns.POLSBYPOPPER}) AS meanpolsbypopper, "
+            f"min({MetricsColumns.REOCK}) AS minreock, "
+            f"max({MetricsColumns.REOCK}) AS maxreock, "
+            f"avg({MetricsColumns.REOCK}) AS meanreock, "
+            f"min({MetricsColumns.CONVEXHULL}) AS minconvexhull, "
+            f"max({MetricsColumns.CONVEXHULL}) AS maxconvexhull, "
+            f"avg({MetricsColumns.CONVEXHULL}) AS meanconvexhull "
+            "FROM districts"
+        )
+        (
+            mindev,
+            maxdev,
+            metrics["min-polsbypopper"],
+            metrics["max-polsbypopper"],
+            metrics["mean-polsbypopper"],
+            metrics["min-reock"],
+            metrics["max-reock"],
+            metrics["mean-reock"],
+            metrics["min-convexhull"],
+            metrics["max-convexhull"],
+            metrics["mean-convexhull"],
+        ) = cur.fetchone()
+        metrics["plan-deviation"] = [mindev, maxdev]
+
+        cur = db.execute("SELECT count(*) FROM districts HAVING NumGeometries(geometry) > 1")
+        metrics["contiguity"] = not bool(cur.fetchall())
+
+        if not isinstance(data["dist-field"], str) or not data["dist-field"].isidentifier():
+            raise ValueError("distField must be a valid identifier")
+        distField = quote_identifier(data["dist-field"])
+        cur = db.execute(
+            f"SELECT count(*) FROM assignments WHERE {distField} = 0 OR {distField} IS NULL"  # noqa: S608
+        )
+        metrics["complete"] = cur.fetchone()[0] == 0
 
     metrics["cut-edges"] = data["metrics"].pop("cut-edges", 0)
     metrics["splits"] = data["metrics"].pop("splits", {})
@@ -522,7 +608,7 @@ def migrateSchema1_0_4_to_1_0_5(data: planSchema1_0_4):
     return data, version.parse("1.0.5")
 
 
-migrations: dict[version.Version, Callable[[dict], tuple[dict, version.Version]]] = {
+migrations: dict[version.Version, Callable[[dict, GeoPackageMigration], tuple[dict, version.Version]]] = {
     version.parse("1.0.0"): migrateSchema1_0_0_to_1_0_1,
     version.parse("1.0.1"): migrateSchema1_0_1_to_1_0_2,
     version.parse("1.0.2"): migrateSchema1_0_2_to_1_0_3,
@@ -544,8 +630,10 @@ def checkMigrateSchema(data: dict, v: version.Version):
     if v not in schemas:
         raise ValueError(f"invalid schema version: {str(v)}")
 
-    while v < schemaVersion:
-        migrate = migrations[v]
-        data, v = migrate(data)
+    with GeoPackageMigration(data) as gpkg:
+        while v < schemaVersion:
+            migrate = migrations[v]
+            data, v = migrate(data, gpkg)
+            gpkg.setVersion(v)
 
     return data
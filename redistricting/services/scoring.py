@@ -0,0 +1,353 @@
+"""QGIS Redistricting Plugin - score candidate assignments against a plan
+
+        begin                : 2026-10-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2026 by Cryptodira
+        email                : stuart@cryptodira.org
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 3 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ *   This program is distributed in the hope that it will be useful, but   *
+ *   WITHOUT ANY WARRANTY; without even the implied warranty of            *
+ *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          *
+ *   GNU General Public License for more details. You should have          *
+ *   received a copy of the GNU General Public License along with this     *
+ *   program. If not, see <http://www.gnu.org/licenses/>.                  *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+import pathlib
+import threading
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+import pandas as pd
+from qgis.core import QgsFeedback, QgsTask
+from qgis.PyQt.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from ..errors import CanceledError
+from ..models import DistrictColumns, MetricTriggers, RdsMetrics
+from ..models.metrics import RdsCutEdges
+from ..models.metricslist import MetricLevel
+from ..utils import tr
+from .metrics import MetricsService, MetricsUpdate
+from .tasks.importequivalency import readAssignmentFile
+from .updateservice import IncrementalFeedback, UpdateParams, UpdateService
+
+if TYPE_CHECKING:
+    import geopandas as gpd
+
+    from ..models import RdsPlan
+
+
+@dataclass
+class CandidateDistrict:
+    district: int
+    members: int
+    population: int
+
+
+class CandidatePlan:
+    """Stands in for the base plan when calculating the metrics of a candidate assignment,
+    with its own metrics and districts, so the base plan is left untouched"""
+
+    def __init__(self, plan: "RdsPlan", districtData: pd.DataFrame):
+        self._plan = plan
+        # geographic metrics look up names in the geography layers, which can't be shared
+        # between threads -- split counts are added to the scores separately
+        self.metrics = RdsMetrics(
+            [type(m)() for m in plan.metrics if m.level() != MetricLevel.GEOGRAPHIC]  # pylint: disable=not-an-iterable
+        )
+        self.districts = [
+            CandidateDistrict(int(d), int(row[DistrictColumns.MEMBERS]), int(row[DistrictColumns.POPULATION]))
+            for d, row in districtData.iterrows()
+        ]
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._plan, name)
+
+    @property
+    def totalPopulation(self) -> int:
+        return self.metrics.totalPopulation or 0
+
+    @property
+    def allocatedDistricts(self) -> int:
+        return len(self.districts) - 1
+
+    @property
+    def allocatedSeats(self) -> int:
+        return sum(d.members for d in self.districts if d.district != 0)
+
+    def planMetrics(self) -> dict[str, Any]:
+        """plan-wide metrics of the candidate, with sequences such as the min and max deviation
+        split into separate columns"""
+        result = {}
+        for m in self.metrics:
+            if m.level() != MetricLevel.PLANWIDE or not m.serialize() or m.value is None:
+                continue
+            if isinstance(m.value, Sequence) and not isinstance(m.value, str):
+                result |= {f"{m.name()}_{i}": v for i, v in enumerate(m.value)}
+            else:
+                result[m.name()] = m.value
+        return result
+
+
+@dataclass
+class ScoringParams(UpdateParams):
+    candidates: list[Union[str, pathlib.Path]]
+    includeGeometry: bool = True
+    headerRow: bool = True
+    geoColumn: Union[int, str] = 0
+    distColumn: Union[int, str] = 1
+    delimiter: str = ","
+    quotechar: str = '"'
+    joinField: Optional[str] = None
+    threads: Optional[int] = None
+    populationData: Optional[pd.DataFrame] = None
+    adjacency: Optional[pd.DataFrame] = None
+    scores: Optional[pd.DataFrame] = None
+
+
+@dataclass
+class CandidateScore:
+    name: str
+    path: pathlib.Path
+    metrics: dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+class ScoringWorker(QRunnable):
+    def __init__(self, service: "ScoringService", plan: "RdsPlan", params: ScoringParams, score: CandidateScore, cb):
+        super().__init__()
+        self.service = service
+        self.plan = plan
+        self.params = params
+        self.score = score
+        self.callback = cb
+
+    def run(self):
+        try:
+            self.score.metrics = self.service.scoreCandidate(self.plan, self.params, self.score.path)
+        except Exception as e:  # pylint: disable=broad-except
+            self.score.error = f"{e!r}"
+
+        self.callback()
+
+
+class ScoringService(UpdateService):
+    """Scores many candidate assignments of the units of a plan, read from block equivalency files,
+    without importing them into a plan. The unit-level population data and geometry are loaded once
+    and each candidate is aggregated and scored with the plan's metrics on a thread pool."""
+
+    paramsCls = ScoringParams
+
+    scoresReady = pyqtSignal("PyQt_PyObject", "PyQt_PyObject")  # RdsPlan, pd.DataFrame
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(tr("Scoring candidate plans"), parent)
+        self._metricsService = MetricsService(self)
+
+    def _candidateNames(self, paths: Iterable[pathlib.Path]) -> list[str]:
+        paths = list(paths)
+        stems = [p.stem for p in paths]
+        return [p.stem if stems.count(p.stem) == 1 else str(p) for p in paths]
+
+    def _readCandidate(self, plan: "RdsPlan", params: ScoringParams, path: pathlib.Path) -> pd.Series:
+        if not path.exists():
+            raise FileNotFoundError(tr("File {path} does not exist").format(path=str(path)))
+
+        keys = self._joinKeys(plan, params)
+        geoType = int if pd.api.types.is_integer_dtype(keys) else str
+        df = readAssignmentFile(
+            path,
+            params.headerRow,
+            params.geoColumn,
+            params.distColumn,
+            params.delimiter,
+            params.quotechar,
+            {params.geoColumn: geoType, params.distColumn: int},
+        )
+        assignment = df.set_index(params.geoColumn)[params.distColumn]
+        # later rows win, as they would when the file is imported into the plan
+        return assignment[~assignment.index.duplicated(keep="last")]
+
+    def _joinKeys(self, plan: "RdsPlan", params: ScoringParams) -> Union[pd.Index, pd.Series]:
+        if params.joinField is None or params.joinField == plan.geoIdField:
+            return params.populationData.index
+
+        return params.populationData[params.joinField]
+
+    def _dissolve(self, plan: "RdsPlan", populationData: "gpd.GeoDataFrame", index: pd.Index) -> "gpd.GeoSeries":
+        import geopandas as gpd  # pylint: disable=import-outside-toplevel # noqa: PLC0415
+
+        assigned = populationData.loc[populationData[plan.distField] != 0, [plan.distField, "geometry"]]
+        geometry = assigned.dissolve(by=plan.distField).geometry
+        # match the district updater, which leaves the unassigned district without geometry
+        return gpd.GeoSeries(geometry.reindex(index), crs=populationData.crs)
+
+    def scoreCandidate(self, plan: "RdsPlan", params: ScoringParams, path: pathlib.Path) -> dict[str, Any]:
+        """aggregate and score a single candidate assignment against the preloaded unit data"""
+        import geopandas as gpd  # pylint: disable=import-outside-toplevel # noqa: PLC0415
+
+        assignment = self._readCandidate(plan, params, path)
+        keys = self._joinKeys(plan, params)
+        districts = pd.Series(keys.map(assignment).to_numpy(), index=params.populationData.index)
+        districts = districts.fillna(0).astype(int)
+        if ((districts < 0) | (districts > plan.numDistricts)).any():
+            raise ValueError(
+                tr("{path} assigns units to districts outside the range 1 to {numDistricts}").format(
+                    path=str(path), numDistricts=plan.numDistricts
+                )
+            )
+
+        populationData = params.populationData.assign(**{plan.distField: districts})
+        sumColumns = [DistrictColumns.POPULATION, *plan.popFields.keys(), *plan.dataFields.keys()]
+        districtData = populationData[[plan.distField, *sumColumns]].groupby(plan.distField).sum()
+        if 0 not in districtData.index:
+            districtData.loc[0] = 0
+            districtData = districtData.sort_index()
+        districtData[DistrictColumns.MEMBERS] = [
+            0 if d == 0 else plan.districts.get(d).members if plan.districts.has(d) else 1
+            for d in districtData.index
+        ]
+
+        geometry = None
+        trigger = MetricTriggers.ON_CREATE_PLAN | MetricTriggers.ON_UPDATE_DEMOGRAPHICS
+        if params.includeGeometry:
+            geometry = self._dissolve(plan, populationData, districtData.index)
+            districtData = gpd.GeoDataFrame(districtData, geometry=geometry, crs=populationData.crs)
+            trigger |= MetricTriggers.ON_UPDATE_GEOMETRY
+
+        candidate = CandidatePlan(plan, districtData)
+        update = MetricsUpdate(trigger, populationData, districtData, geometry, params.adjacency)
+        self._metricsService.run(QgsFeedback(), candidate, update)
+
+        # a geography is split if its units fall in more than one district
+        splits = {
+            f"splits_{f.fieldName}": int(populationData.groupby(f.fieldName)[plan.distField].nunique().gt(1).sum())
+            for f in plan.geoFields
+        }
+        return candidate.planMetrics() | splits
+
+    def run(self, task: Optional[QgsTask], plan: "RdsPlan", params: ScoringParams) -> ScoringParams:
+        feedback = IncrementalFeedback(task or QgsFeedback())
+
+        feedback.setProgressIncrement(0, 20, "load")
+        if params.populationData is None:
+            params.populationData = self._loadAssignments(plan, True, True, params.includeGeometry, feedback)
+        feedback.setRows(len(params.populationData))
+
+        if params.includeGeometry and params.adjacency is None and plan.metrics.metrics.has(RdsCutEdges.name()):
+            params.adjacency = RdsCutEdges.unitAdjacency(plan)
+
+        feedback.setProgressIncrement(20, 100, "score")
+        paths = [pathlib.Path(p) for p in params.candidates]
+        scores = [CandidateScore(name, path) for name, path in zip(self._candidateNames(paths), paths)]
+
+        def progress():
+            nonlocal count
+            with lock:
+                count += 1
+                feedback.updateProgress(len(scores), count)
+
+        lock = threading.Lock()
+        count = 0
+        pool = QThreadPool()
+        if params.threads:
+            pool.setMaxThreadCount(params.threads)
+        workers: list[ScoringWorker] = []
+        for score in scores:
+            worker = ScoringWorker(self, plan, params, score, progress)
+            worker.setAutoDelete(False)
+            workers.append(worker)
+            pool.start(worker)
+
+        while not pool.waitForDone(100):
+            if feedback.isCanceled():
+                pool.clear()
+                pool.waitForDone()
+                raise CanceledError()
+
+        feedback.setRows(len(scores))
+        params.scores = pd.DataFrame(
+            [{**s.metrics, "error": s.error} for s in scores],
+            index=pd.Index([s.name for s in scores], name="candidate"),
+        )
+        return params
+
+    def finished(
+        self,
+        status: UpdateService.UpdateStatus,
+        task: Optional[QgsTask],
+        plan: Optional["RdsPlan"],
+        params: Optional[ScoringParams],
+        exception: Optional[Exception],
+    ):
+        super().finished(status, task, plan, params, exception)
+        if status == UpdateService.UpdateStatus.SUCCESS:
+            self.scoresReady.emit(plan, params.scores)
+
+    def score(  # noqa: PLR0913
+        self,
+        plan: "RdsPlan",
+        candidates: Iterable[Union[str, pathlib.Path]],
+        force: bool = False,
+        foreground: bool = False,
+        *,
+        includeGeometry: bool = True,
+        headerRow: bool = True,
+        geoColumn: Union[int, str] = 0,
+        distColumn: Union[int, str] = 1,
+        delimiter: str = ",",
+        quotechar: str = '"',
+        joinField: Optional[str] = None,
+        threads: Optional[int] = None,
+    ):
+        """score block equivalency files against the plan's units, emitting scoresReady with a table of the
+        plan-wide metrics of each candidate, indexed by candidate name
+
+        :param plan: Plan whose units, population data and metrics are used to score the candidates
+        :type plan: RdsPlan
+
+        :param candidates: Block equivalency files, in any format the assignment importer supports
+        :type candidates: Iterable[str | pathlib.Path]
+
+        :param includeGeometry: Dissolve district geometry to calculate compactness and other geometric metrics
+        :type includeGeometry: bool
+
+        :param joinField: Geography field of the plan matching the geography column of the files, if not the geoid
+        :type joinField: str | None
+
+        :param threads: Maximum number of candidates to score at once
+        :type threads: int | None
+        """
+        return self.update(
+            plan,
+            force,
+            foreground,
+            candidates=list(candidates),
+            includeGeometry=includeGeometry,
+            headerRow=headerRow,
+            geoColumn=geoColumn,
+            distColumn=distColumn,
+            delimiter=delimiter,
+            quotechar=quotechar,
+            joinField=joinField,
+            threads=threads,
+        )
+
+
+def exportScores(scores: pd.DataFrame, path: Union[str, pathlib.Path]):
+    """Write a table of candidate scores to a CSV file, or to JSON if the file does not have a .csv extension"""
+    path = pathlib.Path(path)
+    if path.suffix.lower() == ".csv":
+        scores.to_csv(path)
+    else:
+        scores.to_json(path, orient="index", indent=2)
@@ -23,17 +23,31 @@
 """
 
 import json
+import sqlite3
 from collections.abc import Iterable
+from contextlib import closing
 from typing import List
 from uuid import UUID
 
 from packaging import version
-from qgis.core import QgsProject
+from qgis.core import Qgis, QgsDataSourceUri, QgsMessageLog, QgsProject
 from qgis.PyQt.QtXml import QDomDocument
 
 from ..models import DistrictColumns, MetricsColumns, RdsPlan, deserialize, serialize
+from ..utils import spatialite_connect, tr
 from .districtio import DistrictReader, DistrictWriter
-from .schema import checkMigrateSchema, schemaVersion
+from .schema import checkMigrateSchema, schemaVersion, writeGeoPackagePlan
+
+
+def sourceWithoutCredentials(source: str) -> str:
+    """remove the password from a database connection string, keeping any authentication
+    configuration id, so the source can be saved where it may be shared"""
+    uri = QgsDataSourceUri(source)
+    if not uri.password():
+        return source
+
+    uri.setPassword("")
+    return uri.uri(False)
 
 
 class ProjectStorage:
@@ -56,20 +70,34 @@ class ProjectStorage:
         return self._version < schemaVersion
 
     def migrate(self):
-        """Migrate edistricting plans in project file to new schema"""
+        """Migrate redistricting plans in project file to new schema"""
         if self._version < schemaVersion:
             l, success = self._project.readListEntry("redistricting", "redistricting-plans", [])
             if not success:
                 return
 
-            for i, d in enumerate(l):
-                data = json.loads(d)
-                l[i] = json.dumps(checkMigrateSchema(data, self._version))
+            for i in range(len(l)):
+                self._migratePlan(l, i)
+            self._setMigrated()
+
+    def _migratePlan(self, l: List[str], i: int) -> dict:
+        """Migrate a single plan to the current schema and save it back to the project
+        immediately, so that an interrupted migration resumes with the next plan"""
+        data = json.loads(l[i])
+        planVersion = version.parse(data.get("schema-version", str(self._version)))
+        if planVersion < schemaVersion:
+            data = checkMigrateSchema(data, planVersion)
+            data["schema-version"] = str(schemaVersion)
+            l[i] = json.dumps(data)
             self._project.writeEntry("redistricting", "redistricting-plans", l)
-            self._version = schemaVersion
-            self._writeVersion()
             self._project.setDirty(True)
 
+        return data
+
+    def _setMigrated(self):
+        self._version = schemaVersion
+        self._writeVersion()
+
     def _readVersion(self):
         v, success = self._project.readEntry("redistricting", "schema-version", None)
         if not success or v is None:
@@ -127,17 +155,48 @@ class ProjectStorage:
             data = serialize(p)
             jsonPlan = json.dumps(data)
             l.append(jsonPlan)
-            self.writeDistricts(p)
+            if p.districtsLoaded:
+                # districts that were never loaded can't have changed
+                self.writeDistricts(p)
+            self.writeGeoPackagePlan(p, data)
         self._project.writeEntry("redistricting", "redistricting-plans", l)
         self._version = schemaVersion
         self._writeVersion()
 
+    def writeGeoPackagePlan(self, plan: RdsPlan, data: dict):
+        """Save a copy of the plan definition in the plan's GeoPackage, with the sources
+        of its geography and population layers, so the plan can be opened without the project"""
+        if not plan.geoPackagePath:
+            return
+
+        data = {**data, "schema-version": str(schemaVersion)}
+        # plan GeoPackages are shared, so database passwords must not be copied into them
+        sources = {
+            layer.id(): (layer.providerType(), sourceWithoutCredentials(layer.source()))
+            for layer in (plan.geoLayer, plan.popLayer)
+            if layer is not None
+        }
+        try:
+            with closing(spatialite_connect(plan.geoPackagePath)) as db:
+                writeGeoPackagePlan(db, data, sources)
+                db.commit()
+        except sqlite3.Error as e:
+            # the copy in the GeoPackage is a convenience -- the project remains the primary store
+            QgsMessageLog.logMessage(
+                tr("Could not save plan {plan} to {path}: {error}").format(
+                    plan=plan.name, path=plan.geoPackagePath, error=e
+                ),
+                "Redistricting",
+                Qgis.MessageLevel.Warning,
+            )
+
     def readRedistrictingPlans(self) -> List[RdsPlan]:
         plans = []
         l, success = self._project.readListEntry("redistricting", "redistricting-plans", [])
         if success:
-            for p in l:
-                planJson = json.loads(p)
+            for i, p in enumerate(l):
+                # plans are migrated one at a time as they are read
+                planJson = self._migratePlan(l, i) if self._version < schemaVersion else json.loads(p)
 
                 if "geo-layer" not in planJson and "pop-layer" in planJson:
                     planJson["geo-layer"] = planJson["pop-layer"]
@@ -145,8 +204,14 @@ class ProjectStorage:
 
                 plan = deserialize(RdsPlan, planJson, parent=self._project)
                 if plan is not None:
-                    self.readDistricts(plan)
+                    # district data is read from the districts layer when the plan
+                    # is activated or its districts are first accessed
+                    plan.setDistrictLoader(self.readDistricts)
                     plans.append(plan)
+
+            if self._version < schemaVersion:
+                self._setMigrated()
+
         return plans
 
     def readActivePlan(self):
@@ -22,23 +22,18 @@
  ***************************************************************************/
 """
 
+from importlib.util import find_spec
 from typing import NamedTuple
 
-import geopandas as gpd
-
-try:
-    import libpysal
-
-    AUTOASSIGN_ENABLED = True
-except ImportError:
-    AUTOASSIGN_ENABLED = False
-
 from qgis.core import QgsTask, QgsVectorLayer
 
 from ...errors import CanceledError
 from ...utils import LayerReader, SqlAccess, tr
 from ._debug import debug_thread
 
+# libpysal (and geopandas) are only imported when a task actually runs
+AUTOASSIGN_ENABLED = find_spec("libpysal") is not None
+
 
 class Row(NamedTuple):
     fid: int
@@ -61,6 +56,9 @@ class AutoAssignUnassignedUnits(SqlAccess, QgsTask):
         self.exception: Exception = None
 
     def run(self):
+        import geopandas as gpd  # pylint: disable=import-outside-toplevel # noqa: PLC0415
+        import libpysal  # pylint: disable=import-outside-toplevel # noqa: PLC0415
+
         debug_thread()
 
         try:
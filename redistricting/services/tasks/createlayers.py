@@ -29,7 +29,6 @@ from itertools import islice
 from numbers import Integral, Real
 from typing import TYPE_CHECKING, Any
 
-import geopandas as gpd
 from qgis.core import QgsExpressionContext, QgsExpressionContextUtils, QgsField, QgsVectorLayer
 from qgis.PyQt.QtCore import QMetaType
 
@@ -326,6 +325,9 @@ class CreatePlanLayersTask(AggregateDataTask):
                 self.createDistricts(db)
 
             self.populationData[self.distField] = 0  # add assignments column
+
+            from ...utils.io import gpd  # pylint: disable=import-outside-toplevel # noqa: PLC0415
+
             self.geometry = gpd.read_file(self.path, layer="districts").geometry
         except CanceledError:
             return False
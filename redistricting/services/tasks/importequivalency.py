@@ -26,9 +26,8 @@ from __future__ import annotations
 
 import pathlib
 from sqlite3 import DatabaseError
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Optional, Union
 
-import geopandas as gpd
 import pandas as pd
 from qgis.core import Qgis, QgsMessageLog, QgsTask, QgsVectorLayer
 from qgis.PyQt.QtCore import QMetaType
@@ -42,6 +41,45 @@ if TYPE_CHECKING:
     from ...models import RdsPlan
 
 
+def readAssignmentFile(  # noqa: PLR0913
+    equivalencyFile: Union[str, pathlib.Path],
+    headerRow=True,
+    geoColumn: Union[int, str] = 0,
+    distColumn: Union[int, str] = 1,
+    delimiter=",",
+    quotechar='"',
+    converters: Optional[dict[Union[int, str], type]] = None,
+) -> pd.DataFrame:
+    """read the geography and district columns of a block equivalency file -- csv, text, spreadsheet
+    or shapefile"""
+    equivalencyFile = pathlib.Path(equivalencyFile)
+    if equivalencyFile.suffix in (".xls", ".xlsx", ".xlsm", ".ods"):
+        return pd.read_excel(
+            equivalencyFile,
+            header=0 if headerRow else None,
+            usecols=(geoColumn, distColumn),
+            converters=converters,
+        )
+
+    if equivalencyFile.suffix in (".csv", ".txt"):
+        return pd.read_csv(
+            equivalencyFile,
+            header=0 if headerRow else None,
+            delimiter=delimiter,
+            quotechar=quotechar,
+            skipinitialspace=True,
+            usecols=(geoColumn, distColumn),
+            converters=converters,
+        )
+
+    if equivalencyFile.suffix == ".shp":
+        from ...utils.io import gpd  # pylint: disable=import-outside-toplevel # noqa: PLC0415
+
+        return gpd.read_file(equivalencyFile, columns=(geoColumn, distColumn))
+
+    raise ValueError(tr("Unsupported file type for import"))
+
+
 class ImportAssignmentFileTask(QgsTask):
     def __init__(  # noqa: PLR0913
         self,
@@ -95,31 +133,18 @@ class ImportAssignmentFileTask(QgsTask):
             self.exception = FileNotFoundError(f"File {self.equivalencyFile} does not exist")
             return False
 
-        if self.equivalencyFile.suffix in (".xls", ".xlsx", ".xlsm", ".ods"):
-            assignments = pd.read_excel(
+        try:
+            assignments = readAssignmentFile(
                 self.equivalencyFile,
-                header=0 if self.headerRow else None,
-                usecols=(self.geoColumn, self.distColumn),
-                converters=converters,
+                self.headerRow,
+                self.geoColumn,
+                self.distColumn,
+                self.delimiter,
+                self.quotechar,
+                converters,
             )
-        elif self.equivalencyFile.suffix in (".csv", ".txt"):
-            try:
-                assignments = pd.read_csv(
-                    self.equivalencyFile,
-                    header=0 if self.headerRow else None,
-                    delimiter=self.delimiter,
-                    quotechar=self.quotechar,
-                    skipinitialspace=True,
-                    usecols=(self.geoColumn, self.distColumn),
-                    converters=converters,
-                )
-            except (ValueError, pd.errors.ParserError, pd.errors.EmptyDataError) as e:
-                self.exception = e
-                return False
-        elif self.equivalencyFile.suffix == ".shp":
-            assignments = gpd.read_file(self.equivalencyFile, columns=(self.geoColumn, self.distColumn))
-        else:
-            self.exception = ValueError(tr("Unsupported file type for import"))
+        except (ValueError, pd.errors.ParserError, pd.errors.EmptyDataError) as e:
+            self.exception = e
             return False
 
         try:
@@ -23,9 +23,8 @@
 """
 
 from collections.abc import Mapping
-from typing import Literal, Optional, Union, overload
+from typing import TYPE_CHECKING, Literal, Optional, Union, overload
 
-import geopandas as gpd
 import pandas as pd
 from qgis.core import Qgis, QgsExpressionContext, QgsExpressionContextUtils, QgsMessageLog, QgsTask, QgsVectorLayer
 
@@ -41,10 +40,15 @@ from ...models import (
     RdsPlan,
 )
 from ...models.lists import KeyedList
-from ...models.metricslist import get_batches
+from ...models.metricslist import MetricContext, get_batches
 from ...utils import LayerReader, SqlAccess, camel_to_snake, tr
+from ...utils.snapshot import snapshot
+from ..profiling import profiler
 from ._debug import debug_thread
 
+if TYPE_CHECKING:
+    import geopandas as gpd
+
 
 class UpdateMetricsTask(QgsTask):
     def __init__(
@@ -53,7 +57,7 @@ class UpdateMetricsTask(QgsTask):
         trigger: MetricTriggers,
         populationData: pd.DataFrame,
         districtData: Optional[pd.DataFrame],
-        geometry: Optional[gpd.GeoSeries],
+        geometry: Optional["gpd.GeoSeries"],
     ):
         super().__init__(tr("Updating metrics"), QgsTask.Flag.AllFlags)
         self.plan = plan
@@ -61,7 +65,7 @@ class UpdateMetricsTask(QgsTask):
         self.trigger = trigger
         self.populationData = populationData
         self.districtData = districtData
-        self.geometry = gpd.GeoSeries.from_wkt(geometry.to_wkt(), crs=geometry.crs) if geometry is not None else None
+        self.geometry = snapshot(geometry)
         self.exception: Optional[Exception] = None
 
     def _get_batches_for_trigger(self, trigger: MetricTriggers):
@@ -74,16 +78,26 @@ class UpdateMetricsTask(QgsTask):
     def calculateMetrics(self):
         """called in background thread to recalculate values of metrics"""
         batches = self._get_batches_for_trigger(self.trigger)
+        context = MetricContext(self.populationData, self.plan)
 
         for b in batches:
             for metric in b:
                 if self.trigger & metric.triggers():
+                    profiler.beginStage(f"metric {metric.name()}")
+                    profiler.setRows(len(self.populationData))
                     depends = {
                         m.name(): self.metrics[m.name()].value  # pylint: disable=unsubscriptable-object
                         for m in metric.depends()
                         if m.name() in self.metrics  # pylint: disable=unsupported-membership-test
                     }
-                    metric.calculate(self.populationData, self.districtData, self.geometry, self.plan, **depends)
+                    metric.calculate(
+                        self.populationData,
+                        self.districtData,
+                        self.geometry,
+                        self.plan,
+                        context=context,
+                        **depends,
+                    )
 
     def saveDistrictMetrics(self):
         """updates the district-level metrics in the plan's district layer"""
@@ -128,7 +142,8 @@ class UpdateMetricsTask(QgsTask):
     def run(self):
         debug_thread()
         try:
-            self.calculateMetrics()
+            with profiler.profileTask(self.description()):
+                self.calculateMetrics()
             return True
         except Exception as e:
             self.exception = e
@@ -182,10 +197,12 @@ class AggregateDataTask(SqlAccess, QgsTask):
         if self.isCanceled():
             raise CanceledError()
 
-    def setProgressIncrement(self, start: int, stop: int):
+    def setProgressIncrement(self, start: int, stop: int, stage: Optional[str] = None):
         super().setProgress(start)
         self._prog_start = start
         self._prog_stop = stop
+        if stage is not None:
+            profiler.beginStage(stage)
 
     def setProgress(self, progress: float):
         super().setProgress(self._prog_start + progress * (self._prog_stop - self._prog_start) / 100)
@@ -212,7 +229,7 @@ class AggregateDataTask(SqlAccess, QgsTask):
         order: Optional[str] = ...,
         read_geometry: Literal[True] = ...,
         chunksize: int = ...,
-    ) -> gpd.GeoDataFrame: ...
+    ) -> "gpd.GeoDataFrame": ...
 
     def read_layer(
         self,
@@ -221,7 +238,7 @@ class AggregateDataTask(SqlAccess, QgsTask):
         order: Optional[str] = None,
         read_geometry: bool = True,
         chunksize: int = 0,
-    ) -> Union[pd.DataFrame, gpd.GeoDataFrame]:
+    ) -> Union[pd.DataFrame, "gpd.GeoDataFrame"]:
         reader = LayerReader(layer, self)
         return reader.read_layer(columns=columns, order=order, read_geometry=read_geometry, chunksize=chunksize)
 
@@ -26,27 +26,28 @@ from collections.abc import Iterable, Mapping, Sequence
 from itertools import repeat
 from typing import TYPE_CHECKING, Union
 
-import geopandas as gpd
 import pandas as pd
-import shapely.ops
 from qgis.PyQt.QtCore import QRunnable, QThreadPool
-from shapely.geometry import MultiPolygon, Polygon
 
 from ...models import DistrictColumns, MetricLevel, MetricTriggers
-from ...models.metricslist import get_batches
+from ...models.metricslist import MetricContext, get_batches
 from ...utils import spatialite_connect, tr
 from ...utils.misc import camel_to_snake, quote_identifier
 from ..districtio import DistrictReader
+from ..profiling import profiler
 from ._debug import debug_thread
 from .updatebase import AggregateDataTask
 
 if TYPE_CHECKING:
+    import geopandas as gpd
+    import shapely
+
     from ...models import RdsMetric, RdsPlan
     from ...models.lists import KeyedList
 
 
 class DissolveWorker(QRunnable):
-    def __init__(self, dist: int, geoms: Sequence[MultiPolygon], cb=None):
+    def __init__(self, dist: int, geoms: Sequence["shapely.MultiPolygon"], cb=None):
         super().__init__()
         self.dist = dist
         self.geoms = geoms
@@ -54,11 +55,13 @@ class DissolveWorker(QRunnable):
         self.callback = cb
 
     def run(self):
+        import shapely.ops  # pylint: disable=import-outside-toplevel # noqa: PLC0415
+
         debug_thread()
 
         self.merged = shapely.ops.unary_union(self.geoms)
-        if isinstance(self.merged, Polygon):
-            self.merged = MultiPolygon([self.merged])
+        if isinstance(self.merged, shapely.Polygon):
+            self.merged = shapely.MultiPolygon([self.merged])
 
         if self.callback:
             self.callback()
@@ -93,7 +96,7 @@ class AggregateDistrictDataTask(AggregateDataTask):
             trigger |= MetricTriggers.ON_UPDATE_GEOMETRY
         self.trigger = trigger
 
-    def disolveGeometry(self, update: gpd.GeoDataFrame):
+    def disolveGeometry(self, update: "gpd.GeoDataFrame"):
         def dissolve_progress():
             nonlocal count, total
             count += 1
@@ -182,6 +185,7 @@ class AggregateDistrictDataTask(AggregateDataTask):
     def calculateMetrics(self):
         """called in background thread to recalculate values of metrics"""
         batches = self._get_batches_for_trigger(self.trigger)
+        context = MetricContext(self.populationData, self.plan)
 
         for b in batches:
             for metric in b:
@@ -191,7 +195,14 @@ class AggregateDistrictDataTask(AggregateDataTask):
                         for m in metric.depends()
                         if m.name() in self.metrics  # pylint: disable=unsupported-membership-test
                     }
-                    metric.calculate(self.populationData, self.districtData, self.geometry, self.plan, **depends)
+                    metric.calculate(
+                        self.populationData,
+                        self.districtData,
+                        self.geometry,
+                        self.plan,
+                        context=context,
+                        **depends,
+                    )
 
     def saveDistrictMetrics(self):
         """updates the district-level metrics in the plan's district layer"""
@@ -236,53 +247,58 @@ class AggregateDistrictDataTask(AggregateDataTask):
             raise RuntimeError(f"Failed to update district metrics: {e}") from e
 
     def run(self) -> bool:  # pylint: disable=too-many-locals,too-many-branches,too-many-statements
+        import geopandas as gpd  # pylint: disable=import-outside-toplevel # noqa: PLC0415
+
         debug_thread()
 
         try:
-            self.setProgressIncrement(0, 20)
-            self.populationData = self.read_layer(self.assignLayer, read_geometry=self.includeGeometry).set_index(
-                self.geoIdField
-            )
-
-            cols = [self.distField]
-            if self.includeDemographics:
-                self.setProgressIncrement(20, 40)
-                popdf = self.loadPopData()
-                self.populationData: gpd.GeoDataFrame = self.populationData.join(popdf)
-                cols += [DistrictColumns.POPULATION, *self.popFields.keys(), *self.dataFields.keys()]
-                self.totalPopulation = int(self.populationData[DistrictColumns.POPULATION].sum())
-
-            self.setProgressIncrement(40, 90)
-            if self.updateDistricts is not None:
-                update = self.populationData[self.populationData[self.distField].isin(self.updateDistricts)]
-            else:
-                update = self.populationData
-
-            if self.includeGeometry:
-                geoms = self.disolveGeometry(update)
-                update = update[cols].groupby(by=self.distField).sum()
-                update["geometry"] = pd.Series(geoms)
-                update = gpd.GeoDataFrame(update, geometry="geometry", crs=self.populationData.crs)
-
-                # self.data = data.to_wkt()
-                self.geometry = update["geometry"]
-                self.districtData = update
-
-                self.updateProgress(1, 1)
-            else:
-                update = update.drop(columns="geometry")
-                total = len(update)
-                self.districtData = update[cols].groupby(by=self.distField).sum()
-
-                self.updateProgress(total, total)
-
-            self.setProgressIncrement(90, 100)
-
-            self.saveDistricts()
-
-            self.calculateMetrics()
-
-            return True
+            with profiler.profileTask(self.description()):
+                self.setProgressIncrement(0, 20, "load")
+                self.populationData = self.read_layer(self.assignLayer, read_geometry=self.includeGeometry).set_index(
+                    self.geoIdField
+                )
+                profiler.setRows(len(self.populationData))
+
+                cols = [self.distField]
+                if self.includeDemographics:
+                    self.setProgressIncrement(20, 40, "load population")
+                    popdf = self.loadPopData()
+                    self.populationData: gpd.GeoDataFrame = self.populationData.join(popdf)
+                    cols += [DistrictColumns.POPULATION, *self.popFields.keys(), *self.dataFields.keys()]
+                    self.totalPopulation = int(self.populationData[DistrictColumns.POPULATION].sum())
+
+                self.setProgressIncrement(40, 90, "dissolve")
+                if self.updateDistricts is not None:
+                    update = self.populationData[self.populationData[self.distField].isin(self.updateDistricts)]
+                else:
+                    update = self.populationData
+
+                if self.includeGeometry:
+                    geoms = self.disolveGeometry(update)
+                    update = update[cols].groupby(by=self.distField).sum()
+                    update["geometry"] = pd.Series(geoms)
+                    update = gpd.GeoDataFrame(update, geometry="geometry", crs=self.populationData.crs)
+
+                    # self.data = data.to_wkt()
+                    self.geometry = update["geometry"]
+                    self.districtData = update
+
+                    self.updateProgress(1, 1)
+                else:
+                    update = update.drop(columns="geometry")
+                    total = len(update)
+                    self.districtData = update[cols].groupby(by=self.distField).sum()
+
+                    self.updateProgress(total, total)
+
+                self.setProgressIncrement(90, 100, "save")
+
+                self.saveDistricts()
+                profiler.setRows(len(self.districtData))
+
+                self.calculateMetrics()
+
+                return True
         except Exception as e:  # pylint: disable=broad-except
             self.exception = e
             return False
@@ -26,7 +26,6 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import TYPE_CHECKING, Literal, Optional, Union, overload
 
-import geopandas as gpd
 import pandas as pd
 from qgis.core import (
     Qgis,
@@ -45,10 +44,13 @@ from ..errors import CanceledError
 from ..models import DistrictColumns
 from ..utils import LayerReader
 from ..utils.misc import quote_identifier
+from .profiling import profiler
 
 if TYPE_CHECKING:
     from uuid import UUID
 
+    import geopandas as gpd
+
     from ..models import RdsPlan
 
 if __debug__:
@@ -74,10 +76,16 @@ class IncrementalFeedback(QgsFeedback):
         self.start = 0
         self.stop = 100
 
-    def setProgressIncrement(self, start: int, stop: int):
+    def setProgressIncrement(self, start: int, stop: int, stage: Optional[str] = None):
         self.task.setProgress(start)
         self.start = start
         self.stop = stop
+        if stage is not None:
+            profiler.beginStage(stage)
+
+    def setRows(self, rows: int):
+        """record the number of rows processed in the current stage"""
+        profiler.setRows(rows)
 
     def updateProgress(self, total: int, count: int):
         if total != 0:
@@ -136,7 +144,7 @@ class UpdateService(QObject):
         readGeometry: Literal[True] = ...,
         chunksize: int = ...,
         feedback: Optional[QgsFeedback] = None,
-    ) -> gpd.GeoDataFrame: ...
+    ) -> "gpd.GeoDataFrame": ...
 
     def readLayer(  # noqa: PLR0913
         self,
@@ -146,7 +154,7 @@ class UpdateService(QObject):
         readGeometry: bool = True,
         chunksize: int = 0,
         feedback: Optional[QgsFeedback] = None,
-    ) -> Union[pd.DataFrame, gpd.GeoDataFrame]:
+    ) -> Union[pd.DataFrame, "gpd.GeoDataFrame"]:
         reader = LayerReader(layer, feedback)
         return reader.read_layer(columns=columns, order=order, read_geometry=readGeometry, chunksize=chunksize)
 
@@ -269,7 +277,8 @@ class UpdateService(QObject):
 
         self.updateStarted.emit(plan)
         try:
-            params = self.run(task, plan, params)
+            with profiler.profileTask(self._description):
+                params = self.run(task, plan, params)
             return (task, plan, params)
         except Exception as e:
             raise UpdateException(task, plan, params, e) from e
@@ -22,7 +22,7 @@
  ***************************************************************************/
 """
 
-from .gpkg import createGeoPackage, createGpkgTable, getTableName, spatialite_connect
+from .gpkg import cloneGeoPackage, createGeoPackage, createGpkgTable, getTableName, spatialite_connect
 from .intl import tr
 from .layer import LayerReader
 from .misc import (
@@ -38,6 +38,7 @@ from .misc import (
 from .sql import SqlAccess
 
 __all__ = (
+    "cloneGeoPackage",
     "createGeoPackage",
     "createGpkgTable",
     "getDefaultField",
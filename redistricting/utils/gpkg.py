@@ -22,9 +22,12 @@
  ***************************************************************************/
 """
 
+import os
 import pathlib
 import re
+import shutil
 import sqlite3
+import sys
 from contextlib import closing
 from os import PathLike
 from typing import Type, Union, overload
@@ -34,6 +37,8 @@ from processing.algs.gdal.GdalUtils import GdalUtils
 from qgis.core import Qgis, QgsDataSourceUri, QgsMessageLog, QgsVectorLayer
 from qgis.PyQt.QtCore import QCoreApplication
 
+from .sqltrace import TracingConnection, sqlTracer
+
 
 def getConnectionStringFromLayer(layer: QgsVectorLayer) -> str:
     if Qgis.versionInt() < 33801:
@@ -84,12 +89,18 @@ def spatialite_connect(  # noqa: PLR0913
     enable_gpkg=None,
 ) -> sqlite3.Connection:
     """returns a dbapi2.Connection to a SpatiaLite db
-    using the mod_spatialite_path() extension (python3)"""
+    using the mod_spatialite_path() extension (python3)
+
+    When SQL tracing is enabled in the plugin settings and no other connection
+    factory is given, the connection logs the timing of each statement"""
 
     def fcnRegexp(pattern, string):
         result = re.search(pattern, string)
         return True if result else False
 
+    if factory is sqlite3.Connection and sqlTracer.enabled:
+        factory = TracingConnection
+
     con = sqlite3.connect(
         database,
         timeout=timeout,
@@ -240,6 +251,64 @@ def createGpkgTable(  # noqa: PLR0913
     return True, None
 
 
+# ioctl request code for FICLONE (_IOW(0x94, 9, int)) -- supported by btrfs, XFS, bcachefs and OCFS2
+FICLONE = 0x40049409
+
+
+def _reflink(src: str, dest: str) -> bool:
+    if sys.platform.startswith("linux"):
+        import fcntl  # pylint: disable=import-outside-toplevel
+
+        with open(src, "rb") as s, open(dest, "wb") as d:
+            try:
+                fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+            except OSError:
+                return False
+        return True
+
+    if sys.platform == "darwin":
+        import ctypes  # pylint: disable=import-outside-toplevel
+        import ctypes.util  # pylint: disable=import-outside-toplevel
+
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        if not hasattr(libc, "clonefile"):
+            return False
+
+        if os.path.exists(dest):
+            os.unlink(dest)
+        return libc.clonefile(os.fsencode(src), os.fsencode(dest), 0) == 0
+
+    return False
+
+
+def cloneGeoPackage(src: Union[str, PathLike], dest: Union[str, PathLike]) -> bool:
+    """Copy a GeoPackage, sharing storage with the source where the file system supports copy-on-write
+    clones (btrfs, XFS, APFS). The clone takes constant time and only pages later modified in either copy
+    consume additional disk space. Falls back to a full copy on other file systems (e.g. NTFS, ext4).
+    Either way the copy is an independent GeoPackage -- nothing in it refers to the source.
+
+    Returns True if the copy shares storage with the source, False if the data was duplicated.
+    """
+    src = os.fspath(src)
+    dest = os.fspath(dest)
+
+    # fold any pending write-ahead log into the main database file so the copy is complete
+    try:
+        with closing(sqlite3.connect(src)) as db:
+            db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    except sqlite3.Error:
+        pass
+
+    try:
+        if _reflink(src, dest):
+            return True
+    except OSError:
+        pass
+
+    shutil.copyfile(src, dest)
+    return False
+
+
 def connect_layer(layer: QgsVectorLayer) -> sqlite3.Connection:
     gpkg, _ = layer.source().split("|", 1)
     return spatialite_connect(gpkg)
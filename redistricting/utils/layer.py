@@ -25,19 +25,20 @@
 import re
 import shlex
 from collections.abc import Iterator
-from typing import Any, Literal, Optional, Union, overload
+from typing import TYPE_CHECKING, Any, Literal, Optional, Union, overload
 from urllib.parse import parse_qs, urlsplit
 
-import geopandas as gpd
 import pandas as pd
 from qgis.core import QgsFeature, QgsFeatureRequest, QgsFeedback, QgsVectorLayer
 
 from ..errors import CanceledError
 from ..utils.misc import quote_list
 from .intl import tr
-from .io import gpd_io_engine
 from .sql import SqlAccess
 
+if TYPE_CHECKING:
+    import geopandas as gpd
+
 
 class LayerReader(SqlAccess):
     def __init__(self, layer: QgsVectorLayer, feedback: Optional[QgsFeedback] = None):
@@ -95,7 +96,7 @@ class LayerReader(SqlAccess):
         read_geometry=True,
         chunksize: Optional[int] = None,
         filt: Optional[dict[str, Any]] = None,
-    ) -> Union[pd.DataFrame, gpd.GeoDataFrame]:
+    ) -> Union[pd.DataFrame, "gpd.GeoDataFrame"]:
         def prog_attributes(f: QgsFeature):
             attrs = [f.attribute(i) for i in indices]
             if read_geometry:
@@ -129,6 +130,8 @@ class LayerReader(SqlAccess):
             req.setOrderBy(orderby)
 
         if read_geometry:
+            import geopandas as gpd  # pylint: disable=import-outside-toplevel # noqa: PLC0415
+
             columns.append("geometry")
             result = gpd.GeoDataFrame.from_features(self._layer.getFeatures(req), self._layer.crs().authid(), columns)
         else:
@@ -139,7 +142,9 @@ class LayerReader(SqlAccess):
 
     def gpd_read(
         self, source=None, fc: int = 0, chunksize: Optional[int] = None, filt: Optional[dict[str, Any]] = None, **kwargs
-    ) -> gpd.GeoDataFrame:
+    ) -> "gpd.GeoDataFrame":
+        from .io import gpd  # pylint: disable=import-outside-toplevel # noqa: PLC0415
+
         result: gpd.GeoDataFrame = None
 
         if source is None:
@@ -201,7 +206,7 @@ class LayerReader(SqlAccess):
         read_geometry: Literal[True] = ...,
         chunksize: int = ...,
         **kwargs,
-    ) -> gpd.GeoDataFrame: ...
+    ) -> "gpd.GeoDataFrame": ...
 
     def read_layer(  # noqa: PLR0915, PLR0913, PLR0912
         self,
@@ -212,7 +217,9 @@ class LayerReader(SqlAccess):
         read_geometry: bool = True,
         chunksize: int = 0,
         **kwargs,
-    ) -> Union[pd.DataFrame, gpd.GeoDataFrame]:
+    ) -> Union[pd.DataFrame, "gpd.GeoDataFrame"]:
+        from .io import gpd, gpd_io_engine  # pylint: disable=import-outside-toplevel # noqa: PLC0415
+
         def makeSqlQuery():
             if columns is None:
                 cols = "*"
@@ -380,7 +387,7 @@ class LayerReader(SqlAccess):
         read_geometry: Literal[True] = ...,
         chunksize: int = ...,
         **kwargs,
-    ) -> gpd.GeoDataFrame: ...
+    ) -> "gpd.GeoDataFrame": ...
 
     def read_sql(  # noqa: PLR0915, PLR0912
         self,
@@ -390,7 +397,9 @@ class LayerReader(SqlAccess):
         read_geometry: bool = True,
         chunksize: int = 0,
         **kwargs,
-    ) -> Union[pd.DataFrame, gpd.GeoDataFrame]:
+    ) -> Union[pd.DataFrame, "gpd.GeoDataFrame"]:
+        from .io import gpd, gpd_io_engine  # pylint: disable=import-outside-toplevel # noqa: PLC0415
+
         if not self.is_sql_capable:
             raise TypeError("Cannot read sql queary from non-sql-capable layer")
 
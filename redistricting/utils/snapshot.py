@@ -0,0 +1,46 @@
+"""QGIS Redistricting Plugin - snapshots of data for background tasks
+
+        begin                : 2026-10-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2026 by Cryptodira
+        email                : stuart@cryptodira.org
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 3 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ *   This program is distributed in the hope that it will be useful, but   *
+ *   WITHOUT ANY WARRANTY; without even the implied warranty of            *
+ *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          *
+ *   GNU General Public License for more details. You should have          *
+ *   received a copy of the GNU General Public License along with this     *
+ *   program. If not, see <http://www.gnu.org/licenses/>.                  *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+from typing import TYPE_CHECKING, Optional, TypeVar, Union
+
+import pandas as pd
+
+if TYPE_CHECKING:
+    import geopandas as gpd
+
+T = TypeVar("T", bound=Union[pd.DataFrame, pd.Series, "gpd.GeoDataFrame", "gpd.GeoSeries"])
+
+
+def snapshot(data: Optional[T]) -> Optional[T]:
+    """Return an independent copy of a (Geo)DataFrame or (Geo)Series to hand to a background task.
+
+    Shapely 2 geometries are immutable, so a geometry column is snapshotted by copying its array of
+    references to the geometries -- the geometries themselves are shared and never re-serialized.
+    Numeric columns are copied as flat buffers. The result is safe to read on another thread while
+    the original is modified on the main thread.
+    """
+    if data is None:
+        return None
+
+    return data.copy(deep=True)
@@ -26,12 +26,9 @@ import re
 import shlex
 import sqlite3
 from collections.abc import Iterable, Sequence
-from typing import Any, Dict, Literal, Union, overload
+from typing import TYPE_CHECKING, Any, Dict, Literal, Union, overload
 
-import psycopg2
 from osgeo import gdal, ogr
-from psycopg2.extensions import cursor
-from psycopg2.extras import RealDictConnection
 from qgis.core import (
     QgsCredentials,
     QgsFeature,
@@ -43,9 +40,13 @@ from qgis.core import (
 )
 
 from .gpkg import spatialite_connect
-from .io import gpd_io_engine
 from .misc import random_id
 
+if TYPE_CHECKING:
+    import psycopg2
+    from psycopg2.extensions import cursor
+    from psycopg2.extras import RealDictConnection
+
 
 class SqlAccess:
     def __init__(self, *args, **kwargs):
@@ -147,7 +148,10 @@ class SqlAccess:
 
     def _connectSqlPostgres(
         self, provider: QgsVectorDataProvider, dict_connection: bool = True
-    ) -> Union[RealDictConnection, psycopg2.extensions.connection]:
+    ) -> Union["RealDictConnection", "psycopg2.extensions.connection"]:
+        from .io import psycopg2  # pylint: disable=import-outside-toplevel # noqa: PLC0415
+        from psycopg2.extras import RealDictConnection  # pylint: disable=import-outside-toplevel # noqa: PLC0415
+
         if self._uri != provider.uri():
             self._uri = provider.uri()
             self._connInfo = self._uri.connectionInfo(True)
@@ -254,7 +258,7 @@ class SqlAccess:
     @overload
     def executeSql(
         self, layer: QgsVectorLayer, sql: str, parameters=None, *, as_dict: Literal[False]
-    ) -> Union[cursor, Iterable[Sequence], Iterable[sqlite3.Row], Iterable[QgsFeature]]: ...
+    ) -> Union["cursor", Iterable[Sequence], Iterable[sqlite3.Row], Iterable[QgsFeature]]: ...
 
     def executeSql(self, layer: QgsVectorLayer, sql: str, parameters=None, *, as_dict=True):
         provider = layer.dataProvider()
@@ -272,6 +276,8 @@ class SqlAccess:
     def isSQLCapable(self, layer: QgsVectorLayer):
         provider = layer.dataProvider()
         if provider.name() == "ogr":
+            from .io import gpd_io_engine  # pylint: disable=import-outside-toplevel # noqa: PLC0415
+
             return (provider.storageType() == "GPKG" and gpd_io_engine != "fiona") or provider.storageType() == "SQLite"
 
         return provider.name() in ("spatialite", "postgis", "postgres")
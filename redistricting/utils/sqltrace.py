@@ -0,0 +1,334 @@
+"""QGIS Redistricting Plugin - SQL statement tracing for GeoPackage connections
+
+        begin                : 2026-10-19
+        git sha              : $Format:%H$
+        copyright            : (C) 2026 by Cryptodira
+        email                : stuart@cryptodira.org
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 3 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ *   This program is distributed in the hope that it will be useful, but   *
+ *   WITHOUT ANY WARRANTY; without even the implied warranty of            *
+ *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          *
+ *   GNU General Public License for more details. You should have          *
+ *   received a copy of the GNU General Public License along with this     *
+ *   program. If not, see <http://www.gnu.org/licenses/>.                  *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+import csv
+import json
+import pathlib
+import sqlite3
+import threading
+import time
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass, field
+from typing import Optional, Union
+
+from qgis.core import Qgis, QgsMessageLog
+
+from .. import settings
+
+# pylint: disable=protected-access
+
+LOG_TAG = "Redistricting SQL"
+
+# statements traced per call -- enough to skip an implicit BEGIN without
+# keeping every row of a large executemany
+MAX_TRACED_STATEMENTS = 3
+
+
+@dataclass
+class SqlStatementStats:
+    sql: str
+    calls: int = 0
+    totalTime: float = 0.0
+    maxTime: float = 0.0
+    rows: int = 0
+    slowCalls: int = 0
+    slowest: Optional[str] = None
+    plan: list[str] = field(default_factory=list)
+
+    @property
+    def meanTime(self) -> float:
+        return self.totalTime / self.calls if self.calls else 0.0
+
+
+class _Execution:
+    __slots__ = ("sql", "parameters", "explainable", "elapsed", "rows", "rowcount", "statements")
+
+    def __init__(self, sql: str, parameters=None, explainable: bool = True):
+        self.sql = sql
+        self.parameters = parameters
+        self.explainable = explainable
+        self.elapsed = 0.0
+        self.rows = 0
+        self.rowcount = -1
+        self.statements: list[str] = []
+
+
+class SqlTracer:
+    """Aggregates the timing and row counts of the statements run on traced
+    connections, keyed by statement text, and captures the query plan of the
+    first slow call to each statement"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: dict[str, SqlStatementStats] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return settings.traceSql
+
+    @property
+    def slowThreshold(self) -> float:
+        return settings.sqlSlowThreshold / 1000
+
+    def _expandedSql(self, execution: _Execution) -> str:
+        # the trace callback receives the statement with its parameters bound,
+        # preceded by the BEGIN of an implicit transaction and followed by the
+        # statements of any triggers it fires, which are prefixed with a comment
+        for statement in execution.statements:
+            if statement.startswith("--") or statement.strip().upper() == "BEGIN":
+                continue
+            return statement
+        return execution.sql
+
+    def record(self, execution: _Execution, db: Optional[sqlite3.Connection] = None):
+        key = " ".join(execution.sql.split())
+        rows = execution.rowcount if execution.rowcount >= 0 else execution.rows
+        expanded = self._expandedSql(execution)
+        slow = execution.elapsed >= self.slowThreshold
+
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = SqlStatementStats(key)
+            stats.calls += 1
+            stats.totalTime += execution.elapsed
+            stats.rows += rows
+            if execution.elapsed >= stats.maxTime:
+                stats.maxTime = execution.elapsed
+                stats.slowest = expanded
+            if slow:
+                stats.slowCalls += 1
+            explain = slow and execution.explainable and db is not None and not stats.plan
+
+        msg = f"{execution.elapsed * 1000:.1f} ms, {rows} rows: {expanded}"
+        if slow:
+            msg = f"SLOW {msg}"
+        if explain:
+            plan = self.explain(db, execution.sql, execution.parameters)
+            with self._lock:
+                stats.plan = plan
+            msg = "\n    ".join([msg, *plan])
+        QgsMessageLog.logMessage(msg, LOG_TAG, Qgis.MessageLevel.Info, notifyUser=False)
+
+    def explain(self, db: sqlite3.Connection, sql: str, parameters=None) -> list[str]:
+        if parameters is None:
+            parameters = ()
+        try:
+            # call the base class so the EXPLAIN itself is not traced
+            rows = sqlite3.Connection.execute(db, f"EXPLAIN QUERY PLAN {sql}", parameters).fetchall()
+        except sqlite3.Error as e:
+            return [f"(query plan unavailable: {e})"]
+
+        depth: dict[int, int] = {0: 0}
+        plan = []
+        for nodeId, parent, _, detail in rows:
+            depth[nodeId] = depth.get(parent, 0) + 1
+            plan.append(f"{'  ' * (depth[nodeId] - 1)}{detail}")
+        return plan
+
+    def report(self) -> list[SqlStatementStats]:
+        with self._lock:
+            return sorted(self._stats.values(), key=lambda s: s.totalTime, reverse=True)
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+    def exportReport(self, path: Union[str, pathlib.Path]):
+        """write the aggregated statistics to a CSV file, or to JSON if the
+        file does not have a .csv extension"""
+        path = pathlib.Path(path)
+        report = self.report()
+        if path.suffix.lower() == ".csv":
+            with path.open("w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(["sql", "calls", "total_ms", "mean_ms", "max_ms", "rows", "slow_calls", "query_plan"])
+                for s in report:
+                    writer.writerow(
+                        [
+                            s.sql,
+                            s.calls,
+                            round(s.totalTime * 1000, 3),
+                            round(s.meanTime * 1000, 3),
+                            round(s.maxTime * 1000, 3),
+                            s.rows,
+                            s.slowCalls,
+                            "\n".join(s.plan),
+                        ]
+                    )
+        else:
+            with path.open("w", encoding="utf-8") as f:
+                json.dump([{**asdict(s), "meanTime": s.meanTime} for s in report], f, indent=2)
+
+
+sqlTracer = SqlTracer()
+
+
+class TracingCursor(sqlite3.Cursor):
+    """Cursor that times each statement, including the time spent fetching its
+    results, and reports it to the tracer once the results are exhausted or
+    the cursor is closed or discarded"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._execution: Optional[_Execution] = None
+
+    def _run(self, execution: _Execution, method, *args):
+        self._finish()
+        self.connection._active = execution
+        start = time.perf_counter()
+        try:
+            result = method(*args)
+        except Exception:
+            # failed statements are not recorded
+            self.connection._active = None
+            raise
+        execution.elapsed = time.perf_counter() - start
+        execution.rowcount = self.rowcount
+        self.connection._active = None
+        self._execution = execution
+        return result
+
+    def _timed(self, method, *args):
+        start = time.perf_counter()
+        try:
+            return method(*args)
+        finally:
+            if self._execution is not None:
+                self._execution.elapsed += time.perf_counter() - start
+
+    def _finish(self):
+        execution, self._execution = self._execution, None
+        if execution is not None:
+            sqlTracer.record(execution, self.connection)
+
+    def execute(self, sql, parameters=()):
+        return self._run(_Execution(sql, parameters), super().execute, sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        # only a sequence can be sampled for the query plan without consuming it
+        if isinstance(seq_of_parameters, Sequence) and len(seq_of_parameters) > 0:
+            execution = _Execution(sql, seq_of_parameters[0])
+        else:
+            execution = _Execution(sql, explainable=False)
+        return self._run(execution, super().executemany, sql, seq_of_parameters)
+
+    def executescript(self, sql_script):
+        execution = _Execution(sql_script, explainable=False)
+        changes = self.connection.total_changes
+        result = self._run(execution, super().executescript, sql_script)
+        execution.rowcount = self.connection.total_changes - changes
+        return result
+
+    def fetchone(self):
+        row = self._timed(super().fetchone)
+        if row is None:
+            self._finish()
+        elif self._execution is not None:
+            self._execution.rows += 1
+        return row
+
+    def fetchmany(self, size=None):
+        if size is None:
+            size = self.arraysize
+        rows = self._timed(super().fetchmany, size)
+        if self._execution is not None:
+            self._execution.rows += len(rows)
+        if len(rows) < size:
+            self._finish()
+        return rows
+
+    def fetchall(self):
+        rows = self._timed(super().fetchall)
+        if self._execution is not None:
+            self._execution.rows += len(rows)
+        self._finish()
+        return rows
+
+    def __next__(self):
+        try:
+            row = self._timed(super().__next__)
+        except StopIteration:
+            self._finish()
+            raise
+        if self._execution is not None:
+            self._execution.rows += 1
+        return row
+
+    def close(self):
+        self._finish()
+        super().close()
+
+    def __del__(self):
+        try:
+            self._finish()
+        except Exception:  # pylint: disable=broad-except # noqa: BLE001, S110
+            pass
+
+
+class TracingConnection(sqlite3.Connection):
+    """Connection whose cursors report each statement to the tracer. The trace
+    callback collects the statements sqlite actually runs for each call, with
+    their parameters bound, so the log shows the values behind a slow query."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._active: Optional[_Execution] = None
+        self.set_trace_callback(self._traceStatement)
+
+    def _traceStatement(self, statement: str):
+        if self._active is not None and len(self._active.statements) < MAX_TRACED_STATEMENTS:
+            self._active.statements.append(statement)
+
+    def cursor(self, factory=None):
+        return super().cursor(factory or TracingCursor)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def executescript(self, sql_script):
+        return self.cursor().executescript(sql_script)
+
+    def _timedTransaction(self, statement: str, method, *args):
+        inTransaction = self.in_transaction
+        start = time.perf_counter()
+        result = method(*args)
+        if inTransaction:
+            execution = _Execution(statement, explainable=False)
+            execution.elapsed = time.perf_counter() - start
+            sqlTracer.record(execution)
+        return result
+
+    def commit(self):
+        self._timedTransaction("COMMIT", super().commit)
+
+    def rollback(self):
+        self._timedTransaction("ROLLBACK", super().rollback)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        statement = "COMMIT" if exc_type is None else "ROLLBACK"
+        return self._timedTransaction(statement, super().__exit__, exc_type, exc_value, traceback)
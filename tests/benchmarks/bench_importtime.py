@@ -0,0 +1,74 @@
+"""QGIS Redistricting Plugin - import time benchmark for plugin startup
+
+Copyright (C) 2026, Stuart C. Naifeh
+
+Imports the plugin module in a fresh interpreter with -X importtime and reports
+the slowest imports and whether any of the modules that should only be loaded
+on demand were pulled in at startup. Run with:
+
+    python -m tests.benchmarks.bench_importtime
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 3 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ *   This program is distributed in the hope that it will be useful, but   *
+ *   WITHOUT ANY WARRANTY; without even the implied warranty of            *
+ *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          *
+ *   GNU General Public License for more details. You should have          *
+ *   received a copy of the GNU General Public License along with this     *
+ *   program. If not, see <http://www.gnu.org/licenses/>.                  *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+import re
+import subprocess
+import sys
+
+DEFERRED = ("geopandas", "shapely", "pyproj", "psycopg2", "pyogrio", "fiona", "libpysal")
+
+IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+
+def import_times(module: str = "redistricting.redistricting") -> dict[str, tuple[int, int]]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times = {}
+    for line in proc.stderr.splitlines():
+        m = IMPORTTIME_RE.match(line)
+        if m:
+            times[m.group(4)] = (int(m.group(1)), int(m.group(2)))
+
+    return times
+
+
+def run(top: int = 20):
+    times = import_times()
+
+    total = times.get("redistricting.redistricting", (0, 0))[1]
+    print(f"total plugin import time: {total / 1000:.1f} ms")
+    print()
+
+    print(f"{'module':<60}{'self (ms)':>12}{'cumulative (ms)':>18}")
+    for name, (self_us, cum_us) in sorted(times.items(), key=lambda t: t[1][1], reverse=True)[:top]:
+        print(f"{name:<60}{self_us / 1000:>12.1f}{cum_us / 1000:>18.1f}")
+    print()
+
+    loaded = sorted({name.split(".")[0] for name in times} & set(DEFERRED))
+    if loaded:
+        print(f"deferred modules loaded at startup: {', '.join(loaded)}")
+    else:
+        print("no deferred modules loaded at startup")
+
+
+if __name__ == "__main__":
+    run()
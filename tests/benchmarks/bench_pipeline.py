@@ -0,0 +1,191 @@
+"""QGIS Redistricting Plugin - benchmarks for the plan update pipeline
+
+Copyright (C) 2026, Stuart C. Naifeh
+
+Times plan creation, district updates, pending-change deltas, metrics and
+import/export against synthetic geography of increasing size. Benchmarks run
+under pytest-benchmark, which can't run under xdist. Run with:
+
+    python -m pytest -n0 tests/benchmarks/bench_pipeline.py \\
+        --bench-units=10000,100000,1000000 --benchmark-json=benchmark.json
+
+and compare two runs with `pytest-benchmark compare`. Pass --bench-layout=voronoi
+to use irregular units instead of a grid.
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 3 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ *   This program is distributed in the hope that it will be useful, but   *
+ *   WITHOUT ANY WARRANTY; without even the implied warranty of            *
+ *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          *
+ *   GNU General Public License for more details. You should have          *
+ *   received a copy of the GNU General Public License along with this     *
+ *   program. If not, see <http://www.gnu.org/licenses/>.                  *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+import pytest
+from qgis.core import QgsFeedback
+
+from redistricting.models import RdsPlan
+from redistricting.models.metricslist import MetricContext, MetricTriggers, metrics_classes
+from redistricting.services import MetricsService, PlanManager
+from redistricting.services.delta import DeltaUpdate, DeltaUpdateService
+from redistricting.services.district import DistrictUpdateParams, DistrictUpdater
+from redistricting.services.metrics import MetricsUpdate
+from redistricting.services.tasks.createlayers import CreatePlanLayersTask
+from redistricting.services.tasks.exportplan import ExportRedistrictingPlanTask
+from redistricting.services.tasks.importequivalency import ImportAssignmentFileTask
+
+from .synthetic import make_plan, open_units_layer
+
+# pylint: disable=redefined-outer-name, unused-argument
+
+ALL_TRIGGERS = MetricTriggers.ON_UPDATE_DEMOGRAPHICS | MetricTriggers.ON_UPDATE_GEOMETRY
+
+
+@pytest.fixture
+def district_update(bench_plan: RdsPlan) -> DistrictUpdateParams:
+    updater = DistrictUpdater(MetricsService())
+    return updater.run(None, bench_plan, DistrictUpdateParams(True, True))
+
+
+@pytest.fixture
+def metrics_update(bench_plan: RdsPlan, district_update: DistrictUpdateParams) -> MetricsUpdate:
+    params = MetricsUpdate(
+        ALL_TRIGGERS, district_update.populationData, district_update.districtData, district_update.geometry
+    )
+    # calculate every metric once so that the dependencies of each metric have values
+    MetricsService().run(QgsFeedback(), bench_plan, params)
+    return params
+
+
+def test_create_plan(benchmark, synthetic_gpkg, rounds, units, tmp_path):
+    geoLayer = open_units_layer(synthetic_gpkg)
+    plan = make_plan(geoLayer)
+    path = tmp_path / "plan.gpkg"
+
+    def setup():
+        path.unlink(missing_ok=True)
+        return (CreatePlanLayersTask(plan, str(path)),), {}
+
+    benchmark.extra_info["units"] = units
+    assert benchmark.pedantic(lambda task: task.run(), setup=setup, rounds=rounds)
+
+
+@pytest.mark.parametrize("districts", [None, {1, 2}], ids=["full", "partial"])
+def test_update_districts(benchmark, bench_plan: RdsPlan, rounds, units, districts):
+    updater = DistrictUpdater(MetricsService())
+
+    def setup():
+        return (None, bench_plan, DistrictUpdateParams(True, True, districts)), {}
+
+    benchmark.extra_info["units"] = units
+    benchmark.pedantic(updater.run, setup=setup, rounds=rounds)
+
+
+@pytest.mark.parametrize("pct_changed", [0.001, 0.01])
+def test_delta(benchmark, bench_plan: RdsPlan, rounds, units, pct_changed):
+    service = DeltaUpdateService(PlanManager())
+    layer = bench_plan.assignLayer
+    distIndex = layer.fields().lookupField(bench_plan.distField)
+
+    # move units at the end of district 1 into district 2
+    changed = [f.id() for f in layer.getFeatures() if f[distIndex] == 1][-max(1, int(units * pct_changed)) :]
+
+    def setup():
+        if layer.isEditable():
+            layer.rollBack()
+        layer.startEditing()
+        for fid in changed:
+            layer.changeAttributeValue(fid, distIndex, 2, 1)
+        return (None, bench_plan, DeltaUpdate(bench_plan)), {}
+
+    benchmark.extra_info["units"] = units
+    benchmark.extra_info["changed"] = len(changed)
+    params = benchmark.pedantic(service.run, setup=setup, rounds=rounds)
+    layer.rollBack()
+
+    assert params.data is not None
+
+
+def test_all_metrics(benchmark, bench_plan: RdsPlan, district_update: DistrictUpdateParams, rounds, units):
+    service = MetricsService()
+
+    def setup():
+        params = MetricsUpdate(
+            ALL_TRIGGERS, district_update.populationData, district_update.districtData, district_update.geometry
+        )
+        return (QgsFeedback(), bench_plan, params), {}
+
+    benchmark.extra_info["units"] = units
+    benchmark.pedantic(service.run, setup=setup, rounds=rounds)
+
+
+@pytest.mark.parametrize("metric", sorted(metrics_classes))
+def test_metric(benchmark, bench_plan: RdsPlan, metrics_update: MetricsUpdate, rounds, units, metric):
+    if not bench_plan.metrics.metrics.has(metric):
+        pytest.skip(f"{metric} is not calculated for new plans")
+
+    m = bench_plan.metrics.metrics[metric]
+    depends = {
+        d.name(): bench_plan.metrics[d.name()].value for d in m.depends() if bench_plan.metrics.metrics.has(d.name())
+    }
+
+    def setup():
+        # the context caches aggregations shared between metrics, so each round gets a fresh one
+        context = MetricContext(metrics_update.populationData, bench_plan)
+        return (
+            metrics_update.populationData,
+            metrics_update.districtData,
+            metrics_update.geometry,
+            bench_plan,
+        ), {"context": context, **depends}
+
+    benchmark.extra_info["units"] = units
+    benchmark.pedantic(m.calculate, setup=setup, rounds=rounds)
+
+
+def test_export_equivalency(benchmark, bench_plan: RdsPlan, rounds, units, tmp_path):
+    path = tmp_path / "plan.csv"
+
+    def setup():
+        return (
+            ExportRedistrictingPlanTask(
+                bench_plan, exportShape=False, exportEquivalency=True, equivalencyFileName=str(path)
+            ),
+        ), {}
+
+    benchmark.extra_info["units"] = units
+    assert benchmark.pedantic(lambda task: task.run(), setup=setup, rounds=rounds)
+
+
+def test_export_shape(benchmark, bench_plan: RdsPlan, district_update, rounds, units, tmp_path):
+    path = tmp_path / "plan.shp"
+
+    def setup():
+        return (
+            ExportRedistrictingPlanTask(bench_plan, exportShape=True, shapeFileName=str(path), exportEquivalency=False),
+        ), {}
+
+    benchmark.extra_info["units"] = units
+    assert benchmark.pedantic(lambda task: task.run(), setup=setup, rounds=rounds)
+
+
+def test_import_equivalency(benchmark, bench_plan: RdsPlan, rounds, units, tmp_path):
+    path = tmp_path / "plan.csv"
+    export = ExportRedistrictingPlanTask(
+        bench_plan, exportShape=False, exportEquivalency=True, equivalencyFileName=str(path)
+    )
+    assert export.run()
+
+    def setup():
+        return (ImportAssignmentFileTask(bench_plan, path),), {}
+
+    benchmark.extra_info["units"] = units
+    assert benchmark.pedantic(lambda task: task.run(), setup=setup, rounds=rounds)
@@ -0,0 +1,83 @@
+"""QGIS Redistricting Plugin - microbenchmark for RdsBaseModel property accessors
+
+Copyright (C) 2026, Stuart C. Naifeh
+
+Compares the compiled property accessors generated when a model class is created
+with the generic descriptor path. Each operation is timed with both kinds of accessor
+in the same benchmark group. Benchmarks run under pytest-benchmark, which can't run
+under xdist. Run with:
+
+    python -m pytest -n0 tests/benchmarks/bench_properties.py \\
+        --benchmark-group-by=group --benchmark-json=properties.json
+
+The table lists the generic and compiled timings of each operation side by side, and
+the json records them with the accessor kind in extra_info for later comparison.
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 3 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ *   This program is distributed in the hope that it will be useful, but   *
+ *   WITHOUT ANY WARRANTY; without even the implied warranty of            *
+ *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          *
+ *   GNU General Public License for more details. You should have          *
+ *   received a copy of the GNU General Public License along with this     *
+ *   program. If not, see <http://www.gnu.org/licenses/>.                  *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+import pytest
+from qgis.PyQt.QtCore import pyqtSignal
+
+from redistricting.models.base import RdsBaseModel, rds_property
+
+# pylint: disable=protected-access, redefined-outer-name
+
+
+class BenchModel(RdsBaseModel):
+    nameChanged = pyqtSignal()
+
+    name: str = rds_property(private=True, default="name", notify=nameChanged)
+    count: int = rds_property(private=True, default=0)
+    ratio: float = rds_property(private=True, default=0.0)
+
+
+PROPERTIES = (BenchModel.name, BenchModel.count, BenchModel.ratio)
+
+
+def get_all(model: BenchModel):
+    return model.count, model.ratio, model.name
+
+
+def set_values(model: BenchModel):
+    model.count = 1
+    model.ratio = 0.5
+
+
+def set_notify(model: BenchModel):
+    model.name = "name"
+
+
+@pytest.fixture(params=["generic", "compiled"])
+def accessors(request: pytest.FixtureRequest):
+    if request.param == "generic":
+        for prop in PROPERTIES:
+            prop._fastget = prop._get
+            prop._fastset = prop._set
+
+    yield request.param
+
+    for prop in PROPERTIES:
+        prop.compile(BenchModel)
+
+
+@pytest.mark.parametrize("operation", [get_all, set_values, set_notify], ids=["get", "set", "set_notify"])
+def test_property_accessors(benchmark, accessors, operation):
+    model = BenchModel()
+    benchmark.group = f"property {operation.__name__}"
+    benchmark.extra_info["accessors"] = accessors
+    benchmark(operation, model)
@@ -0,0 +1,94 @@
+"""QGIS Redistricting Plugin - fixtures for the update pipeline benchmarks
+
+Copyright (C) 2026, Stuart C. Naifeh
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 3 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ *   This program is distributed in the hope that it will be useful, but   *
+ *   WITHOUT ANY WARRANTY; without even the implied warranty of            *
+ *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          *
+ *   GNU General Public License for more details. You should have          *
+ *   received a copy of the GNU General Public License along with this     *
+ *   program. If not, see <http://www.gnu.org/licenses/>.                  *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+import pathlib
+
+import pytest
+from qgis.core import QgsProject, QgsVectorLayer
+
+from redistricting.models import RdsPlan
+from redistricting.services.tasks.createlayers import CreatePlanLayersTask
+
+from .synthetic import assign_bands, create_synthetic_geopackage, make_plan, open_units_layer
+
+# pylint: disable=redefined-outer-name
+
+
+def pytest_addoption(parser: pytest.Parser):
+    group = parser.getgroup("redistricting benchmarks")
+    group.addoption(
+        "--bench-units",
+        default="10000",
+        help="comma-separated numbers of synthetic units to benchmark (e.g. 10000,100000,1000000)",
+    )
+    group.addoption(
+        "--bench-layout", default="grid", choices=("grid", "voronoi"), help="shape of the synthetic units"
+    )
+    group.addoption("--bench-rounds", type=int, default=3, help="rounds for each benchmark")
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc):
+    if "units" in metafunc.fixturenames:
+        units = [int(u) for u in metafunc.config.getoption("--bench-units").split(",")]
+        metafunc.parametrize("units", units, ids=[f"{u}units" for u in units], scope="session")
+
+
+@pytest.fixture(scope="session")
+def layout(request: pytest.FixtureRequest) -> str:
+    return request.config.getoption("--bench-layout")
+
+
+@pytest.fixture(scope="session")
+def rounds(request: pytest.FixtureRequest) -> int:
+    return request.config.getoption("--bench-rounds")
+
+
+@pytest.fixture(scope="session")
+def synthetic_gpkg(units, layout, tmp_path_factory: pytest.TempPathFactory) -> pathlib.Path:
+    path = tmp_path_factory.mktemp(f"synthetic_{layout}_{units}") / "units.gpkg"
+    return create_synthetic_geopackage(path, units, layout)
+
+
+@pytest.fixture(scope="session")
+def plan_gpkg(synthetic_gpkg: pathlib.Path) -> pathlib.Path:
+    geoLayer = open_units_layer(synthetic_gpkg)
+    plan = make_plan(geoLayer)
+    path = synthetic_gpkg.with_name("plan.gpkg")
+    task = CreatePlanLayersTask(plan, str(path))
+    assert task.run(), task.exception
+
+    assign_bands(path)
+    return path
+
+
+@pytest.fixture
+def geo_layer(synthetic_gpkg: pathlib.Path) -> QgsVectorLayer:
+    layer = open_units_layer(synthetic_gpkg)
+    QgsProject.instance().addMapLayer(layer, False)
+    return layer
+
+
+@pytest.fixture
+def bench_plan(geo_layer: QgsVectorLayer, plan_gpkg: pathlib.Path) -> RdsPlan:
+    plan = make_plan(geo_layer)
+    plan.addLayersFromGeoPackage(plan_gpkg)
+    QgsProject.instance().addMapLayers([plan.distLayer, plan.assignLayer], False)
+    return plan
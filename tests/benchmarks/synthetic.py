@@ -0,0 +1,148 @@
+"""QGIS Redistricting Plugin - synthetic geography for benchmarks
+
+Copyright (C) 2026, Stuart C. Naifeh
+
+Generates a GeoPackage of synthetic census units -- a regular grid of squares
+or the Voronoi cells of random points -- with population, demographic and
+geography fields shaped like the ones the plugin expects from census data,
+and builds plans on top of it.
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 3 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ *   This program is distributed in the hope that it will be useful, but   *
+ *   WITHOUT ANY WARRANTY; without even the implied warranty of            *
+ *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          *
+ *   GNU General Public License for more details. You should have          *
+ *   received a copy of the GNU General Public License along with this     *
+ *   program. If not, see <http://www.gnu.org/licenses/>.                  *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+import math
+import pathlib
+from typing import Literal, Union
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import shapely
+from qgis.core import QgsVectorLayer
+
+from redistricting.models import RdsDataField, RdsField, RdsPlan
+from redistricting.utils import spatialite_connect
+
+UNIT_SIZE = 250.0  # meters
+UNITS_PER_VTD = 40
+VTDS_PER_COUNTY = 50
+NUM_DISTRICTS = 10
+
+
+def grid_units(units: int) -> tuple[gpd.GeoSeries, np.ndarray]:
+    """Square units in row-major order, so that consecutive units are adjacent"""
+    cols = math.ceil(math.sqrt(units))
+    i = np.arange(units)
+    x = (i % cols) * UNIT_SIZE
+    y = (i // cols) * UNIT_SIZE
+    return gpd.GeoSeries(shapely.box(x, y, x + UNIT_SIZE, y + UNIT_SIZE), crs="EPSG:3857"), i
+
+
+def voronoi_units(units: int, rng: np.random.Generator) -> tuple[gpd.GeoSeries, np.ndarray]:
+    """Voronoi cells of uniformly distributed random points, ordered by row so that
+    ranges of consecutive units form compact districts"""
+    extent = math.ceil(math.sqrt(units)) * UNIT_SIZE
+    points = shapely.points(rng.uniform(0, extent, (units, 2)))
+    bounds = shapely.box(0, 0, extent, extent)
+
+    cells = shapely.get_parts(shapely.voronoi_polygons(shapely.multipoints(points), extend_to=bounds))
+    cells = shapely.intersection(cells, bounds)
+
+    # voronoi_polygons does not return the cells in the order of the input points
+    tree = shapely.STRtree(cells)
+    cell_index = tree.query(points, predicate="within")
+    order = np.empty(units, dtype=int)
+    order[cell_index[0]] = cell_index[1]
+    cells = cells[order]
+
+    coords = shapely.get_coordinates(points)
+    band = (coords[:, 1] // UNIT_SIZE).astype(int)
+    rank = np.lexsort((coords[:, 0], band))
+    return gpd.GeoSeries(cells[rank], crs="EPSG:3857"), np.arange(units)
+
+
+def create_synthetic_geopackage(
+    path: Union[str, pathlib.Path],
+    units: int,
+    layout: Literal["grid", "voronoi"] = "grid",
+    seed: int = 0,
+    layer: str = "units",
+) -> pathlib.Path:
+    rng = np.random.default_rng(seed)
+
+    if layout == "grid":
+        geometry, index = grid_units(units)
+    elif layout == "voronoi":
+        geometry, index = voronoi_units(units, rng)
+    else:
+        raise ValueError(f"unknown layout: {layout}")
+
+    pop = rng.poisson(30, units)
+    vap = rng.binomial(pop, 0.75)
+    vap_black = rng.binomial(vap, 0.25)
+    vap_hispanic = rng.binomial(vap - vap_black, 0.15)
+    vtd = index // UNITS_PER_VTD
+    county = vtd // VTDS_PER_COUNTY
+
+    df = gpd.GeoDataFrame(
+        {
+            "geoid": pd.Series(index).map("{:015d}".format),
+            "statefp": "99",
+            "countyid": pd.Series(county).map("99{:03d}".format),
+            "vtdid": pd.Series(vtd).map("99{:09d}".format),
+            "pop_total": pop,
+            "vap_total": vap,
+            "vap_ap_black": vap_black,
+            "vap_hispanic": vap_hispanic,
+            "vap_nh_white": vap - vap_black - vap_hispanic,
+        },
+        geometry=geometry,
+    )
+
+    path = pathlib.Path(path)
+    df.to_file(path, layer=layer, driver="GPKG")
+    return path
+
+
+def open_units_layer(path: pathlib.Path) -> QgsVectorLayer:
+    layer = QgsVectorLayer(f"{path}|layername=units", "units", "ogr")
+    assert layer.isValid()
+    return layer
+
+
+def make_plan(geoLayer: QgsVectorLayer) -> RdsPlan:
+    plan = RdsPlan("benchmark", NUM_DISTRICTS)
+    plan.geoLayer = geoLayer
+    plan.geoIdField = "geoid"
+    plan.popField = "pop_total"
+    plan.popFields.append(RdsField(geoLayer, "vap_total", "VAP"))
+    plan.dataFields.extend(
+        [
+            RdsDataField(geoLayer, "vap_ap_black", "APBVAP", pctBase="vap_total"),
+            RdsDataField(geoLayer, "vap_hispanic", "HVAP", pctBase="vap_total"),
+            RdsDataField(geoLayer, "vap_nh_white", "WVAP", pctBase="vap_total"),
+        ]
+    )
+    plan.geoFields.extend([RdsField(geoLayer, "vtdid", "VTD"), RdsField(geoLayer, "countyid", "County")])
+    return plan
+
+
+def assign_bands(gpkgPath: pathlib.Path, numDistricts: int = NUM_DISTRICTS):
+    """Assign consecutive runs of units -- horizontal bands of the synthetic geography -- to each district"""
+    with spatialite_connect(gpkgPath) as db:
+        (count,) = db.execute("SELECT count(*) FROM assignments").fetchone()
+        db.execute("UPDATE assignments SET district = ((fid - 1) * ?) / ? + 1", (numDistricts, count))
@@ -474,6 +474,12 @@ def qgis_app():
     _APP.exitQgis()
 
 
+@pytest.fixture(autouse=True)
+def qgis_resources(qgis_app):  # pylint: disable=unused-argument
+    """Register the plugin's Qt resources, as the plugin does when it is created."""
+    qInitResources()
+
+
 @pytest.fixture(scope="session")
 def qapp_cls():
     return QgsApplication
@@ -589,6 +595,7 @@ from redistricting.models.plan import RdsPlan  # isort: skip  # noqa: E402
 from redistricting.models.serialization import deserialize  # noqa: E402 # isort: skip
 from redistricting.models import metrics, splitsmetric  # noqa: F401, E402 # isort: skip; pylint: disable=unused-import
 from redistricting.models.lists import KeyedList  # noqa: F401, E402 # isort: skip
+from redistricting.resources import qInitResources  # noqa: E402 # isort: skip
 
 
 @pytest.fixture
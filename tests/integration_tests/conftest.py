@@ -24,7 +24,6 @@ from qgis.core import QgsProject
 from qgis.PyQt.QtWidgets import QToolBar
 
 from redistricting import services
-from redistricting.resources import *  # noqa: F403 # pylint: disable=wildcard-import, unused-wildcard-import
 
 # pylint: disable=unused-argument, redefined-outer-name
 
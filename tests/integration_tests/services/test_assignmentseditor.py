@@ -21,6 +21,7 @@ Copyright 2022-2024, Stuart C. Naifeh
 import pandas as pd
 import pytest
 from pytestqt.qtbot import QtBot
+from qgis.core import QgsVectorLayerCache
 
 from redistricting.models import RdsPlan
 from redistricting.services import (
@@ -160,3 +161,87 @@ class TestAssignmentsEditor:
         assert f is not None
         l = pd.DataFrame(f, columns=plan.assignLayer.fields().names())
         assert len(l) == 1564
+
+    def test_edit_assignments_batch_is_single_undo_command(self, plan: RdsPlan, qtbot: QtBot):
+        editor = PlanAssignmentEditor(plan)
+        plan.assignLayer.startEditing()
+        undoStack = plan.assignLayer.undoStack()
+        count = undoStack.count()
+        with qtbot.waitSignal(editor.assignmentsChanged):
+            editor.reassignDistrict(5, 0)
+        assert undoStack.count() == count + 1
+        assert plan.assignLayer.getFeature(114)[2] == 0
+
+        undoStack.undo()
+        assert plan.assignLayer.getFeature(114)[2] == 5
+        undoStack.redo()
+        assert plan.assignLayer.getFeature(114)[2] == 0
+        plan.assignLayer.rollBack(True)
+
+    def test_edit_assignments_batch_emits_assignments_changed_once(self, plan: RdsPlan):
+        editor = PlanAssignmentEditor(plan)
+        plan.assignLayer.startEditing()
+        emitted = []
+        editor.assignmentsChanged.connect(emitted.append)
+
+        editor.reassignDistrict(5, 0)
+        assert emitted == [plan]
+
+        emitted.clear()
+        plan.assignLayer.undoStack().undo()
+        assert emitted == [plan]
+        plan.assignLayer.rollBack(True)
+
+    def test_edit_assignments_in_active_edit_command_joins_macro(self, plan: RdsPlan):
+        editor = PlanAssignmentEditor(plan)
+        plan.assignLayer.startEditing()
+        undoStack = plan.assignLayer.undoStack()
+        count = undoStack.count()
+        editor.beginEditCommand()
+        editor.assignFeaturesToDistrict([114], 1)
+        editor.reassignDistrict(5, 0)
+        editor.endEditCommand()
+        assert undoStack.count() == count + 1
+
+        undoStack.undo()
+        assert plan.assignLayer.getFeature(114)[2] == 5
+        plan.assignLayer.rollBack(True)
+
+    def test_get_dist_features_multiple_values(self, plan: RdsPlan):
+        editor = PlanAssignmentEditor(plan)
+        single = pd.DataFrame(editor.getDistFeatures("placeid", "0116312"), columns=plan.assignLayer.fields().names())
+        vtds = single["vtdid"].unique().tolist()
+        f = editor.getDistFeatures("vtdid", vtds)
+        l = pd.DataFrame(f, columns=plan.assignLayer.fields().names())
+        assert set(l["vtdid"]) == set(vtds)
+
+        f = editor.getDistFeatures("vtdid", vtds, sourceDistrict=5)
+        l = pd.DataFrame(f, columns=plan.assignLayer.fields().names())
+        assert (l["district"] == 5).all()
+
+    def test_edit_assignments_batch_notifies_layer_listeners(self, plan: RdsPlan):
+        editor = PlanAssignmentEditor(plan)
+        plan.assignLayer.startEditing()
+        distIndex = plan.assignLayer.fields().indexOf(plan.distField)
+        changed: dict[int, int] = {}
+
+        def attributeValueChanged(fid, idx, value):
+            if idx == distIndex:
+                changed[fid] = value
+
+        plan.assignLayer.attributeValueChanged.connect(attributeValueChanged)
+        cache = QgsVectorLayerCache(plan.assignLayer, plan.assignLayer.featureCount())
+        cache.setFullCache(True)
+
+        editor.reassignDistrict(5, 0)
+        assert 114 in changed
+        assert set(changed.values()) == {0}
+        assert cache.getFeature(114)[distIndex] == 0
+
+        changed.clear()
+        plan.assignLayer.undoStack().undo()
+        assert changed[114] == 5
+        assert cache.getFeature(114)[distIndex] == 5
+
+        plan.assignLayer.attributeValueChanged.disconnect(attributeValueChanged)
+        plan.assignLayer.rollBack(True)
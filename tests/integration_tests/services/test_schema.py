@@ -5,7 +5,8 @@ import pytest
 from packaging import version
 from qgis.core import QgsProject, QgsVectorLayer
 
-from redistricting.services.schema import checkMigrateSchema
+from redistricting.services.schema import checkMigrateSchema, readGeoPackageVersion, schemaVersion
+from redistricting.utils import spatialite_connect
 
 
 @pytest.mark.parametrize("plugin_version", ["0.0.1", "0.0.4"])
@@ -875,3 +876,13 @@ class TestSchema:
                 "total-population": 227036,
             },
         }
+
+    def test_migrate_records_geopackage_version(self, schema_version, json_str, dist_layer):
+        migrated = checkMigrateSchema(json.loads(json_str), version.parse(schema_version))
+
+        geoPackagePath, _ = dist_layer.source().split("|", 1)
+        with spatialite_connect(geoPackagePath) as db:
+            assert readGeoPackageVersion(db) == schemaVersion
+
+        # layer changes are skipped when the migration is repeated
+        assert checkMigrateSchema(json.loads(json_str), version.parse(schema_version)) == migrated
@@ -206,8 +206,7 @@ class TestDistrictController:
         set_mime = mocker.patch.object(QgsApplication.instance().clipboard(), "setMimeData")
         controller_with_active_plan.copyToClipboard()
         clipboard.assert_called_once()
-        clipboard.return_value.getAsHtml.assert_called_once()
-        clipboard.return_value.getAsCsv.assert_called_once()
+        clipboard.return_value.getAsMimeData.assert_called_once()
         mime.assert_called_once()
         set_mime.assert_called_once()
 
@@ -225,8 +224,9 @@ class TestDistrictController:
         dockwidget.return_value.tblDataTable.selectedIndexes.return_value = selection
         controller_with_active_plan.copySelection()
         clipboard.assert_called_once()
-        clipboard.return_value.getAsHtml.assert_called_once()
-        clipboard.return_value.getAsCsv.assert_called_once()
+        clipboard.return_value.getAsMimeData.assert_called_once_with(
+            controller_with_active_plan.planManager.activePlan, [(1, 5)]
+        )
         mime.assert_called_once()
         set_mime.assert_called_once()
 
@@ -474,15 +474,17 @@ class TestEditAssignmentsController:
             in qgis_iface.messageBar().get_messages(Qgis.MessageLevel.Warning)
         )
 
-    def test_save_as_new(
+    def test_save_as_new(  # noqa: PLR0913
         self,
         controller_with_plan: EditAssignmentsController,
         mock_copy_dlg,
         mock_plan,
+        mock_updater,
         qgis_iface: QgisInterface,
         mocker: MockerFixture,
     ):
         copier = mocker.patch("redistricting.controllers.edit.PlanCopier", spec=PlanCopier)
+        controller_with_plan.updateService = mock_updater
         mock_plan.assignLayer.isEditable.return_value = True
         mock_copy_dlg.return_value.exec.return_value = QDialog.DialogCode.Accepted
         controller_with_plan.saveChangesAsNewPlan()
@@ -490,7 +492,9 @@ class TestEditAssignmentsController:
         mock_copy_dlg.return_value.exec.assert_called_once()
         copier.assert_called_once()
         copier.return_value.copyPlan.assert_called_once()
-        copier.return_value.copyBufferedAssignments.assert_called_once()
+        copier.return_value.copyBufferedAssignments.assert_called_once_with(
+            copier.return_value.copyPlan.return_value, mock_updater
+        )
 
     def test_save_as_new_cancel_returns(
         self,
@@ -30,7 +30,6 @@ from qgis.PyQt.QtWidgets import QAction, QDialog
 
 from redistricting import controllers, gui, services
 from redistricting.models import RdsPlan
-from redistricting.resources import *  # noqa: F403  # pylint: disable=wildcard-import, unused-wildcard-import
 
 
 class TestPlanController:
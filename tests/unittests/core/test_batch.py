@@ -0,0 +1,114 @@
+"""QGIS Redistricting Plugin - unit tests for headless recalculation of plans
+
+Copyright (C) 2026, Stuart C. Naifeh
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 3 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ *   This program is distributed in the hope that it will be useful, but   *
+ *   WITHOUT ANY WARRANTY; without even the implied warranty of            *
+ *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          *
+ *   GNU General Public License for more details. You should have          *
+ *   received a copy of the GNU General Public License along with this     *
+ *   program. If not, see <http://www.gnu.org/licenses/>.                  *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+import csv
+import json
+from contextlib import closing
+
+import pytest
+from qgis.core import QgsProject
+from qgis.PyQt.QtXml import QDomDocument
+
+from redistricting.models import RdsPlan
+from redistricting.services import ProjectStorage
+from redistricting.services.batch import BatchJob, HeadlessPlan, readProjectPlan, runBatch, writeSummary
+from redistricting.services.schema import readGeoPackagePlan
+from redistricting.utils import spatialite_connect
+
+# pylint: disable=redefined-outer-name
+
+
+@pytest.fixture
+def saved_plan(plan: RdsPlan, plan_gpkg_path):
+    ProjectStorage(QgsProject.instance(), QDomDocument("plan")).writeRedistrictingPlans([plan])
+    return plan_gpkg_path
+
+
+class TestBatch:
+    def test_headless_plan_opens_plan(self, saved_plan, plan: RdsPlan):
+        layers = len(QgsProject.instance().mapLayers())
+        with HeadlessPlan(BatchJob(saved_plan)) as p:
+            assert p is not plan
+            assert p.id == plan.id
+            assert p.geoLayer.source() == plan.geoLayer.source()
+            assert len(p.districts) == len(plan.districts)
+        assert len(QgsProject.instance().mapLayers()) == layers
+
+    def test_headless_plan_without_definition_raises(self, plan_gpkg_path):
+        with pytest.raises(ValueError, match="does not contain a plan definition"):
+            HeadlessPlan(BatchJob(plan_gpkg_path))
+
+    def test_read_project_plan(self, datadir, plan_gpkg_path):
+        data, sources = readProjectPlan(datadir / "test_project.qgz", plan_gpkg_path)
+        assert data["name"] == "Test Plan"
+        assert data["schema-version"] == "1.0.3"
+        assert sources == {data["geo-layer"]: ("ogr", f"{(datadir / 'tuscaloosa.gpkg').resolve()}|layername=block20")}
+
+    def test_read_project_plan_of_other_geopackage(self, datadir, tmp_path):
+        assert readProjectPlan(datadir / "test_project.qgz", tmp_path / "other.gpkg") == (None, {})
+
+    def test_headless_plan_reads_definition_from_project(self, datadir, plan_gpkg_path):
+        with HeadlessPlan(BatchJob(plan_gpkg_path, project=datadir / "test_project.qgz")) as p:
+            assert p.name == "Test Plan"
+            assert p.numDistricts == 5
+            assert p.geoLayer.source().endswith("tuscaloosa.gpkg|layername=block20")
+
+    def test_run_batch_saves_definition_from_project(self, datadir, plan_gpkg_path):
+        results = runBatch([BatchJob(plan_gpkg_path, project=datadir / "test_project.qgz")], processes=1)
+        assert results[0].success, results[0].error
+
+        with closing(spatialite_connect(plan_gpkg_path)) as db:
+            data, _ = readGeoPackagePlan(db)
+        assert data["name"] == "Test Plan"
+
+    def test_run_batch(self, saved_plan, plan: RdsPlan):
+        results = runBatch([BatchJob(saved_plan)], processes=1)
+        assert len(results) == 1
+        assert results[0].success, results[0].error
+        assert results[0].plan == plan.name
+        assert results[0].metrics
+
+        with closing(spatialite_connect(saved_plan)) as db:
+            data, _ = readGeoPackagePlan(db)
+        assert data["geo-layer"] == plan.geoLayer.id()
+        assert data["metrics"]
+
+    def test_run_batch_reports_failures(self, plan_gpkg_path, tmp_path):
+        results = runBatch([BatchJob(plan_gpkg_path), BatchJob(tmp_path / "missing.gpkg")], processes=1)
+        assert [r.success for r in results] == [False, False]
+        assert all(r.error for r in results)
+
+    def test_write_summary_csv(self, saved_plan, tmp_path):
+        results = runBatch([BatchJob(saved_plan)], processes=1)
+        path = tmp_path / "summary.csv"
+        writeSummary(results, path)
+        with path.open(encoding="utf-8", newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert rows[0]["geopackage"] == str(saved_plan)
+        assert rows[0]["success"] == "True"
+        assert "totalPopulation" in rows[0]
+
+    def test_write_summary_json(self, saved_plan, tmp_path):
+        results = runBatch([BatchJob(saved_plan)], processes=1)
+        path = tmp_path / "summary.json"
+        writeSummary(results, path)
+        summary = json.loads(path.read_text(encoding="utf-8"))
+        assert summary[0]["metrics"] == results[0].metrics
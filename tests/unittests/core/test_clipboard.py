@@ -0,0 +1,57 @@
+"""QGIS Redistricting Plugin - unit tests for district clipboard access
+
+Copyright (C) 2026, Stuart C. Naifeh
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 3 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ *   This program is distributed in the hope that it will be useful, but   *
+ *   WITHOUT ANY WARRANTY; without even the implied warranty of            *
+ *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          *
+ *   GNU General Public License for more details. You should have          *
+ *   received a copy of the GNU General Public License along with this     *
+ *   program. If not, see <http://www.gnu.org/licenses/>.                  *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+import pytest
+from qgis.PyQt.QtCore import Qt
+
+from redistricting.models import RdsDistrictDataModel, RdsPlan
+from redistricting.services import DistrictClipboardAccess
+
+# pylint: disable=no-self-use
+
+
+class TestDistrictClipboardAccess:
+    @pytest.fixture
+    def model(self, plan: RdsPlan) -> RdsDistrictDataModel:
+        return RdsDistrictDataModel(plan)
+
+    def test_selection_data_all(self, model: RdsDistrictDataModel):
+        data = DistrictClipboardAccess().getSelectionData(model, None)
+        assert len(data) == model.rowCount()
+        assert len(data.columns) == model.columnCount() - 1
+        assert data.index[0] == "Unassigned"
+
+    def test_selection_data_cells(self, model: RdsDistrictDataModel):
+        data = DistrictClipboardAccess().getSelectionData(model, [(1, 2), (3, 3), (3, 0)])
+        assert list(data.index) == [model.data(model.index(1, 0)), model.data(model.index(3, 0))]
+        assert list(data.columns) == [
+            model.headerData(2, Qt.Orientation.Horizontal, Qt.ItemDataRole.DisplayRole),
+            model.headerData(3, Qt.Orientation.Horizontal, Qt.ItemDataRole.DisplayRole),
+        ]
+        assert data.iloc[0, 0] == model.data(model.index(1, 2))
+        assert data.iloc[1, 1] == model.data(model.index(3, 3))
+        assert data.isna().iloc[0, 1]
+
+    def test_mime_data(self, plan: RdsPlan):
+        mime = DistrictClipboardAccess().getAsMimeData(plan, [(1, 2)])
+        assert set(mime) == {"text/html", "application/csv", "text/plain"}
+        assert "<table" in mime["text/html"]
+        assert "\t" in mime["text/plain"]
@@ -0,0 +1,144 @@
+"""QGIS Redistricting Plugin - unit tests for comparing the districts of two plans
+
+Copyright (C) 2026, Stuart C. Naifeh
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 3 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ *   This program is distributed in the hope that it will be useful, but   *
+ *   WITHOUT ANY WARRANTY; without even the implied warranty of            *
+ *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          *
+ *   GNU General Public License for more details. You should have          *
+ *   received a copy of the GNU General Public License along with this     *
+ *   program. If not, see <http://www.gnu.org/licenses/>.                  *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+import pandas as pd
+import pytest
+
+from redistricting.models import RdsPlan
+from redistricting.services import PlanComparisonService
+from redistricting.services.compare import ComparisonParams, PlanComparison
+
+# pylint: disable=redefined-outer-name
+
+
+@pytest.fixture
+def service(qgis_parent):
+    return PlanComparisonService(qgis_parent)
+
+
+@pytest.fixture
+def overlap():
+    # rows are districts of the plan, columns are districts of the other plan
+    return pd.DataFrame(
+        [[10, 0, 5], [0, 80, 20], [0, 0, 0], [5, 30, 60]],
+        index=range(4),
+        columns=range(3),
+    )
+
+
+@pytest.fixture
+def comparison(mocker, overlap):
+    plan = mocker.create_autospec(spec=RdsPlan, instance=True)
+    plan.name = "current"
+    other = mocker.create_autospec(spec=RdsPlan, instance=True)
+    other.name = "proposed"
+    return PlanComparison(plan, other, "population", overlap)
+
+
+def compare(service: PlanComparisonService, plan: RdsPlan, other: RdsPlan, **kwargs) -> PlanComparison:
+    return service.run(None, plan, ComparisonParams(other, **kwargs)).comparison
+
+
+class TestPlanComparison:
+    def test_population_and_retention(self, comparison: PlanComparison):
+        assert list(comparison.population) == [15, 100, 0, 95]
+        assert list(comparison.retained) == [10, 80, 0, 0]
+        assert comparison.coreRetention[1] == 0.8
+        assert comparison.coreRetention[3] == 0
+        assert pd.isna(comparison.coreRetention[2])
+
+    def test_best_match_excludes_unassigned(self, comparison: PlanComparison):
+        assert comparison.bestMatch[0] == 2
+        assert comparison.bestMatch[1] == 1
+        assert pd.isna(comparison.bestMatch[2])
+        assert comparison.bestMatch[3] == 2
+        assert comparison.bestMatchShare[3] == pytest.approx(60 / 95)
+
+    def test_total_retention(self, comparison: PlanComparison):
+        assert comparison.totalRetention == pytest.approx(80 / 195)
+
+    def test_table(self, comparison: PlanComparison):
+        table = comparison.table()
+        assert table.index.name == "district"
+        assert list(table.columns) == [
+            "population",
+            "core_retention",
+            "best_match",
+            "best_match_share",
+            "proposed:0",
+            "proposed:1",
+            "proposed:2",
+        ]
+
+    def test_export(self, comparison: PlanComparison, tmp_path):
+        comparison.export(tmp_path / "comparison.csv")
+        exported = pd.read_csv(tmp_path / "comparison.csv", index_col="district")
+        assert exported.loc[1, "proposed:1"] == 80
+
+        comparison.export(tmp_path / "comparison.json")
+        exported = pd.read_json(tmp_path / "comparison.json", orient="index")
+        assert exported.loc[3, "best_match"] == 2
+
+
+class TestPlanComparisonService:
+    def test_compare_plan_with_itself(self, service, plan: RdsPlan):
+        comparison = compare(service, plan, plan)
+
+        assert comparison.overlap.shape == (plan.numDistricts + 1, plan.numDistricts + 1)
+        assert comparison.unmatched == 0
+        assert comparison.population.sum() == 227036
+        assigned = comparison.population.index[(comparison.population > 0) & (comparison.population.index != 0)]
+        assert (comparison.coreRetention[assigned] == 1).all()
+        assert (comparison.bestMatch[assigned] == assigned).all()
+        assert comparison.totalRetention == 1
+
+    def test_compare_plans(self, service, plan: RdsPlan, new_plan: RdsPlan):
+        comparison = compare(service, plan, new_plan)
+
+        assert comparison.overlap.to_numpy().sum() + comparison.unmatched == 227036
+        assert list(comparison.overlap.columns) == list(range(new_plan.numDistricts + 1))
+
+    def test_compare_keeps_districts_above_num_districts(self, service, plan: RdsPlan):
+        plan.numDistricts = 3
+        comparison = compare(service, plan, plan)
+
+        assert list(comparison.overlap.index) == [0, 1, 2, 3, 4, 5]
+        assert list(comparison.overlap.columns) == [0, 1, 2, 3, 4, 5]
+        assert comparison.overlap.to_numpy().sum() + comparison.unmatched == 227036
+        dropped = comparison.population[[4, 5]]
+        assert dropped.sum() > 0
+        assert (comparison.coreRetention[dropped.index[dropped > 0]] == 1).all()
+
+    def test_compare_pop_field(self, service, plan: RdsPlan):
+        total = compare(service, plan, plan)
+        vap = compare(service, plan, plan, popField="vap_total")
+        assert vap.popField == "vap_total"
+        assert vap.population.sum() < total.population.sum()
+
+    def test_compare_invalid_pop_field_raises(self, service, plan: RdsPlan):
+        with pytest.raises(ValueError):
+            compare(service, plan, plan, popField="not_a_field")
+
+    def test_compare_emits_comparison_complete(self, service, plan: RdsPlan, qtbot):
+        with qtbot.waitSignal(service.comparisonComplete) as blocker:
+            service.compare(plan, plan, foreground=True)
+        assert blocker.args[0] is plan
+        assert isinstance(blocker.args[1], PlanComparison)
@@ -74,3 +74,12 @@ class TestDistrictDataModel:
     def test_clear_plan(self, district_model: RdsDistrictDataModel, qtbot: QtBot):
         with qtbot.waitSignals([district_model.modelAboutToBeReset, district_model.modelReset]):
             district_model.plan = None
+
+    def test_data_cached_until_district_changed(self, district_model: RdsDistrictDataModel, plan: RdsPlan):
+        index = district_model.createIndex(1, 0)
+        assert district_model.data(index, Qt.ItemDataRole.DisplayRole) == plan.districts[1].name
+        assert district_model.data(index, Qt.ItemDataRole.FontRole).bold()
+
+        plan.districts[1].name = "District One"
+        assert district_model.data(index, Qt.ItemDataRole.DisplayRole) == "District One"
+        assert district_model.data(index, RdsDistrictDataModel.RawDataRole) == "District One"
@@ -19,7 +19,7 @@ Copyright 2022-2024, Stuart C. Naifeh
  ***************************************************************************/
 """
 from redistricting.models import RdsDistrict
-from redistricting.services.districtio import DistrictReader
+from redistricting.services.districtio import DistrictReader, DistrictWriter
 
 
 class TestDistrictReader:
@@ -28,3 +28,42 @@ class TestDistrictReader:
         l = r.readFromLayer()
         assert len(l) == 5
         assert all(isinstance(d, RdsDistrict) for d in l)
+
+    def test_loaddistricts_refreshes_districts_in_place(self, plan):
+        district = plan.districts[1]
+        population = district.population
+        district.population = 0
+
+        r = DistrictReader(plan.distLayer, popField="pop_total")
+        r.loadDistricts(plan)
+        assert plan.districts[1] is district
+        assert district.population == population
+
+    def test_writer_writes_only_dirty_districts(self, plan, mocker):
+        reload = mocker.spy(plan.distLayer, "reload")
+        writer = DistrictWriter(plan.distLayer, plan.distField, plan.popField, plan.districtColumns)
+        for d in plan.districts:
+            d.setClean()
+
+        writer.writeToLayer(plan.districts)
+        reload.assert_not_called()
+
+        plan.districts[2].name = "Second District"
+        writer.writeToLayer(plan.districts)
+        reload.assert_called_once()
+        assert not plan.districts[2].isDirty()
+
+        records = {d.district: d for d in DistrictReader(plan.distLayer, popField="pop_total").readFromLayer()}
+        assert records[2].name == "Second District"
+
+    def test_writer_sets_fid_of_new_districts(self, plan):
+        writer = DistrictWriter(plan.distLayer, plan.distField, plan.popField, plan.districtColumns)
+        fids = {d.fid for d in plan.districts}
+        district = RdsDistrict(6, name="Sixth District")
+        assert district.fid == -1
+
+        writer.writeToLayer([district])
+        assert district.fid not in fids
+        assert district.fid != -1
+        assert not district.isDirty()
+        assert plan.distLayer.getFeature(district.fid)[plan.distField] == 6
@@ -22,14 +22,13 @@ Copyright 2022-2024, Stuart C. Naifeh
 import pytest
 from pytest_mock import MockerFixture
 from pytestqt.plugin import QtBot
-from qgis.core import QgsVectorLayer
+from qgis.core import QgsFeatureRequest, QgsGeometry, QgsPointXY, QgsRectangle, QgsVectorLayer
 from qgis.gui import QgsMapCanvas
 from qgis.PyQt.QtCore import QPoint, QPointF, Qt
 from qgis.PyQt.QtGui import QMouseEvent
 
 from redistricting.gui import PaintDistrictsTool, PaintMode
 from redistricting.models import RdsPlan
-from redistricting.resources import *  # noqa: F403  # pylint: disable=unused-wildcard-import, wildcard-import
 
 # pylint: disable=protected-access
 
@@ -101,6 +100,60 @@ class TestPaintTool:
             qtbot.keyPress(qgis_canvas, Qt.Key.Key_Escape)
         assert not active_tool.isActive()
 
+    def test_activate_builds_index(self, active_tool_with_plan: PaintDistrictsTool):
+        assert active_tool_with_plan._index is not None
+        assert active_tool_with_plan._indexLayer is active_tool_with_plan._layer
+
+    @staticmethod
+    def fidsAt(layer: QgsVectorLayer, geom: QgsGeometry) -> set[int]:
+        request = QgsFeatureRequest(geom.boundingBox())
+        return {f.id() for f in layer.getFeatures(request) if f.geometry().intersects(geom)}
+
+    def test_features_at_point(self, active_tool_with_plan: PaintDistrictsTool):
+        layer = active_tool_with_plan._layer
+        feature = next(layer.getFeatures())
+        point = feature.geometry().pointOnSurface().asPoint()
+        assert active_tool_with_plan._featuresAtLayerPoint(point) == [feature.id()]
+
+    def test_features_at_shared_boundary(self, active_tool_with_plan: PaintDistrictsTool):
+        layer = active_tool_with_plan._layer
+        feature = next(layer.getFeatures())
+        neighbor = next(
+            f
+            for f in layer.getFeatures(QgsFeatureRequest(feature.geometry().boundingBox()))
+            if f.id() != feature.id() and f.geometry().touches(feature.geometry())
+        )
+        shared = feature.geometry().intersection(neighbor.geometry())
+        vertex = QgsPointXY(next(shared.vertices()))
+
+        fids = active_tool_with_plan._featuresAtLayerPoint(vertex)
+        assert {feature.id(), neighbor.id()} <= set(fids)
+        assert set(fids) == self.fidsAt(layer, QgsGeometry.fromPointXY(vertex))
+
+    def test_features_in_geometry(self, active_tool_with_plan: PaintDistrictsTool, qgis_canvas: QgsMapCanvas):
+        layer = active_tool_with_plan._layer
+        qgis_canvas.setDestinationCrs(layer.crs())
+        feature = next(layer.getFeatures())
+        center = feature.geometry().pointOnSurface().asPoint()
+        rect = QgsRectangle(center, center)
+        rect.grow(feature.geometry().boundingBox().width())
+        geom = QgsGeometry.fromRect(rect)
+
+        fids = active_tool_with_plan._featuresInGeometry(geom)
+        assert feature.id() in fids
+        assert set(fids) == self.fidsAt(layer, geom)
+
+    def test_prepared_geometry_cache_is_bounded(self, active_tool_with_plan: PaintDistrictsTool, qgis_canvas, qtbot):
+        active_tool_with_plan.MaxPreparedGeometries = 2
+        fids = [f.id() for f in active_tool_with_plan._layer.getFeatures(QgsFeatureRequest().setLimit(3))]
+        for fid in fids:
+            active_tool_with_plan._preparedGeometry(fid)
+        assert list(active_tool_with_plan._prepared) == fids[1:]
+
+        with qtbot.wait_signal(active_tool_with_plan.deactivated):
+            qgis_canvas.unsetMapTool(active_tool_with_plan)
+        assert len(active_tool_with_plan._prepared) == 0
+
     def test_mouse_press_without_target_no_edit(
         self, active_tool: PaintDistrictsTool, qgis_canvas: QgsMapCanvas, qtbot: QtBot
     ):
@@ -248,7 +301,8 @@ class TestPaintTool:
         qtbot.mouseRelease(
             qgis_canvas.viewport(), Qt.MouseButton.LeftButton, pos=qgis_canvas.viewport().rect().center()
         )
-        assert paintFeatures.call_count == 2
+        # releasing over the unit painted by the last move does not paint it again
+        assert paintFeatures.call_count == 1
 
         qgis_parent.hide()
 
@@ -20,14 +20,16 @@ Copyright 2022-2025, Stuart C. Naifeh
 """
 
 import sqlite3
+from contextlib import closing
 
 import pytest
 from pytest_mock import MockerFixture
 from pytestqt.plugin import QtBot
 from qgis.core import Qgis
 
-from redistricting.models import RdsPlan
-from redistricting.services import PlanCopier
+from redistricting.models import MetricTriggers, RdsPlan
+from redistricting.services import DistrictUpdater, MetricsService, PlanCopier
+from redistricting.services.schema import readGeoPackagePlan, writeGeoPackagePlan
 
 # pylint: disable=protected-access
 
@@ -80,3 +82,98 @@ class TestPlanCopier:
         with sqlite3.connect(new_plan.geoPackagePath) as db:
             c = db.execute("SELECT count(distinct district) FROM assignments")
             assert c.fetchone()[0] == 5
+
+    def test_copy_with_assignments_clears_plan_definition(
+        self, copier: PlanCopier, valid_plan: RdsPlan, datadir, mocker: MockerFixture
+    ):
+        mocker.patch("redistricting.services.copy.PlanBuilder")
+        with closing(sqlite3.connect(valid_plan.geoPackagePath)) as db:
+            writeGeoPackagePlan(db, {"id": "source"}, {"layer": ("ogr", "source.gpkg")})
+            db.commit()
+
+        copier.copyPlan("copied", "copy of plan", str(datadir / "copied.gpkg"), True)
+
+        with closing(sqlite3.connect(datadir / "copied.gpkg")) as db:
+            assert readGeoPackagePlan(db) == (None, {})
+        with closing(sqlite3.connect(valid_plan.geoPackagePath)) as db:
+            assert readGeoPackagePlan(db)[0] == {"id": "source"}
+
+    def test_copy_buffered_assignments(self, copier: PlanCopier, valid_plan: RdsPlan, new_plan: RdsPlan):
+        idx = valid_plan.assignLayer.fields().lookupField(valid_plan.distField)
+        valid_plan.assignLayer.startEditing()
+        for fid in (1, 2, 3):
+            valid_plan.assignLayer.changeAttributeValue(fid, idx, 4)
+        copier.copyBufferedAssignments(new_plan)
+        valid_plan.assignLayer.rollBack(True)
+        with sqlite3.connect(new_plan.geoPackagePath) as db:
+            c = db.execute("SELECT fid FROM assignments WHERE district = 4 ORDER BY fid")
+            assert [r[0] for r in c.fetchall()] == [1, 2, 3]
+
+    def test_copy_buffered_assignments_returns_changed_districts(
+        self, copier: PlanCopier, valid_plan: RdsPlan, new_plan: RdsPlan, mock_updater
+    ):
+        idx = valid_plan.assignLayer.fields().lookupField(valid_plan.distField)
+        valid_plan.assignLayer.startEditing()
+        for fid in (1, 2, 3):
+            valid_plan.assignLayer.changeAttributeValue(fid, idx, 4)
+        districts = copier.copyBufferedAssignments(new_plan, mock_updater)
+        valid_plan.assignLayer.rollBack(True)
+        assert districts == {0, 4}
+        mock_updater.update.assert_called_once_with(
+            new_plan, True, districts={0, 4}, includeDemographics=True, includeGeometry=True
+        )
+
+    def test_copy_buffered_assignments_large_edit(
+        self, valid_plan: RdsPlan, new_plan: RdsPlan, mock_updater, mocker: MockerFixture
+    ):
+        # more changed features than SQLite allows host parameters in a single statement
+        source = mocker.create_autospec(spec=RdsPlan, instance=True)
+        source.distField = valid_plan.distField
+        fields = valid_plan.assignLayer.fields()
+        idx = fields.lookupField(valid_plan.distField)
+        source.assignLayer.fields.return_value = fields
+        source.assignLayer.isEditable.return_value = True
+        source.assignLayer.editBuffer.return_value.changedAttributeValues.return_value = {
+            fid: {idx: 4} for fid in range(1, 40001)
+        }
+
+        districts = PlanCopier(source).copyBufferedAssignments(new_plan, mock_updater)
+
+        with sqlite3.connect(new_plan.geoPackagePath) as db:
+            c = db.execute("SELECT count(*) FROM assignments WHERE fid <= 40000 AND district != 4")
+            assert c.fetchone()[0] == 0
+        assert 4 in districts
+        assert districts > {4}
+        mock_updater.update.assert_called_once()
+
+    def test_copy_buffered_assignments_updates_districts(
+        self, copier: PlanCopier, valid_plan: RdsPlan, new_plan: RdsPlan, mocker: MockerFixture
+    ):
+        metrics = mocker.create_autospec(spec=MetricsService, instance=True)
+        updater = DistrictUpdater(metrics)
+        update = updater.update
+
+        def updateInForeground(*args, **kwargs):
+            return update(*args, foreground=True, **kwargs)
+
+        mocker.patch.object(updater, "update", side_effect=updateInForeground)
+
+        idx = valid_plan.assignLayer.fields().lookupField(valid_plan.distField)
+        valid_plan.assignLayer.startEditing()
+        for fid in (1, 2, 3):
+            valid_plan.assignLayer.changeAttributeValue(fid, idx, 4)
+        copier.copyBufferedAssignments(new_plan, updater)
+        valid_plan.assignLayer.rollBack(True)
+
+        with sqlite3.connect(new_plan.geoPackagePath) as db:
+            c = db.execute("SELECT district, population FROM districts WHERE district IN (0, 4)")
+            population = dict(c.fetchall())
+        assert population[4] > 0
+        assert population[0] + population[4] == 227036
+        assert new_plan.districts.get(4).population == population[4]
+
+        metrics.update.assert_called_once()
+        assert metrics.update.call_args.args[0] is new_plan
+        assert metrics.update.call_args.kwargs["trigger"] == (
+            MetricTriggers.ON_UPDATE_DEMOGRAPHICS | MetricTriggers.ON_UPDATE_GEOMETRY
+        )
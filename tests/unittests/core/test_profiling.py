@@ -0,0 +1,190 @@
+"""QGIS Redistricting Plugin - unit tests for background task profiling
+
+Copyright (C) 2026, Stuart C. Naifeh
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 3 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ *   This program is distributed in the hope that it will be useful, but   *
+ *   WITHOUT ANY WARRANTY; without even the implied warranty of            *
+ *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          *
+ *   GNU General Public License for more details. You should have          *
+ *   received a copy of the GNU General Public License along with this     *
+ *   program. If not, see <http://www.gnu.org/licenses/>.                  *
+ *                                                                         *
+ ***************************************************************************/
+"""
+import json
+import threading
+import tracemalloc
+
+import pytest
+from pytest_mock import MockerFixture
+from qgis.core import QgsMessageLog
+
+from redistricting import settings
+from redistricting.services.profiling import StageProfile, TaskProfiler
+
+# pylint: disable=redefined-outer-name
+
+
+
+class TestTaskProfiler:
+    @pytest.fixture(autouse=True)
+    def log(self, mocker: MockerFixture):
+        return mocker.patch("redistricting.services.profiling.QgsMessageLog", spec=QgsMessageLog)
+
+    @pytest.fixture
+    def profiler(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(settings, "enableProfiling", True)
+        monkeypatch.setattr(settings, "profileMemory", False)
+        monkeypatch.setattr(settings, "profilingLog", "")
+        return TaskProfiler()
+
+    @pytest.fixture
+    def profiles(self, profiler: TaskProfiler) -> list[StageProfile]:
+        result = []
+        profiler.stageProfiled.connect(result.append)
+        return result
+
+    def test_disabled_records_nothing(self, profiler: TaskProfiler, profiles, log, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(settings, "enableProfiling", False)
+        with profiler.profileTask("task"):
+            profiler.beginStage("stage")
+            profiler.setRows(10)
+
+        assert profiles == []
+        log.logMessage.assert_not_called()
+
+    def test_stage_outside_task_is_ignored(self, profiler: TaskProfiler, profiles):
+        profiler.beginStage("stage")
+        profiler.endStage()
+        assert profiles == []
+
+    def test_records_each_stage(self, profiler: TaskProfiler, profiles, log):
+        with profiler.profileTask("task"):
+            profiler.beginStage("load")
+            profiler.setRows(100)
+            profiler.beginStage("save")
+
+        assert [(p.task, p.stage, p.rows) for p in profiles] == [("task", "load", 100), ("task", "save", None)]
+        assert all(p.wallTime >= 0 and p.cpuTime >= 0 for p in profiles)
+        assert profiles[0].peakMemory is None
+        assert log.logMessage.call_count == 2
+
+    def test_nested_task_restores_outer_stage(self, profiler: TaskProfiler, profiles):
+        with profiler.profileTask("outer"):
+            profiler.beginStage("outer stage")
+            with profiler.profileTask("inner"):
+                profiler.beginStage("inner stage")
+            profiler.setRows(5)
+
+        assert [(p.task, p.stage, p.rows) for p in profiles] == [
+            ("inner", "inner stage", None),
+            ("outer", "outer stage", 5),
+        ]
+
+    def test_records_stage_when_task_raises(self, profiler: TaskProfiler, profiles):
+        with pytest.raises(ValueError), profiler.profileTask("task"):
+            profiler.beginStage("stage")
+            raise ValueError()
+
+        assert len(profiles) == 1
+
+    def test_profile_memory(self, profiler: TaskProfiler, profiles, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(settings, "profileMemory", True)
+        try:
+            with profiler.profileTask("task"):
+                profiler.beginStage("stage")
+                data = [0] * 100000  # noqa: F841 # pylint: disable=unused-variable
+        finally:
+            tracemalloc.stop()
+
+        assert profiles[0].peakMemory > 0
+        assert profiles[0].peakMemoryShared is False
+
+    def test_profile_memory_marks_overlapping_stages(
+        self, profiler: TaskProfiler, profiles, monkeypatch: pytest.MonkeyPatch, mocker: MockerFixture
+    ):
+        monkeypatch.setattr(settings, "profileMemory", True)
+        reset_peak = mocker.spy(tracemalloc, "reset_peak")
+        started = threading.Event()
+        finish = threading.Event()
+
+        def other():
+            with profiler.profileTask("other"):
+                profiler.beginStage("other stage")
+                started.set()
+                finish.wait(5)
+
+        thread = threading.Thread(target=other)
+        thread.start()
+        try:
+            assert started.wait(5)
+            with profiler.profileTask("task"):
+                profiler.beginStage("stage")
+        finally:
+            finish.set()
+            thread.join()
+
+        # only the stage that started alone reset the peak
+        assert reset_peak.call_count == 1
+        profile = next(p for p in profiles if p.task == "task")
+        assert profile.peakMemoryShared is True
+        assert "shared with concurrent stages" in str(profile)
+
+    def test_profile_memory_marks_nested_stages(
+        self, profiler: TaskProfiler, profiles, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr(settings, "profileMemory", True)
+        with profiler.profileTask("outer"):
+            profiler.beginStage("outer stage")
+            with profiler.profileTask("inner"):
+                profiler.beginStage("inner stage")
+            profiler.beginStage("after")
+
+        assert [(p.stage, p.peakMemoryShared) for p in profiles] == [
+            ("inner stage", True),
+            ("outer stage", True),
+            ("after", False),
+        ]
+
+    def test_profile_memory_stops_tracing_after_task(
+        self, profiler: TaskProfiler, profiles, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr(settings, "profileMemory", True)
+        with profiler.profileTask("outer"):
+            with profiler.profileTask("inner"):
+                profiler.beginStage("stage")
+                assert tracemalloc.is_tracing()
+            assert tracemalloc.is_tracing()
+            profiler.beginStage("stage")
+
+        assert not tracemalloc.is_tracing()
+        assert all(p.peakMemory is not None for p in profiles)
+
+    def test_profile_memory_leaves_existing_tracing(self, profiler: TaskProfiler, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(settings, "profileMemory", True)
+        tracemalloc.start()
+        try:
+            with profiler.profileTask("task"):
+                profiler.beginStage("stage")
+            assert tracemalloc.is_tracing()
+        finally:
+            tracemalloc.stop()
+
+    def test_writes_log_file(self, profiler: TaskProfiler, tmp_path, monkeypatch: pytest.MonkeyPatch):
+        path = tmp_path / "profile.jsonl"
+        monkeypatch.setattr(settings, "profilingLog", str(path))
+        with profiler.profileTask("task"):
+            profiler.beginStage("load")
+            profiler.setRows(10)
+            profiler.beginStage("save")
+
+        records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+        assert [(r["task"], r["stage"], r["rows"]) for r in records] == [("task", "load", 10), ("task", "save", None)]
+        assert {"time", "wallTime", "cpuTime", "peakMemory", "maxRss"} <= records[0].keys()
@@ -0,0 +1,115 @@
+"""QGIS Redistricting Plugin - unit tests for scoring candidate assignments
+
+Copyright (C) 2026, Stuart C. Naifeh
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 3 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ *   This program is distributed in the hope that it will be useful, but   *
+ *   WITHOUT ANY WARRANTY; without even the implied warranty of            *
+ *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          *
+ *   GNU General Public License for more details. You should have          *
+ *   received a copy of the GNU General Public License along with this     *
+ *   program. If not, see <http://www.gnu.org/licenses/>.                  *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+import pathlib
+
+import pandas as pd
+import pytest
+
+from redistricting.models import RdsPlan
+from redistricting.models.metrics import RdsCutEdges
+from redistricting.models.metricslist import MetricContext
+from redistricting.services import ScoringService
+from redistricting.services.scoring import ScoringParams, exportScores
+
+# pylint: disable=redefined-outer-name,protected-access
+
+
+@pytest.fixture
+def assignmentfile_csv(datadir: pathlib.Path):
+    return datadir / "tuscaloosa_be.csv"
+
+
+@pytest.fixture
+def single_district_csv(assignmentfile_csv: pathlib.Path, tmp_path: pathlib.Path):
+    df = pd.read_csv(assignmentfile_csv, dtype={"geoid20": str})
+    df["district"] = 1
+    path = tmp_path / "single.csv"
+    df.to_csv(path, index=False)
+    return path
+
+
+@pytest.fixture
+def service(qgis_parent):
+    return ScoringService(qgis_parent)
+
+
+def score(service: ScoringService, plan: RdsPlan, *candidates, **kwargs) -> pd.DataFrame:
+    params = ScoringParams(list(candidates), geoColumn="geoid20", distColumn="district", **kwargs)
+    return service.run(None, plan, params).scores
+
+
+class TestScoringService:
+    def test_score_candidates(self, service, plan: RdsPlan, assignmentfile_csv, single_district_csv):
+        scores = score(service, plan, assignmentfile_csv, single_district_csv)
+
+        assert list(scores.index) == ["tuscaloosa_be", "single"]
+        assert scores["error"].isna().all()
+        assert (scores["totalPopulation"] == 227036).all()
+        assert {"cutEdges", "meanPolsbypopper", "planDeviation_0", "planDeviation_1", "splits_vtdid"} <= set(
+            scores.columns
+        )
+        assert scores.loc["single", "cutEdges"] == 0
+        assert scores.loc["single", "splits_vtdid"] == 0
+        assert not scores.loc["single", "complete"]
+        assert scores.loc["tuscaloosa_be", "cutEdges"] > 0
+
+    def test_score_leaves_plan_unchanged(self, service, plan: RdsPlan, single_district_csv):
+        score(service, plan, single_district_csv)
+        assert plan.metrics.meanPolsbypopper == 0.4
+        assert plan.metrics.planDeviation == (100, -500)
+
+    def test_score_without_geometry(self, service, plan: RdsPlan, assignmentfile_csv):
+        scores = score(service, plan, assignmentfile_csv, includeGeometry=False)
+        assert "totalPopulation" in scores.columns
+        assert "meanPolsbypopper" not in scores.columns
+        assert "cutEdges" not in scores.columns
+
+    def test_score_reports_bad_candidates(self, service, plan: RdsPlan, assignmentfile_csv, tmp_path):
+        bad = tmp_path / "bad.csv"
+        df = pd.read_csv(assignmentfile_csv, dtype={"geoid20": str})
+        df.loc[0, "district"] = 9
+        df.to_csv(bad, index=False)
+
+        scores = score(service, plan, assignmentfile_csv, tmp_path / "missing.csv", bad)
+        assert pd.isna(scores.loc["tuscaloosa_be", "error"])
+        assert "FileNotFoundError" in scores.loc["missing", "error"]
+        assert "outside the range" in scores.loc["bad", "error"]
+
+    def test_score_emits_scores_ready(self, service, plan: RdsPlan, assignmentfile_csv, qtbot):
+        with qtbot.waitSignal(service.scoresReady) as blocker:
+            service.score(plan, [assignmentfile_csv], foreground=True, geoColumn="geoid20", distColumn="district")
+        assert list(blocker.args[1].index) == ["tuscaloosa_be"]
+
+    def test_cut_edges_from_adjacency_matches_query(self, service, plan: RdsPlan):
+        data = service._loadAssignments(plan, False, False)
+        fromQuery = RdsCutEdges()
+        fromQuery.calculate(data, None, None, plan)
+        fromAdjacency = RdsCutEdges()
+        context = MetricContext(data, plan, RdsCutEdges.unitAdjacency(plan))
+        fromAdjacency.calculate(data, None, None, plan, context=context)
+        assert fromAdjacency.value == fromQuery.value
+
+    def test_export_scores(self, service, plan: RdsPlan, assignmentfile_csv, tmp_path):
+        scores = score(service, plan, assignmentfile_csv, includeGeometry=False)
+        exportScores(scores, tmp_path / "scores.csv")
+        exported = pd.read_csv(tmp_path / "scores.csv", index_col="candidate")
+        assert exported.loc["tuscaloosa_be", "totalPopulation"] == 227036
@@ -18,15 +18,22 @@
 """
 
 import json
+import sqlite3
 from collections.abc import Generator
+from contextlib import closing
 
 import pytest
+from packaging import version
+from pytest_mock import MockerFixture
 from pytestqt.plugin import QtBot
-from qgis.core import QgsProject
+from qgis.core import Qgis, QgsProject
 from qgis.PyQt.QtXml import QDomDocument
 
 from redistricting.models import RdsPlan
 from redistricting.services import ProjectStorage
+from redistricting.services.schema import readGeoPackagePlan, schemaVersion
+from redistricting.services.storage import sourceWithoutCredentials
+from redistricting.utils import spatialite_connect
 
 
 class TestStorage:
@@ -68,6 +75,36 @@ class TestStorage:
         assert len(plan.geoFields) == 2
         assert plan.geoFields[0].layer == block_layer
 
+    def test_read_plans_defers_districts(self, storage: ProjectStorage, mocker: MockerFixture):
+        readDistricts = mocker.spy(storage, "readDistricts")
+        plans = storage.readRedistrictingPlans()
+        plan = plans[0]
+        assert not plan.districtsLoaded
+        readDistricts.assert_not_called()
+
+        assert len(plan.districts) == 6
+        assert plan.districtsLoaded
+        readDistricts.assert_called_once_with(plan)
+        assert len(plan.districts) == 6
+        readDistricts.assert_called_once()
+
+    def test_migrate_skips_migrated_plans(self, empty_storage: ProjectStorage, mocker: MockerFixture):
+        checkMigrateSchema = mocker.patch("redistricting.services.storage.checkMigrateSchema")
+        checkMigrateSchema.side_effect = lambda data, v: dict(data)
+        empty_storage._version = version.parse("1.0.4")  # pylint: disable=protected-access
+        QgsProject.instance().writeEntry(
+            "redistricting",
+            "redistricting-plans",
+            [json.dumps({"name": "migrated", "schema-version": str(schemaVersion)}), json.dumps({"name": "old"})],
+        )
+
+        empty_storage.migrate()
+        checkMigrateSchema.assert_called_once_with({"name": "old"}, version.parse("1.0.4"))
+        assert empty_storage.version == schemaVersion
+
+        l, _ = QgsProject.instance().readListEntry("redistricting", "redistricting-plans")
+        assert all(json.loads(p)["schema-version"] == str(schemaVersion) for p in l)
+
     def test_read_active_plan(self, storage: ProjectStorage):
         u = storage.readActivePlan()
         assert str(u) == "b63a8bbe-124d-4be2-953e-0a5b0d70fb91"
@@ -83,6 +120,41 @@ class TestStorage:
         assert j["geo-layer"] == block_layer.id()
         assert j["dist-layer"] == dist_layer.id()
 
+    def test_write_plan_saves_definition_to_geopackage(
+        self, empty_storage: ProjectStorage, plan: RdsPlan, block_layer, plan_gpkg_path
+    ):
+        empty_storage.writeRedistrictingPlans([plan])
+        with closing(spatialite_connect(plan_gpkg_path)) as db:
+            data, sources = readGeoPackagePlan(db)
+
+        assert data["id"] == str(plan.id)
+        assert data["schema-version"] == str(schemaVersion)
+        assert sources == {block_layer.id(): ("ogr", block_layer.source())}
+
+    def test_write_plan_to_geopackage_error_logs_warning(
+        self, empty_storage: ProjectStorage, plan: RdsPlan, mocker: MockerFixture
+    ):
+        error = sqlite3.OperationalError("database is locked")
+        mocker.patch("redistricting.services.storage.spatialite_connect", side_effect=error)
+        log = mocker.patch("redistricting.services.storage.QgsMessageLog")
+        empty_storage.writeGeoPackagePlan(plan, {})
+        log.logMessage.assert_called_once()
+        assert "locked" in log.logMessage.call_args.args[0]
+        assert log.logMessage.call_args.args[2] == Qgis.MessageLevel.Warning
+
+    def test_source_without_credentials(self):
+        source = "dbname='census' host=localhost port=5432 user='me' password='secret' table=\"public\".\"blocks\""
+        stripped = sourceWithoutCredentials(source)
+        assert "secret" not in stripped
+        assert "dbname='census'" in stripped
+        assert "user='me'" in stripped
+
+        source = "dbname='census' host=localhost authcfg=abc1234 table=\"public\".\"blocks\""
+        assert sourceWithoutCredentials(source) == source
+
+        source = "/data/tuscaloosa.gpkg|layername=block20"
+        assert sourceWithoutCredentials(source) == source
+
     def test_write_active_plan(self, empty_storage: ProjectStorage, mock_plan):
         empty_storage.writeActivePlan(mock_plan)
         planid, _ = QgsProject.instance().readEntry("redistricting", "active-plan")
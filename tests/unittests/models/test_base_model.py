@@ -132,6 +132,33 @@ class TestBaseModel:
         assert inst.prop1 == "string"
         assert inst.prop2 == [-1]
 
+    def test_change_journal(self):
+        class ModelTest8(RdsBaseModel):
+            prop1: str = rds_property(private=True, default="default")
+            prop2: list[int] = rds_property(private=True, factory=list)
+            prop3: int = 1
+
+        inst = ModelTest8()
+        inst.beginChanges()
+        assert inst.isRecordingChanges()
+        inst.prop1 = "changed"
+        inst.prop1 = "changed again"
+        inst.prop2 = [1, 2]
+        inst.prop3 = 2
+        assert inst.endChanges() == {"prop1": "default", "prop2": [], "prop3": 1}
+        assert not inst.isRecordingChanges()
+
+        inst.beginChanges()
+        inst.prop1 = "changed again"
+        assert inst.endChanges() == {}
+
+        inst.beginChanges()
+        inst.prop1 = "rolled back"
+        inst.prop2 = [3]
+        inst.rollbackChanges()
+        assert inst.prop1 == "changed again"
+        assert inst.prop2 == [1, 2]
+
     def test_base_model_with_factory(self):
         def factory():
             return []
@@ -275,6 +302,22 @@ class TestRdsProperty:
         assert callable(C.my_prop.fvalid)
         assert C.my_prop.__doc__ == "Docstring"
 
+    def test_rds_property_compiled_accessors(self):
+        class C:
+            my_prop: int = rds_property(private=True, default=0)
+
+        c = C()
+        c.my_prop = 2
+        assert c.my_prop == 2
+        assert c._my_prop == 2
+
+        c.my_prop = 3.0
+        assert c.my_prop == 3
+        assert isinstance(c.my_prop, int)
+
+        with pytest.raises(TypeError):
+            c.my_prop = "x"
+
     def test_rds_property_private(self):
         class C:
             my_prop: str = rds_property(private=True)
@@ -62,3 +62,34 @@ class TestDeltaList:
         assert delta_list[0, 0] == 1
         assert delta_list[0, 1] == 100
         assert delta_list["vap_total"] == [80]
+
+    def test_getitem_missing_value_returns_none(self, empty_delta_list: DeltaList):
+        data = pd.DataFrame({"pop_total": [100.0, None]}, index=[1, 2])
+        empty_delta_list.setData(data)
+        assert empty_delta_list[0, 0] == 100
+        assert empty_delta_list[1, 0] is None
+        assert empty_delta_list[1]["pop_total"] is None
+
+    def test_update_same_shape_emits_values_changed(self, empty_delta_list: DeltaList, qtbot):
+        data = pd.DataFrame({"pop_total": [100, 50, 25], "vap_total": [80, 40, 20]}, index=[1, 2, 3])
+        empty_delta_list.update(data)
+        delta = empty_delta_list[1]
+
+        changed = data.copy()
+        changed.loc[2, "vap_total"] = 45
+        changed.loc[3, "vap_total"] = 15
+        blocks = []
+        empty_delta_list.valuesChanged.connect(lambda *block: blocks.append(block))
+        with qtbot.assertNotEmitted(empty_delta_list.updateStarted):
+            empty_delta_list.update(changed)
+
+        assert blocks == [(1, 1, 2, 1)]
+        assert empty_delta_list[1] is delta
+        assert delta["vap_total"] == 45
+
+    def test_update_new_districts_resets(self, delta_list: DeltaList, qtbot):
+        data = pd.DataFrame({"district": [1, 2], "pop_total": [100, 50]}, index=[1, 2])
+        with qtbot.waitSignals([delta_list.updateStarted, delta_list.updateComplete], timeout=100):
+            delta_list.update(data)
+        assert len(delta_list) == 2
+        assert delta_list[1, 1] == 50
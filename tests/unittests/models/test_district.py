@@ -21,6 +21,7 @@ Copyright 2022-2024, Stuart C. Naifeh
 import pytest
 
 from redistricting.models import (
+    DistrictList,
     RdsDistrict,
     RdsUnassigned
 )
@@ -97,3 +98,90 @@ class TestDistrict:
         district = RdsUnassigned()
         with pytest.raises(AttributeError):
             district.name = "New Name"
+
+
+class TestDistrictList:
+    @pytest.fixture
+    def districts(self):
+        return DistrictList([RdsUnassigned(), RdsDistrict(1, population=100), RdsDistrict(2, population=200)])
+
+    def test_districts_share_store(self, districts: DistrictList):
+        d = RdsDistrict(3, name="Three", population=300, fid=7)
+        districts.append(d)
+        assert d.name == "Three"
+        assert d.population == 300
+        assert d.fid == 7
+        assert districts[1].population == 100
+        assert districts[2].population == 200
+
+    def test_removed_district_keeps_data(self, districts: DistrictList):
+        d = districts[1]
+        districts.remove(d)
+        assert d.district == 1
+        assert d.population == 100
+        assert districts[1].district == 2
+        assert districts[1].population == 200
+
+    def test_update_data(self, districts: DistrictList):
+        d = districts[2]
+        districts.updateData(
+            [0, 1, 2], {"population": [5, 150, 250], "members": [3, 1, 2], "polsbypopper": [0.1, 0.2, 0.3]}, [1, 2, 3]
+        )
+        assert districts[2] is d
+        assert d.population == 250
+        assert d.members == 2
+        assert d.polsbypopper == 0.3
+        assert d.fid == 3
+        assert districts[0].population == 5
+        assert districts[0].members is None
+        assert districts[0].polsbypopper is None
+
+    def test_dirty_tracking(self, districts: DistrictList):
+        assert len(districts.dirtyDistricts()) == 3
+        districts.updateData([0, 1, 2], {"population": [0, 100, 200]}, [1, 2, 3])
+        assert districts.dirtyDistricts() == []
+
+        d = districts[2]
+        d.name = "Two"
+        assert d.isDirty()
+        assert districts.dirtyDistricts() == [d]
+
+        d.setClean()
+        d.description = "the second district"
+        assert districts.dirtyDistricts() == [d]
+
+    def test_slice_update_data(self, districts: DistrictList):
+        sliced = districts[1:]
+        assert isinstance(sliced, DistrictList)
+        assert list(sliced) == [districts[1], districts[2]]
+
+        sliced.updateData([2], {"population": [225]}, [9])
+        assert districts[2].population == 225
+        assert districts[2].fid == 9
+        assert districts[1].population == 100
+
+        districts[1].name = "One"
+        assert sliced.dirtyDistricts() == [districts[1]]
+
+    def test_district_in_two_lists_keeps_data(self, districts: DistrictList):
+        d = districts[1]
+        other = DistrictList([d])
+        assert d.population == 100
+
+        other.updateData([1], {"population": [110]})
+        assert d.population == 110
+        districts.updateData([0, 1, 2], {"population": [0, 120, 200]})
+        assert other[0].population == 120
+        assert districts[2].population == 200
+
+    def test_numeric_columns_keep_types(self, districts: DistrictList):
+        d = districts[1]
+        assert isinstance(d.population, int)
+        assert isinstance(d.pct_deviation, float)
+        assert districts[0].deviation is None
+
+        districts.updateData([0, 1, 2], {"population": [0, 150.5, 200], "pieces": [None, 1, 2]})
+        assert d.population == 150.5
+        assert districts[2].population == 200
+        assert districts[0].pieces is None
+        assert isinstance(districts[2].pieces, int)
@@ -19,6 +19,8 @@ Copyright (C) 2025, Stuart C. Naifeh
  ***************************************************************************/
 """
 
+import pandas as pd
+
 from redistricting.models import metrics, metricslist
 
 
@@ -35,3 +37,43 @@ class TestMetrics:
         m = TestMetricClass()
         m.calculate(None, None, mock_plan)
         assert m.value == "dummy"
+
+
+class TestMetricContext:
+    def test_context_aggregates_once(self, mock_plan):
+        mock_plan.popFields.keys.return_value = []
+        mock_plan.dataFields.keys.return_value = []
+        data = pd.DataFrame(
+            {
+                "geoid": ["a", "b", "c", "d"],
+                "county": ["01", "01", "02", "02"],
+                "district": [1, 2, 2, 2],
+                "population": [10, 20, 30, 40],
+            }
+        )
+        context = metricslist.MetricContext(data, mock_plan)
+
+        assert context.districtUnitCounts is context.districtUnitCounts
+        assert context.districtUnitCounts.to_dict() == {1: 1, 2: 3}
+
+        sums = context.geoDistrictSums("county")
+        assert sums is context.geoDistrictSums("county")
+        assert sums["population"].to_dict() == {("01", 1): 10, ("01", 2): 20, ("02", 2): 70}
+
+    def test_complete_metric_uses_context(self, mock_plan):
+        data = pd.DataFrame({"district": [1, 2, 3, 4, 5], "population": [1, 1, 1, 1, 1]})
+        m = metrics.RdsCompleteMetric()
+        m.calculate(data, None, None, mock_plan, context=metricslist.MetricContext(data, mock_plan))
+        assert m.value is True
+
+        data.loc[0, "district"] = 0
+        m.calculate(data, None, None, mock_plan)
+        assert m.value is False
+
+    def test_deviation_uses_district_totals(self, mock_plan):
+        # mock_plan has 5 seats, so the ideal population per member is 20
+        data = pd.DataFrame({"district": [1, 2, 2, 2], "population": [10, 20, 30, 40]})
+        districtData = pd.DataFrame({"population": [30, 10], "members": [1, 1]}, index=pd.Index([1, 2]))
+        m = metrics.RdsDeviationMetric()
+        m.calculate(data, districtData, None, mock_plan, totalPopulation=100)
+        assert m.value.to_dict() == {1: 10, 2: -10}
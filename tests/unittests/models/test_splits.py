@@ -167,3 +167,19 @@ class TestSplits:
             521.6544782826682,
             79.72727272727273,
         ]
+
+    def test_splits_created_on_demand(self, splits_data):
+        s = RdsSplits("vtdid", data=splits_data)
+        assert len(s.splits._cache) == 0  # pylint: disable=protected-access
+        g = s[2]
+        assert g.geoid == "0155200"
+        assert s[2] is g
+        assert s.index(g) == 2
+        assert g[1].district == 3
+        assert g[1] is g[1]
+
+    def test_splits_regroups_noncontiguous_rows(self, splits_data):
+        s = RdsSplits("vtdid", data=splits_data.iloc[[0, 2, 1, 3]])
+        assert len(s) == 2
+        assert s[0].districts == [1, 5]
+        assert s[1].districts == [2, 3]
@@ -18,6 +18,8 @@ Copyright 2022-2024, Stuart C. Naifeh
  *                                                                         *
  ***************************************************************************/
 """
+import subprocess
+import sys
 from collections.abc import Generator
 
 import pytest
@@ -26,16 +28,42 @@ from pytest_mock.plugin import MockerFixture
 from pytestqt.plugin import QtBot
 from qgis.core import QgsProject
 from qgis.gui import QgisInterface
+from qgis.PyQt.QtCore import QFile
 from qgis.PyQt.QtWidgets import QMessageBox
 
 from redistricting import (
     classFactory,
     redistricting
 )
+from redistricting.resources import qCleanupResources, qInitResources
 
 # pylint: disable=unused-argument
 
 
+def test_plugin_import_defers_geospatial_modules():
+    code = (
+        "import sys, redistricting.redistricting; "
+        "print(','.join(m for m in ('geopandas', 'shapely', 'pyproj', 'psycopg2') if m in sys.modules))"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert proc.stdout.strip() == ""
+
+
+def test_resources_registered_with_plugin(qgis_iface, mocker: MockerFixture):
+    settings = mocker.patch("redistricting.redistricting.QSettings")
+    settings.return_value.value.return_value = "en_US"
+
+    qCleanupResources()
+    assert not QFile.exists(":/plugins/redistricting/icon.png")
+
+    plugin = redistricting.Redistricting(qgis_iface)
+    assert QFile.exists(":/plugins/redistricting/planmetrics.svg")
+
+    plugin.initGui()
+    plugin.unload()
+    assert not QFile.exists(":/plugins/redistricting/icon.png")
+
+
 class TestPluginInit:
 
     @pytest.fixture
@@ -0,0 +1,45 @@
+"""QGIS Redistricting Plugin - unit tests for GeoPackage utilities
+
+Copyright 2022-2025, Stuart C. Naifeh
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 3 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ *   This program is distributed in the hope that it will be useful, but   *
+ *   WITHOUT ANY WARRANTY; without even the implied warranty of            *
+ *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          *
+ *   GNU General Public License for more details. You should have          *
+ *   received a copy of the GNU General Public License along with this     *
+ *   program. If not, see <http://www.gnu.org/licenses/>.                  *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+import sqlite3
+
+from pytest_mock import MockerFixture
+
+from redistricting.utils import cloneGeoPackage
+
+
+class TestCloneGeoPackage:
+    def test_clone_copies_database(self, plan_gpkg_path, datadir):
+        dest = datadir / "cloned.gpkg"
+        cloneGeoPackage(plan_gpkg_path, dest)
+        assert dest.exists()
+        with sqlite3.connect(plan_gpkg_path) as src, sqlite3.connect(dest) as db:
+            assert (
+                db.execute("SELECT count(*) FROM assignments").fetchone()
+                == src.execute("SELECT count(*) FROM assignments").fetchone()
+            )
+
+    def test_clone_falls_back_to_copy(self, plan_gpkg_path, datadir, mocker: MockerFixture):
+        mocker.patch("redistricting.utils.gpkg._reflink", return_value=False)
+        copyfile = mocker.patch("redistricting.utils.gpkg.shutil.copyfile")
+        dest = datadir / "cloned.gpkg"
+        assert not cloneGeoPackage(plan_gpkg_path, dest)
+        copyfile.assert_called_once_with(str(plan_gpkg_path), str(dest))
@@ -0,0 +1,92 @@
+"""QGIS Redistricting Plugin - unit tests for snapshotting task data
+
+Copyright (C) 2026, Stuart C. Naifeh
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 3 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ *   This program is distributed in the hope that it will be useful, but   *
+ *   WITHOUT ANY WARRANTY; without even the implied warranty of            *
+ *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          *
+ *   GNU General Public License for more details. You should have          *
+ *   received a copy of the GNU General Public License along with this     *
+ *   program. If not, see <http://www.gnu.org/licenses/>.                  *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+import geopandas as gpd
+import pandas as pd
+import pytest
+import shapely
+
+from redistricting.utils.snapshot import snapshot
+
+# pylint: disable=redefined-outer-name
+
+
+@pytest.fixture
+def geometry() -> gpd.GeoSeries:
+    return gpd.GeoSeries(
+        [shapely.box(0, 0, 1, 1), shapely.box(1, 0, 2, 1), shapely.box(0, 1, 1, 2)],
+        index=pd.Index([1, 2, 3], name="district"),
+        crs="EPSG:3857",
+    )
+
+
+@pytest.fixture
+def districts(geometry: gpd.GeoSeries) -> gpd.GeoDataFrame:
+    return gpd.GeoDataFrame({"population": [100, 200, 300]}, geometry=geometry)
+
+
+class TestSnapshot:
+    def test_none(self):
+        assert snapshot(None) is None
+
+    def test_geoseries_keeps_crs_and_index(self, geometry: gpd.GeoSeries):
+        copy = snapshot(geometry)
+        assert isinstance(copy, gpd.GeoSeries)
+        assert copy.crs == geometry.crs
+        assert copy.index.equals(geometry.index)
+        assert copy.index.name == "district"
+        assert copy.geom_equals(geometry).all()
+
+    def test_geoseries_independent_of_source(self, geometry: gpd.GeoSeries):
+        copy = snapshot(geometry)
+        original = copy[2]
+        geometry[2] = shapely.box(5, 5, 6, 6)
+        geometry.drop(index=3, inplace=True)
+        geometry.set_crs("EPSG:4269", allow_override=True, inplace=True)
+
+        assert copy[2].equals(original)
+        assert list(copy.index) == [1, 2, 3]
+        assert copy.crs == "EPSG:3857"
+
+    def test_geodataframe_keeps_crs_and_index(self, districts: gpd.GeoDataFrame):
+        copy = snapshot(districts)
+        assert isinstance(copy, gpd.GeoDataFrame)
+        assert copy.crs == districts.crs
+        assert copy.geometry.name == districts.geometry.name
+        assert copy.index.equals(districts.index)
+        assert copy.equals(districts)
+
+    def test_geodataframe_independent_of_source(self, districts: gpd.GeoDataFrame):
+        copy = snapshot(districts)
+        districts.loc[1, "population"] = 0
+        districts.loc[1, "geometry"] = shapely.box(5, 5, 6, 6)
+        districts["extra"] = 1
+
+        assert copy.loc[1, "population"] == 100
+        assert copy.loc[1, "geometry"].equals(shapely.box(0, 0, 1, 1))
+        assert "extra" not in copy.columns
+
+    def test_dataframe_independent_of_source(self):
+        df = pd.DataFrame({"population": [100, 200]}, index=pd.Index([1, 2], name="district"))
+        copy = snapshot(df)
+        df.loc[1, "population"] = 0
+        assert copy.loc[1, "population"] == 100
+        assert copy.index.name == "district"
@@ -0,0 +1,130 @@
+"""QGIS Redistricting Plugin - unit tests for SQL tracing
+
+Copyright (C) 2026, Stuart C. Naifeh
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 3 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ *   This program is distributed in the hope that it will be useful, but   *
+ *   WITHOUT ANY WARRANTY; without even the implied warranty of            *
+ *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          *
+ *   GNU General Public License for more details. You should have          *
+ *   received a copy of the GNU General Public License along with this     *
+ *   program. If not, see <http://www.gnu.org/licenses/>.                  *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+import csv
+import json
+import sqlite3
+from contextlib import closing
+
+import pytest
+from pytest_mock import MockerFixture
+from qgis.core import QgsMessageLog
+
+from redistricting import settings
+from redistricting.utils import spatialite_connect
+from redistricting.utils.sqltrace import TracingConnection, sqlTracer
+
+# pylint: disable=redefined-outer-name
+
+
+@pytest.fixture(autouse=True)
+def log(mocker: MockerFixture):
+    return mocker.patch("redistricting.utils.sqltrace.QgsMessageLog", spec=QgsMessageLog)
+
+
+@pytest.fixture
+def tracing(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "traceSql", True)
+    monkeypatch.setattr(settings, "sqlSlowThreshold", 0)
+    sqlTracer.reset()
+    yield sqlTracer
+    sqlTracer.reset()
+
+
+@pytest.fixture
+def db(tracing):
+    with closing(sqlite3.connect(":memory:", factory=TracingConnection)) as db:
+        db.executescript("CREATE TABLE t (a INTEGER PRIMARY KEY, b TEXT); CREATE INDEX idx_b ON t (b);")
+        db.executemany("INSERT INTO t (b) VALUES (?)", [(str(i),) for i in range(20)])
+        db.commit()
+        tracing.reset()
+        yield db
+
+
+def stats(sql: str):
+    return next(s for s in sqlTracer.report() if s.sql == sql)
+
+
+class TestSqlTracer:
+    def test_spatialite_connect_traces_when_enabled(self, tracing, plan_gpkg_path):
+        with closing(spatialite_connect(plan_gpkg_path)) as db:
+            assert isinstance(db, TracingConnection)
+
+    def test_spatialite_connect_does_not_trace_when_disabled(self, plan_gpkg_path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(settings, "traceSql", False)
+        with closing(spatialite_connect(plan_gpkg_path)) as db:
+            assert not isinstance(db, TracingConnection)
+
+    def test_counts_fetched_rows(self, db: sqlite3.Connection):
+        assert len(db.execute("SELECT * FROM t WHERE a <= ?", (5,)).fetchall()) == 5
+        for _ in db.execute("SELECT * FROM t WHERE a <= ?", (3,)):
+            pass
+
+        s = stats("SELECT * FROM t WHERE a <= ?")
+        assert s.calls == 2
+        assert s.rows == 8
+
+    def test_counts_changed_rows(self, db: sqlite3.Connection):
+        db.execute("UPDATE t SET b = 'x' WHERE a <= 10")
+        assert stats("UPDATE t SET b = 'x' WHERE a <= 10").rows == 10
+
+    def test_records_statement_when_cursor_discarded(self, db: sqlite3.Connection):
+        assert db.execute("SELECT count(*) FROM t").fetchone() == (20,)
+        assert stats("SELECT count(*) FROM t").calls == 1
+
+    def test_logs_expanded_sql(self, db: sqlite3.Connection, log):
+        db.execute("SELECT * FROM t WHERE b = ?", ("7",)).fetchall()
+        assert "SELECT * FROM t WHERE b = '7'" in log.logMessage.call_args.args[0]
+        assert stats("SELECT * FROM t WHERE b = ?").slowest == "SELECT * FROM t WHERE b = '7'"
+
+    def test_captures_query_plan_for_slow_statements(self, db: sqlite3.Connection):
+        db.execute("SELECT * FROM t WHERE b = ?", ("7",)).fetchall()
+        assert any("idx_b" in line for line in stats("SELECT * FROM t WHERE b = ?").plan)
+
+    def test_skips_query_plan_for_fast_statements(self, db: sqlite3.Connection, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(settings, "sqlSlowThreshold", 60000)
+        db.execute("SELECT * FROM t WHERE b = ?", ("7",)).fetchall()
+        s = stats("SELECT * FROM t WHERE b = ?")
+        assert s.slowCalls == 0
+        assert s.plan == []
+
+    def test_failed_statements_not_recorded(self, db: sqlite3.Connection):
+        with pytest.raises(sqlite3.OperationalError):
+            db.execute("SELECT * FROM missing")
+        assert sqlTracer.report() == []
+
+    def test_export_csv(self, db: sqlite3.Connection, tmp_path):
+        db.execute("SELECT * FROM t").fetchall()
+        path = tmp_path / "trace.csv"
+        sqlTracer.exportReport(path)
+        with path.open(encoding="utf-8", newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert rows[0]["sql"] == "SELECT * FROM t"
+        assert rows[0]["rows"] == "20"
+        assert "SCAN t" in rows[0]["query_plan"]
+
+    def test_export_json(self, db: sqlite3.Connection, tmp_path):
+        db.execute("SELECT * FROM t").fetchall()
+        path = tmp_path / "trace.json"
+        sqlTracer.exportReport(path)
+        report = json.loads(path.read_text(encoding="utf-8"))
+        assert report[0]["sql"] == "SELECT * FROM t"
+        assert report[0]["calls"] == 1